@@ -0,0 +1,55 @@
+"""
+Sync Vs Async Handler Paths Against Mock-ATS
+
+- GetJobs Vs GetJobsAsync With all=true And A Small per_page, So Each
+  Invocation Walks Many Prefetched Pages
+- CreateCandidatesBulk Vs CreateCandidatesBulkAsync At The Same Concurrency
+
+The Response Cache Is Disabled So Every Call Reaches The Upstream.
+
+Usage:
+    python Benchmarks/Async_Benchmark.py [--iterations 50] [--items 200]
+"""
+
+import argparse
+import json
+import os
+import time
+
+import Bench_Common
+
+
+def Main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    Parser.add_argument("--iterations", type=int, default=50)
+    Parser.add_argument("--items", type=int, default=200)
+    Parser.add_argument("--concurrency", type=int, default=8)
+    Args = Parser.parse_args()
+
+    os.environ["AtsCacheEnabled"] = "false"
+    os.environ["AtsPoolSize"] = str(Args.concurrency)
+    os.environ["AtsBulkConcurrency"] = str(Args.concurrency)
+    # Every Run Sends The Same Emails; Each Must Still Create Its Candidates
+    os.environ["AtsCandidateDedup"] = "false"
+    BaseUrl = Bench_Common.StartMockServer()
+    import handler
+
+    print(f"Mock-ATS At {BaseUrl}")
+    ListEvent = {"queryStringParameters": {"all": "true", "per_page": "1"}}
+    for Label, Handler in (("GetJobs all=true", handler.GetJobs), ("GetJobsAsync all=true", handler.GetJobsAsync)):
+        Handler(ListEvent, None)
+        Samples = Bench_Common.TimeCalls(lambda: Handler(ListEvent, None), Args.iterations)
+        Bench_Common.PrintRow(Label, Bench_Common.Summarize(Samples))
+
+    Body = json.dumps(
+        [{"name": f"Async Candidate{Index}", "email": f"async{Index}@example.com", "job_id": "1"} for Index in range(Args.items)]
+    )
+    for Label, Handler in (("CreateCandidatesBulk", handler.CreateCandidatesBulk), ("CreateCandidatesBulkAsync", handler.CreateCandidatesBulkAsync)):
+        Start = time.perf_counter()
+        Response = Handler({"body": Body}, None)
+        Elapsed = time.perf_counter() - Start
+        print(f"{Label:<28} status={Response['statusCode']} elapsed={Elapsed:.2f}s rate={Args.items / Elapsed:.1f}/s")
+
+
+if __name__ == "__main__":
+    Main()
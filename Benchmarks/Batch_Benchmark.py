@@ -0,0 +1,114 @@
+"""
+Batch Read Benchmark Against Mock-ATS
+
+One Dashboard Page View: The Jobs Listing, The First Page Of Applications
+For Every Job On It, And The Candidates Listing. Timed Two Ways:
+
+- separate:  One Handler Invocation Per Read, One After Another (N+2 Calls,
+             As The Dashboard Makes Them Today)
+- batch:     One POST /batch With include=applications On The Jobs Read
+
+Each Upstream Call Is Delayed By --upstream-ms (Mock Slow Mode), So The
+Gap Shows What Running The Reads Concurrently Saves. Measured With The
+Response Cache Off And Then On (Every Page Cached After The First View).
+API Gateway And Lambda Invoke Overhead Per Call Is Not Included; The
+Invocation Counts Are Printed So It Can Be Added.
+
+Usage:
+    python Benchmarks/Batch_Benchmark.py [--jobs 20] [--applications 5] [--upstream-ms 20] [--iterations 20]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+import Bench_Common
+
+
+def Seed(Mock: Any, Jobs: int, ApplicationsPerJob: int) -> None:
+    Stamp = Mock.now_stamp()
+    Mock.JOBS.load(
+        [
+            {"id": Index, "title": f"Engineer {Index}", "location": "Remote", "status": "open", "url": f"https://example.com/{Index}", "updated_at": Stamp}
+            for Index in range(1, Jobs + 1)
+        ]
+    )
+    Mock.APPLICATIONS.load(
+        [
+            {
+                "id": (JobId - 1) * ApplicationsPerJob + Index,
+                "candidate_id": Index,
+                "job_id": JobId,
+                "status": "applied",
+                "candidate": {"name": f"Candidate {Index}", "email": f"candidate{Index}@example.com"},
+                "updated_at": Stamp,
+            }
+            for JobId in range(1, Jobs + 1)
+            for Index in range(1, ApplicationsPerJob + 1)
+        ]
+    )
+
+
+def Main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    Parser.add_argument("--jobs", type=int, default=20)
+    Parser.add_argument("--applications", type=int, default=5)
+    Parser.add_argument("--upstream-ms", type=float, default=20)
+    Parser.add_argument("--iterations", type=int, default=20)
+    Args = Parser.parse_args()
+
+    os.environ["AtsTraceEnabled"] = "false"
+    os.environ["AtsBatchConcurrency"] = "8"
+    os.environ["AtsPoolSize"] = "16"
+    BaseUrl = Bench_Common.StartMockServer()
+    Mock = sys.modules["Mock_Server"]
+    Seed(Mock, Args.jobs, Args.applications)
+    Mock.SLOW_RATE, Mock.SLOW_MS = 1.0, Args.upstream_ms
+    import handler
+    from ats_ratelimit import QUOTA_METER
+
+    logging.disable(logging.INFO)
+    print(f"Mock-ATS At {BaseUrl}, {Args.jobs} Jobs x {Args.applications} Applications, {Args.upstream_ms}ms Per Upstream Call")
+    JobsParams = {"page": "1", "per_page": str(Args.jobs)}
+
+    def Separate() -> Dict[str, Any]:
+        Jobs = json.loads(handler.GetJobs({"queryStringParameters": JobsParams}, None)["body"])["jobs"]
+        for Job in Jobs:
+            Job["applications"] = json.loads(handler.GetApplications({"queryStringParameters": {"job_id": str(Job["id"])}}, None)["body"])["applications"]
+        Candidates = json.loads(handler.GetCandidates({"queryStringParameters": {}}, None)["body"])["candidates"]
+        return {"jobs": Jobs, "candidates": Candidates}
+
+    BatchBody = json.dumps(
+        {
+            "requests": [
+                {"id": "jobs", "path": "/jobs", "params": JobsParams, "include": ["applications"]},
+                {"id": "candidates", "path": "/candidates"},
+            ]
+        }
+    )
+
+    def Batched() -> Dict[str, Any]:
+        Responses = json.loads(handler.Batch({"body": BatchBody}, None)["body"])["responses"]
+        return {"jobs": Responses[0]["body"]["jobs"], "candidates": Responses[1]["body"]["candidates"]}
+
+    for CacheEnabled in ("false", "true"):
+        os.environ["AtsCacheEnabled"] = CacheEnabled
+        print(f"\n-- response cache {'on' if CacheEnabled == 'true' else 'off'} --")
+        Results: List[Dict[str, Any]] = []
+        for Label, Call, Invocations in (("separate", Separate, Args.jobs + 2), ("batch", Batched, 1)):
+            Call()
+            Calls = QUOTA_METER.Snapshot()["upstream_calls"]
+            Samples = Bench_Common.TimeCalls(lambda: Results.append(Call()), Args.iterations)
+            Bench_Common.PrintRow(Label, Bench_Common.Summarize(Samples))
+            print(f"{'':<28} invocations/view={Invocations} upstream calls/view={(QUOTA_METER.Snapshot()['upstream_calls'] - Calls) / Args.iterations:.1f}")
+        print(f"Same Page Both Ways: {Results[0] == Results[-1]}")
+
+
+if __name__ == "__main__":
+    Start = time.perf_counter()
+    Main()
+    print(f"\nDone In {time.perf_counter() - Start:.1f}s")
@@ -0,0 +1,145 @@
+"""
+Shared Helpers For The Benchmark Scripts
+
+- Starts Mock-ATS In A Background Thread On A Free Port, Working On A
+  Temporary Copy Of The Fixture Files So Benchmarks Never Touch Them
+- Points The Serverless Handler At That Server Through The Environment
+- Small Timing And Percentile Utilities, API Gateway Proxy Events And RSS
+"""
+
+import json
+import logging
+import os
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MOCK_DIR = os.path.join(ROOT_DIR, "Mock-ATS")
+HANDLER_DIR = os.path.join(ROOT_DIR, "SVL-FRAMEWORK")
+API_KEY = "Dummy_Key_1608"
+
+for _Path in (MOCK_DIR, HANDLER_DIR):
+    if _Path not in sys.path:
+        sys.path.insert(0, _Path)
+
+
+def ImportMockServer() -> Any:
+    """
+    Import Mock_Server Against A Temporary Copy Of The Fixture Files.
+    """
+    DataDir = tempfile.mkdtemp(prefix="mock-ats-")
+    for FileName in ("Jobs.json", "Candidates.json", "Applications.json"):
+        shutil.copy(os.path.join(MOCK_DIR, FileName), DataDir)
+
+    # Mock_Server Resolves Its Data Files Relative To The Working Directory
+    os.chdir(DataDir)
+    import Mock_Server
+
+    return Mock_Server
+
+
+def StartMockServer() -> str:
+    """
+    Run Mock-ATS On 127.0.0.1:<Free Port> And Return Its Base Url.
+    """
+    from werkzeug.serving import make_server
+
+    Mock_Server = ImportMockServer()
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    Server = make_server("127.0.0.1", 0, Mock_Server.app, threaded=True)
+    threading.Thread(target=Server.serve_forever, daemon=True).start()
+
+    BaseUrl = f"http://127.0.0.1:{Server.server_port}"
+    os.environ["AtsBaseUrl"] = BaseUrl
+    os.environ["AtsApiKey"] = API_KEY
+    return BaseUrl
+
+
+def TimeCalls(Func: Callable[[], Any], Iterations: int) -> List[float]:
+    """
+    Call Func Iterations Times And Return Each Latency In Milliseconds.
+    """
+    Samples: List[float] = []
+    for _ in range(Iterations):
+        Start = time.perf_counter()
+        Func()
+        Samples.append((time.perf_counter() - Start) * 1000)
+    return Samples
+
+
+def Summarize(Samples: List[float]) -> Dict[str, float]:
+    """
+    Return Count, Mean And p50/p95/p99 For A List Of Millisecond Samples.
+    """
+    Ordered = sorted(Samples)
+
+    def Percentile(Fraction: float) -> float:
+        return Ordered[min(len(Ordered) - 1, int(Fraction * len(Ordered)))]
+
+    return {
+        "count": len(Ordered),
+        "mean_ms": round(statistics.fmean(Ordered), 3),
+        "p50_ms": round(Percentile(0.50), 3),
+        "p95_ms": round(Percentile(0.95), 3),
+        "p99_ms": round(Percentile(0.99), 3),
+    }
+
+
+def PrintRow(Label: str, Stats: Dict[str, float]) -> None:
+    print(
+        f"{Label:<28} n={Stats['count']:<6} mean={Stats['mean_ms']:>8.3f}ms "
+        f"p50={Stats['p50_ms']:>8.3f}ms p95={Stats['p95_ms']:>8.3f}ms p99={Stats['p99_ms']:>8.3f}ms"
+    )
+
+
+def ApiEvent(
+    Method: str,
+    Path: str,
+    Query: Optional[Dict[str, str]] = None,
+    Body: Optional[Any] = None,
+    Headers: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    An API Gateway (REST, Lambda Proxy) Event As serverless.yml's http Events Deliver It.
+    """
+    return {
+        "resource": Path,
+        "path": Path,
+        "httpMethod": Method,
+        "headers": {"Accept": "application/json", "Content-Type": "application/json", **(Headers or {})},
+        "multiValueHeaders": None,
+        "queryStringParameters": Query or None,
+        "multiValueQueryStringParameters": None,
+        "pathParameters": None,
+        "stageVariables": None,
+        "requestContext": {"requestId": str(uuid.uuid4()), "httpMethod": Method, "path": f"/dev{Path}", "stage": "dev"},
+        "body": json.dumps(Body) if Body is not None else None,
+        "isBase64Encoded": False,
+    }
+
+
+def RssMb() -> float:
+    """
+    Resident Set Size Of This Process Right Now (Peak RSS Where /proc Is Missing).
+    """
+    try:
+        with open("/proc/self/statm") as Handle:
+            return int(Handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return MaxRssMb()
+
+
+def MaxRssMb() -> float:
+    """
+    Peak Resident Set Size Of This Process So Far.
+    """
+    Peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes On Linux, Bytes On macOS
+    return Peak / (1024 * 1024) if sys.platform == "darwin" else Peak / 1024
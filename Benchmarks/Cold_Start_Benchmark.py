@@ -0,0 +1,197 @@
+"""
+Cold Start Benchmark: Import Time And First-Invocation Latency
+
+Every Trial Is A Fresh Python Process Against Mock-ATS That Imports handler,
+Then Invokes One Handler Twice:
+
+- import:  Module Import Plus Init Warm-Up (Everything Lambda Bills As Init)
+- first:   The First Invocation, Paying Whatever Setup Init Left Behind
+- warm:    The Second Invocation, For Comparison (Response Cache Off)
+- process: Wall Time Of The Whole Process, Interpreter Startup Included
+
+Each Handler Runs Under Two Environments And Two Bytecode States:
+
+- local:   No Lambda Variables; Live Config Reads And No Warm-Up
+- lambda:  AWS_LAMBDA_FUNCTION_NAME And _HANDLER Set, As In A Deployed
+           Function; Config Frozen At Import And The Handler Warmed In Init
+- pyc:     Compiled Bytecode Already Cached (Ship .pyc With The Package)
+- source:  No Bytecode, Every Module Compiled On Import
+
+Also Lists The Slowest Modules Under handler From python -X importtime.
+
+--save-baseline FILE Stores The p50 Of import + first Per Row; --baseline
+FILE Compares Against It And Exits 1 When A Row Grew By More Than
+--tolerance (Plus --slack-ms, To Ride Out Timer Noise).
+
+Usage:
+    python Benchmarks/Cold_Start_Benchmark.py [--trials 5] [--handlers Hello,GetJobs,GetJobsAsync,CacheStats]
+        [--save-baseline cold_start.json] [--baseline cold_start.json --tolerance 0.25]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Tuple
+
+HANDLER_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "SVL-FRAMEWORK")
+
+EVENTS: Dict[str, Dict[str, Any]] = {
+    "GetJobs": {"queryStringParameters": {"page": "1", "per_page": "20"}},
+    "GetJobsAsync": {"queryStringParameters": {"page": "1", "per_page": "20"}},
+    "GetCandidates": {"queryStringParameters": {"page": "1", "per_page": "20"}},
+    "GetApplications": {"queryStringParameters": {"page": "1", "per_page": "20"}},
+}
+ENVIRONMENTS = ("local", "lambda")
+BYTECODE = ("pyc", "source")
+
+
+# -----------------------
+# Child Process
+# -----------------------
+def Child(Name: str) -> None:
+    """
+    Import handler, Invoke Name Twice And Print One JSON Line Of Timings.
+    """
+    Start = time.perf_counter()
+    sys.path.insert(0, HANDLER_DIR)
+    import handler
+
+    Imported = time.perf_counter()
+    Func = getattr(handler, Name)
+    Event = EVENTS.get(Name, {})
+    Timings = {"import_ms": (Imported - Start) * 1000}
+    for Label in ("first_ms", "warm_ms"):
+        Begin = time.perf_counter()
+        Response = Func(dict(Event), None)
+        Timings[Label] = (time.perf_counter() - Begin) * 1000
+        if Response.get("statusCode") != 200:
+            raise SystemExit(f"{Name} Answered {Response.get('statusCode')}: {Response.get('body')}")
+    Timings["modules"] = len(sys.modules)
+    print("COLD_START " + json.dumps(Timings))
+
+
+# -----------------------
+# Parent
+# -----------------------
+def ChildEnv(Name: str, Environment: str, Bytecode: str, CacheDir: str) -> Dict[str, str]:
+    Env = {Key: Value for Key, Value in os.environ.items() if Key not in ("AWS_LAMBDA_FUNCTION_NAME", "_HANDLER", "PYTHONDONTWRITEBYTECODE")}
+    Env["AtsCacheEnabled"] = "false"
+    Env["AtsTraceEnabled"] = "false"
+    if Environment == "lambda":
+        Env["AWS_LAMBDA_FUNCTION_NAME"] = "Cold-Start-Benchmark"
+        Env["_HANDLER"] = f"handler.{Name}"
+    if Bytecode == "pyc":
+        Env["PYTHONPYCACHEPREFIX"] = os.path.join(CacheDir, "pyc")
+    else:
+        Env["PYTHONPYCACHEPREFIX"] = os.path.join(CacheDir, "none")
+        Env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return Env
+
+
+def RunChild(Name: str, Env: Dict[str, str], ImportTime: bool = False) -> Tuple[Dict[str, Any], str]:
+    Command = [sys.executable] + (["-X", "importtime"] if ImportTime else []) + [os.path.abspath(__file__), "--child", Name]
+    Start = time.perf_counter()
+    Done = subprocess.run(Command, env=Env, capture_output=True, text=True)
+    Wall = (time.perf_counter() - Start) * 1000
+    Lines = [Line for Line in Done.stdout.splitlines() if Line.startswith("COLD_START ")]
+    if Done.returncode != 0 or not Lines:
+        raise SystemExit(f"{Name} Child Failed:\n{Done.stdout}\n{Done.stderr}")
+    Timings = json.loads(Lines[-1][len("COLD_START ") :])
+    Timings["process_ms"] = Wall
+    return Timings, Done.stderr
+
+
+def Percentile(Samples: List[float], Fraction: float) -> float:
+    Ordered = sorted(Samples)
+    return Ordered[min(len(Ordered) - 1, int(Fraction * len(Ordered)))]
+
+
+def SlowestImports(Stderr: str, Count: int) -> List[Tuple[str, float]]:
+    """
+    Direct Imports Of handler (One Level Deep) By Cumulative Microseconds, From -X importtime.
+    """
+    Modules: List[Tuple[str, float]] = []
+    for Line in Stderr.splitlines():
+        if not Line.startswith("import time:") or "cumulative" in Line:
+            continue
+        _, Cumulative, Name = Line[len("import time:") :].split("|")
+        # One Space Plus Two Per Nesting Level; handler Itself Sits At Level 0
+        if Name.startswith("   ") and not Name.startswith("     "):
+            Modules.append((Name.strip(), int(Cumulative) / 1000))
+    return sorted(Modules, key=lambda Item: -Item[1])[:Count]
+
+
+def Main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    Parser.add_argument("--child", help=argparse.SUPPRESS)
+    Parser.add_argument("--trials", type=int, default=5)
+    Parser.add_argument("--handlers", default="Hello,GetJobs,GetJobsAsync,CacheStats")
+    Parser.add_argument("--baseline", help="Compare Against This Baseline File")
+    Parser.add_argument("--save-baseline", help="Write This Run's Numbers Here")
+    Parser.add_argument("--tolerance", type=float, default=0.25)
+    Parser.add_argument("--slack-ms", type=float, default=5.0)
+    Args = Parser.parse_args()
+    if Args.child:
+        Child(Args.child)
+        return
+
+    import Bench_Common
+
+    BaseUrl = Bench_Common.StartMockServer()
+    CacheDir = tempfile.mkdtemp(prefix="cold-start-")
+    Handlers = [Name.strip() for Name in Args.handlers.split(",") if Name.strip()]
+    print(f"Mock-ATS At {BaseUrl}, {Args.trials} Fresh Processes Per Row, Python {sys.version.split()[0]}")
+
+    # Fill The Bytecode Cache Once So pyc Rows Never Pay For Compiling
+    RunChild(Handlers[0], ChildEnv(Handlers[0], "local", "pyc", CacheDir))
+
+    Results: Dict[str, float] = {}
+    print(f"\n{'':<30} {'import':>9} {'first':>9} {'import+first':>13} {'warm':>8} {'process':>9}  (p50 ms)")
+    for Name in Handlers:
+        for Environment in ENVIRONMENTS:
+            for Bytecode in BYTECODE:
+                Env = ChildEnv(Name, Environment, Bytecode, CacheDir)
+                Samples = [RunChild(Name, Env)[0] for _ in range(Args.trials)]
+                Column = {Key: Percentile([Sample[Key] for Sample in Samples], 0.5) for Key in ("import_ms", "first_ms", "warm_ms", "process_ms")}
+                Budget = Percentile([Sample["import_ms"] + Sample["first_ms"] for Sample in Samples], 0.5)
+                Label = f"{Name} {Environment}/{Bytecode}"
+                Results[Label] = round(Budget, 3)
+                print(
+                    f"{Label:<30} {Column['import_ms']:>9.1f} {Column['first_ms']:>9.1f} {Budget:>13.1f} "
+                    f"{Column['warm_ms']:>8.2f} {Column['process_ms']:>9.1f}"
+                )
+
+    _, Stderr = RunChild("GetJobs", ChildEnv("GetJobs", "lambda", "pyc", CacheDir), ImportTime=True)
+    print("\nSlowest Imports Under handler (lambda/pyc, Cumulative ms):")
+    for Module, Millis in SlowestImports(Stderr, 10):
+        print(f"  {Module:<26} {Millis:>7.1f}")
+
+    if Args.save_baseline:
+        with open(Args.save_baseline, "w") as Handle:
+            json.dump(Results, Handle, indent=2, sort_keys=True)
+        print(f"\nBaseline Written To {Args.save_baseline}")
+
+    if Args.baseline:
+        with open(Args.baseline) as Handle:
+            Baseline: Dict[str, float] = json.load(Handle)
+        Regressions = [
+            f"{Label}: {Results[Label]:.1f}ms Vs {Before:.1f}ms"
+            for Label, Before in sorted(Baseline.items())
+            if Label in Results and Results[Label] > Before * (1 + Args.tolerance) + Args.slack_ms
+        ]
+        print(f"\nAgainst {Args.baseline} (Tolerance {Args.tolerance:.0%} + {Args.slack_ms}ms):")
+        for Line in Regressions or ["No Regressions"]:
+            print(f"  {Line}")
+        if Regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    Start = time.perf_counter()
+    Main()
+    if "--child" not in sys.argv:
+        print(f"\nDone In {time.perf_counter() - Start:.1f}s")
@@ -0,0 +1,98 @@
+"""
+Multi-ATS Federation Benchmark Against Mock-ATS
+
+--connectors Mock-ATS Listeners Stand In For Separate Upstreams (Each Its
+Own Port And Connector; One Dataset Behind Them, So De-Duplication Is Off
+Here). Every Upstream Call Is Delayed By --upstream-ms, And With --slow-ms
+The Last Connector Takes That Long Instead (A Degraded Vendor).
+
+- one by one:  One GetJobs Per Connector, In Turn, Each Waited Out In Full
+               (What A Client Stitching Several Single-Upstream Stacks
+               Together Pays)
+- federated:   One GetJobs With connectors=all, Fanned Out Concurrently;
+               The Slow Connector Is Cut Off At AtsFederationTimeout. Its Read
+               Keeps Running, So The Next Request Often Joins It In Flight
+               (Coalescing) And Still Gets That Connector's Page
+
+Usage:
+    python Benchmarks/Federation_Benchmark.py [--connectors 4] [--iterations 50] [--upstream-ms 20] [--slow-ms 500] [--timeout 0.2]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List
+
+import Bench_Common
+
+
+def Main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    Parser.add_argument("--connectors", type=int, default=4)
+    Parser.add_argument("--iterations", type=int, default=50)
+    Parser.add_argument("--upstream-ms", type=float, default=20)
+    Parser.add_argument("--slow-ms", type=float, default=500)
+    Parser.add_argument("--timeout", type=float, default=0.2, help="AtsFederationTimeout")
+    Args = Parser.parse_args()
+
+    from werkzeug.serving import make_server
+
+    os.environ["AtsTraceEnabled"] = "false"
+    os.environ["AtsCacheEnabled"] = "false"
+    os.environ["AtsFederationDedup"] = ""
+    BaseUrl = Bench_Common.StartMockServer()
+    Mock = sys.modules["Mock_Server"]
+    Mock.SLOW_RATE, Mock.SLOW_MS = 1.0, Args.upstream_ms
+
+    def Listen(App: Any) -> str:
+        Server = make_server("127.0.0.1", 0, App, threaded=True)
+        threading.Thread(target=Server.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{Server.server_port}"
+
+    def Slow(Environ: Dict[str, Any], StartResponse: Any) -> Any:
+        time.sleep(max(0.0, Args.slow_ms - Args.upstream_ms) / 1000)
+        return Mock.app(Environ, StartResponse)
+
+    Urls = [BaseUrl] + [Listen(Mock.app) for _ in range(Args.connectors - 2)] + [Listen(Slow if Args.slow_ms > 0 else Mock.app)]
+    Names = [f"ats{Index}" for Index in range(len(Urls))]
+    os.environ["AtsConnectors"] = json.dumps(
+        {"connectors": [{"name": Name, "base_url": Url, "api_key": Bench_Common.API_KEY} for Name, Url in zip(Names, Urls)]}
+    )
+    import handler
+
+    logging.disable(logging.WARNING)
+    print(f"Mock-ATS At {BaseUrl}, {len(Urls)} Connectors, {Args.upstream_ms}ms Per Upstream Call, Last One {Args.slow_ms}ms")
+
+    def OneByOne() -> None:
+        for Name in Names:
+            handler.GetJobs({"queryStringParameters": {"connectors": Name}}, None)
+
+    Reports: List[Dict[str, Any]] = []
+
+    def Federated() -> None:
+        Response = handler.GetJobs({"queryStringParameters": {"connectors": "all"}}, None)
+        Reports.append(json.loads(Response["body"]))
+
+    for Label, Call, Timeout in (("one by one", OneByOne, 60.0), ("federated", Federated, Args.timeout)):
+        os.environ["AtsFederationTimeout"] = str(Timeout)
+        Call()
+        Reports.clear()
+        Bench_Common.PrintRow(Label, Bench_Common.Summarize(Bench_Common.TimeCalls(Call, Args.iterations)))
+
+    Partial = sum(Report["partial"] for Report in Reports)
+    Records = sum(len(Report["jobs"]) for Report in Reports) / max(1, len(Reports))
+    print(f"\nFederated: {Partial}/{len(Reports)} Partial, {Records:.1f} Records Per Response")
+    for Name in Names:
+        Millis = [Report["connectors"][Name]["ms"] for Report in Reports]
+        Statuses = {Report["connectors"][Name]["status"] for Report in Reports}
+        print(f"  {Name:<8} {Bench_Common.Summarize(Millis)['p50_ms']:8.1f}ms p50  {', '.join(sorted(Statuses))}")
+
+
+if __name__ == "__main__":
+    Start = time.perf_counter()
+    Main()
+    print(f"\nDone In {time.perf_counter() - Start:.1f}s")
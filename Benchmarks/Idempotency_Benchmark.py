@@ -0,0 +1,134 @@
+"""
+Idempotent Create Benchmark Against Mock-ATS
+
+Three Write Patterns:
+
+- retries:     Every POST /candidates Is Sent --retries Extra Times With The
+               Same Idempotency-Key, As A Client Does After A Timeout
+- concurrent:  --burst Copies Of One Request Arrive At Once (A Double Submit
+               Or A Retry Racing The Original), Repeated Per Applicant
+- reapply:     Each Applicant Applies To --jobs Jobs, A New Key Per Application
+
+Each Run Three Ways:
+
+- no keys:     Store Off (AtsIdempotencyTtl=0, AtsCandidateDedup=false) And
+               The Mock Ignoring Idempotency-Key, Like An Upstream Without It
+- upstream:    Store Off; Only The Key Forwarded Upstream Stops Duplicates
+- store:       Idempotency Store And Candidate Email Index On
+
+Reports Latency Per Request, Candidates Created In The Mock (Duplicates
+Are Those Past One Per Applicant) And Upstream Calls Per Request. Each
+Upstream Call Is Delayed By --upstream-ms (Mock Slow Mode).
+
+Usage:
+    python Benchmarks/Idempotency_Benchmark.py [--applicants 200] [--retries 2] [--burst 4] [--jobs 3] [--upstream-ms 5]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+import Bench_Common
+
+STORE_OFF = {"AtsIdempotencyTtl": "0", "AtsCandidateDedup": "false"}
+STORE_ON = {"AtsIdempotencyTtl": "86400", "AtsCandidateDedup": "true"}
+# (Label, Gateway Environment, Mock Idempotency TTL)
+MODES = (
+    ("no keys", STORE_OFF, 0),
+    ("upstream", STORE_OFF, 86400),
+    ("store", STORE_ON, 86400),
+)
+
+
+def Event(Body: Dict[str, Any], Key: str) -> Dict[str, Any]:
+    return {"body": json.dumps(Body), "headers": {"Idempotency-Key": Key}}
+
+
+def Main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    Parser.add_argument("--applicants", type=int, default=200)
+    Parser.add_argument("--retries", type=int, default=2)
+    Parser.add_argument("--burst", type=int, default=4)
+    Parser.add_argument("--jobs", type=int, default=3)
+    Parser.add_argument("--upstream-ms", type=float, default=5)
+    Args = Parser.parse_args()
+
+    os.environ["AtsTraceEnabled"] = "false"
+    os.environ["AtsPoolSize"] = str(max(10, Args.burst))
+    BaseUrl = Bench_Common.StartMockServer()
+    Mock = sys.modules["Mock_Server"]
+    Mock.SLOW_RATE, Mock.SLOW_MS = 1.0, Args.upstream_ms
+    import handler
+    from ats_ratelimit import QUOTA_METER
+
+    logging.disable(logging.INFO)
+    print(f"Mock-ATS At {BaseUrl}, {Args.applicants} Applicants, {Args.upstream_ms}ms Per Upstream Call")
+    Run = 0
+
+    def Applicant(Pattern: str, Index: int) -> Dict[str, Any]:
+        return {"name": f"Applicant {Index}", "email": f"{Pattern}{Run}.{Index}@example.com", "job_id": "1"}
+
+    def Retries(Index: int) -> List[Dict[str, Any]]:
+        Body = Applicant("retry", Index)
+        return [Event(Body, f"retry-{Run}-{Index}")] * (1 + Args.retries)
+
+    def Reapply(Index: int) -> List[Dict[str, Any]]:
+        Body = Applicant("reapply", Index)
+        return [Event({**Body, "job_id": str(Job % 8 + 1)}, f"reapply-{Run}-{Index}-{Job}") for Job in range(Args.jobs)]
+
+    def Sequential(Events: Callable[[int], List[Dict[str, Any]]]) -> List[float]:
+        Samples: List[float] = []
+        for Index in range(Args.applicants):
+            for Sent in Events(Index):
+                Samples.extend(Bench_Common.TimeCalls(lambda: handler.CreateCandidate(Sent, None), 1))
+        return Samples
+
+    def Concurrent() -> List[float]:
+        Samples: List[float] = []
+        Lock = threading.Lock()
+
+        def Send(Sent: Dict[str, Any]) -> None:
+            Latency = Bench_Common.TimeCalls(lambda: handler.CreateCandidate(Sent, None), 1)
+            with Lock:
+                Samples.extend(Latency)
+
+        for Index in range(Args.applicants // 4 or 1):
+            Sent = Event(Applicant("burst", Index), f"burst-{Run}-{Index}")
+            Threads = [threading.Thread(target=Send, args=(Sent,)) for _ in range(Args.burst)]
+            for Thread in Threads:
+                Thread.start()
+            for Thread in Threads:
+                Thread.join()
+        return Samples
+
+    Patterns = (
+        ("retries", lambda: Sequential(Retries), Args.applicants),
+        ("concurrent", Concurrent, Args.applicants // 4 or 1),
+        ("reapply", lambda: Sequential(Reapply), Args.applicants),
+    )
+    for Pattern, Call, Applicants in Patterns:
+        print(f"\n-- {Pattern} --")
+        for Label, Env, MockTtl in MODES:
+            os.environ.update(Env)
+            Mock.IDEMPOTENCY.ttl = MockTtl
+            Run += 1
+            Candidates = len(Mock.CANDIDATES)
+            Calls = QUOTA_METER.Snapshot()["upstream_calls"]
+            Samples = Call()
+            Created = len(Mock.CANDIDATES) - Candidates
+            Bench_Common.PrintRow(Label, Bench_Common.Summarize(Samples))
+            print(
+                f"{'':<28} candidates created={Created} duplicates={Created - Applicants} "
+                f"upstream calls/request={(QUOTA_METER.Snapshot()['upstream_calls'] - Calls) / len(Samples):.2f}"
+            )
+
+
+if __name__ == "__main__":
+    Start = time.perf_counter()
+    Main()
+    print(f"\nDone In {time.perf_counter() - Start:.1f}s")
@@ -0,0 +1,322 @@
+"""
+Load Benchmark: Serverless Handlers Against A Seeded Mock-ATS
+
+Seeds Mock-ATS With Synthetic Data (See Synthetic_Data.py), Then Drives
+Each Handler In-Process With API Gateway Proxy Events, Two Ways:
+
+- closed:  --concurrency Callers, Each Sending Its Next Request As Soon As
+           The Last One Answers, For --duration Seconds. Measures Capacity
+- open:    Requests Arrive On A Schedule (Poisson At --rate Per Second)
+           Whether Or Not Earlier Ones Finished, Each Timed From Its
+           Scheduled Arrival, So Queueing Shows Up In The Tail Instead Of
+           Being Hidden By A Caller That Waited. --rate auto Offers Half
+           The Closed-Loop Throughput Of The Same Handler
+
+Scenarios: GetJobs / GetCandidates (A Random Page), GetApplications (A
+Random Job, Skewed Toward Busy Ones), CreateCandidate (A New Applicant)
+And CreateApplication (A Random Candidate And Job). The Response Cache Is
+Off Unless --cache on, So Every Read Reaches The Upstream; --faults Loads
+A Mock Fault Plan (Seeded Latency Tails, Errors, Resets) Before The Run. Requests And
+Data Come From Seeded Generators, So Two Runs Send The Same Traffic.
+
+Each Row Reports p50/p95/p99 Latency, Throughput, Errors (An Unexpected
+Status) And RSS After The Row. --output Writes The Report As JSON;
+--save-baseline Stores It And --baseline Compares Against One, Exiting 1
+When Latency Or RSS Grew, Or Throughput Fell, By More Than --tolerance
+(Plus --slack-ms / --slack-mb, To Ride Out Noise).
+
+Usage:
+    python Benchmarks/Load_Benchmark.py [--jobs 10000] [--candidates 10000] [--applications 30000] [--duration 5]
+        [--concurrency 8] [--rate auto] [--handlers GetJobs,CreateCandidate] [--modes closed,open]
+        [--save-baseline load.json] [--baseline load.json --tolerance 0.3]
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import math
+import os
+import platform
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
+import Bench_Common
+import Synthetic_Data
+
+PER_PAGE = 20
+# Report Fields Compared Against A Baseline, And Which Direction Is Worse
+HIGHER_IS_WORSE = ("p50_ms", "p95_ms", "p99_ms")
+LOWER_IS_WORSE = ("throughput_rps",)
+
+EventFactory = Callable[[random.Random], Dict[str, Any]]
+
+
+def Scenarios(Counts: Dict[str, int]) -> Dict[str, Tuple[int, EventFactory]]:
+    """
+    Handler Name -> (Expected Status, Event Factory).
+    """
+    Jobs, Candidates = max(1, Counts["jobs"]), max(1, Counts["candidates"])
+    Applicants = itertools.count(1)
+
+    def Page(Records: int) -> Callable[[random.Random], Dict[str, str]]:
+        Pages = max(1, math.ceil(Records / PER_PAGE))
+        return lambda Random: {"page": str(Random.randint(1, Pages)), "per_page": str(PER_PAGE)}
+
+    JobsPage, CandidatesPage = Page(Jobs), Page(Candidates)
+
+    def NewApplicant(Random: random.Random) -> Dict[str, Any]:
+        Index = next(Applicants)
+        return Bench_Common.ApiEvent(
+            "POST",
+            "/candidates",
+            Body={"name": f"Load Applicant{Index}", "email": f"load.{Index}@example.com", "phone": f"+1666{Index:07d}", "job_id": str(Random.randint(1, Jobs))},
+        )
+
+    return {
+        "GetJobs": (200, lambda Random: Bench_Common.ApiEvent("GET", "/jobs", JobsPage(Random))),
+        "GetCandidates": (200, lambda Random: Bench_Common.ApiEvent("GET", "/candidates", CandidatesPage(Random))),
+        "GetApplications": (
+            200,
+            lambda Random: Bench_Common.ApiEvent("GET", "/applications", {"job_id": str(1 + int(Random.random() ** 2 * Jobs)), "per_page": str(PER_PAGE)}),
+        ),
+        "CreateCandidate": (201, NewApplicant),
+        "CreateApplication": (
+            201,
+            lambda Random: Bench_Common.ApiEvent(
+                "POST", "/applications", Body={"candidate_id": str(Random.randint(1, Candidates)), "job_id": str(Random.randint(1, Jobs))}
+            ),
+        ),
+    }
+
+
+# -----------------------
+# Load Generators
+# -----------------------
+def ClosedLoop(Invoke: Callable[[Dict[str, Any]], bool], MakeEvent: EventFactory, Concurrency: int, Duration: float, Seed: int) -> Tuple[List[float], int, float]:
+    """
+    (Latencies Ms, Errors, Elapsed Seconds) Of Concurrency Callers Looping For Duration.
+    """
+    Samples: List[List[float]] = [[] for _ in range(Concurrency)]
+    Errors = [0] * Concurrency
+    Start = time.perf_counter()
+    Stop = Start + Duration
+
+    def Caller(Slot: int) -> None:
+        Random = random.Random(Seed * 1000 + Slot)
+        while time.perf_counter() < Stop:
+            Event = MakeEvent(Random)
+            Begin = time.perf_counter()
+            Ok = Invoke(Event)
+            Samples[Slot].append((time.perf_counter() - Begin) * 1000)
+            Errors[Slot] += not Ok
+
+    Threads = [threading.Thread(target=Caller, args=(Slot,)) for Slot in range(Concurrency)]
+    for Thread in Threads:
+        Thread.start()
+    for Thread in Threads:
+        Thread.join()
+    return [Sample for Slot in Samples for Sample in Slot], sum(Errors), time.perf_counter() - Start
+
+
+def OpenLoop(
+    Invoke: Callable[[Dict[str, Any]], bool],
+    MakeEvent: EventFactory,
+    Rate: float,
+    Duration: float,
+    Workers: int,
+    Seed: int,
+    Poisson: bool = True,
+) -> Tuple[List[float], int, float]:
+    """
+    (Latencies Ms, Errors, Elapsed Seconds) Of Requests Arriving At Rate Per
+    Second For Duration. Latency Runs From The Scheduled Arrival, So Time
+    Spent Waiting For A Free Worker Counts.
+    """
+    Random = random.Random(Seed)
+    Samples: List[float] = []
+    Errors = [0]
+    Lock = threading.Lock()
+
+    def Run(Due: float, Event: Dict[str, Any]) -> None:
+        Ok = Invoke(Event)
+        Latency = (time.perf_counter() - Due) * 1000
+        with Lock:
+            Samples.append(Latency)
+            Errors[0] += not Ok
+
+    Start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=Workers, thread_name_prefix="OpenLoop") as Pool:
+        Due, End = Start, Start + Duration
+        while Due < End:
+            Delay = Due - time.perf_counter()
+            if Delay > 0:
+                time.sleep(Delay)
+            Pool.submit(Run, Due, MakeEvent(Random))
+            Due += Random.expovariate(Rate) if Poisson else 1 / Rate
+    return Samples, Errors[0], time.perf_counter() - Start
+
+
+# -----------------------
+# Report And Baseline
+# -----------------------
+def Row(Samples: List[float], Errors: int, Elapsed: float, RssBefore: float) -> Dict[str, Any]:
+    Stats: Dict[str, Any] = dict(Bench_Common.Summarize(Samples)) if Samples else {"count": 0}
+    Rss = Bench_Common.RssMb()
+    Stats.update(
+        throughput_rps=round(len(Samples) / Elapsed, 1) if Elapsed > 0 else 0.0,
+        errors=Errors,
+        rss_mb=round(Rss, 1),
+        rss_growth_mb=round(Rss - RssBefore, 1),
+    )
+    return Stats
+
+
+def PrintLoadRow(Label: str, Stats: Dict[str, Any]) -> None:
+    if not Stats["count"]:
+        print(f"{Label:<28} No Requests Completed")
+        return
+    Bench_Common.PrintRow(Label, Stats)
+    Offered = f" offered={Stats['offered_rps']:.1f}/s" if "offered_rps" in Stats else ""
+    print(f"{'':<28} throughput={Stats['throughput_rps']:.1f}/s{Offered} errors={Stats['errors']} rss={Stats['rss_mb']:.1f}MB ({Stats['rss_growth_mb']:+.1f})")
+
+
+def Regressions(Report: Dict[str, Any], Baseline: Dict[str, Any], Tolerance: float, SlackMs: float, SlackMb: float) -> List[str]:
+    Found: List[str] = []
+    for Label, Before in sorted(Baseline.get("scenarios", {}).items()):
+        Now = Report["scenarios"].get(Label)
+        if not Now or not Now.get("count") or not Before.get("count"):
+            continue
+        for Field in HIGHER_IS_WORSE:
+            if Now[Field] > Before[Field] * (1 + Tolerance) + SlackMs:
+                Found.append(f"{Label} {Field}: {Now[Field]:.2f} Vs {Before[Field]:.2f}")
+        for Field in LOWER_IS_WORSE:
+            if Now[Field] < Before[Field] * (1 - Tolerance):
+                Found.append(f"{Label} {Field}: {Now[Field]:.1f} Vs {Before[Field]:.1f}")
+        if Now["rss_mb"] > Before["rss_mb"] * (1 + Tolerance) + SlackMb:
+            Found.append(f"{Label} rss_mb: {Now['rss_mb']:.1f} Vs {Before['rss_mb']:.1f}")
+    if Found and Report["meta"]["records"] != Baseline.get("meta", {}).get("records"):
+        Found.append(f"(Baseline Was Seeded With {Baseline.get('meta', {}).get('records')}, This Run With {Report['meta']['records']})")
+    return Found
+
+
+def Main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    Parser.add_argument("--jobs", type=int, default=10000)
+    Parser.add_argument("--candidates", type=int, default=10000)
+    Parser.add_argument("--applications", type=int, default=30000)
+    Parser.add_argument("--seed", type=int, default=1)
+    Parser.add_argument("--handlers", default="GetJobs,GetCandidates,GetApplications,CreateCandidate,CreateApplication")
+    Parser.add_argument("--modes", default="closed,open")
+    Parser.add_argument("--duration", type=float, default=5.0, help="Seconds Per Row")
+    Parser.add_argument("--warmup", type=float, default=1.0, help="Unrecorded Seconds Before Each Handler")
+    Parser.add_argument("--concurrency", type=int, default=8)
+    Parser.add_argument("--rate", default="auto", help="Open-Loop Requests Per Second, Or auto")
+    Parser.add_argument("--arrivals", choices=("poisson", "uniform"), default="poisson")
+    Parser.add_argument("--open-workers", type=int, default=32)
+    Parser.add_argument("--cache", choices=("on", "off"), default="off")
+    Parser.add_argument("--upstream-ms", type=float, default=0.0, help="Added Mock Latency Per Upstream Call")
+    Parser.add_argument("--faults", help="Mock Fault Plan (JSON File Or Inline), See Mock-ATS/Mock_Faults.py")
+    Parser.add_argument("--output", help="Write This Run's Report Here")
+    Parser.add_argument("--baseline", help="Compare Against This Baseline File")
+    Parser.add_argument("--save-baseline", help="Write This Run's Report As The Baseline")
+    Parser.add_argument("--tolerance", type=float, default=0.3)
+    Parser.add_argument("--slack-ms", type=float, default=2.0)
+    Parser.add_argument("--slack-mb", type=float, default=32.0)
+    Args = Parser.parse_args()
+
+    Modes = [Mode.strip() for Mode in Args.modes.split(",") if Mode.strip()]
+    os.environ["AtsTraceEnabled"] = "false"
+    os.environ["AtsCacheEnabled"] = "true" if Args.cache == "on" else "false"
+    os.environ["AtsPoolSize"] = str(max(Args.concurrency, Args.open_workers))
+    # Every Applicant Is New; Keep The Email Index From Growing Across The Run
+    os.environ["AtsCandidateDedup"] = "false"
+    BaseUrl = Bench_Common.StartMockServer()
+    Mock = sys.modules["Mock_Server"]
+
+    Seeded = time.perf_counter()
+    Counts = Synthetic_Data.SeedMock(Mock, Args.jobs, Args.candidates, Args.applications, Args.seed)
+    Seeded = time.perf_counter() - Seeded
+    if Args.upstream_ms > 0:
+        Mock.SLOW_RATE, Mock.SLOW_MS = 1.0, Args.upstream_ms
+    if Args.faults:
+        Mock.FAULTS.configure(Mock.load_plan(Args.faults))
+    import handler
+
+    logging.disable(logging.INFO)
+    print(f"Mock-ATS At {BaseUrl}, Seeded {Counts} In {Seeded:.1f}s, RSS {Bench_Common.RssMb():.1f}MB")
+
+    Report: Dict[str, Any] = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "records": Counts,
+            "seed": Args.seed,
+            "cache": Args.cache,
+            "upstream_ms": Args.upstream_ms,
+            "faults": Mock.FAULTS.snapshot()["routes"] if Args.faults else None,
+            "duration": Args.duration,
+            "concurrency": Args.concurrency,
+            "arrivals": Args.arrivals,
+        },
+        "scenarios": {},
+    }
+
+    Table = Scenarios(Counts)
+    for Name in [Name.strip() for Name in Args.handlers.split(",") if Name.strip()]:
+        if Name not in Table:
+            raise SystemExit(f"Unknown Handler {Name}; Choose From {', '.join(Table)}")
+        Expected, MakeEvent = Table[Name]
+        Func = getattr(handler, Name)
+
+        def Invoke(Event: Dict[str, Any]) -> bool:
+            try:
+                return Func(Event, None).get("statusCode") == Expected
+            except Exception:
+                return False
+
+        print(f"\n-- {Name} --")
+        ClosedLoop(Invoke, MakeEvent, Args.concurrency, Args.warmup, Args.seed + 1)
+        Closed: Dict[str, Any] = {}
+        if "closed" in Modes or Args.rate == "auto":
+            RssBefore = Bench_Common.RssMb()
+            Closed = Row(*ClosedLoop(Invoke, MakeEvent, Args.concurrency, Args.duration, Args.seed), RssBefore)
+            if "closed" in Modes:
+                Report["scenarios"][f"{Name}/closed"] = Closed
+                PrintLoadRow(f"closed x{Args.concurrency}", Closed)
+
+        if "open" in Modes:
+            Rate = max(1.0, Closed.get("throughput_rps", 0) / 2) if Args.rate == "auto" else float(Args.rate)
+            RssBefore = Bench_Common.RssMb()
+            Open = Row(*OpenLoop(Invoke, MakeEvent, Rate, Args.duration, Args.open_workers, Args.seed, Args.arrivals == "poisson"), RssBefore)
+            Open["offered_rps"] = round(Rate, 1)
+            Report["scenarios"][f"{Name}/open"] = Open
+            PrintLoadRow(f"open @{Rate:.0f}/s", Open)
+
+    Report["meta"]["max_rss_mb"] = round(Bench_Common.MaxRssMb(), 1)
+    print(f"\nPeak RSS {Report['meta']['max_rss_mb']:.1f}MB")
+    for Path in (Args.output, Args.save_baseline):
+        if Path:
+            with open(Path, "w") as Handle:
+                json.dump(Report, Handle, indent=2, sort_keys=True)
+            print(f"Report Written To {Path}")
+
+    if Args.baseline:
+        with open(Args.baseline) as Handle:
+            Baseline = json.load(Handle)
+        Found = Regressions(Report, Baseline, Args.tolerance, Args.slack_ms, Args.slack_mb)
+        print(f"\nAgainst {Args.baseline} (Tolerance {Args.tolerance:.0%} + {Args.slack_ms}ms / {Args.slack_mb}MB):")
+        for Line in Found or ["No Regressions"]:
+            print(f"  {Line}")
+        if Found:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    Start = time.perf_counter()
+    Main()
+    print(f"\nDone In {time.perf_counter() - Start:.1f}s")
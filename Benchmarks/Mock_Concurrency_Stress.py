@@ -0,0 +1,117 @@
+"""
+Mock-ATS Concurrency Stress Test
+
+Starts Mock_Server.py As A Subprocess (Optionally With Several Worker
+Processes On The Sqlite Backend), Fires Concurrent POST /candidates And
+POST /applications, Then Checks That:
+
+- Every Returned id Is Unique
+- Every Write Is Visible Afterwards (No Lost Writes)
+
+Exits Non-Zero On Any Duplicate Or Missing Record.
+
+Usage:
+    python Benchmarks/Mock_Concurrency_Stress.py [--backend sqlite --workers 4] [--requests 2000] [--threads 64]
+"""
+
+import argparse
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+import Bench_Common
+
+
+def FreePort() -> int:
+    with socket.socket() as Sock:
+        Sock.bind(("127.0.0.1", 0))
+        return Sock.getsockname()[1]
+
+
+def WaitForServer(BaseUrl: str, Headers: dict, Timeout: float = 15) -> None:
+    Deadline = time.time() + Timeout
+    while time.time() < Deadline:
+        try:
+            requests.get(f"{BaseUrl}/offers", headers=Headers, timeout=1)
+            return
+        except requests.ConnectionError:
+            time.sleep(0.1)
+    raise RuntimeError("Mock-ATS Did Not Start")
+
+
+def Main() -> int:
+    Parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    Parser.add_argument("--backend", choices=("memory", "sqlite"), default="memory")
+    Parser.add_argument("--workers", type=int, default=1)
+    Parser.add_argument("--requests", type=int, default=2000)
+    Parser.add_argument("--threads", type=int, default=64)
+    Args = Parser.parse_args()
+
+    DataDir = tempfile.mkdtemp(prefix="mock-ats-stress-")
+    for FileName in ("Jobs.json", "Candidates.json", "Applications.json"):
+        shutil.copy(os.path.join(Bench_Common.MOCK_DIR, FileName), DataDir)
+
+    Port = FreePort()
+    BaseUrl = f"http://127.0.0.1:{Port}"
+    Headers = {"Authorization": f"Bearer {Bench_Common.API_KEY}"}
+    Env = dict(os.environ, MOCK_ATS_BACKEND=Args.backend)
+    Server = subprocess.Popen(
+        [sys.executable, os.path.join(Bench_Common.MOCK_DIR, "Mock_Server.py"), "--port", str(Port), "--workers", str(Args.workers)],
+        cwd=DataDir,
+        env=Env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    try:
+        WaitForServer(BaseUrl, Headers)
+        Session = requests.Session()
+        Session.headers.update(Headers)
+        Session.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=Args.threads))
+        Before = len(Session.get(f"{BaseUrl}/candidates", params={"per_page": 10**9}).json()["data"])
+
+        def CreatePair(Index: int):
+            Candidate = Session.post(f"{BaseUrl}/candidates", json={"first_name": "Stress", "last_name": str(Index)}).json()
+            Application = Session.post(f"{BaseUrl}/applications", json={"candidate_id": Candidate["id"], "job_id": Index % 8 + 1}).json()
+            return Candidate["id"], Application["id"]
+
+        Start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=Args.threads) as Executor:
+            Results = list(Executor.map(CreatePair, range(Args.requests)))
+        Elapsed = time.perf_counter() - Start
+
+        CandidateIds = [CandidateId for CandidateId, _ in Results]
+        ApplicationIds = [ApplicationId for _, ApplicationId in Results]
+        After = len(Session.get(f"{BaseUrl}/candidates", params={"per_page": 10**9}).json()["data"])
+
+        Failures = []
+        if len(set(CandidateIds)) != len(CandidateIds):
+            Failures.append(f"{len(CandidateIds) - len(set(CandidateIds))} Duplicate Candidate ids")
+        if len(set(ApplicationIds)) != len(ApplicationIds):
+            Failures.append(f"{len(ApplicationIds) - len(set(ApplicationIds))} Duplicate Application ids")
+        if After - Before != Args.requests:
+            Failures.append(f"Expected {Args.requests} New Candidates, Found {After - Before}")
+
+        print(
+            f"backend={Args.backend} workers={Args.workers} threads={Args.threads} "
+            f"pairs={Args.requests} elapsed={Elapsed:.2f}s rate={2 * Args.requests / Elapsed:.0f} writes/s"
+        )
+        for Failure in Failures:
+            print(f"FAIL: {Failure}")
+        if not Failures:
+            print("OK: All ids Unique, No Lost Writes")
+        return 1 if Failures else 0
+    finally:
+        Server.terminate()
+        Server.wait()
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
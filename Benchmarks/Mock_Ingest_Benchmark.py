@@ -0,0 +1,62 @@
+"""
+Mock-ATS Ingest Throughput: Full-File Rewrite Vs Write-Behind Journal
+
+Seeds The Candidate Collection, Then POSTs Candidates Through The Flask Test
+Client (No Network) In Two Modes:
+
+- rewrite: The Previous Behavior, Re-Dumping The Whole Candidates File (indent=2) After Every Insert
+- journal: The Current Behavior, Buffered Appends To Candidates.journal.jsonl
+
+Usage:
+    python Benchmarks/Mock_Ingest_Benchmark.py [--seed 10000] [--posts 500]
+"""
+
+import argparse
+import json
+import time
+
+import Bench_Common
+
+
+def Main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    Parser.add_argument("--seed", type=int, default=10000)
+    Parser.add_argument("--posts", type=int, default=500)
+    Args = Parser.parse_args()
+
+    Mock_Server = Bench_Common.ImportMockServer()
+    Client = Mock_Server.app.test_client()
+    Headers = {"Authorization": f"Bearer {Bench_Common.API_KEY}"}
+    Journal = Mock_Server.CANDIDATES_JOURNAL
+    JournalAppend = Journal.append
+
+    def LegacyAppend(Record):
+        with open(Mock_Server.CANDIDATES_FILE, "w") as File:
+            json.dump(Mock_Server.CANDIDATES.records(), File, indent=2)
+
+    print(f"Seeded Candidates: {Args.seed}, Posts Per Mode: {Args.posts}")
+    for Mode, Append in (("rewrite", LegacyAppend), ("journal", JournalAppend)):
+        Mock_Server.CANDIDATES.load(
+            [
+                {"id": Index, "first_name": "Seed", "last_name": str(Index), "emails": [], "phones": [], "cv_url": None}
+                for Index in range(1, Args.seed + 1)
+            ]
+        )
+        Journal.compact()
+        Journal.append = Append
+
+        Start = time.perf_counter()
+        for Index in range(Args.posts):
+            Client.post(
+                "/candidates",
+                headers=Headers,
+                json={"first_name": "Bench", "last_name": str(Index), "emails": [{"value": f"b{Index}@example.com"}]},
+            )
+        Journal.append = JournalAppend
+        Journal.flush()
+        Elapsed = time.perf_counter() - Start
+        print(f"{Mode:<8} elapsed={Elapsed:.2f}s rate={Args.posts / Elapsed:,.0f} inserts/s")
+
+
+if __name__ == "__main__":
+    Main()
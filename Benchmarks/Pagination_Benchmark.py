@@ -0,0 +1,175 @@
+"""
+Deep Pagination Benchmark: Page Offsets Vs Keyset Cursors
+
+Loads --records Synthetic Jobs And Measures Reading One --per-page Page At
+Increasing Depths Into The Listing, Plain And Filtered (status=open):
+
+- store:   Mock_Store Directly, Memory And Sqlite Backends; page() / query()
+           With An Offset Vs page_after() / query(after=...) From The Last id
+- mock:    GET /offers?page=<n> Vs GET /offers?cursor=<token> Over HTTP
+- gateway: Walking A Filtered Listing Through GetJobs With all=true And
+           next_cursor, Upstream page= Vs Upstream Keyset (AtsPushDown cursor)
+
+Usage:
+    python Benchmarks/Pagination_Benchmark.py [--records 50000] [--per-page 20] [--iterations 50]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+import requests
+
+import Bench_Common
+
+DEPTHS = (0.0, 0.5, 0.99)
+
+
+def MakeJobs(Count: int, UpdatedAt: str) -> List[Dict[str, Any]]:
+    Random = random.Random(16)
+    return [
+        {
+            "id": Index,
+            "title": f"Engineer {Index}",
+            "location": Random.choice(["Remote", "Berlin", "Paris"]),
+            "status": Random.choice(["open", "closed", "draft"]),
+            "url": f"https://example.com/{Index}",
+            "updated_at": UpdatedAt,
+        }
+        for Index in range(1, Count + 1)
+    ]
+
+
+def Row(Label: str, Iterations: int, Call: Callable[[], Any]) -> None:
+    Bench_Common.PrintRow(Label, Bench_Common.Summarize(Bench_Common.TimeCalls(Call, Iterations)))
+
+
+def StoreBench(Mock: Any, Jobs: List[Dict[str, Any]], Args: argparse.Namespace) -> None:
+    import Mock_Store
+
+    SqlitePath = os.path.join(tempfile.mkdtemp(prefix="mock-ats-"), "bench.sqlite")
+    Stores = {
+        "memory": Mock_Store.Collection(index_fields=("status", "location")),
+        "sqlite": Mock_Store.SqliteCollection(SqlitePath, "jobs", index_fields=("status", "location")),
+    }
+    Open = [Job for Job in Jobs if Job["status"] == "open"]
+    Filters = {"location": ["remote", "berlin", "paris"], "status": ["open"]}
+
+    for Backend, Store in Stores.items():
+        Store.load(Jobs)
+        print(f"\n-- store: {Backend} --")
+        for Depth in DEPTHS:
+            Start = int(len(Jobs) * Depth)
+            After = Jobs[Start - 1]["id"] if Start else None
+            End = Start + Args.per_page
+            Row(f"page offset @ {Depth:.0%}", Args.iterations, lambda: Store.page(Start, End))
+            Row(f"page_after  @ {Depth:.0%}", Args.iterations, lambda: Store.page_after(After, Args.per_page))
+            Assert(Store.page(Start, End) == Store.page_after(After, Args.per_page), Backend, "page")
+
+            FilteredStart = int(len(Open) * Depth)
+            FilteredAfter = ([], Open[FilteredStart - 1]["id"]) if FilteredStart else None
+            FilteredEnd = FilteredStart + Args.per_page
+            Row(f"filtered offset @ {Depth:.0%}", Args.iterations, lambda: Store.query(FilteredStart, FilteredEnd, dict(Filters)))
+            Row(f"filtered after  @ {Depth:.0%}", Args.iterations, lambda: Store.query(0, Args.per_page, dict(Filters), after=FilteredAfter))
+            Assert(
+                Store.query(FilteredStart, FilteredEnd, dict(Filters)) == Store.query(0, Args.per_page, dict(Filters), after=FilteredAfter),
+                Backend,
+                "query",
+            )
+
+
+def Assert(Same: bool, Backend: str, What: str) -> None:
+    if not Same:
+        raise SystemExit(f"{Backend} {What}: Offset And Keyset Pages Differ")
+
+
+def MockBench(BaseUrl: str, Jobs: List[Dict[str, Any]], Args: argparse.Namespace) -> None:
+    Session = requests.Session()
+    Session.headers["Authorization"] = f"Bearer {Bench_Common.API_KEY}"
+    Url = f"{BaseUrl}/offers"
+
+    # Collect A Cursor At Each Depth With Big Pages (per_page Is Not Part Of A Cursor's Scope)
+    Stride = 1000
+    Cursors: Dict[int, str] = {0: ""}
+    Cursor, Offset = "", 0
+    while True:
+        Body = Session.get(Url, params={"status": "open", "cursor": Cursor, "per_page": Stride}).json()
+        Offset += len(Body["data"])
+        Cursor = Body.get("next_cursor")
+        if not Cursor:
+            break
+        Cursors[Offset] = Cursor
+    Total = Offset
+
+    print(f"\n-- mock over HTTP (status=open, {Total} Matches) --")
+    for Depth in DEPTHS:
+        Offset = max(Position for Position in Cursors if Position <= Total * Depth)
+        Page = Offset // Args.per_page + 1
+        Paged = {"status": "open", "page": Page, "per_page": Args.per_page}
+        Keyed = {"status": "open", "cursor": Cursors[Offset], "per_page": Args.per_page}
+        Row(f"page={Page}", Args.iterations, lambda: Session.get(Url, params=Paged).raise_for_status())
+        Row(f"cursor @ {Offset}", Args.iterations, lambda: Session.get(Url, params=Keyed).raise_for_status())
+        Assert(Session.get(Url, params=Paged).json()["data"] == Session.get(Url, params=Keyed).json()["data"], "mock", "listing")
+
+
+def GatewayBench(Args: argparse.Namespace) -> None:
+    import handler
+    from ats_ratelimit import QUOTA_METER
+
+    print(f"\n-- gateway: all=true walk of status=OPEN, limit={Args.gateway_limit} Per Response --")
+    Walks = {}
+    for Label, PushDown in (("upstream page=", "jobs=status"), ("upstream keyset", "jobs=cursor|status")):
+        os.environ["AtsPushDown"] = PushDown
+        Calls = QUOTA_METER.Snapshot()["upstream_calls"]
+        Ids: List[str] = []
+        Samples: List[float] = []
+        Params = {"status": "open", "all": "true", "limit": str(Args.gateway_limit)}
+        while True:
+            Start = time.perf_counter()
+            Body = json.loads(handler.GetJobs({"queryStringParameters": Params}, None)["body"])
+            Samples.append((time.perf_counter() - Start) * 1000)
+            Ids.extend(Job["id"] for Job in Body["jobs"])
+            if not Body["next_cursor"]:
+                break
+            Params = {"status": "open", "cursor": Body["next_cursor"], "limit": str(Args.gateway_limit)}
+        Bench_Common.PrintRow(f"{Label} (per response)", Bench_Common.Summarize(Samples))
+        print(
+            f"{'':<28} responses={len(Samples)} walk={sum(Samples) / 1000:.2f}s "
+            f"upstream calls={QUOTA_METER.Snapshot()['upstream_calls'] - Calls}"
+        )
+        Walks[Label] = Ids
+    print(f"\nSame Records Both Ways: {len(set(map(tuple, Walks.values()))) == 1}")
+
+
+def Main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    Parser.add_argument("--records", type=int, default=50000)
+    Parser.add_argument("--per-page", type=int, default=20)
+    Parser.add_argument("--iterations", type=int, default=50)
+    Parser.add_argument("--gateway-limit", type=int, default=1000)
+    Args = Parser.parse_args()
+
+    os.environ["AtsCacheEnabled"] = "false"
+    os.environ["AtsQueryPageSize"] = "100"
+    BaseUrl = Bench_Common.StartMockServer()
+    Mock = sys.modules["Mock_Server"]
+    Jobs = MakeJobs(Args.records, Mock.now_stamp())
+    Mock.JOBS.load([dict(Job) for Job in Jobs])
+    logging.disable(logging.INFO)
+    print(f"Mock-ATS At {BaseUrl}, {Args.records} Jobs, per_page={Args.per_page}")
+
+    StoreBench(Mock, Jobs, Args)
+    MockBench(BaseUrl, Jobs, Args)
+    GatewayBench(Args)
+
+
+if __name__ == "__main__":
+    Start = time.perf_counter()
+    Main()
+    print(f"\nDone In {time.perf_counter() - Start:.1f}s")
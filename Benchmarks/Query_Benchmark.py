@@ -0,0 +1,120 @@
+"""
+Filter Push-Down Benchmark Against Mock-ATS
+
+Loads --records Synthetic Jobs Into Mock-ATS And Asks For One Page Of A
+Selective Listing (status=DRAFT&location=Berlin&q=python) Three Ways:
+
+- client:    The Old Way; Fetch Every Job With all=true And Filter Client-Side
+- local:     The Query Params, With AtsPushDown Empty (Streaming Filter Stage)
+- push-down: The Query Params, With Every Filter Pushed To Mock-ATS
+
+Reports Latency Percentiles, Upstream Calls And Response Bytes Per Request
+(Response Cache Off, So Every Request Reaches The Upstream).
+
+Usage:
+    python Benchmarks/Query_Benchmark.py [--records 5000] [--iterations 50] [--per-page 20]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import Bench_Common
+
+QUERY = {"status": "DRAFT", "location": "Berlin", "q": "python"}
+MOCK_PUSH_DOWN = "jobs=status|location|q|sort:id|sort:title|sort:location"
+
+
+def Run(Label: str, Iterations: int, Call: Callable[[], Tuple[List[Dict[str, Any]], int]]) -> List[Dict[str, Any]]:
+    """
+    Time Call, Which Returns (Jobs, Response Bytes), And Print Its Cost.
+    """
+    from ats_ratelimit import QUOTA_METER
+
+    Sizes: List[int] = []
+    Jobs: List[Dict[str, Any]] = []
+
+    def Timed() -> None:
+        Page, Size = Call()
+        Jobs[:] = Page
+        Sizes.append(Size)
+
+    Calls = QUOTA_METER.Snapshot()["upstream_calls"]
+    Samples = Bench_Common.TimeCalls(Timed, Iterations)
+    Bench_Common.PrintRow(Label, Bench_Common.Summarize(Samples))
+    print(
+        f"{'':<28} upstream calls/request={(QUOTA_METER.Snapshot()['upstream_calls'] - Calls) / Iterations:.1f} "
+        f"response bytes/request={sum(Sizes) / len(Sizes):,.0f}"
+    )
+    return Jobs
+
+
+def Main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    Parser.add_argument("--records", type=int, default=5000)
+    Parser.add_argument("--iterations", type=int, default=50)
+    Parser.add_argument("--per-page", type=int, default=20)
+    Args = Parser.parse_args()
+
+    os.environ["AtsCacheEnabled"] = "false"
+    os.environ["AtsStreamMaxItems"] = str(Args.records)
+    os.environ["AtsStreamMaxBytes"] = str(256 * 1024 * 1024)
+    BaseUrl = Bench_Common.StartMockServer()
+    Mock = sys.modules["Mock_Server"]
+    Random = random.Random(11)
+    Mock.JOBS.load(
+        [
+            {
+                "id": Index,
+                "title": f"{Random.choice(['Senior', 'Junior', 'Staff'])} {Random.choice(['Python', 'Go', 'Data', 'Java'])} Engineer",
+                "location": Random.choice(["Remote", "Berlin", "Paris", "London", "New York"]),
+                "status": Random.choice(["open", "published", "closed", "draft"]),
+                "url": f"https://example.com/{Index}",
+                "updated_at": Mock.now_stamp(),
+            }
+            for Index in range(1, Args.records + 1)
+        ]
+    )
+    import handler
+
+    logging.disable(logging.INFO)
+    print(f"Mock-ATS At {BaseUrl}, {Args.records} Jobs, Query {QUERY}, per_page={Args.per_page}")
+
+    def Handle(Params: Dict[str, str]) -> Tuple[Dict[str, Any], int]:
+        Body = handler.GetJobs({"queryStringParameters": Params}, None)["body"]
+        return json.loads(Body), len(Body)
+
+    def ClientSide() -> Tuple[List[Dict[str, Any]], int]:
+        Words = QUERY["q"].lower().split()
+        Listing, Size = Handle({"all": "true", "per_page": "100"})
+        Matches = [
+            Job
+            for Job in Listing["jobs"]
+            if Job["status"] == QUERY["status"]
+            and (Job["location"] or "").lower() == QUERY["location"].lower()
+            and all(Word in f"{Job['title']} {Job['location']}".lower() for Word in Words)
+        ]
+        return Matches[: Args.per_page], Size
+
+    def Queried() -> Tuple[List[Dict[str, Any]], int]:
+        Listing, Size = Handle({**QUERY, "per_page": str(Args.per_page)})
+        return Listing["jobs"], Size
+
+    print()
+    Expected = Run("client-side filter", Args.iterations, ClientSide)
+    os.environ["AtsPushDown"] = ""
+    Local = Run("local filter stage", Args.iterations, Queried)
+    os.environ["AtsPushDown"] = MOCK_PUSH_DOWN
+    Pushed = Run("push-down", Args.iterations, Queried)
+    print(f"\nSame Page All Three Ways: {Expected == Local == Pushed} ({len(Expected)} Jobs)")
+
+
+if __name__ == "__main__":
+    Start = time.perf_counter()
+    Main()
+    print(f"\nDone In {time.perf_counter() - Start:.1f}s")
@@ -0,0 +1,86 @@
+"""
+Response Serialization And Compression Benchmark
+
+For Unified Job Listings Of Roughly 1 KB To 5 MB:
+
+- Encode Time Per Available JSON Backend (stdlib, orjson)
+- Compress + Base64 Time And Final Body Size Per Available Encoding
+  (gzip, br), Measured Through CompressResponse As The Handlers Use It
+
+Usage:
+    python Benchmarks/Serialization_Benchmark.py [--sizes 1KB,10KB,100KB,1MB,5MB] [--iterations 20]
+"""
+
+import argparse
+import os
+import time
+from typing import Any, Dict, List
+
+import Bench_Common
+from ats_normalize import UnifyJobs
+import ats_serialize
+
+
+def ParseSize(Text: str) -> int:
+    Text = Text.strip().upper()
+    for Suffix, Scale in (("MB", 1024 * 1024), ("KB", 1024), ("B", 1)):
+        if Text.endswith(Suffix):
+            return int(float(Text[: -len(Suffix)]) * Scale)
+    return int(Text)
+
+
+def BuildListing(TargetBytes: int) -> Dict[str, Any]:
+    """
+    A {"jobs": [...]} Body Of UnifiedRecords Whose Encoding Is About TargetBytes.
+    """
+    Raw: List[Dict[str, Any]] = []
+    Size = 12
+    while Size < TargetBytes:
+        Index = len(Raw)
+        Raw.append(
+            {
+                "id": Index,
+                "title": f"Senior Software Engineer {Index}",
+                "location": ["Pune", "Remote", "New York", "Berlin"][Index % 4],
+                "status": ["open", "draft", "closed"][Index % 3],
+                "apply_url": f"https://careers.example.com/jobs/{Index}?source=unified",
+            }
+        )
+        Size += 150
+    return {"jobs": UnifyJobs(Raw)}
+
+
+def Main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    Parser.add_argument("--sizes", default="1KB,10KB,100KB,1MB,5MB")
+    Parser.add_argument("--iterations", type=int, default=20)
+    Args = Parser.parse_args()
+
+    os.environ["AtsCompressionMinBytes"] = "0"
+    print(f"JSON Backends: {', '.join(ats_serialize.JSON_BACKENDS)}; Encodings: {', '.join(ats_serialize.COMPRESSORS)}")
+    for SizeText in Args.sizes.split(","):
+        Listing = BuildListing(ParseSize(SizeText))
+        Iterations = max(3, Args.iterations if ParseSize(SizeText) < 1024 * 1024 else Args.iterations // 5)
+        print(f"\n-- {SizeText.strip()} ({len(Listing['jobs'])} Jobs) --")
+
+        Body = ""
+        for Backend in ats_serialize.JSON_BACKENDS:
+            os.environ["AtsJsonBackend"] = Backend
+            Samples = Bench_Common.TimeCalls(lambda: ats_serialize.DumpJson(Listing), Iterations)
+            Body = ats_serialize.DumpJson(Listing)
+            Bench_Common.PrintRow(f"encode {Backend} ({len(Body)} B)", Bench_Common.Summarize(Samples))
+
+        for Encoding in ats_serialize.COMPRESSORS:
+            Response = ats_serialize.CompressResponse({"statusCode": 200, "headers": {}, "body": Body}, Encoding)
+            Samples = Bench_Common.TimeCalls(
+                lambda: ats_serialize.CompressResponse({"statusCode": 200, "headers": {}, "body": Body}, Encoding),
+                Iterations,
+            )
+            Ratio = len(Response["body"]) / len(Body)
+            Bench_Common.PrintRow(f"{Encoding}+base64 ({len(Response['body'])} B, {Ratio:.0%})", Bench_Common.Summarize(Samples))
+
+
+if __name__ == "__main__":
+    Start = time.perf_counter()
+    Main()
+    print(f"\nDone In {time.perf_counter() - Start:.1f}s")
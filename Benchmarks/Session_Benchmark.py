@@ -0,0 +1,43 @@
+"""
+Cold Vs Warm Ats Client Latency
+
+Cold: A New AtsClient (And Session) Per Call, Like The Old Per-Invocation Client
+Warm: The Shared Module-Level Client From GetAtsClient(), Reusing Pooled Connections
+
+Usage:
+    python Benchmarks/Session_Benchmark.py [--iterations 500]
+"""
+
+import argparse
+
+import Bench_Common
+
+
+def Main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    Parser.add_argument("--iterations", type=int, default=500)
+    Args = Parser.parse_args()
+
+    BaseUrl = Bench_Common.StartMockServer()
+    import handler
+
+    def ColdCall() -> None:
+        Client = handler.AtsClient()
+        try:
+            Client.GetJobsFromAts(Page=1, PerPage=10)
+        finally:
+            Client.Close()
+
+    def WarmCall() -> None:
+        handler.GetAtsClient().GetJobsFromAts(Page=1, PerPage=10)
+
+    # Prime The Shared Client So Only Steady-State Calls Are Measured
+    WarmCall()
+
+    print(f"Mock-ATS At {BaseUrl}, {Args.iterations} Calls Each")
+    Bench_Common.PrintRow("GetJobsFromAts Cold", Bench_Common.Summarize(Bench_Common.TimeCalls(ColdCall, Args.iterations)))
+    Bench_Common.PrintRow("GetJobsFromAts Warm", Bench_Common.Summarize(Bench_Common.TimeCalls(WarmCall, Args.iterations)))
+
+
+if __name__ == "__main__":
+    Main()
@@ -0,0 +1,130 @@
+"""
+Synthetic Mock-ATS Data
+
+Deterministic Jobs, Candidates And Applications In The Shapes Mock-ATS
+Stores (See Its .json Fixtures), For Load Tests Well Past The Handful Of
+Fixture Records: 10k To 1M Records Build In Seconds. The Same --seed
+Always Produces The Same Records.
+
+- Generate():  The Three Record Lists
+- SeedMock():  Load Them Straight Into A Running Mock_Server's Collections
+- As A Script: Write Jobs.json / Candidates.json / Applications.json Into
+  --out, To Start A Standalone Mock-ATS (Or Several Workers) Against Them
+
+Usage:
+    python Benchmarks/Synthetic_Data.py --out /tmp/mock-data [--jobs 10000] [--candidates 100000] [--applications 300000] [--seed 1]
+    cd /tmp/mock-data && python /path/to/Mock-ATS/Mock_Server.py
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Tuple
+
+TITLES = ("Software Engineer", "Data Scientist", "Product Manager", "Frontend Developer", "Backend Developer", "Designer", "Recruiter", "SRE")
+LEVELS = ("Junior", "", "Senior", "Staff", "Principal")
+LOCATIONS = ("New York", "San Francisco", "Remote", "Austin", "Berlin", "London", "Paris", "Bangalore")
+JOB_STATUSES = (("open", 6), ("draft", 1), ("closed", 2), ("archived", 1))
+APPLICATION_STATUSES = (("applied", 6), ("screening", 3), ("in_review", 2), ("rejected", 3), ("hired", 1))
+FIRST_NAMES = ("John", "Jane", "Bob", "Alice", "Priya", "Chen", "Maria", "Omar", "Yuki", "Lena", "Ravi", "Sofia")
+LAST_NAMES = ("Doe", "Smith", "Johnson", "Brown", "Patel", "Wang", "Garcia", "Hassan", "Tanaka", "Muller", "Rossi", "Silva")
+
+Records = List[Dict[str, Any]]
+
+
+def _Weighted(Choices: Tuple[Tuple[str, int], ...]) -> List[str]:
+    return [Value for Value, Weight in Choices for _ in range(Weight)]
+
+
+def _Stamps(Random: random.Random, Count: int) -> List[str]:
+    # Fixed-Width UTC Stamps Spread Over The Last 90 Days, Like Mock_Server.now_stamp()
+    Now = datetime.now(timezone.utc)
+    return [(Now - timedelta(seconds=Random.randrange(90 * 86400))).strftime("%Y-%m-%dT%H:%M:%S.%fZ") for _ in range(Count)]
+
+
+def Generate(Jobs: int, Candidates: int, Applications: int, Seed: int = 1) -> Tuple[Records, Records, Records]:
+    """
+    (Jobs, Candidates, Applications) With ids 1..N Each. Applications Point At
+    Existing Jobs And Candidates, Skewed So Some Jobs Draw Far More Than Others.
+    """
+    Random = random.Random(Seed)
+    JobStatuses = _Weighted(JOB_STATUSES)
+    ApplicationStatuses = _Weighted(APPLICATION_STATUSES)
+
+    JobRecords = [
+        {
+            "id": Index,
+            "title": " ".join(Part for Part in (Random.choice(LEVELS), Random.choice(TITLES)) if Part),
+            "location": Random.choice(LOCATIONS),
+            "status": Random.choice(JobStatuses),
+            "url": f"https://example.com/job{Index}",
+            "updated_at": Stamp,
+        }
+        for Index, Stamp in enumerate(_Stamps(Random, Jobs), 1)
+    ]
+
+    CandidateRecords = []
+    for Index, Stamp in enumerate(_Stamps(Random, Candidates), 1):
+        First, Last = Random.choice(FIRST_NAMES), Random.choice(LAST_NAMES)
+        CandidateRecords.append(
+            {
+                "id": Index,
+                "first_name": First,
+                "last_name": Last,
+                "emails": [{"value": f"{First.lower()}.{Last.lower()}.{Index}@example.com", "type": "work"}],
+                "phones": [{"value": f"+1555{Index:07d}", "type": "mobile"}],
+                "cv_url": f"https://example.com/cv/{Index}.pdf",
+                "updated_at": Stamp,
+            }
+        )
+
+    ApplicationRecords = [
+        {
+            "id": Index,
+            # Squaring A Uniform Draw Piles Applications Onto The Lower Job ids
+            "candidate_id": Random.randint(1, max(1, Candidates)),
+            "job_id": 1 + int(Random.random() ** 2 * max(1, Jobs)),
+            "status": Random.choice(ApplicationStatuses),
+            "updated_at": Stamp,
+        }
+        for Index, Stamp in enumerate(_Stamps(Random, Applications), 1)
+    ]
+    return JobRecords, CandidateRecords, ApplicationRecords
+
+
+def SeedMock(Mock: Any, Jobs: int, Candidates: int, Applications: int, Seed: int = 1) -> Dict[str, int]:
+    """
+    Replace A Mock_Server Module's Data With Generated Records; Returns The Counts.
+    """
+    JobRecords, CandidateRecords, ApplicationRecords = Generate(Jobs, Candidates, Applications, Seed)
+    Mock.JOBS.load(JobRecords)
+    Mock.CANDIDATES.load(CandidateRecords)
+    Mock.APPLICATIONS.load(ApplicationRecords)
+    return {"jobs": len(JobRecords), "candidates": len(CandidateRecords), "applications": len(ApplicationRecords)}
+
+
+def Main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    Parser.add_argument("--out", required=True, help="Directory For The Three .json Files")
+    Parser.add_argument("--jobs", type=int, default=10000)
+    Parser.add_argument("--candidates", type=int, default=100000)
+    Parser.add_argument("--applications", type=int, default=300000)
+    Parser.add_argument("--seed", type=int, default=1)
+    Args = Parser.parse_args()
+
+    os.makedirs(Args.out, exist_ok=True)
+    Generated = Generate(Args.jobs, Args.candidates, Args.applications, Args.seed)
+    for FileName, Records in zip(("Jobs.json", "Candidates.json", "Applications.json"), Generated):
+        Path = os.path.join(Args.out, FileName)
+        with open(Path, "w") as Handle:
+            json.dump(Records, Handle, separators=(",", ":"))
+        print(f"{Path}: {len(Records)} Records")
+
+
+if __name__ == "__main__":
+    Start = time.perf_counter()
+    Main()
+    print(f"\nDone In {time.perf_counter() - Start:.1f}s")
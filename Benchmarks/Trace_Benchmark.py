@@ -0,0 +1,102 @@
+"""
+Tracing Overhead Benchmark Against Mock-ATS
+
+Runs The Same Handler Calls With Tracing Off, On But Never Sampled
+(AtsTraceSampleRate=0, Spans Still Recorded) And On With Every Trace
+Written (AtsTraceSampleRate=1, Lines Discarded Instead Of Printed):
+
+- GetJobs cache hit:  No Upstream Call, So Tracing Cost Is Most Visible
+- GetJobs live page:  One Upstream GET (Response Cache Off)
+- GetJobs all=true:   --records Jobs Streamed In One Response
+
+Also Prints One Sampled EMF Line So Its Shape Can Be Checked.
+
+Usage:
+    python Benchmarks/Trace_Benchmark.py [--records 2000] [--iterations 300]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import Bench_Common
+
+MODES = (
+    ("off", {"AtsTraceEnabled": "false"}),
+    ("on, rate=0", {"AtsTraceEnabled": "true", "AtsTraceSampleRate": "0"}),
+    ("on, rate=1", {"AtsTraceEnabled": "true", "AtsTraceSampleRate": "1"}),
+)
+
+
+def Compare(Title: str, Iterations: int, Call: Callable[[], Any]) -> None:
+    """
+    Time Call Under Each Mode, Interleaving Rounds So Drift Hits Every Mode Alike.
+    """
+    Samples: Dict[str, List[float]] = {Label: [] for Label, _ in MODES}
+    Rounds = 5
+    for _ in range(Rounds):
+        for Label, Env in MODES:
+            os.environ.update(Env)
+            Samples[Label].extend(Bench_Common.TimeCalls(Call, max(1, Iterations // Rounds)))
+
+    print(f"\n-- {Title} --")
+    Baseline = Bench_Common.Summarize(Samples["off"])
+    for Label, _ in MODES:
+        Stats = Bench_Common.Summarize(Samples[Label])
+        Bench_Common.PrintRow(Label, Stats)
+        if Label != "off":
+            print(f"{'':<28} overhead p50={Stats['p50_ms'] - Baseline['p50_ms']:+.3f}ms ({(Stats['p50_ms'] / Baseline['p50_ms'] - 1) * 100:+.1f}%)")
+
+
+def Main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    Parser.add_argument("--records", type=int, default=2000)
+    Parser.add_argument("--iterations", type=int, default=300)
+    Args = Parser.parse_args()
+
+    os.environ["AtsStreamMaxItems"] = str(Args.records)
+    os.environ["AtsStreamMaxBytes"] = str(256 * 1024 * 1024)
+    BaseUrl = Bench_Common.StartMockServer()
+    Mock = sys.modules["Mock_Server"]
+    Mock.JOBS.load(
+        [
+            {"id": Index, "title": f"Engineer {Index}", "location": "Remote", "status": "open", "url": f"https://example.com/{Index}", "updated_at": Mock.now_stamp()}
+            for Index in range(1, Args.records + 1)
+        ]
+    )
+    import ats_trace
+    import handler
+
+    logging.disable(logging.INFO)
+    Written: List[str] = []
+    ats_trace.SetTraceSink(Written.append)
+    print(f"Mock-ATS At {BaseUrl}, {Args.records} Jobs")
+
+    def Page() -> Dict[str, Any]:
+        return handler.GetJobs({"queryStringParameters": {"page": "1", "per_page": "20"}}, None)
+
+    os.environ["AtsCacheEnabled"] = "true"
+    Page()
+    Compare("GetJobs cache hit (per_page=20)", Args.iterations, Page)
+
+    os.environ["AtsCacheEnabled"] = "false"
+    Compare("GetJobs live page (per_page=20)", Args.iterations, Page)
+    Compare(
+        f"GetJobs all=true ({Args.records} Jobs)",
+        max(10, Args.iterations // 20),
+        lambda: handler.GetJobs({"queryStringParameters": {"all": "true", "per_page": "100"}}, None),
+    )
+
+    Sample = json.loads(Written[-1])
+    Sample["upstream"] = Sample["upstream"][:2] + (["..."] if len(Sample["upstream"]) > 2 else [])
+    print(f"\n{len(Written)} Lines Written. Last One:\n{json.dumps(Sample)}")
+
+
+if __name__ == "__main__":
+    Start = time.perf_counter()
+    Main()
+    print(f"\nDone In {time.perf_counter() - Start:.1f}s")
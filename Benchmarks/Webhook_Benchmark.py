@@ -0,0 +1,113 @@
+"""
+Webhook Read Model Benchmark Against Mock-ATS
+
+One Job With --applications Applications (Seeded, Mixed Statuses). A
+Dashboard Wants The Job's First Page Plus Its Status Counts:
+
+- upstream scan:  GET /applications?job_id=&all=true, Counted Client-Side
+                  (Every Page, Every Time)
+- read model:     GET /applications?job_id= With AtsReadModelEnabled; The
+                  Counts Come From The Model's Counts Table
+
+Then --events Signed application.updated Events Go Through POST
+/webhooks/default In Shuffled Order (Older Updates Arrive Late And Are
+Skipped As stale), A --duplicates Share Of Them Sent Twice, Reporting
+Ingest Latency And That Each Event Id Was Applied Once.
+
+Usage:
+    python Benchmarks/Webhook_Benchmark.py [--applications 2000] [--iterations 50] [--events 2000] [--duplicates 0.2]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Dict, List
+
+import Bench_Common
+import Synthetic_Data
+
+SECRET = "Bench_Webhook_Secret"
+
+
+def Main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    Parser.add_argument("--applications", type=int, default=2000)
+    Parser.add_argument("--iterations", type=int, default=50)
+    Parser.add_argument("--events", type=int, default=2000)
+    Parser.add_argument("--duplicates", type=float, default=0.2)
+    Parser.add_argument("--seed", type=int, default=1)
+    Args = Parser.parse_args()
+
+    Directory = tempfile.mkdtemp(prefix="ats-read-model-")
+    os.environ["AtsTraceEnabled"] = "false"
+    os.environ["AtsCacheEnabled"] = "false"
+    os.environ["AtsStreamMaxItems"] = str(max(5000, Args.applications))
+    os.environ["AtsReadModelPath"] = os.path.join(Directory, "read-model.sqlite")
+    os.environ["AtsWebhookSecret"] = SECRET
+    BaseUrl = Bench_Common.StartMockServer()
+    Mock = sys.modules["Mock_Server"]
+    Synthetic_Data.SeedMock(Mock, 1, max(1, Args.applications // 4), Args.applications, Args.seed)
+    import handler
+    from ats_webhooks import Sign
+
+    logging.disable(logging.WARNING)
+    print(f"Mock-ATS At {BaseUrl}, One Job With {Args.applications} Applications")
+
+    def UpstreamScan() -> Dict[str, int]:
+        os.environ["AtsReadModelEnabled"] = "false"
+        Response = handler.GetApplications({"queryStringParameters": {"job_id": "1", "all": "true"}}, None)
+        return dict(Counter(Record["status"] for Record in json.loads(Response["body"])["applications"]))
+
+    def ReadModel() -> Dict[str, int]:
+        os.environ["AtsReadModelEnabled"] = "true"
+        Response = handler.GetApplications({"queryStringParameters": {"job_id": "1"}}, None)
+        return json.loads(Response["body"])["status_counts"]
+
+    Bench_Common.PrintRow("upstream scan", Bench_Common.Summarize(Bench_Common.TimeCalls(UpstreamScan, Args.iterations)))
+    Start = time.perf_counter()
+    Counts = ReadModel()
+    print(f"  First Read Model Call (Primes The Job): {(time.perf_counter() - Start) * 1000:.1f}ms")
+    Bench_Common.PrintRow("read model", Bench_Common.Summarize(Bench_Common.TimeCalls(ReadModel, Args.iterations)))
+    print(f"  Counts Agree: {Counts == UpstreamScan()}")
+
+    # Signed Status Changes, Some Delivered Twice
+    os.environ["AtsReadModelEnabled"] = "true"
+    Random = random.Random(Args.seed)
+    Statuses = [Status for Status, _ in Synthetic_Data.APPLICATION_STATUSES]
+    Deliveries: List[Dict[str, Any]] = []
+    for Index in range(Args.events):
+        Record = {"id": str(Random.randint(1, Args.applications)), "job_id": "1", "status": Random.choice(Statuses)}
+        Record["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%S.", time.gmtime()) + f"{Index:06d}Z"
+        Body = json.dumps({"id": f"evt_{Index}", "type": "application.updated", "data": Record})
+        Copies = 2 if Random.random() < Args.duplicates else 1
+        Deliveries.extend([{"body": Body}] * Copies)
+    Random.shuffle(Deliveries)
+
+    Outcomes: Counter = Counter()
+    Pending = iter(Deliveries)
+
+    def Deliver() -> None:
+        Body = next(Pending)["body"]
+        Response = handler.Webhook(
+            {"pathParameters": {"connector": "default"}, "headers": {"X-Ats-Signature": Sign(SECRET, Body)}, "body": Body}, None
+        )
+        Outcomes.update(Item["outcome"] for Item in json.loads(Response["body"])["events"])
+
+    Samples = Bench_Common.TimeCalls(Deliver, len(Deliveries))
+    print()
+    Bench_Common.PrintRow("webhook ingest", Bench_Common.Summarize(Samples))
+    print(f"  {len(Deliveries)} Deliveries Of {Args.events} Events In {sum(Samples) / 1000:.2f}s: {dict(Outcomes)}")
+    Counts = ReadModel()
+    print(f"  Counts After Events: {Counts} (Total {sum(Counts.values())})")
+
+
+if __name__ == "__main__":
+    Start = time.perf_counter()
+    Main()
+    print(f"\nDone In {time.perf_counter() - Start:.1f}s")
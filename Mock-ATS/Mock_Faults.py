@@ -0,0 +1,260 @@
+"""
+Per-Route Fault Injection For The Mock ATS
+
+A Fault Plan Maps Routes To The Misbehaviour Wanted On Them, To Reproduce A
+Slow Or Flaky Upstream (And Its p99) On Demand:
+
+    {
+      "seed": 7,
+      "routes": {
+        "GET /candidates": {
+          "latency": {"dist": "lognormal", "ms": 20, "sigma": 1.0, "max_ms": 3000},
+          "errors": {"503": 0.02, "500": 0.005},
+          "throttle": {"rate": 0.01, "retry_after": 2},
+          "reset": 0.002,
+          "truncate": 0.002
+        },
+        "POST *": {"latency": {"dist": "normal", "ms": 80, "sd_ms": 20}},
+        "*": {"latency": {"dist": "fixed", "ms": 5}}
+      }
+    }
+
+Route Keys Are "METHOD /path" Or Just "/path" (Any Method), Either Exact Or
+An fnmatch Pattern ("GET /candidates*", "*"). An Exact Key Wins Over A
+Pattern, "METHOD /path" Over "/path", And Patterns Are Tried In The Order
+Given. Each Request Matches At Most One Rule.
+
+Per Rule:
+- latency:   Added Before Answering. dist Is fixed (ms), normal (Mean ms,
+             sd_ms), lognormal (Median ms, sigma) Or pareto (Minimum ms,
+             alpha); The Last Two Are Long-Tailed. rate Delays Only A Share
+             Of Requests, max_ms Caps The Draw
+- errors:    Status -> Share Answered With That Status
+- throttle:  Share Answered 429 With Retry-After (Seconds)
+- reset:     Share Whose Connection Is Dropped Without A Response
+- truncate:  Share Whose Body Is Cut Off Mid-Way (Content-Length Promises More)
+
+The Shares Of One Rule Add Up To At Most 1; A Request Gets One Of Them Or
+None. Every Request's Fate Is Drawn From (seed, Rule, Its Sequence Number On
+That Rule), So The Same Seed Replays The Same Faults On The Same Requests,
+However Other Routes Interleave. Replacing The Plan Restarts The Sequences.
+"""
+
+import fnmatch
+import json
+import os
+import random
+import threading
+
+DISTRIBUTIONS = ("fixed", "normal", "lognormal", "pareto")
+RULE_FIELDS = ("latency", "errors", "throttle", "reset", "truncate")
+
+
+class FaultPlanError(ValueError):
+    pass
+
+
+def _share(value, what):
+    try:
+        share = float(value)
+    except (TypeError, ValueError):
+        raise FaultPlanError(f'{what} Must Be A Number')
+    if not 0 <= share <= 1:
+        raise FaultPlanError(f'{what} Must Be Between 0 And 1')
+    return share
+
+
+def _milliseconds(spec, name, default=None):
+    value = spec.get(name, default)
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        raise FaultPlanError(f'latency.{name} Must Be A Number')
+    if value < 0:
+        raise FaultPlanError(f'latency.{name} Must Not Be Negative')
+    return value
+
+
+class Fate:
+    """
+    What Happens To One Request: delay_ms, Then action (None, "error",
+    "throttle", "reset" Or "truncate") With status / retry_after.
+    """
+
+    __slots__ = ("rule", "delay_ms", "action", "status", "retry_after")
+
+    def __init__(self, rule, delay_ms=0.0, action=None, status=None, retry_after=None):
+        self.rule = rule
+        self.delay_ms = delay_ms
+        self.action = action
+        self.status = status
+        self.retry_after = retry_after
+
+
+class FaultRule:
+    def __init__(self, key, spec):
+        if not isinstance(spec, dict):
+            raise FaultPlanError(f'Rule {key!r} Must Be An Object')
+        unknown = set(spec) - set(RULE_FIELDS)
+        if unknown:
+            raise FaultPlanError(f'Rule {key!r} Has Unknown Fields: {", ".join(sorted(unknown))}')
+        self.key = key
+        method, _, path = key.partition(' ') if ' ' in key else ('', '', key)
+        self.method = method.upper()
+        self.path = path
+        self.pattern = any(char in key for char in '*?[')
+        self.latency = self._latency(spec.get('latency'))
+
+        # Cumulative Shares, Walked With One Uniform Draw Per Request
+        self.outcomes = []
+        self.retry_after = None
+        total = 0.0
+        for status, share in sorted((spec.get('errors') or {}).items()):
+            try:
+                code = int(status)
+            except ValueError:
+                raise FaultPlanError(f'Rule {key!r}: Error Status {status!r} Is Not A Number')
+            if not 400 <= code <= 599:
+                raise FaultPlanError(f'Rule {key!r}: Error Status {code} Is Not A 4xx/5xx')
+            total += _share(share, f'errors.{status}')
+            self.outcomes.append((total, 'error', code))
+        throttle = spec.get('throttle') or {}
+        if throttle:
+            total += _share(throttle.get('rate', 0), 'throttle.rate')
+            self.retry_after = str(max(0, int(throttle.get('retry_after', 1))))
+            self.outcomes.append((total, 'throttle', 429))
+        for action in ('reset', 'truncate'):
+            if spec.get(action):
+                total += _share(spec[action], action)
+                self.outcomes.append((total, action, None))
+        if total > 1 + 1e-9:
+            raise FaultPlanError(f'Rule {key!r}: Fault Shares Add Up To {total:.3f}, Over 1')
+        self.spec = spec
+        self.sequence = 0
+
+    @staticmethod
+    def _latency(spec):
+        if not spec:
+            return None
+        if not isinstance(spec, dict):
+            raise FaultPlanError('latency Must Be An Object')
+        dist = spec.get('dist', 'fixed')
+        if dist not in DISTRIBUTIONS:
+            raise FaultPlanError(f'latency.dist Must Be One Of {", ".join(DISTRIBUTIONS)}')
+        ms = _milliseconds(spec, 'ms', 0)
+        return {
+            "dist": dist,
+            "ms": ms,
+            "sd_ms": _milliseconds(spec, 'sd_ms', ms / 4),
+            "sigma": float(spec.get('sigma', 1.0)),
+            "alpha": float(spec.get('alpha', 1.5)),
+            "rate": _share(spec.get('rate', 1), 'latency.rate'),
+            "max_ms": _milliseconds(spec, 'max_ms', float('inf')),
+        }
+
+    def matches(self, method, path):
+        if self.method and self.method != method:
+            return False
+        return fnmatch.fnmatchcase(path, self.path) if self.pattern else path == self.path
+
+    def draw(self, rng):
+        delay = 0.0
+        latency = self.latency
+        if latency and rng.random() < latency["rate"]:
+            if latency["dist"] == 'fixed':
+                delay = latency["ms"]
+            elif latency["dist"] == 'normal':
+                delay = rng.gauss(latency["ms"], latency["sd_ms"])
+            elif latency["dist"] == 'lognormal':
+                delay = rng.lognormvariate(0, latency["sigma"]) * latency["ms"]
+            else:
+                delay = rng.paretovariate(latency["alpha"]) * latency["ms"]
+            delay = min(max(0.0, delay), latency["max_ms"])
+        roll = rng.random()
+        for bound, action, status in self.outcomes:
+            if roll < bound:
+                return Fate(self.key, delay, action, status, self.retry_after)
+        return Fate(self.key, delay)
+
+
+class FaultPlan:
+    """
+    The Active Plan Plus Per-Rule Counters; Safe To Share Between Request Threads.
+    """
+
+    def __init__(self, default_seed=None):
+        self.default_seed = default_seed
+        self.lock = threading.Lock()
+        self.configure({})
+
+    def configure(self, plan):
+        # Validate Fully Before Swapping, So A Bad Plan Leaves The Old One Running
+        if not isinstance(plan, dict):
+            raise FaultPlanError('Fault Plan Must Be An Object')
+        routes = plan.get('routes') or {}
+        if not isinstance(routes, dict):
+            raise FaultPlanError('routes Must Map Route Keys To Rules')
+        rules = [FaultRule(key, spec) for key, spec in routes.items()]
+        seed = plan.get('seed', self.default_seed)
+        if seed is None:
+            seed = random.randrange(2 ** 31)
+        exact = [rule for rule in rules if not rule.pattern]
+        patterns = [rule for rule in rules if rule.pattern]
+        with self.lock:
+            self.seed = seed
+            # Exact "METHOD /path" Before Exact "/path", Then Patterns In Plan Order
+            self.rules = sorted(exact, key=lambda rule: not rule.method) + patterns
+            self.stats = {rule.key: {"requests": 0, "delayed": 0, "delay_ms": 0.0} for rule in rules}
+
+    def clear(self):
+        self.configure({})
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    def draw(self, method, path):
+        # The Fate Of This Request, Or None When No Rule Covers It
+        rules = self.rules
+        rule = next((rule for rule in rules if rule.matches(method, path)), None)
+        if rule is None:
+            return None
+        with self.lock:
+            if rule not in self.rules:
+                return None
+            rule.sequence += 1
+            sequence = rule.sequence
+            seed = self.seed
+        fate = rule.draw(random.Random(f'{seed}:{rule.key}:{sequence}'))
+        with self.lock:
+            stats = self.stats.get(rule.key)
+            if stats is not None:
+                stats["requests"] += 1
+                if fate.delay_ms:
+                    stats["delayed"] += 1
+                    stats["delay_ms"] += fate.delay_ms
+                if fate.action:
+                    name = f'{fate.action}_{fate.status}' if fate.action == 'error' else fate.action
+                    stats[name] = stats.get(name, 0) + 1
+        return fate
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "seed": self.seed,
+                "routes": {rule.key: rule.spec for rule in self.rules},
+                "stats": {key: {**stats, "delay_ms": round(stats["delay_ms"], 1)} for key, stats in self.stats.items()},
+            }
+
+
+def load_plan(source):
+    # A Plan From Inline JSON Or A Path To A JSON File
+    source = source.strip()
+    if not source.startswith('{'):
+        if not os.path.exists(source):
+            raise FaultPlanError(f'Fault Plan File {source} Not Found')
+        with open(source, 'r') as f:
+            source = f.read()
+    try:
+        return json.loads(source)
+    except ValueError as error:
+        raise FaultPlanError(f'Fault Plan Is Not Valid JSON: {error}')
@@ -1,7 +1,32 @@
-from flask import Flask, request, jsonify
+from flask import Flask, g, request, jsonify
 from flask_cors import CORS
+import argparse
+import atexit
+import base64
+import hashlib
+import hmac
 import json
 import os
+import random
+import socket
+import struct
+import threading
+import time
+from datetime import datetime, timezone
+
+from Mock_Faults import FaultPlan, FaultPlanError, load_plan
+from Mock_Store import (
+    Collection,
+    IdempotencyLedger,
+    Journal,
+    SqliteCollection,
+    SqliteIdempotencyLedger,
+    join_candidate,
+    listing_order,
+    parse_sort,
+    start_flusher,
+)
+from Mock_Webhooks import WebhookEmitter
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS For All Routes
@@ -11,60 +36,139 @@ JOBS_FILE = 'Jobs.json'
 CANDIDATES_FILE = 'Candidates.json'
 APPLICATIONS_FILE = 'Applications.json'
 
-# Global Data Lists
-JOBS = []
-CANDIDATES = []
-APPLICATIONS = []
+# Storage Backend: "memory" (Single Process, Journaled To The .json Files) Or
+# "sqlite" (Shared By Several Worker Processes, Seeded From The .json Files)
+BACKEND = os.environ.get('MOCK_ATS_BACKEND', 'memory')
+DB_FILE = os.environ.get('MOCK_ATS_DB', 'Mock_ATS.sqlite')
 
-def load_data():
-    global JOBS, CANDIDATES, APPLICATIONS
-    try:
-        if os.path.exists(JOBS_FILE):
-            with open(JOBS_FILE, 'r') as f:
-                JOBS = json.load(f)
-        else:
-            JOBS = []
-            save_jobs()
-    except:
-        JOBS = []
-        save_jobs()
+# Write-Behind Persistence: Snapshot (The .json File) Plus An Append-Only Journal
+FLUSH_COUNT = int(os.environ.get('MOCK_ATS_FLUSH_COUNT', '100'))
+FLUSH_INTERVAL = float(os.environ.get('MOCK_ATS_FLUSH_INTERVAL', '1.0'))
+COMPACT_EVERY = int(os.environ.get('MOCK_ATS_COMPACT_EVERY', '10000'))
 
-    try:
-        if os.path.exists(CANDIDATES_FILE):
-            with open(CANDIDATES_FILE, 'r') as f:
-                CANDIDATES = json.load(f)
-        else:
-            CANDIDATES = []
-            save_candidates()
-    except:
-        CANDIDATES = []
-        save_candidates()
+# Fault Injection (Off By Default): Answer A Share Of Requests With An Error
+# Status (Plus Retry-After If Set) And/Or Delay A Share Of Them, To Exercise
+# Client Retries, Circuit Breakers And Hedging. Repeatable For A Given Seed.
+FAULT_RATE = float(os.environ.get('MOCK_ATS_FAULT_RATE', '0'))
+FAULT_STATUS = int(os.environ.get('MOCK_ATS_FAULT_STATUS', '503'))
+FAULT_RETRY_AFTER = os.environ.get('MOCK_ATS_FAULT_RETRY_AFTER', '')
+SLOW_RATE = float(os.environ.get('MOCK_ATS_SLOW_RATE', '0'))
+SLOW_MS = float(os.environ.get('MOCK_ATS_SLOW_MS', '0'))
+FAULT_RANDOM = random.Random(os.environ.get('MOCK_ATS_SEED'))
+FAULT_LOCK = threading.Lock()
+
+# Per-Route Fault Plan (See Mock_Faults.py): Latency Distributions, Error
+# Statuses, 429s, Connection Resets And Truncated Bodies. Loaded From
+# MOCK_ATS_FAULTS (Inline JSON Or A File Path) Or --faults, And Replaced At
+# Runtime Through PUT /admin/faults. Applied After The Global Knobs Above
+FAULTS = FaultPlan(os.environ.get('MOCK_ATS_SEED'))
+if os.environ.get('MOCK_ATS_FAULTS'):
+    FAULTS.configure(load_plan(os.environ['MOCK_ATS_FAULTS']))
+
+# Worker Processes (--workers); Above One, Runtime Plan And Webhook Changes Are Refused
+WORKERS = 1
 
+# Vendor-Style Quota (Off By Default): A Token Bucket Of QUOTA_RATE Requests
+# Per Second (Bursting To QUOTA_BURST); Requests Over It Get 429 + Retry-After
+QUOTA_RATE = float(os.environ.get('MOCK_ATS_QUOTA_RATE', '0'))
+QUOTA_BURST = float(os.environ.get('MOCK_ATS_QUOTA_BURST', '0')) or max(1.0, QUOTA_RATE)
+QUOTA_STATE = {"tokens": QUOTA_BURST, "updated": time.monotonic(), "served": 0, "throttled": 0}
+QUOTA_LOCK = threading.Lock()
+
+# Creates Sent With An Idempotency-Key Are Answered Once; Repeats Within
+# IDEMPOTENCY_TTL Seconds Replay The Stored Response (422 If The Body Differs)
+IDEMPOTENCY_TTL = float(os.environ.get('MOCK_ATS_IDEMPOTENCY_TTL', '86400'))
+
+# Outgoing Webhooks (Off Unless MOCK_ATS_WEBHOOK_URL Is Set, Or Set Through
+# PUT /admin/webhooks): Creates And Updates Are POSTed There As Signed Events
+# (See Mock_Webhooks.py). MOCK_ATS_WEBHOOK_DUPLICATES Sends A Share Twice
+WEBHOOKS = WebhookEmitter(
+    os.environ.get('MOCK_ATS_WEBHOOK_URL', ''),
+    os.environ.get('MOCK_ATS_WEBHOOK_SECRET', ''),
+    duplicates=float(os.environ.get('MOCK_ATS_WEBHOOK_DUPLICATES', '0')),
+    seed=os.environ.get('MOCK_ATS_SEED'),
+)
+
+# Keyset Cursors Are Signed, So Clients Cannot Forge Positions
+CURSOR_SECRET = os.environ.get('MOCK_ATS_CURSOR_SECRET', 'Mock_Cursor_Secret').encode()
+
+class NoJournal:
+    # The Sqlite Backend Is Durable On Its Own
+    def append(self, record):
+        pass
+
+if BACKEND == 'sqlite':
+    JOBS = SqliteCollection(DB_FILE, 'jobs', index_fields=("status", "location"))
+    CANDIDATES = SqliteCollection(DB_FILE, 'candidates')
+    APPLICATIONS = SqliteCollection(DB_FILE, 'applications', index_fields=("job_id", "status"))
+    JOBS_JOURNAL = CANDIDATES_JOURNAL = APPLICATIONS_JOURNAL = NoJournal()
+    JOURNALS = ()
+    IDEMPOTENCY = SqliteIdempotencyLedger(os.path.splitext(DB_FILE)[0] + '.idempotency.sqlite', IDEMPOTENCY_TTL)
+else:
+    # Indexed Collections (id -> Record, Plus Jobs By status / location And Applications By job_id / status)
+    JOBS = Collection(index_fields=("status", "location"))
+    CANDIDATES = Collection()
+    APPLICATIONS = Collection(index_fields=("job_id", "status"))
+    JOBS_JOURNAL = Journal(JOBS, JOBS_FILE, flush_count=FLUSH_COUNT, compact_every=COMPACT_EVERY)
+    CANDIDATES_JOURNAL = Journal(CANDIDATES, CANDIDATES_FILE, flush_count=FLUSH_COUNT, compact_every=COMPACT_EVERY)
+    APPLICATIONS_JOURNAL = Journal(APPLICATIONS, APPLICATIONS_FILE, flush_count=FLUSH_COUNT, compact_every=COMPACT_EVERY)
+    JOURNALS = (JOBS_JOURNAL, CANDIDATES_JOURNAL, APPLICATIONS_JOURNAL)
+    IDEMPOTENCY = IdempotencyLedger(IDEMPOTENCY_TTL)
+
+def load_journal(journal):
     try:
-        if os.path.exists(APPLICATIONS_FILE):
-            with open(APPLICATIONS_FILE, 'r') as f:
-                APPLICATIONS = json.load(f)
-        else:
-            APPLICATIONS = []
-            save_applications()
+        journal.replay()
     except:
-        APPLICATIONS = []
-        save_applications()
+        journal.collection.load([])
+    if not os.path.exists(journal.snapshot_path):
+        journal.compact()
 
-def save_jobs():
-    with open(JOBS_FILE, 'w') as f:
-        json.dump(JOBS, f, indent=2)
+def now_stamp():
+    # Fixed-Width UTC ISO 8601, So Stamps Compare Correctly As Strings
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
 
-def save_candidates():
-    with open(CANDIDATES_FILE, 'w') as f:
-        json.dump(CANDIDATES, f, indent=2)
+# Records From Files Written Before updated_at Existed Count As Updated At Startup
+LOADED_AT = now_stamp()
 
-def save_applications():
-    with open(APPLICATIONS_FILE, 'w') as f:
-        json.dump(APPLICATIONS, f, indent=2)
+def seed_collection(collection, path):
+    # Only The First Worker To Start On An Empty Database Seeds It
+    if collection.count() == 0 and os.path.exists(path):
+        with open(path, 'r') as f:
+            records = json.load(f)
+        for record in records:
+            record.pop("candidate", None)
+            record.setdefault("updated_at", LOADED_AT)
+        collection.load(records)
+
+def load_data():
+    if BACKEND == 'sqlite':
+        seed_collection(JOBS, JOBS_FILE)
+        seed_collection(CANDIDATES, CANDIDATES_FILE)
+        seed_collection(APPLICATIONS, APPLICATIONS_FILE)
+        return
+    for journal in JOURNALS:
+        load_journal(journal)
+    # Older Files Stored The Joined Candidate Inside Each Application; It Is Rebuilt Per Request Now
+    for application in APPLICATIONS.records():
+        application.pop("candidate", None)
+    for collection in (JOBS, CANDIDATES, APPLICATIONS):
+        for record in collection.records():
+            record.setdefault("updated_at", LOADED_AT)
 
-# Load Data On Startup
+def flush_data():
+    for journal in JOURNALS:
+        journal.compact()
+
+def conditional_json(payload):
+    # Answer 304 When The Client Already Holds This Exact Payload (If-None-Match)
+    response = jsonify(payload)
+    response.add_etag()
+    return response.make_conditional(request)
+
+# Load Data On Startup, Flush Buffered Writes In The Background And Compact On Exit
 load_data()
+start_flusher(JOURNALS, FLUSH_INTERVAL)
+atexit.register(flush_data)
 
 @app.before_request
 def check_auth():
@@ -77,73 +181,350 @@ def check_auth():
     if token != 'Dummy_Key_1608':
         return jsonify({"error": "Invalid token"}), 401
 
-@app.route('/offers', methods=['GET'])
-def get_offers():
+def is_admin():
+    # The Admin Routes Stay Reachable Whatever Faults Or Quota Are Configured
+    return request.path.startswith('/admin/')
+
+@app.before_request
+def enforce_quota():
+    if request.method == 'OPTIONS' or QUOTA_RATE <= 0 or is_admin():
+        return
+    with QUOTA_LOCK:
+        now = time.monotonic()
+        tokens = min(QUOTA_BURST, QUOTA_STATE["tokens"] + (now - QUOTA_STATE["updated"]) * QUOTA_RATE)
+        QUOTA_STATE["updated"] = now
+        if tokens < 1:
+            QUOTA_STATE["tokens"] = tokens
+            QUOTA_STATE["throttled"] += 1
+            retry_after = (1 - tokens) / QUOTA_RATE
+        else:
+            QUOTA_STATE["tokens"] = tokens - 1
+            QUOTA_STATE["served"] += 1
+            return
+    response = jsonify({"error": "Rate Limit Exceeded"})
+    response.status_code = 429
+    response.headers['Retry-After'] = str(max(1, int(retry_after + 0.999)))
+    return response
+
+@app.before_request
+def inject_faults():
+    if request.method == 'OPTIONS' or (FAULT_RATE <= 0 and SLOW_RATE <= 0) or is_admin():
+        return
+    with FAULT_LOCK:
+        fail = FAULT_RANDOM.random() < FAULT_RATE
+        slow = FAULT_RANDOM.random() < SLOW_RATE
+    if slow:
+        time.sleep(SLOW_MS / 1000)
+    if fail:
+        response = jsonify({"error": "Injected Fault"})
+        response.status_code = FAULT_STATUS
+        if FAULT_RETRY_AFTER:
+            response.headers['Retry-After'] = FAULT_RETRY_AFTER
+        return response
+
+@app.before_request
+def inject_route_faults():
+    if request.method == 'OPTIONS' or not FAULTS or is_admin():
+        return
+    fate = FAULTS.draw(request.method, request.path)
+    if fate is None:
+        return
+    if fate.delay_ms:
+        time.sleep(fate.delay_ms / 1000)
+    if fate.action == 'reset':
+        return reset_connection()
+    if fate.action == 'truncate':
+        g.truncate_body = True
+    elif fate.action:
+        response = jsonify({"error": "Rate Limit Exceeded" if fate.action == 'throttle' else "Injected Fault"})
+        response.status_code = fate.status
+        if fate.retry_after is not None:
+            response.headers['Retry-After'] = fate.retry_after
+        return response
+
+def reset_connection():
+    # Abort The Socket (RST On Close) So The Client Gets No Response At All;
+    # Werkzeug Then Fails To Write This Placeholder And Drops The Connection
+    sock = request.environ.get('werkzeug.socket')
+    response = app.response_class(b'', status=502)
+    if sock is None:
+        # Not Under Werkzeug: Fall Back To A Body That Never Arrives
+        response.headers['Content-Length'] = '1'
+        return response
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+    sock.shutdown(socket.SHUT_RDWR)
+    return response
+
+@app.after_request
+def truncate_body(response):
+    # Send Half The Body Under The Full Content-Length, Then Close
+    if not g.get('truncate_body') or response.direct_passthrough:
+        return response
+    data = response.get_data()
+    response.response = [data[:len(data) // 2]]
+    response.headers['Content-Length'] = str(len(data))
+    return response
+
+# Listing Filters Per Collection: Query Param -> Filtered Fields. status Takes A
+# Comma-Separated Any-Of List, location One Value; Both Ignore Case. q Must Match
+# Every Word Somewhere In The Search Fields; sort=title,-id Orders The Listing
+JOB_FILTERS = ("status", "location")
+JOB_SEARCH = ("title", "location")
+CANDIDATE_SEARCH = ("first_name", "last_name", "emails.0.value")
+APPLICATION_FILTERS = ("status",)
+
+class BadCursor(ValueError):
+    pass
+
+@app.errorhandler(BadCursor)
+def bad_cursor(error):
+    return jsonify({"error": str(error)}), 400
+
+def listing_scope():
+    # Everything That Shapes A Listing Except The Position, So A Cursor Only Resumes The Listing It Came From
+    args = sorted((name, value) for name, value in request.args.items(multi=True) if name not in ('cursor', 'page', 'per_page'))
+    return hashlib.sha256(json.dumps([request.path, args]).encode()).hexdigest()[:16]
+
+def encode_cursor(record, order):
+    payload = {"id": record["id"], "key": [record.get(field) for field, _ in order], "scope": listing_scope()}
+    body = base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode()).decode().rstrip('=')
+    signature = hmac.new(CURSOR_SECRET, body.encode(), hashlib.sha256).hexdigest()[:32]
+    return f'{body}.{signature}'
+
+def decode_cursor(token):
+    # Returns (key values, id) Of The Last Record Already Served
+    body, _, signature = token.partition('.')
+    expected = hmac.new(CURSOR_SECRET, body.encode(), hashlib.sha256).hexdigest()[:32]
+    if not hmac.compare_digest(signature, expected):
+        raise BadCursor('Invalid Cursor')
+    payload = json.loads(base64.urlsafe_b64decode(body + '=' * (-len(body) % 4)))
+    if payload.get("scope") != listing_scope():
+        raise BadCursor('Cursor Does Not Match This Listing')
+    return payload["key"], payload["id"]
+
+def list_page(collection, field=None, value=None, filters=(), search_fields=()):
+    """
+    One Page Of A Listing As (records, next_cursor). Filters, q, sort And
+    updated_since / since_id Go Through query(). With A cursor Param (Empty
+    For The First Page) The Page Is A Keyset Read After The Cursor Position
+    And next_cursor Points Past Its Last Record (None At The End); Otherwise
+    page Is An Offset And next_cursor Is None.
+    """
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 10, type=int)
-    start = (page - 1) * per_page
-    end = start + per_page
-    return jsonify({"data": JOBS[start:end]})
+    wanted = {name: request.args[name] for name in filters if request.args.get(name)}
+    search = request.args.get('q', '').split() if search_fields else []
+    sort = parse_sort(request.args.get('sort'))
+    since = request.args.get('updated_since')
+    since_id = request.args.get('since_id', type=int)
+    plain = not (wanted or search or sort) and since is None and since_id is None
+
+    if 'cursor' in request.args:
+        after = decode_cursor(request.args['cursor']) if request.args['cursor'] else None
+        start, end = 0, per_page + 1
+    else:
+        after = None
+        start = (page - 1) * per_page
+        end = start + per_page
+
+    if plain and 'cursor' in request.args:
+        try:
+            records = collection.page_after(after[1] if after else None, end, field=field, value=value)
+        except KeyError as error:
+            raise BadCursor(str(error.args[0])) from None
+    elif plain:
+        records = collection.page(start, end, field=field, value=value)
+    else:
+        by_field = {name: raw.split(',') if name == 'status' else [raw] for name, raw in wanted.items()}
+        if field is not None:
+            by_field[field] = [value]
+        records = collection.query(
+            start, end, filters=by_field, search=search, search_fields=search_fields, sort=sort, since=since, since_id=since_id, after=after
+        )
+
+    if 'cursor' not in request.args or len(records) <= per_page:
+        return records[:per_page], None
+    return records[:per_page], encode_cursor(records[per_page - 1], listing_order(sort, since))
+
+def listing(records, next_cursor):
+    # Keyset Reads Carry next_cursor; Offset Reads Keep Their Original Shape
+    body = {"data": records}
+    if 'cursor' in request.args:
+        body["next_cursor"] = next_cursor
+    return conditional_json(body)
+
+def update_record(collection, journal, record_id, event, present=lambda record: record):
+    # Shallow-Merge The Body Into A Copy Of The Record, Bump updated_at And Announce It
+    current = collection.get(record_id)
+    if current is None:
+        return jsonify({"error": "Not Found"}), 404
+    data = request.get_json() or {}
+    record = {**current, **{key: value for key, value in data.items() if key not in ("id", "updated_at")}}
+    record["updated_at"] = now_stamp()
+    collection.upsert(record)
+    journal.append(record)
+    WEBHOOKS.emit(event, present(record))
+    return jsonify(record)
+
+def idempotent_create(create):
+    # Run create() Once Per Idempotency-Key On This Route; Without The Header It Always Runs
+    key = request.headers.get('Idempotency-Key')
+    if not key:
+        body, status = create()
+        return jsonify(body), status
+    fingerprint = hashlib.sha256(request.get_data()).hexdigest()
+    body, status, replayed = IDEMPOTENCY.run(f'{request.path}:{key}', fingerprint, create)
+    response = jsonify(body)
+    response.status_code = status
+    if replayed:
+        response.headers['Idempotent-Replayed'] = 'true'
+    return response
+
+@app.route('/admin/faults', methods=['GET'])
+def get_faults():
+    return jsonify(FAULTS.snapshot())
+
+@app.route('/admin/faults', methods=['PUT'])
+def set_faults():
+    if WORKERS > 1:
+        return jsonify({"error": "Fault Plans Need A Single Process; Restart Without --workers"}), 409
+    try:
+        FAULTS.configure(request.get_json(force=True, silent=True))
+    except (FaultPlanError, TypeError, ValueError) as error:
+        return jsonify({"error": str(error)}), 400
+    return jsonify(FAULTS.snapshot())
+
+@app.route('/admin/faults', methods=['DELETE'])
+def clear_faults():
+    FAULTS.clear()
+    return jsonify(FAULTS.snapshot())
+
+@app.route('/admin/webhooks', methods=['GET'])
+def get_webhooks():
+    return jsonify(WEBHOOKS.snapshot())
+
+@app.route('/admin/webhooks', methods=['PUT'])
+def set_webhooks():
+    if WORKERS > 1:
+        return jsonify({"error": "Webhooks Need A Single Process; Restart Without --workers"}), 409
+    try:
+        WEBHOOKS.configure(request.get_json(force=True, silent=True))
+    except (TypeError, ValueError) as error:
+        return jsonify({"error": str(error)}), 400
+    return jsonify(WEBHOOKS.snapshot())
+
+@app.route('/offers', methods=['GET'])
+def get_offers():
+    return listing(*list_page(JOBS, filters=JOB_FILTERS, search_fields=JOB_SEARCH))
+
+@app.route('/offers/<job_id>', methods=['PATCH'])
+def update_offer(job_id):
+    return update_record(JOBS, JOBS_JOURNAL, job_id, 'job.updated')
 
 @app.route('/candidates', methods=['POST'])
 def create_candidate():
     data = request.get_json()
-    candidate_id = len(CANDIDATES) + 1
-    candidate = {
-        "id": candidate_id,
-        "first_name": data.get("first_name"),
-        "last_name": data.get("last_name"),
-        "emails": data.get("emails", []),
-        "phones": data.get("phones", []),
-        "cv_url": data.get("cv_url"),
-    }
-    CANDIDATES.append(candidate)
-    save_candidates()
-    return jsonify(candidate), 201
+
+    def create():
+        candidate = CANDIDATES.create(lambda candidate_id: {
+            "id": candidate_id,
+            "first_name": data.get("first_name"),
+            "last_name": data.get("last_name"),
+            "emails": data.get("emails", []),
+            "phones": data.get("phones", []),
+            "cv_url": data.get("cv_url"),
+            "updated_at": now_stamp(),
+        })
+        CANDIDATES_JOURNAL.append(candidate)
+        WEBHOOKS.emit('candidate.created', candidate)
+        return candidate, 201
+
+    return idempotent_create(create)
 
 @app.route('/candidates', methods=['GET'])
 def get_candidates():
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 10, type=int)
-    start = (page - 1) * per_page
-    end = start + per_page
-    return jsonify({"data": CANDIDATES[start:end]})
+    return listing(*list_page(CANDIDATES, search_fields=CANDIDATE_SEARCH))
+
+@app.route('/candidates/<candidate_id>', methods=['PATCH'])
+def update_candidate(candidate_id):
+    return update_record(CANDIDATES, CANDIDATES_JOURNAL, candidate_id, 'candidate.updated')
 
 @app.route('/applications', methods=['POST'])
 def create_application():
     data = request.get_json()
-    app_id = len(APPLICATIONS) + 1
-    application = {
-        "id": app_id,
-        "candidate_id": data.get("candidate_id"),
-        "job_id": data.get("job_id"),
-        "status": "applied",
-    }
-    APPLICATIONS.append(application)
-    save_applications()
-    return jsonify(application), 201
+
+    def create():
+        application = APPLICATIONS.create(lambda app_id: {
+            "id": app_id,
+            "candidate_id": data.get("candidate_id"),
+            "job_id": data.get("job_id"),
+            "status": "applied",
+            "updated_at": now_stamp(),
+        })
+        APPLICATIONS_JOURNAL.append(application)
+        WEBHOOKS.emit('application.created', join_candidate(application, CANDIDATES))
+        return application, 201
+
+    return idempotent_create(create)
 
 @app.route('/applications', methods=['GET'])
 def get_applications():
     job_id = request.args.get('job_id')
-    apps = APPLICATIONS
+    # Slice Via The job_id Index First, Then Join Candidate Info Onto Copies Of Just This Page
     if job_id:
-        apps = [app for app in APPLICATIONS if str(app["job_id"]) == str(job_id)]
-    # Add candidate info
-    for app in apps:
-        candidate = next((c for c in CANDIDATES if str(c["id"]) == str(app["candidate_id"])), None)
-        if candidate:
-            app["candidate"] = {
-                "name": f"{candidate['first_name']} {candidate['last_name']}".strip(),
-                "email": candidate["emails"][0]["value"] if candidate["emails"] else None,
-                "first_name": candidate["first_name"],
-                "last_name": candidate["last_name"],
-            }
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 10, type=int)
-    start = (page - 1) * per_page
-    end = start + per_page
-    return jsonify({"data": apps[start:end]})
+        apps, next_cursor = list_page(APPLICATIONS, field="job_id", value=job_id, filters=APPLICATION_FILTERS)
+    else:
+        apps, next_cursor = list_page(APPLICATIONS, filters=APPLICATION_FILTERS)
+    return listing([join_candidate(app, CANDIDATES) for app in apps], next_cursor)
+
+@app.route('/applications/<application_id>', methods=['PATCH'])
+def update_application(application_id):
+    return update_record(APPLICATIONS, APPLICATIONS_JOURNAL, application_id, 'application.updated', lambda app: join_candidate(app, CANDIDATES))
+
+def serve_workers(parser, port, workers):
+    # A Pre-Fork Gunicorn Master: Long-Lived Workers, Each With A Few Threads,
+    # Sharing The Sqlite Data (Seeded Once By load_data Above, Before The Fork)
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        parser.error('--workers Needs gunicorn (pip install -r Requirements.txt)')
+
+    class MockApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f'0.0.0.0:{port}')
+            self.cfg.set('workers', workers)
+            self.cfg.set('worker_class', 'gthread')
+            self.cfg.set('threads', 4)
+
+        def load(self):
+            return app
+
+    MockApplication().run()
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Mock ATS Server')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=1, help='Gunicorn Worker Processes (Needs MOCK_ATS_BACKEND=sqlite)')
+    parser.add_argument('--faults', help='Fault Plan JSON File (See Mock_Faults.py)')
+    args = parser.parse_args()
+
+    if args.faults:
+        FAULTS.configure(load_plan(args.faults))
+
+    if args.workers > 1:
+        if BACKEND != 'sqlite':
+            parser.error('Multiple Workers Share State Only With MOCK_ATS_BACKEND=sqlite')
+        # Each Worker Would Keep Its Own Fault Draws, Quota Bucket, Plan
+        # Sequence Numbers And Webhook Queue, So None Of Them Would Hold
+        # Across The Mock As A Whole (N Workers Allow N Times The Quota)
+        if FAULT_RATE > 0 or SLOW_RATE > 0 or QUOTA_RATE > 0:
+            parser.error('Fault Mode And Quota Need A Single Process; Drop --workers')
+        if FAULTS or os.environ.get('MOCK_ATS_SEED'):
+            parser.error('Fault Plans And MOCK_ATS_SEED Need A Single Process; Drop --workers')
+        if WEBHOOKS:
+            parser.error('Webhooks Need A Single Process; Drop --workers')
+        WORKERS = args.workers
+        serve_workers(parser, args.port, args.workers)
+    else:
+        # No Reloader: Its Parent Process Would Load And Compact Its Own Stale Copy On Exit
+        app.run(host='0.0.0.0', port=args.port, debug=True, use_reloader=False, threaded=True)
@@ -0,0 +1,676 @@
+"""
+In-Memory Indexed Store For The Mock ATS
+
+Each Collection Keeps:
+- id -> record dict For O(1) Lookups
+- ids In Insertion Order For O(per_page) Page Slices
+- Optional Secondary Indexes (field value -> ids), E.g. Applications By job_id
+
+SqliteCollection Offers The Same Interface Over A Shared Sqlite File, For
+Running Several Worker Processes Against One Dataset.
+
+Both Also Answer Filtered Listings (query): Any-Of Value Filters (Served
+From The Secondary Indexes When The Field Has One), A Word Search Over Some
+Fields, A Sort, And Delta Queries: Records Updated Since A Timestamp
+(Ordered By updated_at, Then id) Or Created After An id. Index Lookups And
+Filters Ignore Case.
+
+Keyset Reads (page_after, Or query(after=...)) Start Right After A Given
+Record Instead Of Skipping An Offset: The In-Memory Collection Bisects Its
+Insertion-Ordered id Lists By Position (And Filters Lazily From There When
+The Listing Is Unsorted), Sqlite Seeks With id > ?.
+
+Records Handed Out Are The Stored Dicts; Callers Must Not Mutate Them.
+Joins Build New Dicts Instead (See join_candidate).
+
+IdempotencyLedger Keeps The Response Of Each Create Sent With An
+Idempotency-Key, So A Retried Create Replays It Instead Of Adding A Second
+Record (SqliteIdempotencyLedger Shares The Ledger Between Workers).
+
+Journal Persists A Collection As A JSON Snapshot Plus An Append-Only JSONL
+Journal: Writes Are Buffered And Flushed In Batches, And The Journal Is
+Periodically Folded Into A Fresh Snapshot That Atomically Replaces The Old One.
+"""
+
+import heapq
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+
+def _key(value):
+    # Ids Arrive As Ints From JSON And As Strings From Query Params
+    return str(value)
+
+
+def _index_key(value):
+    # Secondary Indexes And Filters Match Case-Insensitively
+    return _key(value).lower()
+
+
+def _id_order(record):
+    try:
+        return int(record["id"])
+    except (TypeError, ValueError):
+        return 0
+
+
+def _dig(record, path):
+    # Dotted Path Such As "emails.0.value"; None When A Step Is Missing
+    value = record
+    for step in path.split('.'):
+        if isinstance(value, dict):
+            value = value.get(step)
+        elif isinstance(value, list) and step.isdigit() and int(step) < len(value):
+            value = value[int(step)]
+        else:
+            return None
+    return value
+
+
+def _matches_search(record, words, fields):
+    text = ' '.join(str(_dig(record, field) or '') for field in fields).lower()
+    return all(word in text for word in words)
+
+
+def _sort_value(value):
+    # Numbers (And Numeric Strings) Numerically, Then Text Ignoring Case
+    text = str(value)
+    if isinstance(value, (int, float)) or text.isdigit():
+        return (0, float(text), '')
+    return (1, 0, text.lower())
+
+
+class OrderKey:
+    """
+    Position Of A Record Under An Order [(field, descending)], Ties Broken By
+    id; Missing Values Sort Last In Either Direction. Built From A Record Or
+    From The (values, id) A Cursor Remembers, So Both Compare Alike.
+    """
+
+    __slots__ = ('parts', 'record_id')
+
+    def __init__(self, values, record_id, order):
+        self.parts = [(value is None or value == '', _sort_value(value), descending) for value, (_, descending) in zip(values, order)]
+        self.record_id = _id_order({"id": record_id})
+
+    @classmethod
+    def of(cls, record, order):
+        return cls([_dig(record, field) for field, _ in order], record.get("id"), order)
+
+    def __lt__(self, other):
+        for (missing, value, descending), (other_missing, other_value, _) in zip(self.parts, other.parts):
+            if missing != other_missing:
+                return other_missing
+            if value != other_value:
+                return value > other_value if descending else value < other_value
+        return self.record_id < other.record_id
+
+
+def listing_order(sort=(), since=None):
+    # Delta Listings Run Oldest Change First Unless A sort Is Given
+    if sort:
+        return list(sort)
+    return [("updated_at", False)] if since is not None else []
+
+
+def _bisect_right(items, target, key):
+    # bisect.bisect_right(items, target, key=key), Whose key= Needs Python 3.10
+    low, high = 0, len(items)
+    while low < high:
+        middle = (low + high) // 2
+        if target < key(items[middle]):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def _insort(items, item, key):
+    items.insert(_bisect_right(items, key(item), key), item)
+
+
+def _seek(records, after, order):
+    # Drop Everything Up To And Including The Cursor Position (after = (values, id))
+    if after is None:
+        return records
+    values, after_id = after
+    return records[_bisect_right(records, OrderKey(values, after_id, order), lambda record: OrderKey.of(record, order)):]
+
+
+def parse_sort(raw):
+    return [(part.strip().lstrip('-'), part.strip().startswith('-')) for part in (raw or '').split(',') if part.strip().lstrip('-')]
+
+
+class Collection:
+    """
+    In-Memory Collection. Every Read And Write Holds One Lock, And New ids
+    Come From A Counter That Only Moves Forward (Never len() + 1).
+    """
+
+    def __init__(self, index_fields=()):
+        self.by_id = {}
+        self.ids = []
+        self.positions = {}
+        self.indexes = {field: defaultdict(list) for field in index_fields}
+        self.last_id = 0
+        self.lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def load(self, records):
+        with self.lock:
+            self.by_id.clear()
+            self.ids.clear()
+            self.positions.clear()
+            for index in self.indexes.values():
+                index.clear()
+            self.last_id = 0
+            for record in records:
+                self.insert(record)
+
+    def _note_id(self, record_id):
+        try:
+            self.last_id = max(self.last_id, int(record_id))
+        except (TypeError, ValueError):
+            pass
+
+    def create(self, build):
+        # Allocate The Next id And Store build(id) Atomically
+        with self.lock:
+            self.last_id += 1
+            return self.insert(build(self.last_id))
+
+    def insert(self, record):
+        key = _key(record["id"])
+        with self.lock:
+            if key in self.by_id:
+                raise KeyError(f"Duplicate id {key}")
+            self.by_id[key] = record
+            self.positions[key] = len(self.ids)
+            self.ids.append(key)
+            for field, index in self.indexes.items():
+                index[_index_key(record.get(field))].append(key)
+            self._note_id(record["id"])
+        return record
+
+    def upsert(self, record):
+        key = _key(record["id"])
+        with self.lock:
+            previous = self.by_id.get(key)
+            if previous is None:
+                return self.insert(record)
+            for field, index in self.indexes.items():
+                if _index_key(previous.get(field)) != _index_key(record.get(field)):
+                    index[_index_key(previous.get(field))].remove(key)
+                    # Index Lists Stay In Insertion Order, So Keyset Seeks Can Bisect Them
+                    _insort(index[_index_key(record.get(field))], key, self.positions.__getitem__)
+            self.by_id[key] = record
+        return record
+
+    def get(self, record_id):
+        return self.by_id.get(_key(record_id))
+
+    def records(self):
+        with self.lock:
+            return [self.by_id[key] for key in self.ids]
+
+    def page(self, start, end, field=None, value=None):
+        with self.lock:
+            if field is None:
+                keys = self.ids
+            else:
+                keys = self.indexes[field].get(_index_key(value), [])
+            return [self.by_id[key] for key in keys[start:end]]
+
+    def page_after(self, after_id, count, field=None, value=None):
+        # Keyset Page: Up To count Records Inserted After after_id (None = From The Start)
+        with self.lock:
+            keys = self.ids if field is None else self.indexes[field].get(_index_key(value), [])
+            start = 0
+            if after_id is not None:
+                position = self.positions.get(_key(after_id))
+                if position is None:
+                    raise KeyError(f"Unknown Cursor Position {after_id}")
+                start = _bisect_right(keys, position, self.positions.__getitem__)
+            return [self.by_id[key] for key in keys[start:start + count]]
+
+    def count(self, field=None, value=None):
+        with self.lock:
+            if field is None:
+                return len(self.ids)
+            return len(self.indexes[field].get(_index_key(value), []))
+
+    def query(self, start, end, filters=None, search=(), search_fields=(), sort=(), since=None, since_id=None, after=None):
+        """
+        filters Is {field: [values]} (Any Of, Ignoring Case). The Most Selective
+        Indexed Filter Picks The Candidates; Everything Else Is A Linear Scan,
+        Which Is Fine For Mock-Sized Data. after = (values, id) Keeps Only
+        Records Past That Position In listing_order(sort, since).
+        """
+        filters = {field: {_index_key(value) for value in values} for field, values in (filters or {}).items()}
+        order = listing_order(sort, since)
+        with self.lock:
+            indexed = [field for field in filters if field in self.indexes]
+            if indexed:
+                field = min(indexed, key=lambda name: sum(len(self.indexes[name].get(value, ())) for value in filters[name]))
+                lists = [self.indexes[field].get(value, []) for value in filters.pop(field)]
+            else:
+                lists = [self.ids]
+            if not order and (after is None or _key(after[1]) in self.positions):
+                return self._scan(lists, start, end, filters, search, search_fields, since_id, after)
+            records = sorted((self.by_id[key] for keys in lists for key in keys), key=_id_order)
+        for field, values in filters.items():
+            records = [record for record in records if _index_key(record.get(field)) in values]
+        if search:
+            records = [record for record in records if _matches_search(record, search, search_fields)]
+        if since_id is not None:
+            records = [record for record in records if _id_order(record) > since_id]
+        if since is not None:
+            records = [record for record in records if (record.get("updated_at") or "") >= since]
+        if order:
+            records = sorted(records, key=lambda record: OrderKey.of(record, order))
+        return _seek(records, after, order)[start:end]
+
+    def _scan(self, lists, start, end, filters, search, search_fields, since_id, after):
+        # Listing In Insertion Order: Seek Each Id List Past after, Then Filter Lazily Until The Page Is Full
+        position = self.positions.__getitem__
+        if after is not None:
+            lists = [keys[_bisect_right(keys, position(_key(after[1])), position):] for keys in lists]
+        keys = lists[0] if len(lists) == 1 else heapq.merge(*lists, key=position)
+        found = []
+        for key in keys:
+            record = self.by_id[key]
+            if any(_index_key(record.get(field)) not in values for field, values in filters.items()):
+                continue
+            if search and not _matches_search(record, search, search_fields):
+                continue
+            if since_id is not None and _id_order(record) <= since_id:
+                continue
+            found.append(record)
+            if len(found) >= end:
+                break
+        return found[start:end]
+
+
+class SqliteCollection:
+    """
+    Same Interface As Collection, Stored In A Sqlite File So Several Worker
+    Processes Share One Dataset. ids Come From AUTOINCREMENT, Which Sqlite
+    Serializes Across Processes, So They Stay Unique And Monotonic.
+    """
+
+    def __init__(self, path, name, index_fields=()):
+        self.path = path
+        self.name = name
+        self.index_fields = tuple(index_fields)
+        self.local = threading.local()
+        columns = ''.join(f', idx_{field} TEXT' for field in self.index_fields)
+        with self._connection() as conn:
+            conn.execute(f'CREATE TABLE IF NOT EXISTS {name} (id INTEGER PRIMARY KEY AUTOINCREMENT, data TEXT NOT NULL{columns})')
+            existing = {row[1] for row in conn.execute(f'PRAGMA table_info({name})')}
+            for field in self.index_fields:
+                if f'idx_{field}' not in existing:
+                    # Database From An Older Run Without This Index; Add And Backfill It
+                    conn.execute(f'ALTER TABLE {name} ADD COLUMN idx_{field} TEXT')
+                    conn.execute(f"UPDATE {name} SET idx_{field} = LOWER(COALESCE(CAST(json_extract(data, '$.{field}') AS TEXT), 'None'))")
+                conn.execute(f'CREATE INDEX IF NOT EXISTS {name}_{field} ON {name} (idx_{field}, id)')
+
+    def _connection(self):
+        # One Connection Per Thread And Per Process (Forked Workers Must Not Share One)
+        conn = getattr(self.local, 'conn', None)
+        if conn is None or self.local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self.local.conn = conn
+            self.local.pid = os.getpid()
+        return conn
+
+    def _row(self, record):
+        return [json.dumps(record)] + [_index_key(record.get(field)) for field in self.index_fields]
+
+    def __len__(self):
+        return self.count()
+
+    def load(self, records):
+        with self._connection() as conn:
+            conn.execute(f'DELETE FROM {self.name}')
+            for record in records:
+                self._write(conn, record)
+
+    def _write(self, conn, record):
+        columns = ''.join(f', idx_{field}' for field in self.index_fields)
+        marks = ', ?' * (len(self.index_fields) + 1)
+        conn.execute(f'INSERT OR REPLACE INTO {self.name} (id, data{columns}) VALUES (?{marks})', [record["id"]] + self._row(record))
+
+    def create(self, build):
+        conn = self._connection()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            record_id = conn.execute(f"INSERT INTO {self.name} (data) VALUES ('{{}}')").lastrowid
+            record = build(record_id)
+            self._write(conn, record)
+        return record
+
+    def insert(self, record):
+        if self.get(record["id"]) is not None:
+            raise KeyError(f"Duplicate id {record['id']}")
+        return self.upsert(record)
+
+    def upsert(self, record):
+        with self._connection() as conn:
+            self._write(conn, record)
+        return record
+
+    def get(self, record_id):
+        try:
+            record_id = int(record_id)
+        except (TypeError, ValueError):
+            return None
+        row = self._connection().execute(f'SELECT data FROM {self.name} WHERE id = ?', (record_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def records(self):
+        return [json.loads(row[0]) for row in self._connection().execute(f'SELECT data FROM {self.name} ORDER BY id')]
+
+    def page(self, start, end, field=None, value=None):
+        limit = max(0, end - start)
+        if field is None:
+            rows = self._connection().execute(f'SELECT data FROM {self.name} ORDER BY id LIMIT ? OFFSET ?', (limit, start))
+        else:
+            rows = self._connection().execute(
+                f'SELECT data FROM {self.name} WHERE idx_{field} = ? ORDER BY id LIMIT ? OFFSET ?',
+                (_index_key(value), limit, start),
+            )
+        return [json.loads(row[0]) for row in rows]
+
+    def page_after(self, after_id, count, field=None, value=None):
+        where, args = ['id > ?'], [int(after_id) if after_id is not None else 0]
+        if field is not None:
+            where.append(f'idx_{field} = ?')
+            args.append(_index_key(value))
+        rows = self._connection().execute(
+            f'SELECT data FROM {self.name} WHERE {" AND ".join(where)} ORDER BY id LIMIT ?', args + [count]
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self, field=None, value=None):
+        if field is None:
+            return self._connection().execute(f'SELECT COUNT(*) FROM {self.name}').fetchone()[0]
+        return self._connection().execute(f'SELECT COUNT(*) FROM {self.name} WHERE idx_{field} = ?', (_index_key(value),)).fetchone()[0]
+
+    @staticmethod
+    def _json_path(field):
+        return '$' + ''.join(f'[{step}]' if step.isdigit() else f'.{step}' for step in field.split('.'))
+
+    def query(self, start, end, filters=None, search=(), search_fields=(), sort=(), since=None, since_id=None, after=None):
+        where, args = ['1'], []
+        for field, values in (filters or {}).items():
+            values = [_index_key(value) for value in values]
+            if field in self.index_fields:
+                column = f'idx_{field}'
+            else:
+                column = f"LOWER(CAST(json_extract(data, '{self._json_path(field)}') AS TEXT))"
+            where.append(f'{column} IN ({", ".join("?" * len(values))})')
+            args.extend(values)
+        if search:
+            text = " || ' ' || ".join(f"COALESCE(json_extract(data, '{self._json_path(field)}'), '')" for field in search_fields)
+            for word in search:
+                where.append(f"instr(LOWER({text}), ?) > 0")
+                args.append(word.lower())
+        if since_id is not None:
+            where.append('id > ?')
+            args.append(since_id)
+        order_fields = listing_order(sort, since)
+        if after is not None and not order_fields:
+            where.append('id > ?')
+            args.append(_id_order({"id": after[1]}))
+        elif after is not None:
+            # Sorted Keyset Reads Order And Seek In Python, Exactly Like The In-Memory Collection
+            rows = self._connection().execute(f'SELECT data FROM {self.name} WHERE {" AND ".join(where)}', args)
+            records = sorted((json.loads(row[0]) for row in rows), key=lambda record: OrderKey.of(record, order_fields))
+            return _seek(records, after, order_fields)[start:end]
+        order = ['id']
+        if since is not None:
+            where.append("COALESCE(json_extract(data, '$.updated_at'), '') >= ?")
+            args.append(since)
+            order = ["json_extract(data, '$.updated_at')", 'id']
+        if sort:
+            order = []
+            for field, descending in sort:
+                direction = ' DESC' if descending else ''
+                if field == 'id':
+                    order.append(f'id{direction}')
+                    continue
+                value = f"json_extract(data, '{self._json_path(field)}')"
+                order.append(f"COALESCE({value}, '') = ''")
+                order.append(f"LOWER({value}){direction}")
+            order.append('id')
+        rows = self._connection().execute(
+            f'SELECT data FROM {self.name} WHERE {" AND ".join(where)} ORDER BY {", ".join(order)} LIMIT ? OFFSET ?',
+            args + [max(0, end - start), start],
+        )
+        return [json.loads(row[0]) for row in rows]
+
+
+def candidate_summary(candidate):
+    emails = candidate.get("emails") or []
+    return {
+        "name": f"{candidate.get('first_name') or ''} {candidate.get('last_name') or ''}".strip(),
+        "email": emails[0].get("value") if emails else None,
+        "first_name": candidate.get("first_name"),
+        "last_name": candidate.get("last_name"),
+    }
+
+
+def join_candidate(application, candidates):
+    # Return A Copy With Candidate Info Attached; The Stored Record Is Left Untouched
+    joined = dict(application)
+    candidate = candidates.get(application.get("candidate_id"))
+    if candidate:
+        joined["candidate"] = candidate_summary(candidate)
+    return joined
+
+
+class IdempotencyLedger:
+    """
+    Stored Create Responses By Idempotency-Key, Kept For ttl Seconds.
+    run() Holds A Per-Key Lock Around The Check And The Create, So Concurrent
+    Duplicates Queue Up Behind The First And Replay Its Response While
+    Creates Under Other Keys Go Ahead.
+    """
+
+    PRUNE_EVERY = 100
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.entries = {}
+        # Guards entries And key_locks; key_locks Maps key To [lock, users]
+        self.lock = threading.Lock()
+        self.key_locks = {}
+        self.writes = 0
+
+    def run(self, key, fingerprint, create):
+        # Returns (body, status, replayed); create() Returns (body, status)
+        with self.lock:
+            holder = self.key_locks.setdefault(key, [threading.Lock(), 0])
+            holder[1] += 1
+        try:
+            with holder[0]:
+                now = time.time()
+                with self.lock:
+                    entry = self.entries.get(key)
+                if entry is not None and entry[3] > now:
+                    return _replay(entry[:3], fingerprint)
+                body, status = create()
+                if status < 500:
+                    with self.lock:
+                        self.entries[key] = (fingerprint, body, status, now + self.ttl)
+                        self._prune(now)
+                return body, status, False
+        finally:
+            with self.lock:
+                holder[1] -= 1
+                if not holder[1]:
+                    del self.key_locks[key]
+
+    def _prune(self, now):
+        self.writes += 1
+        if self.writes % self.PRUNE_EVERY == 0:
+            for key in [key for key, entry in self.entries.items() if entry[3] <= now]:
+                del self.entries[key]
+
+
+class SqliteIdempotencyLedger:
+    """
+    Same Interface As IdempotencyLedger, Stored In Its Own Sqlite File. Each
+    run() Is One IMMEDIATE Transaction On That File, Which Serializes Keyed
+    Creates Across Worker Processes Without Locking The Collections.
+    """
+
+    def __init__(self, path, ttl):
+        self.path = path
+        self.ttl = ttl
+        self.local = threading.local()
+        with self._connection() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS idempotency (key TEXT PRIMARY KEY, fingerprint TEXT, body TEXT, status INTEGER, expires_at REAL)')
+
+    def _connection(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None or self.local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self.local.conn = conn
+            self.local.pid = os.getpid()
+        return conn
+
+    def run(self, key, fingerprint, create):
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            now = time.time()
+            row = conn.execute('SELECT fingerprint, body, status FROM idempotency WHERE key = ? AND expires_at > ?', (key, now)).fetchone()
+            if row is not None:
+                return _replay((row[0], json.loads(row[1]), row[2]), fingerprint)
+            body, status = create()
+            if status < 500:
+                conn.execute('INSERT OR REPLACE INTO idempotency VALUES (?, ?, ?, ?, ?)', (key, fingerprint, json.dumps(body), status, now + self.ttl))
+                conn.execute('DELETE FROM idempotency WHERE expires_at <= ?', (now,))
+            return body, status, False
+        finally:
+            conn.execute('COMMIT')
+
+
+def _replay(entry, fingerprint):
+    stored_fingerprint, body, status = entry
+    if stored_fingerprint != fingerprint:
+        return {"error": "Idempotency-Key Reused With A Different Body"}, 422, False
+    return body, status, True
+
+
+class Journal:
+    """
+    Write-Behind Persistence For One Collection.
+
+    - append() Only Buffers; The Buffer Is Written To The Journal Once It
+      Holds flush_count Records Or When The Background Flusher Runs
+    - Every compact_every Journal Records, The Whole Collection Is Written To
+      A Temp File And os.replace()d Over The Snapshot, Then The Journal Is Reset
+    - replay() Loads Snapshot Then Journal; Records Are Upserted By id, So A
+      Record Present In Both (Or Twice In The Journal) Is Harmless, And A
+      Torn Final Line From A Crash Is Skipped
+    """
+
+    def __init__(self, collection, snapshot_path, journal_path=None, flush_count=100, compact_every=10000):
+        self.collection = collection
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path or os.path.splitext(snapshot_path)[0] + '.journal.jsonl'
+        self.flush_count = flush_count
+        self.compact_every = compact_every
+        self.buffer = []
+        self.journal_size = 0
+        self.lock = threading.Lock()
+
+    def replay(self):
+        records = []
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r') as f:
+                records = json.load(f)
+        self.collection.load(records)
+
+        self.journal_size = 0
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    self.collection.upsert(record)
+                    self.journal_size += 1
+
+    def append(self, record):
+        with self.lock:
+            self.buffer.append(record)
+            if len(self.buffer) >= self.flush_count:
+                self._flush_locked()
+
+    def flush(self):
+        with self.lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self.buffer:
+            return
+        lines = ''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in self.buffer)
+        with open(self.journal_path, 'a') as f:
+            f.write(lines)
+        self.journal_size += len(self.buffer)
+        self.buffer = []
+        if self.journal_size >= self.compact_every:
+            self._compact_locked()
+
+    def compact(self):
+        with self.lock:
+            self._flush_locked()
+            self._compact_locked()
+
+    def _compact_locked(self):
+        directory = os.path.dirname(os.path.abspath(self.snapshot_path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.snapshot-', suffix='.json')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.collection.records(), f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.snapshot_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        # Everything Journaled So Far Is In The Snapshot Now
+        with open(self.journal_path, 'w'):
+            pass
+        self.journal_size = 0
+
+
+def start_flusher(journals, interval):
+    # Background Thread That Flushes Partially Filled Buffers Every interval Seconds
+    def run():
+        while True:
+            time.sleep(interval)
+            for journal in journals:
+                try:
+                    journal.flush()
+                except Exception:
+                    pass
+
+    thread = threading.Thread(target=run, name='journal-flusher', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,147 @@
+"""
+Outgoing Webhooks For The Mock ATS
+
+Creates (And Application / Candidate / Offer Updates) Are Announced To One
+Url As Signed Events, Like A Vendor's Change Feed:
+
+    {"id": "evt_...", "type": "application.created", "created_at": "...", "data": {...}}
+
+Signed With X-Ats-Signature: t=<Unix Seconds>,v1=<HMAC-SHA256 Of "t.body">
+(The Scheme SVL-FRAMEWORK/ats_webhooks.py Verifies). One Background Thread
+Delivers Them In Order, Retrying Failures With Backoff; A Share Of Events
+Can Be Sent Twice On Purpose (duplicates), As Real Senders Deliver At Least
+Once. Application Events Carry The Joined Candidate, Like GET /applications.
+"""
+
+import hashlib
+import hmac
+import json
+import queue
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+from datetime import datetime, timezone
+
+
+def sign(secret, body, timestamp=None):
+    stamp = int(time.time()) if timestamp is None else int(timestamp)
+    digest = hmac.new(secret.encode(), f'{stamp}.{body}'.encode(), hashlib.sha256).hexdigest()
+    return f't={stamp},v1={digest}'
+
+
+class WebhookEmitter:
+    """
+    Queue Plus Delivery Thread (Started On The First Event). Safe To Share
+    Between Request Threads; configure() Swaps The Target At Runtime.
+    """
+
+    def __init__(self, url='', secret='', duplicates=0.0, attempts=3, timeout=5.0, seed=None):
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.random = random.Random(seed)
+        self.thread = None
+        self.attempts = attempts
+        self.timeout = timeout
+        self.stats = {"emitted": 0, "delivered": 0, "duplicated": 0, "retries": 0, "failed": 0}
+        self.configure({"url": url, "secret": secret, "duplicates": duplicates})
+
+    def configure(self, settings):
+        if not isinstance(settings, dict):
+            raise ValueError('Webhook Settings Must Be An Object')
+        duplicates = float(settings.get('duplicates', 0) or 0)
+        if not 0 <= duplicates <= 1:
+            raise ValueError('duplicates Must Be Between 0 And 1')
+        url = settings.get('url') or ''
+        parts = urllib.parse.urlsplit(url) if isinstance(url, str) else None
+        if url and (parts is None or parts.scheme not in ('http', 'https') or not parts.hostname):
+            raise ValueError('url Must Be An http(s) Url With A Host')
+        with self.lock:
+            self.url = url
+            self.secret = settings.get('secret') or ''
+            self.duplicates = duplicates
+
+    def __bool__(self):
+        return bool(self.url)
+
+    def emit(self, event_type, data):
+        # Queue One Event; A No-Op While No Url Is Set
+        with self.lock:
+            if not self.url:
+                return None
+            event = {
+                "id": f'evt_{uuid.uuid4().hex}',
+                "type": event_type,
+                "created_at": datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
+                "data": data,
+            }
+            self.stats["emitted"] += 1
+            copies = 2 if self.duplicates and self.random.random() < self.duplicates else 1
+            self.stats["duplicated"] += copies - 1
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.deliver_forever, name='Mock-Webhooks', daemon=True)
+                self.thread.start()
+        for _ in range(copies):
+            self.queue.put((self.url, self.secret, event))
+        return event["id"]
+
+    def deliver_forever(self):
+        while True:
+            url, secret, event = self.queue.get()
+            try:
+                self.deliver(url, secret, event)
+            except Exception:
+                # Never Let One Bad Event Stop The Only Delivery Thread
+                with self.lock:
+                    self.stats["failed"] += 1
+            finally:
+                self.queue.task_done()
+
+    def deliver(self, url, secret, event):
+        body = json.dumps(event, separators=(',', ':'))
+        for attempt in range(self.attempts):
+            if attempt:
+                with self.lock:
+                    self.stats["retries"] += 1
+                time.sleep(min(2.0, 0.1 * 2 ** attempt))
+            # Signed Per Attempt, So A Retry After A Long Backoff Is Not Refused As Expired
+            request = urllib.request.Request(
+                url,
+                data=body.encode(),
+                method='POST',
+                headers={"Content-Type": "application/json", "X-Ats-Signature": sign(secret, body)},
+            )
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    response.read()
+                with self.lock:
+                    self.stats["delivered"] += 1
+                return True
+            except urllib.error.HTTPError as error:
+                # Refusals (Bad Signature, Unknown Connector) Will Not Change On Retry
+                if error.code < 500 and error.code != 429:
+                    break
+            except (urllib.error.URLError, OSError):
+                pass
+        with self.lock:
+            self.stats["failed"] += 1
+        return False
+
+    def flush(self, timeout=10.0):
+        # Wait Until Every Queued Event Has Been Delivered Or Given Up On
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return not self.queue.unfinished_tasks
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "url": self.url,
+                "duplicates": self.duplicates,
+                "pending": self.queue.unfinished_tasks,
+                "stats": dict(self.stats),
+            }
@@ -0,0 +1,398 @@
+"""
+Asyncio Ats Client
+
+Mirrors AtsClient On aiohttp, So Handlers Can Await Several Upstream Calls
+At Once. Takes The Same Config Snapshot As AtsClient (See handler._ReadAtsConfig).
+
+aiohttp Is Optional; It Is Only Imported When An AsyncAtsClient Is Built.
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from ats_normalize import ExtractList
+from ats_ratelimit import QUOTA_METER, AsyncSingleFlight, FlightKey, RateLimiter
+from ats_resilience import CircuitOpenError, ParseRetryAfter, Resilience, UpstreamError
+from ats_trace import Span, TraceUpstream
+
+
+class AsyncAtsClient:
+    """
+    Async ATS Client Wrapper
+
+    - Same Endpoints, Method Names, Timeouts, Errors, Resilience And Rate Limit Rules As AtsClient
+    - One aiohttp.ClientSession (Pooled Connector) Per Client, Created On
+      First Use Inside The Running Event Loop
+    """
+
+    def __init__(self, Config: Dict[str, Any]) -> None:
+        self.Config = Config
+        self.AtsBaseUrl = Config.get("AtsBaseUrl")
+        self.AtsApiKey = Config.get("AtsApiKey")
+        self.AtsApplicationsPath = Config.get("AtsApplicationsPath") or "/applications"
+
+        if not self.AtsBaseUrl or not self.AtsApiKey:
+            raise ValueError("Missing AtsBaseUrl Or AtsApiKey Environment Variables")
+
+        self.AtsBaseUrl = self.AtsBaseUrl.rstrip("/")
+        self.Timeouts: Dict[str, float] = Config.get("Timeouts") or {}
+        self._Session: Any = None
+        self.Resilience = Resilience(Config)
+        self.Limiter = RateLimiter(Config)
+        self.Flights: Optional[AsyncSingleFlight] = AsyncSingleFlight() if Config.get("Coalesce", True) else None
+
+    def _GetSession(self) -> Any:
+        if self._Session is None or self._Session.closed:
+            import aiohttp
+
+            KeepAlive = self.Config.get("KeepAlive", True)
+            Connector = aiohttp.TCPConnector(
+                limit=int(self.Config.get("PoolSize") or 10),
+                keepalive_timeout=60 if KeepAlive else None,
+                force_close=not KeepAlive,
+            )
+            self._Session = aiohttp.ClientSession(
+                connector=Connector,
+                headers={
+                    "Authorization": f"Bearer {self.AtsApiKey}",
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                },
+            )
+        return self._Session
+
+    def _GetTimeout(self, Endpoint: str) -> Any:
+        import aiohttp
+
+        return aiohttp.ClientTimeout(
+            total=self.Timeouts.get(Endpoint, 15),
+            connect=self.Config.get("ConnectTimeout"),
+        )
+
+    async def Close(self) -> None:
+        if self._Session is not None and not self._Session.closed:
+            await self._Session.close()
+        self.Limiter.Close()
+
+    async def _Send(
+        self,
+        Method: str,
+        Endpoint: str,
+        Url: str,
+        Params: Dict[str, str],
+        Payload: Optional[Dict[str, Any]],
+        Headers: Optional[Dict[str, str]],
+    ) -> Tuple[int, Any, str]:
+        """
+        One Attempt, Returning (Status, Headers, Body Text).
+        """
+        QUOTA_METER.CountUpstreamCall(Endpoint)
+        Start = time.monotonic()
+        async with self._GetSession().request(
+            Method,
+            Url,
+            params=Params,
+            json=Payload,
+            headers=Headers,
+            timeout=self._GetTimeout(Endpoint),
+        ) as Response:
+            Text = await Response.text()
+        if Response.status < 500:
+            self.Resilience.Latency.Record(Endpoint, time.monotonic() - Start)
+        return Response.status, Response.headers, Text
+
+    async def _SendHedged(self, Endpoint: str, Send: Callable[[], Awaitable[Tuple[int, Any, str]]]) -> Tuple[int, Any, str]:
+        """
+        Async Counterpart Of AtsClient._SendHedged; The Losing Request Is Cancelled.
+        """
+        Delay = self.Resilience.Latency.HedgeDelay(Endpoint, self.Resilience.HedgeMinDelay)
+        if Delay is None:
+            return await Send()
+
+        Primary = asyncio.ensure_future(Send())
+        Done, _ = await asyncio.wait({Primary}, timeout=Delay)
+        if Done or not self.Limiter.TryReserve(Endpoint):
+            return await Primary
+
+        self.Resilience.Count("hedges")
+        Backup = asyncio.ensure_future(Send())
+        Pending = {Primary, Backup}
+        Error: Optional[BaseException] = None
+        try:
+            while Pending:
+                Done, Pending = await asyncio.wait(Pending, return_when=asyncio.FIRST_COMPLETED)
+                for Finished in Done:
+                    if Finished.exception() is None:
+                        if Finished is Backup:
+                            self.Resilience.Count("hedge_wins")
+                        return Finished.result()
+                    Error = Finished.exception()
+            raise Error  # type: ignore[misc]
+        finally:
+            for Straggler in Pending:
+                Straggler.cancel()
+
+    async def _Request(
+        self,
+        Method: str,
+        Endpoint: str,
+        Path: str,
+        Label: str,
+        Params: Optional[Dict[str, Any]] = None,
+        Payload: Optional[Dict[str, Any]] = None,
+        Headers: Optional[Dict[str, str]] = None,
+        IdempotencyKey: Optional[str] = None,
+    ) -> Tuple[int, Any, Optional[str]]:
+        """
+        Send One Logical Request And Return (Status, Json, ETag). 304 Yields A None Body.
+        Identical GETs In Flight Are Joined, As In AtsClient._Request.
+        """
+        if Method == "GET" and self.Flights is not None:
+            return await self.Flights.Do(
+                FlightKey(Endpoint, Params, Headers),
+                lambda: self._Exchange(Method, Endpoint, Path, Label, Params, Payload, Headers, IdempotencyKey),
+            )
+        return await self._Exchange(Method, Endpoint, Path, Label, Params, Payload, Headers, IdempotencyKey)
+
+    async def _Exchange(
+        self,
+        Method: str,
+        Endpoint: str,
+        Path: str,
+        Label: str,
+        Params: Optional[Dict[str, Any]],
+        Payload: Optional[Dict[str, Any]],
+        Headers: Optional[Dict[str, str]],
+        IdempotencyKey: Optional[str],
+    ) -> Tuple[int, Any, Optional[str]]:
+        """
+        Same Rate Limit, Breaker, Retry And Hedging Rules As AtsClient._Exchange.
+        """
+        import aiohttp
+
+        Resilience = self.Resilience
+        Policy = Resilience.Policy
+        Breaker = Resilience.Breaker(Endpoint)
+        Repeatable = Method == "GET" or IdempotencyKey is not None
+        if IdempotencyKey is not None:
+            Headers = {**(Headers or {}), "Idempotency-Key": IdempotencyKey}
+        Query = {Key: str(Value) for Key, Value in (Params or {}).items()}
+        Url = f"{self.AtsBaseUrl}{Path}"
+
+        def Send() -> Awaitable[Tuple[int, Any, str]]:
+            return self._Send(Method, Endpoint, Url, Query, Payload, Headers)
+
+        Attempt = 0
+        while True:
+            Attempt += 1
+            Throttle = self.Limiter.Reserve(Endpoint)
+            if Throttle:
+                await asyncio.sleep(Throttle)
+            if not Breaker.Allow():
+                self.Limiter.Refund(Endpoint)
+                Resilience.Count("short_circuits")
+                raise CircuitOpenError(Endpoint, Breaker.RetryIn())
+
+            RetryAfter: Optional[float] = None
+            Status: Optional[int] = None
+            Started = time.perf_counter()
+            try:
+                Status, ResponseHeaders, Text = await (self._SendHedged(Endpoint, Send) if Method == "GET" and Resilience.HedgeEnabled else Send())
+                TraceUpstream(Endpoint, Method, Attempt, Status, Started, len(Text))
+                if Status >= 500:
+                    Breaker.RecordFailure()
+                else:
+                    Breaker.RecordSuccess()
+
+                ETag = ResponseHeaders.get("ETag")
+                if Status == 304:
+                    return 304, None, ETag
+                if Status < 400:
+                    with Span("upstream_json"):
+                        Body = json.loads(Text)
+                    return Status, Body, ETag
+
+                if Status in (429, 503):
+                    RetryAfter = ParseRetryAfter(ResponseHeaders.get("Retry-After"))
+                Failure = UpstreamError(f"Ats {Label} Error: {Status} {Text}", StatusCode=Status, RetryAfter=RetryAfter)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as Ex:
+                # ValueError Covers A Truncated Or Garbled Json Body
+                if Status is None:
+                    TraceUpstream(Endpoint, Method, Attempt, None, Started, Error=type(Ex).__name__)
+                Breaker.RecordFailure()
+                Failure = UpstreamError(f"Ats {Label} Error: {Ex!r}")
+
+            Wait = Policy.Delay(Attempt, RetryAfter) if Repeatable and Policy.ShouldRetry(Attempt, Failure.StatusCode) else None
+            if Wait is None:
+                raise Failure
+            Resilience.Count("retries")
+            await asyncio.sleep(Wait)
+
+    @staticmethod
+    def _PageParams(Page: Optional[int], PerPage: Optional[int]) -> Dict[str, Any]:
+        Params: Dict[str, Any] = {}
+        if Page is not None:
+            Params["page"] = Page
+        if PerPage is not None:
+            Params["per_page"] = PerPage
+        return Params
+
+    # -----------------------
+    # Jobs / Offers
+    # -----------------------
+    async def GetJobsFromAts(self, Page: Optional[int] = None, PerPage: Optional[int] = None) -> Dict[str, Any]:
+        _, Body, _ = await self._Request("GET", "GetJobs", "/offers", "Jobs", Params=self._PageParams(Page, PerPage))
+        return Body
+
+    # -----------------------
+    # Candidates
+    # -----------------------
+    async def CreateCandidateInAts(self, CandidatePayload: Dict[str, Any], IdempotencyKey: Optional[str] = None) -> Dict[str, Any]:
+        _, Body, _ = await self._Request(
+            "POST", "CreateCandidate", "/candidates", "Create Candidate", Payload=CandidatePayload, IdempotencyKey=IdempotencyKey
+        )
+        return Body
+
+    async def GetCandidatesFromAts(self, Page: Optional[int] = None, PerPage: Optional[int] = None) -> Dict[str, Any]:
+        _, Body, _ = await self._Request("GET", "GetCandidates", "/candidates", "Candidates", Params=self._PageParams(Page, PerPage))
+        return Body
+
+    # -----------------------
+    # Applications / Pipeline
+    # -----------------------
+    async def CreateApplicationInAts(self, CandidateId: str, JobId: str, IdempotencyKey: Optional[str] = None) -> Dict[str, Any]:
+        Payload = {
+            "candidate_id": CandidateId,
+            "job_id": JobId,
+        }
+        _, Body, _ = await self._Request(
+            "POST", "CreateApplication", self.AtsApplicationsPath, "Create Application", Payload=Payload, IdempotencyKey=IdempotencyKey
+        )
+        return Body
+
+    async def GetApplicationsFromAts(
+        self,
+        JobId: Optional[str] = None,
+        Page: Optional[int] = None,
+        PerPage: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        Params = self._PageParams(Page, PerPage)
+        if JobId is not None:
+            Params["job_id"] = JobId
+        _, Body, _ = await self._Request("GET", "GetApplications", self.AtsApplicationsPath, "Applications", Params=Params)
+        return Body
+
+    async def GetConditional(
+        self,
+        Resource: str,
+        Params: Dict[str, Any],
+        IfNoneMatch: Optional[str] = None,
+    ) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Async Counterpart Of AtsClient.GetConditional.
+        """
+        Endpoint, Path, Label = {
+            "jobs": ("GetJobs", "/offers", "Jobs"),
+            "candidates": ("GetCandidates", "/candidates", "Candidates"),
+            "applications": ("GetApplications", self.AtsApplicationsPath, "Applications"),
+        }[Resource]
+        Headers = {"If-None-Match": IfNoneMatch} if IfNoneMatch else None
+        Status, Body, ETag = await self._Request("GET", Endpoint, Path, Label, Params=Params, Headers=Headers)
+        if Status == 304:
+            return None, ETag or IfNoneMatch
+        return Body, ETag
+
+    # -----------------------
+    # Auto-Pagination
+    # -----------------------
+    async def _IterPages(
+        self,
+        FetchPage: Callable[[int], Awaitable[Any]],
+        PerPage: int,
+        StartPage: int,
+        PrefetchDepth: Optional[int],
+    ) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Async Counterpart Of AtsClient._IterPages: Following Pages Run As
+        Concurrent Tasks While The Caller Works On The Current One.
+        """
+        Depth = self.Config.get("PrefetchDepth", 2) if PrefetchDepth is None else PrefetchDepth
+        Pending: Deque[Tuple[int, "asyncio.Task[Any]"]] = deque()
+        NextPage = StartPage
+
+        try:
+            while True:
+                while len(Pending) <= max(0, Depth):
+                    Pending.append((NextPage, asyncio.ensure_future(FetchPage(NextPage))))
+                    NextPage += 1
+
+                Page, PageTask = Pending.popleft()
+                Records = ExtractList(await PageTask)
+                if Records:
+                    yield Page, Records
+                if len(Records) < PerPage:
+                    return
+        finally:
+            for _, PageTask in Pending:
+                PageTask.cancel()
+
+    async def IterCursorPagesFromAts(
+        self,
+        Resource: str,
+        Params: Dict[str, Any],
+        PerPage: int = 100,
+        StartCursor: str = "",
+    ) -> AsyncIterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Async Counterpart Of AtsClient.IterCursorPagesFromAts (No Prefetch).
+        """
+        Cursor: Optional[str] = StartCursor
+        while Cursor is not None:
+            Raw, _ = await self.GetConditional(Resource, {**Params, "cursor": Cursor, "per_page": PerPage})
+            Records = ExtractList(Raw)
+            if Records:
+                yield Cursor, Records
+            Cursor = Raw.get("next_cursor") if isinstance(Raw, dict) else None
+
+    def IterJobsFromAts(
+        self,
+        PerPage: int = 100,
+        StartPage: int = 1,
+        PrefetchDepth: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        return self._IterPages(
+            lambda Page: self.GetJobsFromAts(Page=Page, PerPage=PerPage),
+            PerPage,
+            StartPage,
+            PrefetchDepth,
+        )
+
+    def IterCandidatesFromAts(
+        self,
+        PerPage: int = 100,
+        StartPage: int = 1,
+        PrefetchDepth: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        return self._IterPages(
+            lambda Page: self.GetCandidatesFromAts(Page=Page, PerPage=PerPage),
+            PerPage,
+            StartPage,
+            PrefetchDepth,
+        )
+
+    def IterApplicationsFromAts(
+        self,
+        JobId: Optional[str] = None,
+        PerPage: int = 100,
+        StartPage: int = 1,
+        PrefetchDepth: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        return self._IterPages(
+            lambda Page: self.GetApplicationsFromAts(JobId=JobId, Page=Page, PerPage=PerPage),
+            PerPage,
+            StartPage,
+            PrefetchDepth,
+        )
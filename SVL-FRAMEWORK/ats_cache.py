@@ -0,0 +1,288 @@
+"""
+Response Cache For The Unified Read Endpoints
+
+- LruCacheTier: In-Process LRU, Lives As Long As The Lambda Container
+- SqliteCacheTier: Optional File-Backed Tier Shared By Every Worker On The Host
+- ResponseCache: Per-Resource TTLs Over One Or Two Tiers, With ETag Bookkeeping
+  For Conditional Revalidation And Hit/Miss/Eviction Counters
+
+Entries Hold The Already Serialized Unified Body, So A Hit Skips Both The
+Upstream Call And Normalization.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class CacheEntry:
+    """
+    One Cached Response Body.
+    """
+
+    __slots__ = ("Resource", "Body", "ETag", "ExpiresAt", "Generation")
+
+    def __init__(self, Resource: str, Body: str, ETag: Optional[str], ExpiresAt: float, Generation: int = 0) -> None:
+        self.Resource = Resource
+        self.Body = Body
+        self.ETag = ETag
+        self.ExpiresAt = ExpiresAt
+        self.Generation = Generation
+
+    def IsFresh(self, Now: float) -> bool:
+        return Now < self.ExpiresAt
+
+
+class CacheStats:
+    """
+    Thread-Safe Counters Reported By ResponseCache.Snapshot().
+    """
+
+    FIELDS = ("hits", "misses", "revalidations", "evictions", "invalidations", "stores", "discarded")
+
+    def __init__(self) -> None:
+        self._Lock = threading.Lock()
+        self._Counts: Dict[str, int] = {Field: 0 for Field in self.FIELDS}
+
+    def Increment(self, Field: str, Amount: int = 1) -> None:
+        with self._Lock:
+            self._Counts[Field] += Amount
+
+    def Snapshot(self) -> Dict[str, int]:
+        with self._Lock:
+            return dict(self._Counts)
+
+
+class CacheTier(ABC):
+    """
+    Interface Every Cache Tier Implements.
+    """
+
+    @abstractmethod
+    def Get(self, Key: str) -> Optional[CacheEntry]:
+        ...
+
+    @abstractmethod
+    def Set(self, Key: str, Entry: CacheEntry) -> None:
+        ...
+
+    @abstractmethod
+    def InvalidateResource(self, Resource: str) -> None:
+        ...
+
+    @abstractmethod
+    def Generation(self, Resource: str) -> int:
+        """
+        Counter Bumped On Every Invalidation Of Resource, As Seen By Everyone Sharing The Tier.
+        """
+
+
+class LruCacheTier(CacheTier):
+    """
+    Bounded In-Process LRU. Expired Entries Are Kept Until Evicted, So They
+    Can Still Be Revalidated With Their ETag.
+    """
+
+    def __init__(self, MaxEntries: int, Stats: CacheStats) -> None:
+        self.MaxEntries = max(1, MaxEntries)
+        self.Stats = Stats
+        self._Entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._Generations: Dict[str, int] = defaultdict(int)
+        self._Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._Entries)
+
+    def Get(self, Key: str) -> Optional[CacheEntry]:
+        with self._Lock:
+            Entry = self._Entries.get(Key)
+            if Entry is not None:
+                self._Entries.move_to_end(Key)
+            return Entry
+
+    def Set(self, Key: str, Entry: CacheEntry) -> None:
+        with self._Lock:
+            self._Entries[Key] = Entry
+            self._Entries.move_to_end(Key)
+            while len(self._Entries) > self.MaxEntries:
+                self._Entries.popitem(last=False)
+                self.Stats.Increment("evictions")
+
+    def Delete(self, Key: str) -> None:
+        with self._Lock:
+            self._Entries.pop(Key, None)
+
+    def InvalidateResource(self, Resource: str) -> None:
+        with self._Lock:
+            for Key in [Key for Key, Entry in self._Entries.items() if Entry.Resource == Resource]:
+                del self._Entries[Key]
+            self._Generations[Resource] += 1
+
+    def Generation(self, Resource: str) -> int:
+        with self._Lock:
+            return self._Generations[Resource]
+
+
+class SqliteCacheTier(CacheTier):
+    """
+    Sqlite-Backed Tier Shared By Every Process That Opens The Same File.
+    Invalidations Bump A Per-Resource Generation So Other Workers Can Tell
+    Their In-Process Copies Are Stale.
+    """
+
+    PRUNE_EVERY = 100
+
+    def __init__(self, Path: str, Stats: CacheStats) -> None:
+        self.Path = Path
+        self.Stats = Stats
+        self._Lock = threading.Lock()
+        self._Writes = 0
+        self._Connection = sqlite3.connect(Path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._Connection.execute("PRAGMA journal_mode=WAL")
+        self._Connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, resource TEXT, body TEXT, etag TEXT, expires_at REAL, generation INTEGER)"
+        )
+        self._Connection.execute("CREATE TABLE IF NOT EXISTS generations (resource TEXT PRIMARY KEY, generation INTEGER)")
+
+    def Get(self, Key: str) -> Optional[CacheEntry]:
+        with self._Lock:
+            Row = self._Connection.execute(
+                "SELECT resource, body, etag, expires_at, generation FROM entries WHERE key = ?",
+                (Key,),
+            ).fetchone()
+        return CacheEntry(*Row) if Row else None
+
+    def Set(self, Key: str, Entry: CacheEntry) -> None:
+        with self._Lock:
+            self._Connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (Key, Entry.Resource, Entry.Body, Entry.ETag, Entry.ExpiresAt, Entry.Generation),
+            )
+            self._Writes += 1
+            if self._Writes % self.PRUNE_EVERY == 0:
+                # Drop Rows Long Past Expiry; Recently Expired Ones Stay For Revalidation
+                Cursor = self._Connection.execute("DELETE FROM entries WHERE expires_at < ?", (time.time() - 3600,))
+                self.Stats.Increment("evictions", max(0, Cursor.rowcount))
+
+    def InvalidateResource(self, Resource: str) -> None:
+        with self._Lock:
+            self._Connection.execute("DELETE FROM entries WHERE resource = ?", (Resource,))
+            self._Connection.execute(
+                "INSERT INTO generations VALUES (?, 1) "
+                "ON CONFLICT(resource) DO UPDATE SET generation = generation + 1",
+                (Resource,),
+            )
+
+    def Generation(self, Resource: str) -> int:
+        with self._Lock:
+            Row = self._Connection.execute(
+                "SELECT generation FROM generations WHERE resource = ?",
+                (Resource,),
+            ).fetchone()
+        return Row[0] if Row else 0
+
+
+class ResponseCache:
+    """
+    Two-Level Response Cache With Per-Resource TTLs.
+
+    Lookup Returns The Entry (Fresh Or Stale), Whether It Is Still Fresh,
+    And The Resource's Generation. A Stale Entry With An ETag Should Be
+    Revalidated Upstream, Then Either Refreshed (304) Or Replaced (200);
+    Handing That Generation Back To Store / Refresh Drops The Write If The
+    Resource Was Invalidated While The Upstream Was Being Read.
+    """
+
+    def __init__(
+        self,
+        Ttls: Dict[str, float],
+        MaxEntries: int = 256,
+        SharedPath: Optional[str] = None,
+    ) -> None:
+        self.Ttls = Ttls
+        self.Stats = CacheStats()
+        self.Local = LruCacheTier(MaxEntries, self.Stats)
+        self.Shared: Optional[CacheTier] = SqliteCacheTier(SharedPath, self.Stats) if SharedPath else None
+        # Orders Store's Generation Check Against Invalidate In This Process
+        self._Lock = threading.Lock()
+
+    @staticmethod
+    def MakeKey(Resource: str, *Parts: Any) -> str:
+        return json.dumps([Resource, *Parts], separators=(",", ":"), default=str)
+
+    def IsCacheable(self, Resource: str) -> bool:
+        return self.Ttls.get(Resource, 0) > 0
+
+    def Generation(self, Resource: str) -> Tuple[int, int]:
+        """
+        (Local, Shared) Invalidation Counters Of Resource.
+        """
+        return (self.Local.Generation(Resource), self.Shared.Generation(Resource) if self.Shared else 0)
+
+    def Lookup(self, Resource: str, Key: str) -> Tuple[Optional[CacheEntry], bool, Tuple[int, int]]:
+        Now = time.time()
+        Generation = self.Generation(Resource)
+
+        Entry = self.Local.Get(Key)
+        if Entry is not None and Entry.Generation != Generation[1]:
+            self.Local.Delete(Key)
+            Entry = None
+
+        if Entry is None and self.Shared is not None:
+            Entry = self.Shared.Get(Key)
+            if Entry is not None:
+                self.Local.Set(Key, Entry)
+
+        if Entry is not None and Entry.IsFresh(Now):
+            self.Stats.Increment("hits")
+            return Entry, True, Generation
+
+        self.Stats.Increment("misses")
+        return Entry, False, Generation
+
+    def Store(
+        self, Resource: str, Key: str, Body: str, ETag: Optional[str], Generation: Optional[Tuple[int, int]] = None
+    ) -> Optional[CacheEntry]:
+        """
+        Cache Body, Unless Resource Was Invalidated Since Generation (From
+        Lookup) Was Read: That Body May Predate The Write. Returns The Entry,
+        Or None When The Write Was Discarded.
+        """
+        with self._Lock:
+            Current = self.Generation(Resource)
+            if Generation is not None and Generation != Current:
+                self.Stats.Increment("discarded")
+                return None
+            Entry = CacheEntry(Resource, Body, ETag, time.time() + self.Ttls.get(Resource, 0), Current[1])
+            self.Local.Set(Key, Entry)
+            if self.Shared is not None:
+                self.Shared.Set(Key, Entry)
+        self.Stats.Increment("stores")
+        return Entry
+
+    def Refresh(self, Key: str, Entry: CacheEntry, Generation: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Extend A Stale Entry After The Upstream Confirmed It With 304 Not Modified.
+        """
+        self.Stats.Increment("revalidations")
+        self.Store(Entry.Resource, Key, Entry.Body, Entry.ETag, Generation)
+
+    def Invalidate(self, Resources: Iterable[str]) -> None:
+        for Resource in Resources:
+            with self._Lock:
+                self.Local.InvalidateResource(Resource)
+                if self.Shared is not None:
+                    self.Shared.InvalidateResource(Resource)
+            self.Stats.Increment("invalidations")
+
+    def Snapshot(self) -> Dict[str, Any]:
+        return {
+            **self.Stats.Snapshot(),
+            "entries": len(self.Local),
+            "shared": self.Shared is not None,
+        }
@@ -0,0 +1,118 @@
+"""
+Environment Configuration, Read Once Per Container
+
+Lambda Environment Variables Cannot Change While A Container Lives, So
+Inside Lambda (AWS_LAMBDA_FUNCTION_NAME Set) The Environment Is Copied Once
+At Import And Every Config Reader Decorated With @Cached Runs Only Once.
+Outside Lambda (Local Runs, serverless-offline, Benchmarks That Flip
+Settings Between Calls) Every Read Goes To os.environ, As Before.
+AtsConfigReload=true Keeps Live Reads Inside Lambda Too.
+
+Validate() Runs Every Registered Reader Up Front, So A Malformed Setting
+Fails The Init Phase With A ConfigError Naming It Instead Of Failing Each
+Request Later.
+"""
+
+import functools
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_FALSE_VALUES = ("0", "false", "no", "off")
+
+
+class ConfigError(ValueError):
+    """
+    An Environment Setting That Cannot Be Parsed.
+    """
+
+
+def InLambda() -> bool:
+    return bool(os.environ.get("AWS_LAMBDA_FUNCTION_NAME"))
+
+
+def _ShouldFreeze() -> bool:
+    return InLambda() and os.environ.get("AtsConfigReload", "false").strip().lower() in _FALSE_VALUES
+
+
+_Frozen = _ShouldFreeze()
+_Snapshot: Dict[str, str] = dict(os.environ) if _Frozen else {}
+_Readers: List[Tuple[Callable[[], Any], List[Any]]] = []
+
+
+def Frozen() -> bool:
+    """
+    True When Settings Are Read Once (Inside Lambda, Without AtsConfigReload).
+    """
+    return _Frozen
+
+
+def Env(Name: str, Default: Optional[str] = None) -> Optional[str]:
+    """
+    os.environ.get, Served From The Init-Time Copy When Frozen.
+    """
+    if _Frozen:
+        return _Snapshot.get(Name, Default)
+    return os.environ.get(Name, Default)
+
+
+def EnvInt(Name: str, Default: int) -> int:
+    Raw = Env(Name)
+    try:
+        return int(Raw) if Raw not in (None, "") else Default
+    except ValueError:
+        raise ConfigError(f"{Name} Must Be An Integer, Got {Raw!r}") from None
+
+
+def EnvFloat(Name: str, Default: float) -> float:
+    Raw = Env(Name)
+    try:
+        return float(Raw) if Raw not in (None, "") else float(Default)
+    except ValueError:
+        raise ConfigError(f"{Name} Must Be A Number, Got {Raw!r}") from None
+
+
+def Cached(Reader: Callable[[], T]) -> Callable[[], T]:
+    """
+    Run A No-Argument Config Reader Once When Frozen, Every Call Otherwise.
+    The Cached Value Is Shared, So Callers Must Not Mutate It.
+    """
+    Slot: List[Any] = []
+
+    @functools.wraps(Reader)
+    def Read() -> T:
+        if not _Frozen:
+            return Reader()
+        if not Slot:
+            Slot.append(Reader())
+        return Slot[0]
+
+    _Readers.append((Reader, Slot))
+    return Read
+
+
+def Validate() -> None:
+    """
+    Parse Every Registered Setting Now, Raising ConfigError On The First Bad One.
+    """
+    for Reader, Slot in _Readers:
+        try:
+            Value = Reader()
+        except ConfigError:
+            raise
+        except (TypeError, ValueError) as Ex:
+            raise ConfigError(f"Invalid Setting In {Reader.__name__}: {Ex}") from None
+        if _Frozen and not Slot:
+            Slot.append(Value)
+
+
+def Reload() -> None:
+    """
+    Re-Read The Environment And Drop Every Cached Reader Value.
+    """
+    global _Frozen, _Snapshot
+    _Frozen = _ShouldFreeze()
+    _Snapshot = dict(os.environ) if _Frozen else {}
+    for _, Slot in _Readers:
+        Slot.clear()
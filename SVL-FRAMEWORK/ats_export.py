@@ -0,0 +1,404 @@
+"""
+Streaming Bulk Export Of Unified Records
+
+Pages Are Pulled One At A Time (Upstream I/O Is Injected As A Pages
+Callable), Normalized And Encoded Straight Into The Target, So Memory Stays
+Flat However Many Records There Are:
+
+- Formats:  ndjson  One Unified Record Per Line
+            csv     Header Plus One Row Per Record; Nested Values As JSON
+            parquet Columnar, One Row Group Per Chunk (Needs pyarrow, Which
+                    Is Optional And Only Imported For This Format)
+- Targets:  /path/file.ndjson   One File, Appended Chunk By Chunk
+            store:///path/dir   Object Store Stand-In: Each Chunk Is Its Own
+                                Immutable Part Object (part-00000.csv, ...),
+                                Plus _manifest.json When The Export Completes
+
+After Every Chunk (ChunkRows Records, Ending On A Page Boundary) The Target
+Is Flushed And A Checkpoint Is Written Next To It: The Last Page Exported,
+Rows So Far, And The File Offset Or Parts List. A Rerun Resumes From There,
+Dropping Anything Written After The Checkpoint; Once An Export Completes,
+The Next Run Starts A Fresh One Over The Same Target. Parquet Parts Are
+Complete Files, So Parquet Needs A store:// Target.
+"""
+
+import csv
+import io
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from ats_normalize import UnifiedRecord
+from ats_serialize import DumpJsonBytes
+
+FORMATS = ("ndjson", "csv", "parquet")
+STORE_PREFIX = "store://"
+DEFAULT_CHUNK_ROWS = 10000
+
+Position = Union[int, str]
+# Pages(Start) -> Iterator Of (Position That Fetched The Page, Raw Records); Start None Means From The Beginning
+PageSource = Callable[[Optional[Position]], Iterator[Tuple[Position, List[Dict[str, Any]]]]]
+
+
+class ExportError(ValueError):
+    """
+    An Export Request That Cannot Run As Given (Format, Target Or Missing pyarrow).
+    """
+
+
+# -----------------------
+# Writers
+# -----------------------
+class _Writer:
+    """
+    Encodes Unified Records; Begin() Opens A File Or Part, End() Closes A Chunk.
+    """
+
+    Extension = ""
+
+    def __init__(self, Fields: Tuple[str, ...]) -> None:
+        self.Fields = Fields
+
+    def Begin(self) -> bytes:
+        return b""
+
+    def Add(self, Records: List[UnifiedRecord]) -> bytes:
+        raise NotImplementedError
+
+    def End(self) -> bytes:
+        return b""
+
+
+class NdjsonWriter(_Writer):
+    Extension = "ndjson"
+
+    def Add(self, Records: List[UnifiedRecord]) -> bytes:
+        return b"".join(DumpJsonBytes(Record) + b"\n" for Record in Records)
+
+
+def _Cell(Value: Any) -> Any:
+    if isinstance(Value, (dict, list)):
+        return json.dumps(Value, separators=(",", ":"))
+    return Value
+
+
+class CsvWriter(_Writer):
+    Extension = "csv"
+
+    def _Encode(self, Rows: List[List[Any]]) -> bytes:
+        Buffer = io.StringIO()
+        csv.writer(Buffer, lineterminator="\n").writerows(Rows)
+        return Buffer.getvalue().encode("utf-8")
+
+    def Begin(self) -> bytes:
+        return self._Encode([list(self.Fields)])
+
+    def Add(self, Records: List[UnifiedRecord]) -> bytes:
+        return self._Encode([[_Cell(getattr(Record, Field)) for Field in self.Fields] for Record in Records])
+
+
+class ParquetWriter(_Writer):
+    """
+    Buffers One Chunk Column By Column, Then Writes It As A Parquet File.
+    Every Column Is A Nullable String, So Parts Always Share One Schema.
+    """
+
+    Extension = "parquet"
+
+    def __init__(self, Fields: Tuple[str, ...]) -> None:
+        super().__init__(Fields)
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ExportError("format=parquet Needs pyarrow In The Deployment Package")
+        self._Arrow = pyarrow
+        self._Parquet = pyarrow.parquet
+        self._Schema = pyarrow.schema([(Field, pyarrow.string()) for Field in Fields])
+        self._Columns: Dict[str, List[Optional[str]]] = {Field: [] for Field in Fields}
+
+    def Add(self, Records: List[UnifiedRecord]) -> bytes:
+        for Field, Column in self._Columns.items():
+            for Record in Records:
+                Value = _Cell(getattr(Record, Field))
+                Column.append(None if Value is None else str(Value))
+        return b""
+
+    def End(self) -> bytes:
+        Table = self._Arrow.Table.from_pydict(self._Columns, schema=self._Schema)
+        Buffer = io.BytesIO()
+        self._Parquet.write_table(Table, Buffer, compression="zstd")
+        self._Columns = {Field: [] for Field in self.Fields}
+        return Buffer.getvalue()
+
+
+WRITERS = {"ndjson": NdjsonWriter, "csv": CsvWriter, "parquet": ParquetWriter}
+
+
+# -----------------------
+# Targets
+# -----------------------
+def _WriteAtomically(Path: str, Data: bytes) -> None:
+    Temporary = Path + ".tmp"
+    with open(Temporary, "wb") as Handle:
+        Handle.write(Data)
+        Handle.flush()
+        os.fsync(Handle.fileno())
+    os.replace(Temporary, Path)
+
+
+class FileSink:
+    """
+    One Local File. Chunks Are Appended As They Are Encoded; A Resume
+    Truncates Back To The Checkpointed Offset First.
+    """
+
+    def __init__(self, Path: str) -> None:
+        self.Path = Path
+        self.CheckpointPath = Path + ".checkpoint.json"
+        self._Handle: Optional[Any] = None
+
+    def Open(self, State: Dict[str, Any]) -> None:
+        Directory = os.path.dirname(os.path.abspath(self.Path))
+        os.makedirs(Directory, exist_ok=True)
+        Offset = int(State.get("bytes", 0))
+        self._Handle = open(self.Path, "r+b" if Offset and os.path.exists(self.Path) else "wb")
+        self._Handle.truncate(Offset)
+        self._Handle.seek(Offset)
+
+    def NewPart(self) -> bool:
+        # Only The Start Of The File Takes A Header
+        return self._Handle.tell() == 0
+
+    def Write(self, Data: bytes) -> None:
+        if Data:
+            self._Handle.write(Data)
+
+    def Commit(self, Rows: int) -> Dict[str, Any]:
+        self._Handle.flush()
+        os.fsync(self._Handle.fileno())
+        return {"bytes": self._Handle.tell()}
+
+    def Finish(self, Summary: Dict[str, Any]) -> None:
+        self.Close()
+
+    def Close(self) -> None:
+        if self._Handle is not None:
+            self._Handle.close()
+            self._Handle = None
+
+
+class ObjectStoreSink:
+    """
+    A Directory Standing In For An Object Store Prefix: Each Chunk Is Put As
+    One Immutable Object, And A Resume Simply Overwrites Parts Past The Checkpoint.
+    """
+
+    def __init__(self, Directory: str, Extension: str) -> None:
+        self.Directory = Directory
+        self.Extension = Extension
+        self.CheckpointPath = os.path.join(Directory, "_checkpoint.json")
+        self.Parts: List[Dict[str, Any]] = []
+        self._Buffer = io.BytesIO()
+
+    def Open(self, State: Dict[str, Any]) -> None:
+        os.makedirs(self.Directory, exist_ok=True)
+        self.Parts = list(State.get("parts", []))
+        self._Buffer = io.BytesIO()
+        if not self.Parts:
+            # A Fresh Export: The Previous Manifest No Longer Describes The Parts
+            self._Remove("_manifest.json")
+
+    def NewPart(self) -> bool:
+        return True
+
+    def Write(self, Data: bytes) -> None:
+        self._Buffer.write(Data)
+
+    def Commit(self, Rows: int) -> Dict[str, Any]:
+        Key = f"part-{len(self.Parts):05d}.{self.Extension}"
+        Data = self._Buffer.getvalue()
+        _WriteAtomically(os.path.join(self.Directory, Key), Data)
+        self.Parts.append({"key": Key, "rows": Rows, "bytes": len(Data)})
+        self._Buffer = io.BytesIO()
+        return {"parts": self.Parts, "bytes": sum(Part["bytes"] for Part in self.Parts)}
+
+    def Finish(self, Summary: Dict[str, Any]) -> None:
+        # Parts Left By A Longer Earlier Export Are Not Part Of This One
+        Keys = {Part["key"] for Part in self.Parts}
+        for Name in os.listdir(self.Directory):
+            if Name.startswith("part-") and Name.endswith("." + self.Extension) and Name not in Keys:
+                self._Remove(Name)
+        _WriteAtomically(os.path.join(self.Directory, "_manifest.json"), json.dumps({**Summary, "parts": self.Parts}, indent=2).encode())
+
+    def _Remove(self, Name: str) -> None:
+        try:
+            os.remove(os.path.join(self.Directory, Name))
+        except FileNotFoundError:
+            pass
+
+    def Close(self) -> None:
+        self._Buffer = io.BytesIO()
+
+
+def OpenSink(Target: str, Format: str) -> Union[FileSink, ObjectStoreSink]:
+    if Target.startswith(STORE_PREFIX):
+        return ObjectStoreSink(Target[len(STORE_PREFIX):], WRITERS[Format].Extension)
+    if Format == "parquet":
+        raise ExportError("format=parquet Writes One Part Per Chunk; Use A store:// Target")
+    return FileSink(Target)
+
+
+# -----------------------
+# Export Loop
+# -----------------------
+def _LoadCheckpoint(Path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(Path, "r") as Handle:
+            return json.load(Handle)
+    except (OSError, ValueError):
+        return None
+
+
+def Export(
+    Pages: PageSource,
+    UnifyPage: Callable[[List[Dict[str, Any]]], List[UnifiedRecord]],
+    Fields: Tuple[str, ...],
+    Resource: str,
+    Format: str,
+    Target: str,
+    ChunkRows: int = DEFAULT_CHUNK_ROWS,
+    PerPage: Optional[int] = None,
+    Restart: bool = False,
+    ShouldStop: Callable[[], bool] = lambda: False,
+    Progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Export Every Page Of Resource To Target, Resuming From Its Checkpoint
+    Unless Restart Is Set, The Checkpoint Is For Another Export, Or Its
+    Export Completed (Then A Fresh One Starts). PerPage Is The Page Size
+    Pages Reads With: Page Positions Depend On It, So It Is Part Of The
+    Checkpoint's Identity. ShouldStop Is Asked After Each Chunk; Stopping
+    Leaves status "partial" And A Checkpoint To Resume From. Progress Gets
+    Each Chunk's Summary.
+    """
+    if Format not in WRITERS:
+        raise ExportError(f"Unknown Format {Format!r}; Expected One Of {', '.join(FORMATS)}")
+    Sink = OpenSink(Target, Format)
+    Identity = {"resource": Resource, "format": Format, "target": Target, "fields": list(Fields), "per_page": PerPage}
+    Checkpoint = None if Restart else _LoadCheckpoint(Sink.CheckpointPath)
+    if Checkpoint is not None and (Checkpoint.get("export") != Identity or Checkpoint.get("status") == "complete"):
+        Checkpoint = None
+
+    Writer = WRITERS[Format](Fields)
+    Start: Optional[Position] = Checkpoint["last_page"] if Checkpoint else None
+    Rows = Checkpoint["rows"] if Checkpoint else 0
+    Started = time.perf_counter()
+    Written = 0
+    PartRows = 0
+    InPart = False
+    Last = Start
+    State: Dict[str, Any] = Checkpoint["sink"] if Checkpoint else {}
+
+    def Summary(Status: str) -> Dict[str, Any]:
+        Seconds = time.perf_counter() - Started
+        return {
+            "status": Status,
+            **Identity,
+            "rows": Rows,
+            "rows_written": Written,
+            "bytes": State.get("bytes", 0),
+            "parts": len(State.get("parts", [])) or None,
+            "seconds": round(Seconds, 3),
+            "rows_per_second": round(Written / Seconds, 1) if Seconds > 0 else None,
+            "resumed": Checkpoint is not None,
+        }
+
+    def Save(Status: str) -> Dict[str, Any]:
+        Report = Summary(Status)
+        _WriteAtomically(
+            Sink.CheckpointPath,
+            json.dumps({"export": Identity, "status": Status, "last_page": Last, "rows": Rows, "sink": State, "summary": Report}).encode(),
+        )
+        return Report
+
+    Sink.Open(State)
+    try:
+        Skip = Start is not None
+        for Page, Records in Pages(Start):
+            # A Resume Starts By Re-Reading The Checkpointed Page, Which Is Already Out
+            if Skip and Page == Start:
+                Skip = False
+                continue
+            Skip = False
+            if not InPart:
+                if Sink.NewPart():
+                    Sink.Write(Writer.Begin())
+                InPart = True
+            Unified = UnifyPage(Records)
+            Sink.Write(Writer.Add(Unified))
+            PartRows += len(Unified)
+            Last = Page
+            if PartRows < ChunkRows:
+                continue
+
+            Sink.Write(Writer.End())
+            State = Sink.Commit(PartRows)
+            Rows += PartRows
+            Written += PartRows
+            PartRows, InPart = 0, False
+            Report = Save("running")
+            if Progress is not None:
+                Progress(Report)
+            if ShouldStop():
+                return Save("partial")
+
+        if InPart and PartRows:
+            Sink.Write(Writer.End())
+            State = Sink.Commit(PartRows)
+            Rows += PartRows
+            Written += PartRows
+        Report = Summary("complete")
+        Sink.Finish(Report)
+        return Save("complete")
+    finally:
+        Sink.Close()
+
+
+def Main() -> None:
+    """
+    Command Line Entry: python SVL-FRAMEWORK/ats_export.py candidates --format csv --out /tmp/candidates.csv
+    Reads AtsBaseUrl / AtsApiKey (And Every Other Client Setting) From The Environment.
+    """
+    import argparse
+    import logging
+
+    Parser = argparse.ArgumentParser(description="Stream Unified Jobs, Candidates Or Applications To A File Or store:// Prefix")
+    Parser.add_argument("resource", choices=("jobs", "candidates", "applications"))
+    Parser.add_argument("--format", choices=FORMATS, default="ndjson")
+    Parser.add_argument("--out", required=True, help="File Path, Or store:///Directory For Part Objects")
+    Parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    Parser.add_argument("--per-page", type=int, default=None, help="Upstream Page Size")
+    Parser.add_argument("--restart", action="store_true", help="Ignore Any Checkpoint And Start Over")
+    Args = Parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    import handler
+
+    Event = {
+        "resource": Args.resource,
+        "format": Args.format,
+        "target": Args.out,
+        "chunk_rows": Args.chunk_rows,
+        "per_page": Args.per_page,
+        "restart": Args.restart,
+    }
+    Result = handler.ExportResource(Event, None)
+    print(json.dumps(Result, indent=2))
+    if Result.get("status") != "complete":
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    Main()
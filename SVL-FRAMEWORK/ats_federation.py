@@ -0,0 +1,255 @@
+"""
+Multi-ATS Federation
+
+A Connector Registry Names Every Upstream One Deployment Serves (Tenants,
+Or Different Vendors), Each With Its Own Base Url, Auth, Paths And Field
+Mapping Profile. It Comes From AtsConnectors (Inline JSON) Or
+AtsConnectorsPath (A JSON File):
+
+    {
+      "connectors": [
+        {"name": "acme", "base_url": "https://acme.example.com/api", "api_key_env": "AcmeApiKey"},
+        {
+          "name": "globex",
+          "base_url": "https://ats.globex.example.com",
+          "api_key": "...",
+          "auth_header": "X-Api-Key",
+          "auth_scheme": "",
+          "headers": {"X-Tenant": "globex"},
+          "paths": {"jobs": "/v2/jobs", "candidates": "/v2/people", "applications": "/v2/applications"},
+          "timeouts": "GetJobs=5,GetCandidates=5",
+          "rate_limits": "*=10",
+          "field_profile": "generic"
+        }
+      ],
+      "default": ["acme", "globex"]
+    }
+
+GET /jobs, /candidates And /applications Fan Out To The Connectors Named By
+connectors=acme,globex (Or connectors=all), Or To "default" When The
+Request Names None; Without Either They Read The Single AtsBaseUrl
+Upstream As Before. Each Connector Is Read Concurrently, And A Connector
+That Fails, Or Has Not Answered Within AtsFederationTimeout, Is Reported
+Instead Of Failing The Request (partial: true). Records Are Tagged With
+Their connector, Interleaved By Position Within Each Upstream Page (Ties In
+Registry Order, So The Order Never Depends On Which Upstream Answered
+First), And De-Duplicated On A Unified Field Per Resource (AtsFederationDedup,
+E.g. Candidates By email): The First Copy In That Order Wins.
+"""
+
+import json
+import time
+from concurrent.futures import Executor, Future, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ats_config import Env
+
+# Default De-Duplication Field Per Resource (Unified Field Names)
+DEFAULT_DEDUP = "jobs=external_url,candidates=email"
+
+# Spec Keys And The AtsClient Config Keys They Fill
+_PASSTHROUGH = {"auth_header": "AuthHeader", "auth_scheme": "AuthScheme"}
+_KNOWN_KEYS = frozenset(
+    ("name", "base_url", "api_key", "api_key_env", "auth_header", "auth_scheme", "headers", "paths", "timeouts", "rate_limits", "field_profile")
+)
+RESOURCES = ("jobs", "candidates", "applications")
+
+
+class FederationError(ValueError):
+    """
+    A connectors= Request The Registry Cannot Serve; Handlers Answer 400.
+    """
+
+
+class Connector:
+    """
+    One Named Upstream: Its AtsClient Config Overrides And Field Profile.
+    """
+
+    __slots__ = ("Name", "BaseUrl", "ApiKey", "Overrides", "Timeouts", "RateLimits", "FieldProfile")
+
+    def __init__(self, Spec: Dict[str, Any]) -> None:
+        if not isinstance(Spec, dict):
+            raise ValueError("Each Connector Must Be An Object")
+        Unknown = sorted(set(Spec) - _KNOWN_KEYS)
+        Name = str(Spec.get("name") or "").strip()
+        if not Name or not Name.replace("-", "").replace("_", "").isalnum():
+            raise ValueError(f"Connector Name Must Be Letters, Digits, - Or _; Got {Spec.get('name')!r}")
+        if Unknown:
+            raise ValueError(f"Connector {Name}: Unknown Keys {', '.join(Unknown)}")
+
+        self.Name = Name
+        self.BaseUrl = str(Spec.get("base_url") or "").rstrip("/")
+        self.ApiKey = Spec.get("api_key") or (Env(Spec["api_key_env"]) if Spec.get("api_key_env") else None)
+        if not self.BaseUrl or not self.ApiKey:
+            raise ValueError(f"Connector {Name}: base_url And api_key (Or api_key_env) Are Required")
+
+        Paths = Spec.get("paths") or {}
+        if not isinstance(Paths, dict) or set(Paths) - set(RESOURCES):
+            raise ValueError(f"Connector {Name}: paths Maps {', '.join(RESOURCES)} To Upstream Paths")
+        Headers = Spec.get("headers") or {}
+        if not isinstance(Headers, dict):
+            raise ValueError(f"Connector {Name}: headers Must Be An Object")
+
+        self.Overrides: Dict[str, Any] = {Key: Spec[Field] for Field, Key in _PASSTHROUGH.items() if Field in Spec}
+        self.Overrides["Paths"] = {Resource: str(Path) for Resource, Path in Paths.items()}
+        self.Overrides["Headers"] = {str(Header): str(Value) for Header, Value in Headers.items()}
+        self.Timeouts: Optional[str] = Spec.get("timeouts")
+        self.RateLimits: Optional[str] = Spec.get("rate_limits")
+        self.FieldProfile: Optional[str] = Spec.get("field_profile")
+
+
+class ConnectorRegistry:
+    def __init__(self, Connectors: List[Connector], Default: Optional[List[str]] = None) -> None:
+        self.Connectors = {Item.Name: Item for Item in Connectors}
+        if len(self.Connectors) != len(Connectors):
+            raise ValueError("Connector Names Must Be Unique")
+        self.Names: Tuple[str, ...] = tuple(Item.Name for Item in Connectors)
+        self.Default: Tuple[str, ...] = tuple(Default or ())
+        Unknown = [Name for Name in self.Default if Name not in self.Connectors]
+        if Unknown:
+            raise ValueError(f"Default Connectors Not In The Registry: {', '.join(Unknown)}")
+
+    def Select(self, Raw: Optional[str]) -> Optional[List[Connector]]:
+        """
+        Connectors For A Request's connectors= Value, In Registry Order.
+        None Means The Request Takes The Single-Upstream Path.
+        """
+        if not Raw:
+            Names = self.Default
+        elif Raw.strip().lower() == "all":
+            Names = self.Names
+        else:
+            Names = tuple(Name.strip() for Name in Raw.split(",") if Name.strip())
+            Unknown = [Name for Name in Names if Name not in self.Connectors]
+            if Unknown:
+                raise FederationError(f"Unknown Connectors: {', '.join(Unknown)}; Configured: {', '.join(self.Names)}")
+        if not Names:
+            return None
+        return [self.Connectors[Name] for Name in self.Names if Name in Names]
+
+
+def ParseRegistry(Raw: str) -> ConnectorRegistry:
+    """
+    Build The Registry From The JSON Text Of AtsConnectors / AtsConnectorsPath.
+    """
+    Spec = json.loads(Raw)
+    if isinstance(Spec, list):
+        Spec = {"connectors": Spec}
+    if not isinstance(Spec, dict) or not isinstance(Spec.get("connectors"), list) or not Spec["connectors"]:
+        raise ValueError('Connectors Config Must Be {"connectors": [...]} With At Least One Connector')
+    return ConnectorRegistry([Connector(Item) for Item in Spec["connectors"]], Spec.get("default"))
+
+
+def ParseDedup(Raw: Optional[str]) -> Dict[str, str]:
+    """
+    Parse "jobs=external_url,candidates=email" Into {Resource: Unified Field}.
+    """
+    Fields: Dict[str, str] = {}
+    for Entry in (Raw or "").split(","):
+        if "=" in Entry:
+            Resource, Field = Entry.split("=", 1)
+            if Field.strip():
+                Fields[Resource.strip()] = Field.strip()
+    return Fields
+
+
+# -----------------------
+# Fan-Out And Merge
+# -----------------------
+class ConnectorResult:
+    """
+    One Connector's Share Of A Federated Read.
+    """
+
+    __slots__ = ("Name", "Status", "Millis", "Records", "Error")
+
+    def __init__(self, Name: str, Status: str, Millis: float, Records: Optional[List[Dict[str, Any]]] = None, Error: Optional[BaseException] = None) -> None:
+        self.Name = Name
+        self.Status = Status
+        self.Millis = Millis
+        self.Records = Records or []
+        self.Error = Error
+
+    def Report(self) -> Dict[str, Any]:
+        Report: Dict[str, Any] = {"status": self.Status, "ms": round(self.Millis, 1), "count": len(self.Records)}
+        if self.Error is not None:
+            Report["error"] = str(self.Error)
+        return Report
+
+
+def FanOut(
+    Pool: Executor,
+    Connectors: List[Connector],
+    Fetch: Callable[[Connector], List[Dict[str, Any]]],
+    Timeout: float,
+) -> List[ConnectorResult]:
+    """
+    Run Fetch For Every Connector At Once And Collect What Arrived Within
+    Timeout Seconds, In Connector Order. A Connector Still Running At The
+    Deadline Is Reported As "timeout" And Left To Finish In The Background:
+    cancel() Only Stops Fetches Still Queued, So Fetch Must Bound Its Own
+    Requests By Timeout And Pool Must Have Room For Such Stragglers.
+    """
+    Start = time.perf_counter()
+    Finished: Dict[str, float] = {}
+
+    def Timed(Item: Connector) -> List[Dict[str, Any]]:
+        try:
+            return Fetch(Item)
+        finally:
+            Finished[Item.Name] = (time.perf_counter() - Start) * 1000
+
+    Pending: List[Tuple[Connector, "Future[List[Dict[str, Any]]]"]] = [(Item, Pool.submit(Timed, Item)) for Item in Connectors]
+    wait([Task for _, Task in Pending], timeout=Timeout)
+
+    Results: List[ConnectorResult] = []
+    for Item, Task in Pending:
+        if not Task.done():
+            Task.cancel()
+            Results.append(ConnectorResult(Item.Name, "timeout", Timeout * 1000))
+            continue
+        Millis = Finished.get(Item.Name, (time.perf_counter() - Start) * 1000)
+        Error = Task.exception()
+        if Error is not None:
+            Results.append(ConnectorResult(Item.Name, "error", Millis, Error=Error))
+        else:
+            Results.append(ConnectorResult(Item.Name, "ok", Millis, Task.result()))
+    return Results
+
+
+def MergeRecords(Results: List[ConnectorResult], DedupField: Optional[str] = None) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Interleave The Connectors' Records By Position (Registry Order Within A
+    Position), Tag Each With Its connector, And Drop Later Copies Of A
+    Non-Empty DedupField Value (Compared Case-Insensitively). Returns
+    (Records, Duplicates Dropped).
+    """
+    Merged: List[Dict[str, Any]] = []
+    Seen: set = set()
+    Duplicates = 0
+    Depth = max((len(Result.Records) for Result in Results), default=0)
+    for Position in range(Depth):
+        for Result in Results:
+            if Position >= len(Result.Records):
+                continue
+            Record = Result.Records[Position]
+            if DedupField:
+                Value = Record.get(DedupField)
+                Key = str(Value).strip().lower() if Value not in (None, "") else None
+                if Key is not None:
+                    if Key in Seen:
+                        Duplicates += 1
+                        continue
+                    Seen.add(Key)
+            Merged.append({**Record, "connector": Result.Name})
+    return Merged, Duplicates
+
+
+def ServerTiming(Results: List[ConnectorResult]) -> str:
+    """
+    Per-Connector Server-Timing Header Value, E.g. 'acme;dur=41.2, globex;dur=5000.0;desc="timeout"'.
+    """
+    return ", ".join(
+        f"{Result.Name};dur={Result.Millis:.1f}" + ("" if Result.Status == "ok" else f';desc="{Result.Status}"') for Result in Results
+    )
@@ -0,0 +1,345 @@
+"""
+Idempotent Writes: Stored Responses And A Candidate Email Index
+
+- MemoryIdempotencyTier: In-Process Records, Lives As Long As The Lambda Container
+- SqliteIdempotencyTier: Optional File-Backed Tier Shared By Every Worker On The Host
+- IdempotencyStore: Claims A Request's Idempotency-Key Before Its Handler Runs
+  And Keeps The Finished Response For Ttl Seconds, So A Retry Gets The Same
+  Answer Without Another Upstream Create. A Duplicate Arriving While The
+  First Is Still Running Waits For It (Up To WaitSeconds) And Replays Too.
+  Also Maps Candidate Emails To Upstream Candidate Ids, So A Repeat Applicant
+  Reuses Their Candidate Instead Of Creating Another.
+
+Claims Are Leased: A Worker That Dies Mid-Request Holds Its Key For At Most
+LeaseSeconds. Keys Are Only As Shared As The Tier, So Lambda Containers Still
+Rely On The Idempotency-Key Forwarded Upstream Between Each Other.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# Outcomes Of IdempotencyStore.Begin
+CLAIMED = "claimed"
+REPLAY = "replay"
+MISMATCH = "mismatch"
+IN_FLIGHT = "in_flight"
+
+DEFAULT_LEASE_SECONDS = 60.0
+# Pause Between Checks While Waiting On Another Worker's Claim
+POLL_SECONDS = 0.05
+
+
+class StoredResponse:
+    """
+    One Claimed Key: Pending While Its Handler Runs, Then The Response It Gave.
+    """
+
+    __slots__ = ("Fingerprint", "Status", "Headers", "Body", "ExpiresAt", "Pending")
+
+    def __init__(
+        self,
+        Fingerprint: str,
+        Status: int,
+        Headers: Dict[str, str],
+        Body: str,
+        ExpiresAt: float,
+        Pending: bool = False,
+    ) -> None:
+        self.Fingerprint = Fingerprint
+        self.Status = Status
+        self.Headers = Headers
+        self.Body = Body
+        self.ExpiresAt = ExpiresAt
+        self.Pending = Pending
+
+
+class IdempotencyStats:
+    """
+    Thread-Safe Counters Reported By IdempotencyStore.Snapshot().
+    """
+
+    FIELDS = ("claims", "replays", "waits", "conflicts", "mismatches", "releases", "index_hits", "index_misses")
+
+    def __init__(self) -> None:
+        self._Lock = threading.Lock()
+        self._Counts: Dict[str, int] = {Field: 0 for Field in self.FIELDS}
+
+    def Increment(self, Field: str, Amount: int = 1) -> None:
+        with self._Lock:
+            self._Counts[Field] += Amount
+
+    def Snapshot(self) -> Dict[str, int]:
+        with self._Lock:
+            return dict(self._Counts)
+
+
+class IdempotencyTier:
+    """
+    Interface Every Tier Implements.
+    """
+
+    Shared = False
+
+    def Claim(self, Key: str, Fingerprint: str, LeaseUntil: float) -> Optional[StoredResponse]:
+        """
+        Atomically Mark Key Pending Unless A Live Record Holds It.
+        None When Claimed, Otherwise The Record Already There.
+        """
+        raise NotImplementedError
+
+    def Complete(self, Key: str, Record: StoredResponse) -> None:
+        raise NotImplementedError
+
+    def Release(self, Key: str) -> None:
+        raise NotImplementedError
+
+    def Wait(self, Key: str, Seconds: float) -> None:
+        """
+        Block Until Key May Have Changed, Or Seconds Pass. Polls By Default.
+        """
+        time.sleep(min(POLL_SECONDS, Seconds))
+
+    def GetCandidate(self, Email: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def SetCandidate(self, Email: str, CandidateId: str, ExpiresAt: float) -> None:
+        raise NotImplementedError
+
+    def DeleteCandidate(self, Email: str) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return 0
+
+
+class MemoryIdempotencyTier(IdempotencyTier):
+    """
+    Bounded In-Process Records. Completing Or Releasing A Key Wakes Every
+    Thread Waiting On It, So Concurrent Duplicates Replay At Once.
+    """
+
+    def __init__(self, MaxEntries: int) -> None:
+        self.MaxEntries = max(1, MaxEntries)
+        self._Records: "OrderedDict[str, StoredResponse]" = OrderedDict()
+        self._Candidates: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._Changed = threading.Condition()
+
+    def __len__(self) -> int:
+        return len(self._Records)
+
+    def _Trim(self, Entries: "OrderedDict[str, Any]") -> None:
+        while len(Entries) > self.MaxEntries:
+            Entries.popitem(last=False)
+
+    def Claim(self, Key: str, Fingerprint: str, LeaseUntil: float) -> Optional[StoredResponse]:
+        with self._Changed:
+            Record = self._Records.get(Key)
+            if Record is not None and time.time() < Record.ExpiresAt:
+                return Record
+            self._Records[Key] = StoredResponse(Fingerprint, 0, {}, "", LeaseUntil, Pending=True)
+            self._Records.move_to_end(Key)
+            self._Trim(self._Records)
+            return None
+
+    def Complete(self, Key: str, Record: StoredResponse) -> None:
+        with self._Changed:
+            self._Records[Key] = Record
+            self._Changed.notify_all()
+
+    def Release(self, Key: str) -> None:
+        with self._Changed:
+            self._Records.pop(Key, None)
+            self._Changed.notify_all()
+
+    def Wait(self, Key: str, Seconds: float) -> None:
+        with self._Changed:
+            Record = self._Records.get(Key)
+            if Record is not None and Record.Pending:
+                self._Changed.wait(Seconds)
+
+    def GetCandidate(self, Email: str) -> Optional[str]:
+        with self._Changed:
+            Entry = self._Candidates.get(Email)
+            if Entry is None or time.time() >= Entry[1]:
+                return None
+            self._Candidates.move_to_end(Email)
+            return Entry[0]
+
+    def SetCandidate(self, Email: str, CandidateId: str, ExpiresAt: float) -> None:
+        with self._Changed:
+            self._Candidates[Email] = (CandidateId, ExpiresAt)
+            self._Candidates.move_to_end(Email)
+            self._Trim(self._Candidates)
+
+    def DeleteCandidate(self, Email: str) -> None:
+        with self._Changed:
+            self._Candidates.pop(Email, None)
+
+
+class SqliteIdempotencyTier(IdempotencyTier):
+    """
+    Sqlite-Backed Tier Shared By Every Process That Opens The Same File.
+    Claims Run In An IMMEDIATE Transaction, So Two Workers Never Both Win One Key.
+    """
+
+    PRUNE_EVERY = 100
+    Shared = True
+
+    def __init__(self, Path: str) -> None:
+        self.Path = Path
+        self._Lock = threading.Lock()
+        self._Writes = 0
+        self._Connection = sqlite3.connect(Path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._Connection.execute("PRAGMA journal_mode=WAL")
+        self._Connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, fingerprint TEXT, status INTEGER, headers TEXT, body TEXT, expires_at REAL, pending INTEGER)"
+        )
+        self._Connection.execute("CREATE TABLE IF NOT EXISTS candidate_emails (email TEXT PRIMARY KEY, candidate_id TEXT, expires_at REAL)")
+
+    def __len__(self) -> int:
+        with self._Lock:
+            return self._Connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _Written(self) -> None:
+        self._Writes += 1
+        if self._Writes % self.PRUNE_EVERY == 0:
+            Now = time.time()
+            self._Connection.execute("DELETE FROM responses WHERE expires_at < ?", (Now,))
+            self._Connection.execute("DELETE FROM candidate_emails WHERE expires_at < ?", (Now,))
+
+    def Claim(self, Key: str, Fingerprint: str, LeaseUntil: float) -> Optional[StoredResponse]:
+        with self._Lock:
+            self._Connection.execute("BEGIN IMMEDIATE")
+            try:
+                Row = self._Connection.execute(
+                    "SELECT fingerprint, status, headers, body, expires_at, pending FROM responses WHERE key = ?",
+                    (Key,),
+                ).fetchone()
+                if Row is not None and time.time() < Row[4]:
+                    return StoredResponse(Row[0], Row[1], json.loads(Row[2]), Row[3], Row[4], bool(Row[5]))
+                self._Connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, 0, '{}', '', ?, 1)",
+                    (Key, Fingerprint, LeaseUntil),
+                )
+                self._Written()
+                return None
+            finally:
+                self._Connection.execute("COMMIT")
+
+    def Complete(self, Key: str, Record: StoredResponse) -> None:
+        with self._Lock:
+            self._Connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, 0)",
+                (Key, Record.Fingerprint, Record.Status, json.dumps(Record.Headers), Record.Body, Record.ExpiresAt),
+            )
+
+    def Release(self, Key: str) -> None:
+        with self._Lock:
+            self._Connection.execute("DELETE FROM responses WHERE key = ? AND pending = 1", (Key,))
+
+    def GetCandidate(self, Email: str) -> Optional[str]:
+        with self._Lock:
+            Row = self._Connection.execute(
+                "SELECT candidate_id FROM candidate_emails WHERE email = ? AND expires_at > ?",
+                (Email, time.time()),
+            ).fetchone()
+        return Row[0] if Row else None
+
+    def SetCandidate(self, Email: str, CandidateId: str, ExpiresAt: float) -> None:
+        with self._Lock:
+            self._Connection.execute("INSERT OR REPLACE INTO candidate_emails VALUES (?, ?, ?)", (Email, CandidateId, ExpiresAt))
+            self._Written()
+
+    def DeleteCandidate(self, Email: str) -> None:
+        with self._Lock:
+            self._Connection.execute("DELETE FROM candidate_emails WHERE email = ?", (Email,))
+
+
+class IdempotencyStore:
+    """
+    Stored Responses Per Idempotency-Key Plus The Candidate Email Index.
+
+    Begin Returns (Outcome, Record):
+    - CLAIMED:   First Sight Of Key; Run The Handler, Then Complete Or Release
+    - REPLAY:    Record Holds The Response To Send Again
+    - MISMATCH:  Key Was Used With A Different Request Body
+    - IN_FLIGHT: Another Request Still Holds Key After WaitSeconds
+
+    A Ttl Or IndexTtl Of 0 Turns That Half Off.
+    """
+
+    def __init__(
+        self,
+        Ttl: float,
+        IndexTtl: float,
+        WaitSeconds: float = 5.0,
+        MaxEntries: int = 1024,
+        SharedPath: Optional[str] = None,
+        LeaseSeconds: float = DEFAULT_LEASE_SECONDS,
+    ) -> None:
+        self.Ttl = Ttl
+        self.IndexTtl = IndexTtl
+        self.WaitSeconds = WaitSeconds
+        self.LeaseSeconds = LeaseSeconds
+        self.Stats = IdempotencyStats()
+        self.Tier: IdempotencyTier = SqliteIdempotencyTier(SharedPath) if SharedPath else MemoryIdempotencyTier(MaxEntries)
+
+    @staticmethod
+    def NormalizeEmail(Email: Any) -> str:
+        return str(Email).strip().lower()
+
+    def Begin(self, Key: str, Fingerprint: str) -> Tuple[str, Optional[StoredResponse]]:
+        Deadline = time.monotonic() + self.WaitSeconds
+        Waited = False
+        while True:
+            Record = self.Tier.Claim(Key, Fingerprint, time.time() + self.LeaseSeconds)
+            if Record is None:
+                self.Stats.Increment("claims")
+                return CLAIMED, None
+            if Record.Fingerprint != Fingerprint:
+                self.Stats.Increment("mismatches")
+                return MISMATCH, Record
+            if not Record.Pending:
+                self.Stats.Increment("replays")
+                return REPLAY, Record
+            Remaining = Deadline - time.monotonic()
+            if Remaining <= 0:
+                self.Stats.Increment("conflicts")
+                return IN_FLIGHT, Record
+            if not Waited:
+                self.Stats.Increment("waits")
+                Waited = True
+            self.Tier.Wait(Key, Remaining)
+
+    def Complete(self, Key: str, Fingerprint: str, Status: int, Headers: Dict[str, str], Body: str) -> None:
+        self.Tier.Complete(Key, StoredResponse(Fingerprint, Status, Headers, Body, time.time() + self.Ttl))
+
+    def Release(self, Key: str) -> None:
+        """
+        Give Up A Claim Without Storing Anything, So The Next Retry Runs Afresh.
+        """
+        self.Stats.Increment("releases")
+        self.Tier.Release(Key)
+
+    def LookupCandidate(self, Email: str) -> Optional[str]:
+        CandidateId = self.Tier.GetCandidate(self.NormalizeEmail(Email))
+        self.Stats.Increment("index_hits" if CandidateId is not None else "index_misses")
+        return CandidateId
+
+    def RememberCandidate(self, Email: str, CandidateId: str) -> None:
+        self.Tier.SetCandidate(self.NormalizeEmail(Email), CandidateId, time.time() + self.IndexTtl)
+
+    def ForgetCandidate(self, Email: str) -> None:
+        self.Tier.DeleteCandidate(self.NormalizeEmail(Email))
+
+    def Snapshot(self) -> Dict[str, Any]:
+        return {
+            **self.Stats.Snapshot(),
+            "entries": len(self.Tier),
+            "shared": self.Tier.Shared,
+        }
@@ -0,0 +1,417 @@
+"""
+Unified Record Normalization
+
+Maps Raw Ats Records To The Unified Job / Candidate / Application Shapes.
+Shared By The Sync And Async Handler Paths So Both Produce Identical Output.
+"""
+
+import json
+import keyword
+import os
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ats_config import Env
+from ats_trace import Span
+
+
+# -----------------------
+# Unified Record Mapping
+# -----------------------
+def BuildAtsCandidatePayload(Name: str, Email: str, Phone: Optional[str], ResumeUrl: Optional[str]) -> Dict[str, Any]:
+    """
+    Map Unified Candidate Fields To A Generic Ats Candidate Payload.
+    """
+    # Split Name Naively Into First / Last
+    NameParts = str(Name).strip().split(" ", 1)
+    FirstName = NameParts[0]
+    LastName = NameParts[1] if len(NameParts) > 1 else ""
+
+    return {
+        "first_name": FirstName,
+        "last_name": LastName,
+        "emails": [{"value": Email, "type": "work"}],
+        "phones": [{"value": Phone, "type": "mobile"}] if Phone else [],
+        "photo_url": None,
+        "social_links": [],
+        "cv_url": ResumeUrl,
+    }
+
+
+def UnifyCreatedApplication(CreatedApplication: Dict[str, Any], CandidateId: str, JobId: str) -> Dict[str, Any]:
+    """
+    Unified Shape Of An Application Returned By A Create Call.
+    """
+    with Span("normalize"):
+        return {
+            "id": str(CreatedApplication.get("id", "")),
+            "job_id": JobId,
+            "candidate_id": CandidateId,
+            "status": NormalizeApplicationStatus(CreatedApplication.get("status")),
+        }
+
+
+def ExtractList(Raw: Any) -> List[Dict[str, Any]]:
+    """
+    "data" Key Is Common, Fallback To Raw List
+    """
+    if isinstance(Raw, list):
+        return Raw
+    if isinstance(Raw, dict):
+        return Raw.get("data") or []
+    return []
+
+
+def UnifyJobs(Jobs: List[Dict[str, Any]]) -> List["UnifiedRecord"]:
+    with Span("normalize"):
+        return GetFieldMappers()["job"].MapPage(Jobs)
+
+
+def UnifyCandidates(Candidates: List[Dict[str, Any]]) -> List["UnifiedRecord"]:
+    with Span("normalize"):
+        return GetFieldMappers()["candidate"].MapPage(Candidates)
+
+
+def UnifyApplications(Applications: List[Dict[str, Any]]) -> List["UnifiedRecord"]:
+    with Span("normalize"):
+        return GetFieldMappers()["application"].MapPage(Applications)
+
+
+def UnifyJob(Job: Dict[str, Any]) -> Dict[str, Any]:
+    return UnifyJobs([Job])[0].ToDict()
+
+
+def UnifyCandidate(Candidate: Dict[str, Any]) -> Dict[str, Any]:
+    return UnifyCandidates([Candidate])[0].ToDict()
+
+
+def UnifyApplication(Application: Dict[str, Any]) -> Dict[str, Any]:
+    return UnifyApplications([Application])[0].ToDict()
+
+
+# -----------------------
+# Status Normalization Engine
+# -----------------------
+DEFAULT_STATUS_PROFILES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "status_profiles.json")
+
+
+class StatusNormalizer:
+    """
+    Table-Driven Raw -> Unified Status Mapping For One Resource.
+
+    Lookup Order: Memo, Then Exact Match On The Lowercased Value, Then One
+    Precompiled Regex Built From The Ordered "contains" Rules (Earlier Rules
+    Win, Like The Old if-Chain), Then The Default.
+    """
+
+    MEMO_LIMIT = 4096
+
+    def __init__(self, Spec: Dict[str, Any]) -> None:
+        self.Default: str = Spec["default"]
+        self.Exact: Dict[str, str] = {Key.lower(): Value for Key, Value in (Spec.get("exact") or {}).items()}
+
+        # One Lookahead Per Rule, Anchored At The Start, So Rule Order Decides Ties
+        Branches = []
+        self.Groups: Dict[str, str] = {}
+        for Index, (Unified, Fragments) in enumerate(Spec.get("contains") or []):
+            Group = f"R{Index}"
+            self.Groups[Group] = Unified
+            Alternatives = "|".join(re.escape(Fragment.lower()) for Fragment in Fragments)
+            Branches.append(f"(?=.*(?:{Alternatives}))(?P<{Group}>)")
+        self.Pattern = re.compile("|".join(Branches), re.DOTALL) if Branches else None
+        self._Memo: Dict[Any, str] = {}
+
+    def Normalize(self, Status: Optional[Any]) -> str:
+        try:
+            Unified = self._Memo.get(Status)
+        except TypeError:
+            # Unhashable Raw Value (E.g. A Nested Object); Resolve Without Memoizing
+            return self._Resolve(Status)
+        if Unified is not None:
+            return Unified
+
+        Unified = self._Resolve(Status)
+        if len(self._Memo) >= self.MEMO_LIMIT:
+            self._Memo.clear()
+        self._Memo[Status] = Unified
+        return Unified
+
+    def NormalizeMany(self, Statuses: List[Optional[Any]]) -> List[str]:
+        """
+        Normalize A Whole Page Of Raw Statuses, Resolving Each Distinct Value Once.
+        """
+        Memo = self._Memo
+        Normalize = self.Normalize
+        try:
+            return [Memo.get(Status) or Normalize(Status) for Status in Statuses]
+        except TypeError:
+            # A Raw Value On This Page Is Unhashable; Fall Back To Per-Record Lookups
+            return [Normalize(Status) for Status in Statuses]
+
+    @property
+    def Statuses(self) -> Tuple[str, ...]:
+        """
+        Every Unified Status This Table Can Produce.
+        """
+        return tuple(sorted({self.Default, *self.Exact.values(), *self.Groups.values()}))
+
+    def RawValues(self, Unified: str) -> List[str]:
+        """
+        Raw Statuses Listed In The Exact Table For One Unified Status. Values
+        That Only Reach It Through "contains" Rules Or The Default Are Not Known.
+        """
+        return sorted(Raw for Raw, Value in self.Exact.items() if Value == Unified)
+
+    def _Resolve(self, Status: Optional[Any]) -> str:
+        if not Status:
+            return self.Default
+        StatusLower = str(Status).lower()
+        Unified = self.Exact.get(StatusLower)
+        if Unified is not None:
+            return Unified
+        if self.Pattern is not None:
+            Match = self.Pattern.match(StatusLower)
+            if Match is not None:
+                return self.Groups[Match.lastgroup]
+        return self.Default
+
+
+_ProfileLock = threading.Lock()
+_ActiveProfile: Optional[Tuple[Tuple[str, str], Dict[str, StatusNormalizer]]] = None
+
+
+def LoadStatusProfile(Name: str, Path: str = DEFAULT_STATUS_PROFILES_PATH) -> Dict[str, StatusNormalizer]:
+    """
+    Compile One Named Profile From A Profiles File Into {"job": ..., "application": ...}.
+    """
+    with open(Path, "r") as ProfileFile:
+        Profiles = json.load(ProfileFile)
+    if Name not in Profiles:
+        raise ValueError(f"Unknown Status Profile: {Name}")
+    return {Resource: StatusNormalizer(Spec) for Resource, Spec in Profiles[Name].items()}
+
+
+def GetStatusNormalizers() -> Dict[str, StatusNormalizer]:
+    """
+    Return The Compiled Profile Chosen By AtsStatusProfile / AtsStatusProfilesPath.
+    Compiled Once Per Container And Recompiled Only If That Config Changes.
+    """
+    global _ActiveProfile
+    Key = (
+        Env("AtsStatusProfile", "generic"),
+        Env("AtsStatusProfilesPath") or DEFAULT_STATUS_PROFILES_PATH,
+    )
+    Active = _ActiveProfile
+    if Active is not None and Active[0] == Key:
+        return Active[1]
+
+    with _ProfileLock:
+        if _ActiveProfile is None or _ActiveProfile[0] != Key:
+            _ActiveProfile = (Key, LoadStatusProfile(*Key))
+        return _ActiveProfile[1]
+
+
+def NormalizeJobStatus(Status: Optional[str]) -> str:
+    return GetStatusNormalizers()["job"].Normalize(Status)
+
+
+def NormalizeApplicationStatus(Status: Optional[str]) -> str:
+    return GetStatusNormalizers()["application"].Normalize(Status)
+
+
+# -----------------------
+# Field Mapping Engine
+# -----------------------
+DEFAULT_FIELD_MAPPINGS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "field_mappings.json")
+
+
+class UnifiedRecord:
+    """
+    Base Of The Compact Records Built By FieldMapper. One Subclass Per
+    Resource Is Generated With __slots__ Set To The Spec's Output Fields.
+    """
+
+    __slots__ = ()
+    FIELDS: Tuple[str, ...] = ()
+
+    def ToDict(self) -> Dict[str, Any]:
+        return {Field: getattr(self, Field) for Field in self.FIELDS}
+
+    def __eq__(self, Other: Any) -> bool:
+        return type(Other) is type(self) and self.ToDict() == Other.ToDict()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.ToDict()!r})"
+
+
+# Names The Generated Source Or The Record Class Already Uses
+_RESERVED_FIELDS = frozenset(("self", "FIELDS", "ToDict"))
+
+
+def _BuildRecordClass(Resource: str, Fields: Tuple[str, ...]) -> type:
+    for Field in Fields:
+        if not Field.isidentifier() or keyword.iskeyword(Field) or Field in _RESERVED_FIELDS or Field.startswith("__"):
+            raise ValueError(f"Invalid Field Name In {Resource} Mapping: {Field!r}")
+
+    Arguments = ", ".join(Fields)
+    Source = (
+        f"def __init__(self, {Arguments}):\n"
+        + "".join(f"    self.{Field} = {Field}\n" for Field in Fields)
+        + "def ToDict(self):\n"
+        + "    return {" + ", ".join(f"{Field!r}: self.{Field}" for Field in Fields) + "}\n"
+    )
+    Namespace: Dict[str, Any] = {}
+    exec(compile(Source, f"<UnifiedRecord {Resource}>", "exec"), Namespace)
+    ClassName = "Unified" + "".join(Part.title() for Part in Resource.split("_"))
+    return type(
+        ClassName,
+        (UnifiedRecord,),
+        {"__slots__": Fields, "FIELDS": Fields, "__init__": Namespace["__init__"], "ToDict": Namespace["ToDict"]},
+    )
+
+
+def _Dig(Value: Any, Keys: Tuple[str, ...]) -> Any:
+    """
+    Follow A Dotted Path Through Nested Dicts And Lists; None If Any Step Is Missing.
+    """
+    for Key in Keys:
+        if isinstance(Value, dict):
+            Value = Value.get(Key)
+        elif isinstance(Value, list) and Key.isdigit():
+            Index = int(Key)
+            Value = Value[Index] if Index < len(Value) else None
+        else:
+            return None
+    return Value
+
+
+class FieldMapper:
+    """
+    Raw Ats Records -> UnifiedRecord, Compiled From A Declarative Spec.
+
+    Spec Is An Ordered {output_field: rule} Object. Each Rule Has:
+    - "from": Dotted Source Paths Tried In Order; The First Truthy Value Wins
+    - "join": Optional Paths Joined With Spaces When Every "from" Path Is Empty
+      (Empty Parts Count As "")
+    - "status": Optional Status Normalizer ("job" / "application") Applied To The Value
+    - "as": Optional Cast; Only "str" Is Supported
+
+    The Spec Is Turned Into The Source Of One MapPage Function With Every
+    Accessor Inlined, So A Page Is Mapped In A Single Comprehension And
+    Statuses Go Through One NormalizeMany Call.
+    """
+
+    def __init__(self, Resource: str, Spec: Dict[str, Dict[str, Any]]) -> None:
+        self.Resource = Resource
+        self.Fields: Tuple[str, ...] = tuple(Spec)
+        self.Record = _BuildRecordClass(Resource, self.Fields)
+        self.Source = self._Generate(Spec)
+
+        Namespace: Dict[str, Any] = {
+            "_Record": self.Record,
+            "_Dig": _Dig,
+            "_NoItems": ({},),
+            "_NoFields": {},
+            "_Str": str,
+            "_Normalizers": GetStatusNormalizers,
+        }
+        exec(compile(self.Source, f"<FieldMapper {Resource}>", "exec"), Namespace)
+        self.MapPage: Callable[[List[Dict[str, Any]]], List[UnifiedRecord]] = Namespace["MapPage"]
+
+    @staticmethod
+    def _Accessor(Path: str) -> str:
+        """
+        Inline Source For One Dotted Path. Key And [0] Steps Are Inlined With
+        Empty Fallbacks (Like The Hand-Written Mappings); Deeper Indexes Use _Dig.
+        """
+        Keys = tuple(str(Path).split("."))
+        if any(Key.isdigit() and Key != "0" for Key in Keys):
+            return f"_Dig(R, {Keys!r})"
+
+        Expression = f"R.get({Keys[0]!r})"
+        for Key in Keys[1:]:
+            if Key == "0":
+                Expression = f"({Expression} or _NoItems)[0]"
+            else:
+                Expression = f"({Expression} or _NoFields).get({Key!r})"
+        return Expression
+
+    def _Generate(self, Spec: Dict[str, Dict[str, Any]]) -> str:
+        Arguments: List[str] = []
+        Statuses: List[Tuple[str, str, str]] = []
+
+        for Field, Rule in Spec.items():
+            Paths = Rule.get("from") or []
+            if isinstance(Paths, str):
+                Paths = [Paths]
+            Expression = " or ".join(self._Accessor(Path) for Path in Paths) or "None"
+
+            if Rule.get("join"):
+                Parts = [f"({self._Accessor(Path)} or '')" for Path in Rule["join"]]
+                Joined = '(%r %% (%s,)).strip()' % (" ".join(["%s"] * len(Parts)), ", ".join(Parts))
+                Expression = f"{Expression} or {Joined}" if Paths else Joined
+
+            if Rule.get("status"):
+                Name = f"S{len(Statuses)}"
+                Statuses.append((Name, str(Rule["status"]), Expression))
+                Expression = Name
+
+            Cast = Rule.get("as")
+            if Cast == "str":
+                Expression = f"_Str({Expression})"
+            elif Cast is not None:
+                raise ValueError(f"Unsupported Cast In {self.Resource}.{Field} Mapping: {Cast!r}")
+
+            Arguments.append(f"({Expression})")
+
+        Lines = ["def MapPage(Records):"]
+        for Name, Kind, Expression in Statuses:
+            Lines.append(f"    {Name}_Page = _Normalizers()[{Kind!r}].NormalizeMany([({Expression}) for R in Records])")
+        Build = f"_Record({', '.join(Arguments)})"
+        if Statuses:
+            Names = ", ".join(Name for Name, _, _ in Statuses)
+            Pages = ", ".join(f"{Name}_Page" for Name, _, _ in Statuses)
+            Lines.append(f"    return [{Build} for R, {Names} in zip(Records, {Pages})]")
+        else:
+            Lines.append(f"    return [{Build} for R in Records]")
+        return "\n".join(Lines) + "\n"
+
+    def Map(self, Record: Dict[str, Any]) -> UnifiedRecord:
+        return self.MapPage([Record])[0]
+
+
+_MappingLock = threading.Lock()
+_ActiveMappings: Optional[Tuple[Tuple[str, str], Dict[str, FieldMapper]]] = None
+
+
+def LoadFieldMappings(Name: str, Path: str = DEFAULT_FIELD_MAPPINGS_PATH) -> Dict[str, FieldMapper]:
+    """
+    Compile One Named Profile From A Mappings File Into {"job": ..., "candidate": ..., "application": ...}.
+    """
+    with open(Path, "r") as MappingFile:
+        Profiles = json.load(MappingFile)
+    if Name not in Profiles:
+        raise ValueError(f"Unknown Field Mapping Profile: {Name}")
+    return {Resource: FieldMapper(Resource, Spec) for Resource, Spec in Profiles[Name].items()}
+
+
+def GetFieldMappers() -> Dict[str, FieldMapper]:
+    """
+    Return The Compiled Mappers Chosen By AtsFieldProfile / AtsFieldMappingsPath.
+    Compiled Once Per Container And Recompiled Only If That Config Changes.
+    """
+    global _ActiveMappings
+    Key = (
+        Env("AtsFieldProfile", "generic"),
+        Env("AtsFieldMappingsPath") or DEFAULT_FIELD_MAPPINGS_PATH,
+    )
+    Active = _ActiveMappings
+    if Active is not None and Active[0] == Key:
+        return Active[1]
+
+    with _MappingLock:
+        if _ActiveMappings is None or _ActiveMappings[0] != Key:
+            _ActiveMappings = (Key, LoadFieldMappings(*Key))
+        return _ActiveMappings[1]
+
@@ -0,0 +1,288 @@
+"""
+Filtering, Sorting And Field Projection For The Unified List Endpoints
+
+GET /jobs, /candidates And /applications Accept:
+- status=OPEN,DRAFT  Any Of These Unified Statuses (Case-Insensitive)
+- location=Remote    Exact Unified Location (Case-Insensitive)
+- q=senior python    Every Word Appears In One Of The Resource's SEARCH_FIELDS
+- sort=-title,id     Unified Fields, "-" For Descending; Missing Values Sort Last
+- fields=id,title    Project Each Record Down To These Unified Fields
+
+PlanPushDown Splits A ListQuery Against What The Upstream Declares It
+Supports (AtsPushDown): Pushed Filters Become Upstream Query Params, The
+Rest Run Here In A Streaming Filter Stage Over Unified Records. Pushed
+Filters Are Re-Checked Locally Too, So An Upstream That Matches Loosely
+Only Costs Bandwidth, Never Correctness.
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
+
+from ats_normalize import UnifiedRecord
+
+QUERY_PARAMS = ("status", "location", "q", "sort", "fields")
+
+# Unified Fields q Searches, Per Resource (Limited To Those The Field Mapping Produces)
+SEARCH_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "jobs": ("title", "location"),
+    "candidates": ("name", "email"),
+    "applications": ("candidate_name", "email"),
+}
+
+Pages = Iterator[Tuple[int, List[Dict[str, Any]]]]
+UnifyPage = Callable[[List[Dict[str, Any]]], List[UnifiedRecord]]
+
+
+class QueryError(ValueError):
+    """
+    A Query Param The Endpoint Cannot Serve; Handlers Answer 400.
+    """
+
+
+def ParsePushDown(Raw: Optional[str]) -> Dict[str, FrozenSet[str]]:
+    """
+    Parse AtsPushDown, E.g. "jobs=status|location|q|sort:title,applications=status",
+    Into {Resource: Capabilities}. "sort:<field>" Means The Upstream Orders By
+    That Unified Field Itself (sort=<field> / sort=-<field>), Same As SortKey.
+    """
+    Capabilities: Dict[str, FrozenSet[str]] = {}
+    for Entry in (Raw or "").split(","):
+        if "=" not in Entry:
+            continue
+        Resource, Names = Entry.split("=", 1)
+        Capabilities[Resource.strip()] = frozenset(Name.strip() for Name in Names.split("|") if Name.strip())
+    return Capabilities
+
+
+def SortKey(Value: Any) -> Tuple[int, Any, str]:
+    """
+    Order Numbers (And Numeric Strings Such As ids) Numerically, Then Text
+    Case-Insensitively.
+    """
+    if isinstance(Value, (int, float)) and not isinstance(Value, bool):
+        return (0, Value, "")
+    Text = str(Value)
+    if Text.isdigit():
+        return (0, int(Text), "")
+    return (1, 0, Text.lower())
+
+
+def _Missing(Value: Any) -> bool:
+    return Value is None or Value == ""
+
+
+# -----------------------
+# Parsed Query
+# -----------------------
+class ListQuery:
+    """
+    One Request's status / location / q / sort / fields, Validated Against
+    The Unified Fields Of Its Resource.
+    """
+
+    def __init__(
+        self,
+        Resource: str,
+        Status: Optional[FrozenSet[str]] = None,
+        Location: Optional[str] = None,
+        Search: Tuple[str, ...] = (),
+        SearchFields: Tuple[str, ...] = (),
+        Sort: Tuple[Tuple[str, bool], ...] = (),
+        Fields: Optional[Tuple[str, ...]] = None,
+    ) -> None:
+        self.Resource = Resource
+        self.Status = Status
+        self.Location = Location
+        self.Search = Search
+        self.SearchFields = SearchFields
+        self.Sort = Sort
+        self.Fields = Fields
+
+    @classmethod
+    def Parse(
+        cls,
+        Resource: str,
+        QueryParams: Dict[str, Any],
+        RecordFields: Sequence[str],
+        Statuses: Sequence[str] = (),
+    ) -> Optional["ListQuery"]:
+        """
+        Build The Query From Request Params, Or None When None Of QUERY_PARAMS Are Set.
+        """
+        if not any(QueryParams.get(Name) for Name in QUERY_PARAMS):
+            return None
+
+        Status = None
+        if QueryParams.get("status"):
+            if "status" not in RecordFields:
+                raise QueryError(f"{Resource} Cannot Be Filtered By status")
+            Status = frozenset(Value.strip().upper() for Value in QueryParams["status"].split(",") if Value.strip())
+            Unknown = sorted(Status.difference(Statuses))
+            if Unknown:
+                raise QueryError(f"Unknown {Resource} status: {', '.join(Unknown)} (Expected One Of {', '.join(Statuses)})")
+
+        Location = None
+        if QueryParams.get("location"):
+            if "location" not in RecordFields:
+                raise QueryError(f"{Resource} Cannot Be Filtered By location")
+            Location = QueryParams["location"].strip().lower()
+
+        Search = tuple(str(QueryParams.get("q") or "").lower().split())
+        SearchFields = tuple(Field for Field in SEARCH_FIELDS.get(Resource, ()) if Field in RecordFields)
+        if Search and not SearchFields:
+            raise QueryError(f"{Resource} Cannot Be Searched With q")
+
+        Sort: List[Tuple[str, bool]] = []
+        for Raw in str(QueryParams.get("sort") or "").split(","):
+            Field = Raw.strip().lstrip("-")
+            if not Field:
+                continue
+            if Field not in RecordFields:
+                raise QueryError(f"Unknown Sort Field For {Resource}: {Field}")
+            Sort.append((Field, Raw.strip().startswith("-")))
+
+        Fields = None
+        if QueryParams.get("fields"):
+            Fields = tuple(Field.strip() for Field in QueryParams["fields"].split(",") if Field.strip())
+            Unknown = [Field for Field in Fields if Field not in RecordFields]
+            if Unknown:
+                raise QueryError(f"Unknown Fields For {Resource}: {', '.join(Unknown)}")
+
+        return cls(Resource, Status, Location, Search, SearchFields, tuple(Sort), Fields)
+
+    @property
+    def Filtering(self) -> bool:
+        return self.Status is not None or self.Location is not None or bool(self.Search)
+
+    def Matches(self, Record: UnifiedRecord) -> bool:
+        if self.Status is not None and Record.status not in self.Status:
+            return False
+        if self.Location is not None and str(Record.location or "").lower() != self.Location:
+            return False
+        if self.Search:
+            Text = " ".join(str(getattr(Record, Field) or "") for Field in self.SearchFields).lower()
+            return all(Word in Text for Word in self.Search)
+        return True
+
+    def SortRecords(self, Records: List[UnifiedRecord]) -> List[UnifiedRecord]:
+        """
+        Stable Multi-Key Sort; One Pass Per Key, Last Key First.
+        """
+        Records = list(Records)
+        for Field, Descending in reversed(self.Sort):
+            if Descending:
+                Records.sort(key=lambda Record: (not _Missing(getattr(Record, Field)), SortKey(getattr(Record, Field))), reverse=True)
+            else:
+                Records.sort(key=lambda Record: (_Missing(getattr(Record, Field)), SortKey(getattr(Record, Field))))
+        return Records
+
+    def Project(self, Record: UnifiedRecord) -> Any:
+        if self.Fields is None:
+            return Record
+        return {Field: getattr(Record, Field) for Field in self.Fields}
+
+
+# -----------------------
+# Push-Down Planning
+# -----------------------
+class PushDownPlan:
+    """
+    Upstream Params For The Parts Of A Query The Upstream Handles.
+
+    Complete Means Every Filter And The Sort Were Pushed, So Upstream Pages
+    Are Already The Answer And page / per_page Can Pass Straight Through.
+    """
+
+    def __init__(self, Params: Dict[str, Any], Complete: bool, SortPushed: bool) -> None:
+        self.Params = Params
+        self.Complete = Complete
+        self.SortPushed = SortPushed
+
+
+def PlanPushDown(Query: ListQuery, Capabilities: FrozenSet[str], RawStatuses: Callable[[str], List[str]]) -> PushDownPlan:
+    """
+    Decide Which Filters Go Upstream. A status Filter Is Only Pushed When
+    Every Wanted Status Has Raw Values In The Status Profile's Exact Table.
+    """
+    Params: Dict[str, Any] = {}
+    Complete = True
+
+    if Query.Status is not None:
+        Raw = {Unified: RawStatuses(Unified) for Unified in sorted(Query.Status)}
+        if "status" in Capabilities and all(Raw.values()):
+            Params["status"] = ",".join(Value for Values in Raw.values() for Value in Values)
+        else:
+            Complete = False
+
+    if Query.Location is not None:
+        if "location" in Capabilities:
+            Params["location"] = Query.Location
+        else:
+            Complete = False
+
+    if Query.Search:
+        if "q" in Capabilities:
+            Params["q"] = " ".join(Query.Search)
+        else:
+            Complete = False
+
+    SortPushed = bool(Query.Sort) and all(f"sort:{Field}" in Capabilities for Field, _ in Query.Sort)
+    if SortPushed:
+        Params["sort"] = ",".join(("-" if Descending else "") + Field for Field, Descending in Query.Sort)
+    elif Query.Sort:
+        Complete = False
+
+    return PushDownPlan(Params, Complete, SortPushed)
+
+
+# -----------------------
+# Streaming Filter Stage
+# -----------------------
+def FilterPage(Records: List[Dict[str, Any]], Unify: UnifyPage, Query: ListQuery) -> List[UnifiedRecord]:
+    Unified = Unify(Records)
+    if not Query.Filtering:
+        return Unified
+    return [Record for Record in Unified if Query.Matches(Record)]
+
+
+def SelectPage(
+    Source: Pages,
+    Unify: UnifyPage,
+    Query: ListQuery,
+    Page: int,
+    PerPage: int,
+    LocalSort: bool,
+    MaxScan: Optional[int] = None,
+) -> Tuple[List[UnifiedRecord], bool]:
+    """
+    Pull Raw Pages Through The Filter And Return (Records, Truncated) For One
+    Page Of The Filtered Listing.
+
+    Without A Local Sort Records Are Taken As They Stream By And Reading
+    Stops As Soon As The Page Is Full. A Local Sort Needs Every Match First.
+    Truncated Is Set When MaxScan Raw Records Were Read Before The Page Was
+    Complete; For A Local Sort That Is An Error Instead, As Any Order Shown
+    Would Be Wrong.
+    """
+    Skip = max(0, (Page - 1) * PerPage)
+    Wanted = Skip + PerPage
+    Matches: List[UnifiedRecord] = []
+    Scanned = 0
+    Truncated = False
+    try:
+        for _, Records in Source:
+            if MaxScan is not None and Scanned + len(Records) > MaxScan:
+                Records = Records[: MaxScan - Scanned]
+                Truncated = True
+            Scanned += len(Records)
+            Matches.extend(FilterPage(Records, Unify, Query))
+            if Truncated or (not LocalSort and len(Matches) >= Wanted):
+                break
+    finally:
+        Source.close()
+
+    if LocalSort:
+        if Truncated:
+            raise QueryError(f"sort Needs A Full Scan Of More Than {MaxScan} Records; Narrow The Filters Or Sort Client-Side")
+        Matches = Query.SortRecords(Matches)
+    Selected = Matches[Skip:Wanted]
+    return Selected, Truncated and len(Selected) < PerPage
@@ -0,0 +1,332 @@
+"""
+Upstream Quota Control
+
+- RateLimiter: Per-Endpoint Token Buckets In Front Of Every Upstream Call,
+  Held In Process Or In A Sqlite File Shared By Every Worker On The Host
+- SingleFlight / AsyncSingleFlight: Identical GETs In Flight At The Same
+  Time Share One Upstream Call
+- QuotaMeter: Upstream Calls Spent Per 1k API Requests Served
+
+Buckets Hand Out Reservations: Taking A Token May Drive The Balance Below
+Zero, And The Caller Sleeps Until Its Token Would Have Accrued. The Clients
+Do The Sleeping; Nothing Here Blocks Except The Sqlite Transaction.
+"""
+
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from ats_resilience import UpstreamError
+
+if TYPE_CHECKING:
+    import asyncio
+
+# (Tokens Per Second, Burst)
+RateLimit = Tuple[float, float]
+
+
+def ParseRateLimits(Raw: Optional[str]) -> Dict[str, RateLimit]:
+    """
+    Parse "GetJobs=5:10,*=20" Into {Endpoint: (Rate, Burst)}.
+    Burst Defaults To The Rate (At Least 1); "*" Covers Unlisted Endpoints.
+    """
+    Limits: Dict[str, RateLimit] = {}
+    for Entry in (Raw or "").split(","):
+        if "=" not in Entry:
+            continue
+        Name, Value = Entry.split("=", 1)
+        RateText, _, BurstText = Value.partition(":")
+        Rate = float(RateText)
+        if Rate <= 0:
+            continue
+        Limits[Name.strip()] = (Rate, float(BurstText) if BurstText else max(1.0, Rate))
+    return Limits
+
+
+class RateLimitedError(UpstreamError):
+    """
+    Raised Without Calling Upstream When A Token Is Further Away Than The Caller May Wait.
+    """
+
+    def __init__(self, Endpoint: str, RetryAfter: float) -> None:
+        super().__init__(f"Ats {Endpoint} Rate Limited, Retry In {RetryAfter:.1f}s", StatusCode=429, RetryAfter=RetryAfter)
+        self.Endpoint = Endpoint
+
+
+def _Refill(Tokens: float, UpdatedAt: float, Now: float, Limit: RateLimit) -> float:
+    Rate, Burst = Limit
+    return min(Burst, Tokens + max(0.0, Now - UpdatedAt) * Rate)
+
+
+# -----------------------
+# Bucket Stores
+# -----------------------
+class BucketStore(ABC):
+    """
+    Where Bucket Balances Live. Take() Is Atomic Per Endpoint.
+    """
+
+    @abstractmethod
+    def Take(self, Endpoint: str, Limit: RateLimit, Cost: float, MaxWait: float) -> Tuple[bool, float]:
+        """
+        Spend Cost Tokens (A Negative Cost Refunds). Returns (Granted, Wait):
+        When Granted, Wait Is How Long Until The Token Accrues; Otherwise The
+        Balance Is Left Untouched And Wait Is How Long The Caller Would Have Needed.
+        """
+
+    def Close(self) -> None:
+        pass
+
+
+def _Spend(Tokens: float, Limit: RateLimit, Cost: float, MaxWait: float) -> Tuple[bool, float, float]:
+    Remaining = Tokens - Cost
+    Wait = max(0.0, -Remaining / Limit[0])
+    if Cost > 0 and Wait > MaxWait:
+        return False, Wait, Tokens
+    return True, Wait, Remaining
+
+
+class MemoryBucketStore(BucketStore):
+    """
+    Buckets Private To This Process.
+    """
+
+    def __init__(self) -> None:
+        self.Buckets: Dict[str, Tuple[float, float]] = {}
+        self.Lock = threading.Lock()
+
+    def Take(self, Endpoint: str, Limit: RateLimit, Cost: float, MaxWait: float) -> Tuple[bool, float]:
+        with self.Lock:
+            Now = time.time()
+            Tokens, UpdatedAt = self.Buckets.get(Endpoint, (Limit[1], Now))
+            Granted, Wait, Tokens = _Spend(_Refill(Tokens, UpdatedAt, Now, Limit), Limit, Cost, MaxWait)
+            self.Buckets[Endpoint] = (Tokens, Now)
+        return Granted, Wait
+
+
+class SqliteBucketStore(BucketStore):
+    """
+    Buckets In A Sqlite File, So Every Worker On The Host Draws From One Quota.
+    Each Take() Is One IMMEDIATE Transaction, Which Serializes Workers.
+    """
+
+    def __init__(self, Path: str) -> None:
+        self.Path = Path
+        self._Lock = threading.Lock()
+        self._Connection = sqlite3.connect(Path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._Connection.execute("PRAGMA journal_mode=WAL")
+        self._Connection.execute("CREATE TABLE IF NOT EXISTS buckets (endpoint TEXT PRIMARY KEY, tokens REAL, updated_at REAL)")
+
+    def Take(self, Endpoint: str, Limit: RateLimit, Cost: float, MaxWait: float) -> Tuple[bool, float]:
+        with self._Lock:
+            Connection = self._Connection
+            Connection.execute("BEGIN IMMEDIATE")
+            try:
+                Now = time.time()
+                Row = Connection.execute("SELECT tokens, updated_at FROM buckets WHERE endpoint = ?", (Endpoint,)).fetchone()
+                Tokens, UpdatedAt = Row if Row else (Limit[1], Now)
+                Granted, Wait, Tokens = _Spend(_Refill(Tokens, UpdatedAt, Now, Limit), Limit, Cost, MaxWait)
+                Connection.execute("INSERT OR REPLACE INTO buckets VALUES (?, ?, ?)", (Endpoint, Tokens, Now))
+                Connection.execute("COMMIT")
+            except BaseException:
+                Connection.execute("ROLLBACK")
+                raise
+        return Granted, Wait
+
+    def Close(self) -> None:
+        with self._Lock:
+            self._Connection.close()
+
+
+# -----------------------
+# Rate Limiter
+# -----------------------
+class RateLimiter:
+    """
+    Per-Client Limiter Built From The Config Keys Set By handler._ReadAtsConfig:
+    RateLimits (From AtsRateLimits), RateLimitMaxWait, RateLimitBackend And RateLimitPath.
+    Endpoints Without A Limit Pass Straight Through.
+    """
+
+    def __init__(self, Config: Dict[str, Any]) -> None:
+        self.Limits: Dict[str, RateLimit] = dict(Config.get("RateLimits") or {})
+        self.MaxWait = float(Config.get("RateLimitMaxWait", 2.0))
+        self.Store: Optional[BucketStore] = None
+        if self.Limits:
+            if Config.get("RateLimitBackend") == "sqlite":
+                self.Store = SqliteBucketStore(Config.get("RateLimitPath") or "/tmp/ats-ratelimit.sqlite")
+            else:
+                self.Store = MemoryBucketStore()
+        self.Counters: Dict[str, float] = {"throttled": 0, "wait_seconds": 0.0, "rejected": 0, "hedges_skipped": 0}
+        self.Lock = threading.Lock()
+
+    def Limit(self, Endpoint: str) -> Optional[RateLimit]:
+        return self.Limits.get(Endpoint) or self.Limits.get("*")
+
+    def _Count(self, Name: str, Amount: float = 1) -> None:
+        with self.Lock:
+            self.Counters[Name] += Amount
+
+    def Reserve(self, Endpoint: str) -> float:
+        """
+        Take A Token For One Upstream Call And Return How Long To Wait Before
+        Sending It. Raises RateLimitedError If That Exceeds RateLimitMaxWait.
+        """
+        Limit = self.Limit(Endpoint)
+        if Limit is None or self.Store is None:
+            return 0.0
+        Granted, Wait = self.Store.Take(Endpoint, Limit, 1, self.MaxWait)
+        if not Granted:
+            self._Count("rejected")
+            raise RateLimitedError(Endpoint, Wait)
+        if Wait > 0:
+            self._Count("throttled")
+            self._Count("wait_seconds", Wait)
+        return Wait
+
+    def TryReserve(self, Endpoint: str) -> bool:
+        """
+        Take A Token Only If One Is Available Now (Used For Optional Calls Such As Hedges).
+        """
+        Limit = self.Limit(Endpoint)
+        if Limit is None or self.Store is None:
+            return True
+        Granted, _ = self.Store.Take(Endpoint, Limit, 1, 0.0)
+        if not Granted:
+            self._Count("hedges_skipped")
+        return Granted
+
+    def Refund(self, Endpoint: str) -> None:
+        """
+        Return A Reserved Token That Was Never Spent Upstream.
+        """
+        Limit = self.Limit(Endpoint)
+        if Limit is not None and self.Store is not None:
+            self.Store.Take(Endpoint, Limit, -1, 0.0)
+
+    def Close(self) -> None:
+        if self.Store is not None:
+            self.Store.Close()
+
+    def Snapshot(self) -> Dict[str, Any]:
+        with self.Lock:
+            Counters = dict(self.Counters)
+        Counters["wait_seconds"] = round(Counters["wait_seconds"], 3)
+        return {
+            "backend": type(self.Store).__name__ if self.Store is not None else None,
+            "limits": {Endpoint: {"rate": Rate, "burst": Burst} for Endpoint, (Rate, Burst) in self.Limits.items()},
+            **Counters,
+        }
+
+
+# -----------------------
+# Request Coalescing
+# -----------------------
+class SingleFlight:
+    """
+    Runs At Most One Call Per Key At A Time; Threads Asking For A Key Already
+    In Flight Wait For That Call And Get Its Result (Or Exception).
+    Results Are Shared, So Callers Must Treat Them As Read-Only.
+    """
+
+    def __init__(self) -> None:
+        self.Flights: Dict[Hashable, "Future[Any]"] = {}
+        self.Lock = threading.Lock()
+        self.Coalesced = 0
+
+    def Do(self, Key: Hashable, Call: Callable[[], Any]) -> Any:
+        with self.Lock:
+            Flight = self.Flights.get(Key)
+            if Flight is not None:
+                self.Coalesced += 1
+                Leader = False
+            else:
+                Flight = self.Flights[Key] = Future()
+                Leader = True
+        if not Leader:
+            return Flight.result()
+
+        try:
+            Flight.set_result(Call())
+        except BaseException as Ex:
+            Flight.set_exception(Ex)
+        finally:
+            with self.Lock:
+                self.Flights.pop(Key, None)
+        return Flight.result()
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight For Coroutines On One Event Loop. The Shared Call Runs As Its
+    Own Task, So One Caller Being Cancelled Does Not Cancel The Others.
+    """
+
+    def __init__(self) -> None:
+        self.Flights: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.Coalesced = 0
+
+    async def Do(self, Key: Hashable, Call: Callable[[], Awaitable[Any]]) -> Any:
+        # Imported Here So The Sync Path Never Loads asyncio
+        import asyncio
+
+        Flight = self.Flights.get(Key)
+        if Flight is None:
+            Flight = self.Flights[Key] = asyncio.ensure_future(Call())
+            Flight.add_done_callback(lambda _: self.Flights.pop(Key, None))
+        else:
+            self.Coalesced += 1
+        return await asyncio.shield(Flight)
+
+
+def FlightKey(Endpoint: str, Params: Optional[Dict[str, Any]], Headers: Optional[Dict[str, str]]) -> Tuple[Any, ...]:
+    """
+    Identity Of A GET For Coalescing: Endpoint, Query And Per-Request Headers (E.g. If-None-Match).
+    """
+    return (
+        Endpoint,
+        tuple(sorted((Key, str(Value)) for Key, Value in (Params or {}).items())),
+        tuple(sorted((Headers or {}).items())),
+    )
+
+
+# -----------------------
+# Quota Accounting
+# -----------------------
+class QuotaMeter:
+    """
+    Counts API Requests Served And Upstream Calls Sent (Each Spending Vendor
+    Quota), Per Container. Cache Hits And Coalesced GETs Lower The Ratio.
+    """
+
+    def __init__(self) -> None:
+        self.ApiRequests = 0
+        self.UpstreamCalls: Dict[str, int] = {}
+        self.Lock = threading.Lock()
+
+    def CountApiRequest(self) -> None:
+        with self.Lock:
+            self.ApiRequests += 1
+
+    def CountUpstreamCall(self, Endpoint: str) -> None:
+        with self.Lock:
+            self.UpstreamCalls[Endpoint] = self.UpstreamCalls.get(Endpoint, 0) + 1
+
+    def Snapshot(self) -> Dict[str, Any]:
+        with self.Lock:
+            ApiRequests = self.ApiRequests
+            UpstreamCalls = dict(self.UpstreamCalls)
+        Total = sum(UpstreamCalls.values())
+        return {
+            "api_requests": ApiRequests,
+            "upstream_calls": Total,
+            "upstream_calls_by_endpoint": UpstreamCalls,
+            "upstream_calls_per_1k_requests": round(Total * 1000 / ApiRequests, 1) if ApiRequests else None,
+        }
+
+
+# Shared By The Sync And Async Clients Of This Container
+QUOTA_METER = QuotaMeter()
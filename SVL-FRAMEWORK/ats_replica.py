@@ -0,0 +1,390 @@
+"""
+Local Replica Of Upstream Jobs, Candidates And Applications
+
+- Replica: Sqlite Copy Of The Raw Upstream Records Per Resource, Kept In
+  Upstream Listing Order, Plus Per-Resource Sync State
+- SyncResource: Brings One Resource Up To Date With The Cheapest Strategy
+  The Upstream Supports:
+
+    updated_since  Pull Records Changed Since The Last Watermark (Minus An Overlap)
+    since_id       Pull Records Created After The Highest Known id (Append-Only Data)
+    hash           Walk Every Page With If-None-Match, Diff Page Hashes, Apply
+                   Changed Pages And Drop Records No Longer Listed
+    auto           updated_since When Records Carry updated_at, Demoted To hash
+                   As Soon As The Upstream Turns Out To Ignore The Filter
+
+  Delta Strategies Cannot See Deletes, So They Still Fall Back To A Full
+  hash Walk Every FullSyncSeconds.
+
+Raw Records Are Stored (Not Unified Ones), So Field Mapping Changes Apply To
+Replica Reads Without A Resync. Upstream I/O Is Injected As A Fetch Callable.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ats_normalize import ExtractList
+
+SYNC_MODES = ("auto", "updated_since", "since_id", "hash")
+DEFAULT_SYNC_PAGE_SIZE = 100
+
+# Fetch(Params, IfNoneMatch) -> (Payload Or None On 304, ETag)
+Fetcher = Callable[[Dict[str, Any], Optional[str]], Tuple[Optional[Any], Optional[str]]]
+
+_STAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def _ShiftStamp(Stamp: str, Seconds: float) -> str:
+    """
+    An ISO 8601 Watermark Moved Back By Seconds, Or Unchanged If It Does Not Parse.
+    """
+    try:
+        When = datetime.fromisoformat(Stamp.replace("Z", "+00:00"))
+    except ValueError:
+        return Stamp
+    if When.tzinfo is None:
+        When = When.replace(tzinfo=timezone.utc)
+    return (When - timedelta(seconds=Seconds)).astimezone(timezone.utc).strftime(_STAMP_FORMAT)
+
+
+def _IdNumber(Record: Dict[str, Any]) -> Optional[int]:
+    try:
+        return int(Record.get("id"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _Digest(Records: List[Dict[str, Any]]) -> str:
+    return hashlib.sha1(json.dumps(Records, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")).hexdigest()
+
+
+class Replica:
+    """
+    Sqlite File Holding Every Synced Resource. Readers Never Block On A Sync:
+    Each Sync Applies Its Changes In One Transaction At The End (WAL Mode).
+    """
+
+    def __init__(self, Path: str) -> None:
+        self.Path = Path
+        self._Lock = threading.Lock()
+        self.SyncLocks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._Connection = sqlite3.connect(Path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._Connection.execute("PRAGMA journal_mode=WAL")
+        self._Connection.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            " resource TEXT, id TEXT, position INTEGER, job_id TEXT, updated_at TEXT, data TEXT,"
+            " PRIMARY KEY (resource, id))"
+        )
+        self._Connection.execute("CREATE INDEX IF NOT EXISTS records_position ON records (resource, position, id)")
+        self._Connection.execute("CREATE INDEX IF NOT EXISTS records_job ON records (resource, job_id, position, id)")
+        self._Connection.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " resource TEXT, page INTEGER, etag TEXT, digest TEXT, ids TEXT, PRIMARY KEY (resource, page))"
+        )
+        self._Connection.execute(
+            "CREATE TABLE IF NOT EXISTS sync_state ("
+            " resource TEXT PRIMARY KEY, mode TEXT, page_size INTEGER, watermark TEXT, max_id INTEGER,"
+            " synced_at REAL, full_synced_at REAL, stale REAL DEFAULT 0)"
+        )
+
+    @contextmanager
+    def _Transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._Lock:
+            self._Connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._Connection
+                self._Connection.execute("COMMIT")
+            except BaseException:
+                self._Connection.execute("ROLLBACK")
+                raise
+
+    def _Query(self, Sql: str, Args: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+        with self._Lock:
+            return self._Connection.execute(Sql, Args).fetchall()
+
+    # -----------------------
+    # Read Side
+    # -----------------------
+    def State(self, Resource: str) -> Dict[str, Any]:
+        Rows = self._Query(
+            "SELECT mode, page_size, watermark, max_id, synced_at, full_synced_at, stale FROM sync_state WHERE resource = ?",
+            (Resource,),
+        )
+        Keys = ("mode", "page_size", "watermark", "max_id", "synced_at", "full_synced_at", "stale")
+        return dict(zip(Keys, Rows[0])) if Rows else dict.fromkeys(Keys)
+
+    def Age(self, Resource: str) -> Optional[float]:
+        """
+        Seconds Since The Last Sync Of Resource Started; None If It Was Never
+        Synced Or A Local Write Has Marked It Stale.
+        """
+        State = self.State(Resource)
+        if not State["synced_at"] or State["stale"]:
+            return None
+        return max(0.0, time.time() - State["synced_at"])
+
+    def Page(self, Resource: str, Page: int, PerPage: int, JobId: Optional[str] = None) -> List[Dict[str, Any]]:
+        Start = max(0, (Page - 1) * PerPage)
+        if JobId is None:
+            Rows = self._Query(
+                "SELECT data FROM records WHERE resource = ? ORDER BY position, id LIMIT ? OFFSET ?",
+                (Resource, PerPage, Start),
+            )
+        else:
+            Rows = self._Query(
+                "SELECT data FROM records WHERE resource = ? AND job_id = ? ORDER BY position, id LIMIT ? OFFSET ?",
+                (Resource, str(JobId), PerPage, Start),
+            )
+        return [json.loads(Row[0]) for Row in Rows]
+
+    def Count(self, Resource: str) -> int:
+        return self._Query("SELECT COUNT(*) FROM records WHERE resource = ?", (Resource,))[0][0]
+
+    def MarkStale(self, Resources: Any) -> None:
+        """
+        Force The Next Replica Read Of Each Resource To Sync First (After A Local
+        Write). A Sync That Started Before The Write Does Not Clear The Mark.
+        """
+        Now = time.time()
+        with self._Transaction() as Connection:
+            for Resource in Resources:
+                Connection.execute("UPDATE sync_state SET stale = ? WHERE resource = ?", (Now, Resource))
+
+    def Snapshot(self) -> Dict[str, Any]:
+        Snapshot: Dict[str, Any] = {}
+        for (Resource,) in self._Query("SELECT resource FROM sync_state ORDER BY resource"):
+            State = self.State(Resource)
+            Age = self.Age(Resource)
+            Snapshot[Resource] = {
+                "mode": State["mode"],
+                "records": self.Count(Resource),
+                "watermark": State["watermark"],
+                "age_seconds": round(Age, 1) if Age is not None else None,
+            }
+        return Snapshot
+
+    # -----------------------
+    # Write Side (Used By SyncResource)
+    # -----------------------
+    def _Row(self, Resource: str, Record: Dict[str, Any], Position: int) -> Tuple[Any, ...]:
+        JobId = Record.get("job_id")
+        return (
+            Resource,
+            str(Record.get("id")),
+            Position,
+            str(JobId) if JobId is not None else None,
+            Record.get("updated_at"),
+            json.dumps(Record, separators=(",", ":")),
+        )
+
+    def ApplyFull(
+        self,
+        Resource: str,
+        Pages: Dict[int, Tuple[Optional[str], str, List[str]]],
+        Changed: Dict[int, List[Dict[str, Any]]],
+        State: Dict[str, Any],
+    ) -> int:
+        """
+        Replace Changed Pages, Forget Pages Past The End, Drop Records No Longer
+        Listed, Then Save State With Watermarks Recomputed From What Is Stored.
+        Returns How Many Records Were Dropped.
+        """
+        PageSize = State["page_size"]
+        Seen = {Id for _, _, Ids in Pages.values() for Id in Ids}
+        with self._Transaction() as Connection:
+            for Page, Records in Changed.items():
+                Base = (Page - 1) * PageSize
+                Connection.executemany(
+                    "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?, ?)",
+                    [self._Row(Resource, Record, Base + Index) for Index, Record in enumerate(Records)],
+                )
+            Connection.execute("DELETE FROM pages WHERE resource = ?", (Resource,))
+            Connection.executemany(
+                "INSERT INTO pages VALUES (?, ?, ?, ?, ?)",
+                [(Resource, Page, ETag, Digest, json.dumps(Ids)) for Page, (ETag, Digest, Ids) in Pages.items()],
+            )
+            Gone = [
+                (Resource, Id)
+                for (Id,) in Connection.execute("SELECT id FROM records WHERE resource = ?", (Resource,)).fetchall()
+                if Id not in Seen
+            ]
+            Connection.executemany("DELETE FROM records WHERE resource = ? AND id = ?", Gone)
+            State["watermark"], State["max_id"] = Connection.execute(
+                "SELECT MAX(updated_at), MAX(CASE WHEN id GLOB '[0-9]*' THEN CAST(id AS INTEGER) END) FROM records WHERE resource = ?",
+                (Resource,),
+            ).fetchone()
+            self._SaveState(Connection, Resource, State)
+        return len(Gone)
+
+    def ApplyDelta(self, Resource: str, Records: List[Dict[str, Any]], State: Dict[str, Any]) -> None:
+        """
+        Upsert Changed Records (Known Ones Keep Their Position, New Ones Go Last) And Save State.
+        """
+        with self._Transaction() as Connection:
+            Last = Connection.execute("SELECT COALESCE(MAX(position), -1) FROM records WHERE resource = ?", (Resource,)).fetchone()[0]
+            for Record in Records:
+                Row = Connection.execute(
+                    "SELECT position FROM records WHERE resource = ? AND id = ?",
+                    (Resource, str(Record.get("id"))),
+                ).fetchone()
+                if Row is None:
+                    Last += 1
+                Connection.execute("INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?, ?)", self._Row(Resource, Record, Row[0] if Row else Last))
+            self._SaveState(Connection, Resource, State)
+
+    def SaveState(self, Resource: str, State: Dict[str, Any]) -> None:
+        with self._Transaction() as Connection:
+            self._SaveState(Connection, Resource, State)
+
+    @staticmethod
+    def _SaveState(Connection: sqlite3.Connection, Resource: str, State: Dict[str, Any]) -> None:
+        Connection.execute(
+            "INSERT INTO sync_state VALUES (?, ?, ?, ?, ?, ?, ?, 0) ON CONFLICT (resource) DO UPDATE SET"
+            " mode = excluded.mode, page_size = excluded.page_size, watermark = excluded.watermark,"
+            " max_id = excluded.max_id, synced_at = excluded.synced_at, full_synced_at = excluded.full_synced_at,"
+            " stale = CASE WHEN sync_state.stale > excluded.synced_at THEN sync_state.stale ELSE 0 END",
+            (
+                Resource,
+                State["mode"],
+                State["page_size"],
+                State["watermark"],
+                State["max_id"],
+                State["synced_at"],
+                State["full_synced_at"],
+            ),
+        )
+
+    def StoredPages(self, Resource: str) -> Dict[int, Tuple[Optional[str], str, List[str]]]:
+        return {
+            Page: (ETag, Digest, json.loads(Ids))
+            for Page, ETag, Digest, Ids in self._Query("SELECT page, etag, digest, ids FROM pages WHERE resource = ?", (Resource,))
+        }
+
+    def Close(self) -> None:
+        with self._Lock:
+            self._Connection.close()
+
+
+# -----------------------
+# Sync
+# -----------------------
+def _FullSync(Store: Replica, Fetch: Fetcher, Resource: str, Mode: str, PageSize: int, Started: float) -> Dict[str, Any]:
+    """
+    hash Strategy: Walk Every Page, Asking For 304 With The Stored ETag, And
+    Rewrite Only Pages Whose Content Hash Changed.
+    """
+    State = Store.State(Resource)
+    Stored = Store.StoredPages(Resource) if State["page_size"] == PageSize else {}
+    Pages: Dict[int, Tuple[Optional[str], str, List[str]]] = {}
+    Changed: Dict[int, List[Dict[str, Any]]] = {}
+    Stamped = True
+
+    Page = 1
+    while True:
+        Old = Stored.get(Page)
+        Raw, ETag = Fetch({"page": Page, "per_page": PageSize}, Old[0] if Old else None)
+        if Raw is None and Old is not None:
+            Pages[Page] = Old
+            Count = len(Old[2])
+        else:
+            Records = ExtractList(Raw)
+            Digest = _Digest(Records)
+            Pages[Page] = (ETag, Digest, [str(Record.get("id")) for Record in Records])
+            if Old is None or Old[1] != Digest:
+                Changed[Page] = Records
+            Stamped = Stamped and all(Record.get("updated_at") for Record in Records)
+            Count = len(Records)
+        if Count < PageSize:
+            break
+        Page += 1
+
+    if Mode == "auto":
+        # Decided On The First Walk (When Every Page Is Fetched), Then Kept
+        Mode = State["mode"] or ("updated_since" if Stamped else "hash")
+    State.update(mode=Mode, page_size=PageSize, synced_at=Started, full_synced_at=Started)
+    Deleted = Store.ApplyFull(Resource, Pages, Changed, State)
+    return {"strategy": "hash", "pages": len(Pages), "changed_pages": len(Changed), "deleted": Deleted}
+
+
+def _DeltaSync(Store: Replica, Fetch: Fetcher, Resource: str, Mode: str, PageSize: int, Overlap: float, Started: float) -> Optional[Dict[str, Any]]:
+    """
+    updated_since / since_id Strategy. Returns None When The Upstream Ignored
+    The Filter (A Record Older Than It Came Back), So The Caller Falls Back To hash.
+    """
+    State = Store.State(Resource)
+    if Mode == "updated_since":
+        Since = _ShiftStamp(State["watermark"], Overlap)
+        Filter: Dict[str, Any] = {"updated_since": Since}
+
+        def Honoured(Record: Dict[str, Any]) -> bool:
+            Stamp = Record.get("updated_at")
+            return bool(Stamp) and Stamp >= Since
+
+    else:
+        MaxId = State["max_id"]
+        Filter = {"since_id": MaxId}
+
+        def Honoured(Record: Dict[str, Any]) -> bool:
+            Number = _IdNumber(Record)
+            return Number is not None and Number > MaxId
+
+    Changed: List[Dict[str, Any]] = []
+    Page = 1
+    while True:
+        Raw, _ = Fetch({**Filter, "page": Page, "per_page": PageSize}, None)
+        Records = ExtractList(Raw)
+        if not all(Honoured(Record) for Record in Records):
+            return None
+        Changed.extend(Records)
+        if len(Records) < PageSize:
+            break
+        Page += 1
+
+    Stamps = [Record["updated_at"] for Record in Changed if Record.get("updated_at")]
+    Ids = [Number for Number in map(_IdNumber, Changed) if Number is not None]
+    if Stamps:
+        State["watermark"] = max([State["watermark"] or "", *Stamps])
+    if Ids:
+        State["max_id"] = max([State["max_id"] or 0, *Ids])
+    State["synced_at"] = Started
+    Store.ApplyDelta(Resource, Changed, State)
+    return {"strategy": Mode, "pages": Page, "changed": len(Changed)}
+
+
+def SyncResource(
+    Store: Replica,
+    Fetch: Fetcher,
+    Resource: str,
+    Mode: str = "auto",
+    PageSize: int = DEFAULT_SYNC_PAGE_SIZE,
+    Overlap: float = 5.0,
+    FullSyncSeconds: float = 3600.0,
+) -> Dict[str, Any]:
+    """
+    Bring One Resource Up To Date And Return What The Sync Did.
+
+    Mode Is The Configured Strategy (See SYNC_MODES). A Delta Runs Only Once A
+    Full Walk Has Established A Watermark; auto Remembers Which Strategy Worked.
+    """
+    Started = time.time()
+    State = Store.State(Resource)
+    Resolved = State["mode"] if Mode == "auto" else Mode
+    Watermark = State["watermark"] if Resolved == "updated_since" else State["max_id"]
+    Due = not State["full_synced_at"] or Started - State["full_synced_at"] >= FullSyncSeconds or State["page_size"] != PageSize
+
+    Result: Optional[Dict[str, Any]] = None
+    if Resolved in ("updated_since", "since_id") and Watermark is not None and not Due:
+        Result = _DeltaSync(Store, Fetch, Resource, Resolved, PageSize, Overlap, Started)
+        if Result is None and Mode == "auto":
+            Store.SaveState(Resource, {**State, "mode": "hash"})
+    if Result is None:
+        Result = _FullSync(Store, Fetch, Resource, Mode, PageSize, Started)
+    Result.update(resource=Resource, mode=Store.State(Resource)["mode"], seconds=round(time.time() - Started, 3))
+    return Result
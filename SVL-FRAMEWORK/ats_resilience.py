@@ -0,0 +1,233 @@
+"""
+Upstream Resilience Primitives
+
+Shared By AtsClient And AsyncAtsClient:
+
+- RetryPolicy: Capped Exponential Backoff With Full Jitter, Honouring Retry-After
+- CircuitBreaker: Per-Endpoint Closed / Open / Half-Open State, So Calls Fail
+  Fast While An Upstream Endpoint Is Unhealthy
+- LatencyTracker: Recent Latencies Per Endpoint; Its p95 Times Hedged GETs
+- UpstreamError / CircuitOpenError: What The Clients Raise
+
+Everything Here Is I/O-Free; The Clients Do The Sleeping And Sending.
+"""
+
+import email.utils
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+# Statuses Worth Another Attempt (When The Request Is Safe To Repeat)
+RETRY_STATUSES = frozenset((429, 502, 503, 504))
+
+
+class UpstreamError(RuntimeError):
+    """
+    A Failed Upstream Call. StatusCode Is None For Network Errors And Timeouts.
+    """
+
+    def __init__(self, Message: str, StatusCode: Optional[int] = None, RetryAfter: Optional[float] = None) -> None:
+        super().__init__(Message)
+        self.StatusCode = StatusCode
+        self.RetryAfter = RetryAfter
+
+
+class CircuitOpenError(UpstreamError):
+    """
+    Raised Without Calling Upstream While The Endpoint's Breaker Is Open.
+    """
+
+    def __init__(self, Endpoint: str, RetryAfter: float) -> None:
+        super().__init__(f"Ats {Endpoint} Circuit Open, Retry In {RetryAfter:.1f}s", StatusCode=503, RetryAfter=RetryAfter)
+        self.Endpoint = Endpoint
+
+
+def ParseRetryAfter(Value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After As Seconds From Now; Accepts Delta-Seconds Or An HTTP-Date.
+    """
+    if not Value:
+        return None
+    Value = Value.strip()
+    try:
+        return max(0.0, float(Value))
+    except ValueError:
+        pass
+    try:
+        When = email.utils.parsedate_to_datetime(Value)
+    except (TypeError, ValueError):
+        return None
+    if When is None:
+        return None
+    return max(0.0, When.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Attempts Counts The First Try; Attempts=1 Disables Retries.
+
+    Backoff Is Full Jitter: uniform(0, min(MaxDelay, BaseDelay * 2 ** (Attempt - 1))).
+    A Server Retry-After Replaces The Backoff, Unless It Exceeds MaxRetryAfter,
+    In Which Case Delay() Returns None And The Caller Gives Up.
+    """
+
+    def __init__(
+        self,
+        Attempts: int = 3,
+        BaseDelay: float = 0.1,
+        MaxDelay: float = 2.0,
+        MaxRetryAfter: float = 5.0,
+        Random: Optional[random.Random] = None,
+    ) -> None:
+        self.Attempts = max(1, int(Attempts))
+        self.BaseDelay = float(BaseDelay)
+        self.MaxDelay = float(MaxDelay)
+        self.MaxRetryAfter = float(MaxRetryAfter)
+        self.Random = Random or random.Random()
+
+    def ShouldRetry(self, Attempt: int, StatusCode: Optional[int]) -> bool:
+        if Attempt >= self.Attempts:
+            return False
+        return StatusCode is None or StatusCode in RETRY_STATUSES
+
+    def Delay(self, Attempt: int, RetryAfter: Optional[float] = None) -> Optional[float]:
+        if RetryAfter is not None:
+            return RetryAfter if RetryAfter <= self.MaxRetryAfter else None
+        Ceiling = min(self.MaxDelay, self.BaseDelay * (2 ** (Attempt - 1)))
+        return self.Random.uniform(0, Ceiling)
+
+
+class CircuitBreaker:
+    """
+    Opens After FailureThreshold Consecutive Failures. While Open, Allow()
+    Is False Until ResetSeconds Pass; Then One Probe Call Is Let Through
+    (Half-Open). Its Success Closes The Breaker, Its Failure Re-Opens It.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, FailureThreshold: int = 5, ResetSeconds: float = 30.0) -> None:
+        self.FailureThreshold = max(1, int(FailureThreshold))
+        self.ResetSeconds = float(ResetSeconds)
+        self.State = self.CLOSED
+        self.Failures = 0
+        self.OpenedAt = 0.0
+        self.ProbeInFlight = False
+        self.Lock = threading.Lock()
+
+    def Allow(self) -> bool:
+        with self.Lock:
+            if self.State == self.CLOSED:
+                return True
+            if self.State == self.OPEN and time.monotonic() - self.OpenedAt >= self.ResetSeconds:
+                self.State = self.HALF_OPEN
+                self.ProbeInFlight = False
+            if self.State == self.HALF_OPEN and not self.ProbeInFlight:
+                self.ProbeInFlight = True
+                return True
+            return False
+
+    def RetryIn(self) -> float:
+        with self.Lock:
+            if self.State == self.CLOSED:
+                return 0.0
+            return max(0.0, self.ResetSeconds - (time.monotonic() - self.OpenedAt))
+
+    def RecordSuccess(self) -> None:
+        with self.Lock:
+            self.State = self.CLOSED
+            self.Failures = 0
+            self.ProbeInFlight = False
+
+    def RecordFailure(self) -> None:
+        with self.Lock:
+            self.Failures += 1
+            if self.State == self.HALF_OPEN or self.Failures >= self.FailureThreshold:
+                self.State = self.OPEN
+                self.OpenedAt = time.monotonic()
+                self.ProbeInFlight = False
+
+    def Snapshot(self) -> Dict[str, Any]:
+        with self.Lock:
+            return {"state": self.State, "failures": self.Failures}
+
+
+class LatencyTracker:
+    """
+    Rolling Window Of Successful Call Latencies (Seconds) Per Endpoint.
+    """
+
+    def __init__(self, Window: int = 200, MinSamples: int = 20) -> None:
+        self.Window = Window
+        self.MinSamples = MinSamples
+        self.Samples: Dict[str, Deque[float]] = {}
+        self.Lock = threading.Lock()
+
+    def Record(self, Endpoint: str, Seconds: float) -> None:
+        with self.Lock:
+            Samples = self.Samples.get(Endpoint)
+            if Samples is None:
+                Samples = self.Samples[Endpoint] = deque(maxlen=self.Window)
+            Samples.append(Seconds)
+
+    def Percentile(self, Endpoint: str, Fraction: float) -> Optional[float]:
+        with self.Lock:
+            Samples = self.Samples.get(Endpoint)
+            if not Samples or len(Samples) < self.MinSamples:
+                return None
+            Ordered = sorted(Samples)
+        return Ordered[min(len(Ordered) - 1, int(Fraction * len(Ordered)))]
+
+    def HedgeDelay(self, Endpoint: str, MinDelay: float) -> Optional[float]:
+        """
+        How Long To Wait Before Sending A Duplicate GET: The Endpoint's p95,
+        But At Least MinDelay. None Until Enough Samples Exist.
+        """
+        P95 = self.Percentile(Endpoint, 0.95)
+        return None if P95 is None else max(MinDelay, P95)
+
+
+class Resilience:
+    """
+    Per-Client Bundle: One RetryPolicy, One Breaker Per Endpoint, One Latency Tracker.
+    Built From The Client Config Keys Set By handler._ReadAtsConfig.
+    """
+
+    def __init__(self, Config: Dict[str, Any]) -> None:
+        self.Policy = RetryPolicy(
+            Attempts=Config.get("RetryAttempts", 3),
+            BaseDelay=Config.get("RetryBaseDelay", 0.1),
+            MaxDelay=Config.get("RetryMaxDelay", 2.0),
+            MaxRetryAfter=Config.get("RetryAfterMax", 5.0),
+        )
+        self.BreakerThreshold = int(Config.get("BreakerThreshold", 5))
+        self.BreakerResetSeconds = float(Config.get("BreakerResetSeconds", 30.0))
+        self.HedgeEnabled = bool(Config.get("HedgeEnabled", False))
+        self.HedgeMinDelay = float(Config.get("HedgeMinDelay", 0.05))
+        self.Latency = LatencyTracker()
+        self.Breakers: Dict[str, CircuitBreaker] = {}
+        self.Counters: Dict[str, int] = {"retries": 0, "hedges": 0, "hedge_wins": 0, "short_circuits": 0}
+        self.Lock = threading.Lock()
+
+    def Breaker(self, Endpoint: str) -> CircuitBreaker:
+        Breaker = self.Breakers.get(Endpoint)
+        if Breaker is None:
+            with self.Lock:
+                Breaker = self.Breakers.setdefault(Endpoint, CircuitBreaker(self.BreakerThreshold, self.BreakerResetSeconds))
+        return Breaker
+
+    def Count(self, Name: str) -> None:
+        with self.Lock:
+            self.Counters[Name] += 1
+
+    def Snapshot(self) -> Dict[str, Any]:
+        with self.Lock:
+            Counters = dict(self.Counters)
+        return {
+            **Counters,
+            "breakers": {Endpoint: Breaker.Snapshot() for Endpoint, Breaker in list(self.Breakers.items())},
+        }
@@ -0,0 +1,211 @@
+"""
+Response Serialization And Compression
+
+- DumpJson Encodes Response Bodies With orjson When It Is Installed (Or
+  Selected Via AtsJsonBackend), Falling Back To The Stdlib Encoder
+- CompressResponse gzip / brotli Encodes Large Bodies Per Accept-Encoding,
+  Returning Them Through API Gateway's Base64 Binary Contract
+
+orjson And brotli Are Optional; Nothing Here Requires Either.
+"""
+
+import base64
+import gzip
+import json
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ats_config import Cached, Env, EnvInt
+from ats_normalize import UnifiedRecord
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - Optional Dependency
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - Optional Dependency
+    brotli = None
+
+
+# -----------------------
+# JSON Backends
+# -----------------------
+def _EncodeRecord(Value: Any) -> Any:
+    if isinstance(Value, UnifiedRecord):
+        return Value.ToDict()
+    raise TypeError(f"Object Of Type {type(Value).__name__} Is Not JSON Serializable")
+
+
+_StdlibEncoder = json.JSONEncoder(default=_EncodeRecord, check_circular=False)
+
+
+def _DumpStdlib(Value: Any) -> bytes:
+    return _StdlibEncoder.encode(Value).encode("utf-8")
+
+
+def _DumpOrjson(Value: Any) -> bytes:
+    try:
+        return orjson.dumps(Value, default=_EncodeRecord, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # Values orjson Rejects (E.g. Integers Beyond 64 Bits) Still Encode Via Stdlib
+        return _DumpStdlib(Value)
+
+
+JSON_BACKENDS: Dict[str, Callable[[Any], bytes]] = {"stdlib": _DumpStdlib}
+if orjson is not None:
+    JSON_BACKENDS["orjson"] = _DumpOrjson
+
+_ActiveBackend: Tuple[Optional[str], str, Callable[[Any], bytes]] = (None, "stdlib", _DumpStdlib)
+
+
+def GetJsonBackend() -> Tuple[str, Callable[[Any], bytes]]:
+    """
+    Resolve AtsJsonBackend (auto | orjson | stdlib) To (Name, Encoder).
+    auto Picks orjson When Importable; An Unavailable Choice Falls Back To stdlib.
+    """
+    global _ActiveBackend
+    Requested = Env("AtsJsonBackend", "auto").lower()
+    Active = _ActiveBackend
+    if Active[0] != Requested:
+        Name = ("orjson" if "orjson" in JSON_BACKENDS else "stdlib") if Requested == "auto" else Requested
+        if Name not in JSON_BACKENDS:
+            Name = "stdlib"
+        Active = _ActiveBackend = (Requested, Name, JSON_BACKENDS[Name])
+    return Active[1], Active[2]
+
+
+def DumpJsonBytes(Value: Any) -> bytes:
+    """
+    UTF-8 JSON For Value (UnifiedRecords Included) Using The Active Backend.
+    """
+    return GetJsonBackend()[1](Value)
+
+
+def DumpJson(Value: Any) -> str:
+    return DumpJsonBytes(Value).decode("utf-8")
+
+
+# -----------------------
+# Response Compression
+# -----------------------
+DEFAULT_COMPRESSION_MIN_BYTES = 1024
+DEFAULT_COMPRESSION_LEVEL = 5
+
+
+def _Gzip(Body: bytes, Level: int) -> bytes:
+    # mtime=0 Keeps Output Deterministic, So Equal Bodies Compress To Equal Bytes
+    return gzip.compress(Body, compresslevel=max(1, min(9, Level)), mtime=0)
+
+
+def _Brotli(Body: bytes, Level: int) -> bytes:
+    return brotli.compress(Body, quality=max(0, min(11, Level)))
+
+
+# Preference Order When The Client Rates Several Encodings Equally
+COMPRESSORS: Dict[str, Callable[[bytes, int], bytes]] = {}
+if brotli is not None:
+    COMPRESSORS["br"] = _Brotli
+COMPRESSORS["gzip"] = _Gzip
+
+
+def _ParseAcceptEncoding(AcceptEncoding: str) -> Dict[str, float]:
+    Weights: Dict[str, float] = {}
+    for Part in AcceptEncoding.split(","):
+        Token, _, Params = Part.strip().partition(";")
+        Token = Token.strip().lower()
+        if not Token:
+            continue
+        Weight = 1.0
+        Params = Params.strip().lower()
+        if Params.startswith("q="):
+            try:
+                Weight = float(Params[2:])
+            except ValueError:
+                Weight = 0.0
+        Weights[Token] = Weight
+    return Weights
+
+
+def NegotiateEncoding(AcceptEncoding: Optional[str]) -> Optional[str]:
+    """
+    Pick The Best Available Content-Encoding For An Accept-Encoding Header, Or None.
+    """
+    if not AcceptEncoding:
+        return None
+    Weights = _ParseAcceptEncoding(AcceptEncoding)
+    Best: Optional[str] = None
+    BestWeight = 0.0
+    for Encoding in COMPRESSORS:
+        Weight = Weights.get(Encoding, Weights.get("*", 0.0))
+        if Weight > BestWeight:
+            Best, BestWeight = Encoding, Weight
+    return Best
+
+
+@Cached
+def _ReadCompressionConfig() -> Tuple[int, int]:
+    return (
+        EnvInt("AtsCompressionMinBytes", DEFAULT_COMPRESSION_MIN_BYTES),
+        EnvInt("AtsCompressionLevel", DEFAULT_COMPRESSION_LEVEL),
+    )
+
+
+def GetHeader(Event: Any, Name: str) -> Optional[str]:
+    """
+    Case-Insensitive Request Header Lookup Across headers / multiValueHeaders.
+    """
+    if not isinstance(Event, dict):
+        return None
+    Wanted = Name.lower()
+    for Key, Value in (Event.get("headers") or {}).items():
+        if Key.lower() == Wanted:
+            return Value
+    for Key, Values in (Event.get("multiValueHeaders") or {}).items():
+        if Key.lower() == Wanted and Values:
+            return ",".join(Values)
+    return None
+
+
+def CompressResponse(Response: Dict[str, Any], AcceptEncoding: Optional[str]) -> Dict[str, Any]:
+    """
+    Compress A Proxy Response Body In Place When It Is Over The Size Threshold
+    And The Client Accepts An Available Encoding.
+    """
+    Body = Response.get("body")
+    if not isinstance(Body, str) or Response.get("isBase64Encoded"):
+        return Response
+    MinBytes, Level = _ReadCompressionConfig()
+    if MinBytes < 0 or len(Body) < MinBytes:
+        return Response
+
+    Headers: Dict[str, str] = Response.setdefault("headers", {})
+    if any(Key.lower() == "content-encoding" for Key in Headers):
+        return Response
+    Headers["Vary"] = "Accept-Encoding"
+    Encoding = NegotiateEncoding(AcceptEncoding)
+    if Encoding is None:
+        return Response
+
+    Raw = Body.encode("utf-8")
+    Compressed = COMPRESSORS[Encoding](Raw, Level)
+    if len(Compressed) >= len(Raw):
+        return Response
+    Headers["Content-Encoding"] = Encoding
+    Response["body"] = base64.b64encode(Compressed).decode("ascii")
+    Response["isBase64Encoded"] = True
+    return Response
+
+
+def ReadRequestBody(Event: Any) -> str:
+    """
+    Request Body As Text, Decoding It When API Gateway Passed It As Base64
+    (Which It Does For Every Body Once binaryMediaTypes Covers */*).
+    """
+    if not isinstance(Event, dict):
+        return ""
+    Body = Event.get("body") or ""
+    if Event.get("isBase64Encoded") and Body:
+        return base64.b64decode(Body).decode("utf-8")
+    return Body
+
@@ -0,0 +1,287 @@
+"""
+Per-Request Tracing And Metrics
+
+One Trace Per API Invocation Collects:
+- Phase Spans (parse, normalize, serialize, compress, upstream_json, ...):
+  Total Milliseconds And Count Per Name. Spans Are Inclusive And May Nest
+- Every Upstream Attempt: Endpoint, Method, Status, Milliseconds, Body Size
+  And Attempt Number (So Retries Show Up As Attempts Past The First)
+- The Response Status And Body Size, The Request Body Size, And Whether The
+  Container Was Cold
+
+When The Invocation Ends The Trace Is Written To Stdout As One JSON Line In
+CloudWatch Embedded Metric Format (EMF), So Latency And Upstream Totals
+Become Metrics (Dimension: Handler) Without A Metrics API Call. Writing Is
+Sampled (AtsTraceSampleRate), But Failures (5xx) And Slow Requests (Over
+AtsTraceSlowMs) Are Always Written; Each Line Says Why It Was Kept.
+
+The Active Trace Lives In A ContextVar. Asyncio Tasks Inherit It, And
+ContextExecutor / Bind Carry It Into Worker Threads, So Prefetched And
+Concurrent Upstream Calls Count Toward The Request That Caused Them. With
+No Active Trace (Or AtsTraceEnabled=false) Every Hook Is A No-Op.
+"""
+
+import contextlib
+import contextvars
+import functools
+import json
+import random
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+
+from ats_config import Cached, Env
+
+DEFAULT_SAMPLE_RATE = 0.1
+DEFAULT_SLOW_MS = 1000.0
+DEFAULT_NAMESPACE = "AtsUnifiedApi"
+
+# Upstream Attempts Listed Per Line; Totals Still Count Every Attempt
+MAX_UPSTREAM_DETAILS = 50
+
+METRICS: Tuple[Tuple[str, str], ...] = (
+    ("Latency", "Milliseconds"),
+    ("UpstreamTime", "Milliseconds"),
+    ("UpstreamCalls", "Count"),
+    ("UpstreamRetries", "Count"),
+    ("ResponseBytes", "Bytes"),
+    ("ColdStart", "Count"),
+    ("Errors", "Count"),
+)
+
+
+def _WriteStdout(Line: str) -> None:
+    sys.stdout.write(Line + "\n")
+    sys.stdout.flush()
+
+
+_Sink: Callable[[str], None] = _WriteStdout
+_ColdStart = True
+_ColdLock = threading.Lock()
+
+
+def SetTraceSink(Sink: Optional[Callable[[str], None]]) -> None:
+    """
+    Send Trace Lines Somewhere Other Than Stdout (None Restores Stdout).
+    """
+    global _Sink
+    _Sink = Sink or _WriteStdout
+
+
+def _TakeColdStart() -> bool:
+    # True For The First Traced Invocation In This Container Only
+    global _ColdStart
+    with _ColdLock:
+        Cold, _ColdStart = _ColdStart, False
+    return Cold
+
+
+def MarkColdStart() -> None:
+    """
+    Count The Next Traced Invocation As A Cold Start Again (After A Snapshot Restore).
+    """
+    global _ColdStart
+    with _ColdLock:
+        _ColdStart = True
+
+
+@Cached
+def _ReadTraceConfig() -> Optional[Tuple[float, float, str]]:
+    """
+    (SampleRate, SlowMs, Namespace), Or None When Tracing Is Off.
+    """
+    if Env("AtsTraceEnabled", "true").strip().lower() in ("0", "false", "no", "off"):
+        return None
+    return (
+        min(1.0, max(0.0, float(Env("AtsTraceSampleRate") or DEFAULT_SAMPLE_RATE))),
+        float(Env("AtsTraceSlowMs") or DEFAULT_SLOW_MS),
+        Env("AtsTraceNamespace") or DEFAULT_NAMESPACE,
+    )
+
+
+# -----------------------
+# Trace
+# -----------------------
+class Trace:
+    """
+    What One Invocation Spent Its Time On. Safe To Record Into From Several Threads.
+    """
+
+    def __init__(self, Handler: str, RequestId: Optional[str], ColdStart: bool, RequestBytes: int) -> None:
+        self.Handler = Handler
+        self.RequestId = RequestId
+        self.ColdStart = ColdStart
+        self.RequestBytes = RequestBytes
+        self.Start = time.perf_counter()
+        self.Spans: Dict[str, List[float]] = {}
+        self.Upstream: List[Dict[str, Any]] = []
+        self.UpstreamCalls = 0
+        self.UpstreamRetries = 0
+        self.UpstreamMillis = 0.0
+        self.Lock = threading.Lock()
+
+    def AddSpan(self, Name: str, Millis: float) -> None:
+        with self.Lock:
+            Total = self.Spans.get(Name)
+            if Total is None:
+                self.Spans[Name] = [Millis, 1]
+            else:
+                Total[0] += Millis
+                Total[1] += 1
+
+    def AddUpstream(self, Endpoint: str, Method: str, Attempt: int, Status: Optional[int], Millis: float, Size: int, Error: Optional[str]) -> None:
+        with self.Lock:
+            self.UpstreamCalls += 1
+            self.UpstreamMillis += Millis
+            if Attempt > 1:
+                self.UpstreamRetries += 1
+            if len(self.Upstream) < MAX_UPSTREAM_DETAILS:
+                Call: Dict[str, Any] = {"endpoint": Endpoint, "method": Method, "attempt": Attempt, "status": Status, "ms": round(Millis, 3), "bytes": Size}
+                if Error is not None:
+                    Call["error"] = Error
+                self.Upstream.append(Call)
+
+    def Record(self, Response: Any, Namespace: str, SampleRate: float, Reason: str, Latency: float) -> Dict[str, Any]:
+        """
+        The EMF Line For This Trace: Metric Values At The Top Level, Details Alongside.
+        """
+        Status = Response.get("statusCode") if isinstance(Response, dict) else None
+        Body = Response.get("body") if isinstance(Response, dict) else None
+        with self.Lock:
+            return {
+                "_aws": {
+                    "Timestamp": int(time.time() * 1000),
+                    "CloudWatchMetrics": [
+                        {
+                            "Namespace": Namespace,
+                            "Dimensions": [["Handler"]],
+                            "Metrics": [{"Name": Name, "Unit": Unit} for Name, Unit in METRICS],
+                        }
+                    ],
+                },
+                "Handler": self.Handler,
+                "Latency": round(Latency, 3),
+                "UpstreamTime": round(self.UpstreamMillis, 3),
+                "UpstreamCalls": self.UpstreamCalls,
+                "UpstreamRetries": self.UpstreamRetries,
+                "ResponseBytes": len(Body) if isinstance(Body, str) else 0,
+                "ColdStart": int(self.ColdStart),
+                "Errors": int(Status is None or Status >= 500),
+                "request_id": self.RequestId,
+                "status_code": Status,
+                "request_bytes": self.RequestBytes,
+                "sampled": Reason,
+                "sample_rate": SampleRate,
+                "spans": {Name: {"ms": round(Total[0], 3), "count": int(Total[1])} for Name, Total in self.Spans.items()},
+                "upstream": list(self.Upstream),
+            }
+
+
+_Current: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar("AtsTrace", default=None)
+
+
+def _RequestId(Event: Any, Context: Any) -> Optional[str]:
+    RequestId = getattr(Context, "aws_request_id", None)
+    if RequestId is None and isinstance(Event, dict):
+        RequestId = (Event.get("requestContext") or {}).get("requestId")
+    return RequestId
+
+
+def TraceRequest(Handler: str, Event: Any, Context: Any, Handle: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Run Handle() Under A New Trace And Write The Trace When It Is Sampled,
+    Failed Or Slow. Returns Handle()'s Response Untouched.
+    """
+    Config = _ReadTraceConfig()
+    if Config is None:
+        return Handle()
+    SampleRate, SlowMs, Namespace = Config
+
+    Body = Event.get("body") if isinstance(Event, dict) else None
+    Current = Trace(Handler, _RequestId(Event, Context), _TakeColdStart(), len(Body) if isinstance(Body, str) else 0)
+    Token = _Current.set(Current)
+    Response: Any = None
+    try:
+        Response = Handle()
+        return Response
+    finally:
+        _Current.reset(Token)
+        Latency = (time.perf_counter() - Current.Start) * 1000
+        Status = Response.get("statusCode") if isinstance(Response, dict) else None
+        if Status is None or Status >= 500:
+            Reason = "error"
+        elif Latency >= SlowMs:
+            Reason = "slow"
+        elif SampleRate >= 1 or random.random() < SampleRate:
+            Reason = "rate"
+        else:
+            Reason = ""
+        if Reason:
+            _Sink(json.dumps(Current.Record(Response, Namespace, SampleRate, Reason, Latency), separators=(",", ":"), default=str))
+
+
+# -----------------------
+# Hooks
+# -----------------------
+class _SpanTimer:
+    __slots__ = ("Trace", "Name", "Start")
+
+    def __init__(self, Current: Trace, Name: str) -> None:
+        self.Trace = Current
+        self.Name = Name
+        self.Start = 0.0
+
+    def __enter__(self) -> None:
+        self.Start = time.perf_counter()
+
+    def __exit__(self, *ExcInfo: Any) -> None:
+        self.Trace.AddSpan(self.Name, (time.perf_counter() - self.Start) * 1000)
+
+
+_NoSpan = contextlib.nullcontext()
+
+
+def Span(Name: str) -> ContextManager[None]:
+    """
+    with Span("normalize"): ... Adds The Block's Time To The Active Trace.
+    """
+    Current = _Current.get()
+    if Current is None:
+        return _NoSpan
+    return _SpanTimer(Current, Name)
+
+
+def TraceUpstream(
+    Endpoint: str,
+    Method: str,
+    Attempt: int,
+    Status: Optional[int],
+    Started: float,
+    Size: int = 0,
+    Error: Optional[str] = None,
+) -> None:
+    """
+    Record One Upstream Attempt That Began At time.perf_counter() == Started.
+    """
+    Current = _Current.get()
+    if Current is not None:
+        Current.AddUpstream(Endpoint, Method, Attempt, Status, (time.perf_counter() - Started) * 1000, Size, Error)
+
+
+class ContextExecutor(ThreadPoolExecutor):
+    """
+    ThreadPoolExecutor Whose Tasks Run In A Copy Of The Submitter's Context,
+    So Their Upstream Calls And Spans Land In The Submitter's Trace.
+    """
+
+    def submit(self, Fn: Callable[..., Any], /, *Args: Any, **Kwargs: Any) -> Future:
+        return super().submit(contextvars.copy_context().run, Fn, *Args, **Kwargs)
+
+
+def Bind(Func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Func Bound To The Caller's Context, For loop.run_in_executor.
+    """
+    return functools.partial(contextvars.copy_context().run, Func)
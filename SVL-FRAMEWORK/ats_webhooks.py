@@ -0,0 +1,281 @@
+"""
+Webhook Ingestion And The Applications Read Model
+
+- Sign / VerifySignature: HMAC-SHA256 Over "{Timestamp}.{Body}", Sent As
+  X-Ats-Signature: t=<Unix Seconds>,v1=<Hex Digest>[,v1=...]. Several v1
+  Entries Let A Sender Rotate Secrets; Timestamps Outside Tolerance Seconds
+  Are Refused, So A Captured Delivery Cannot Be Replayed Later
+- ReadModel: Sqlite File Holding, Per Connector, The Raw Upstream
+  Applications Of Every Job It Has Seen, A Running Status Count Per Job And
+  A Ledger Of Event Ids. Each Event Is Applied Once, In The Same
+  Transaction That Records Its Id, So A Redelivered Event Changes Nothing.
+  An Application Moving Status (Or Job) Decrements Its Old Count And
+  Increments The New One, So A Job's Counts Are One Indexed Read.
+
+Events Look Like:
+
+    {"id": "evt_...", "type": "application.created|application.updated|application.deleted", "data": {...}}
+
+Events Of Other Types Are Recorded (And De-Duplicated) But Leave The Model
+Alone. An Update Older Than The Stored Copy (By updated_at) Is Skipped, As
+Deliveries May Arrive Out Of Order. A Job Is Only Served From The Model
+Once It Has Been Primed From A Full Upstream Listing; Events Keep It
+Current After That. Raw Records Are Stored, But Counts Hold The Status
+The Injected StatusOf Gave, So A Status Mapping Change Needs A Re-Prime.
+"""
+
+import hashlib
+import hmac
+import json
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+SIGNATURE_HEADER = "X-Ats-Signature"
+DEFAULT_TOLERANCE_SECONDS = 300.0
+
+# Outcomes Of ReadModel.Apply
+APPLIED = "applied"
+DUPLICATE = "duplicate"
+STALE = "stale"
+IGNORED = "ignored"
+
+APPLICATION_EVENTS = ("application.created", "application.updated", "application.deleted")
+# Prune The Event Ledger Once Per This Many Recorded Events
+PRUNE_EVERY = 1000
+
+# StatusOf(Raw Application) -> Status Counted For It
+StatusFunc = Callable[[Dict[str, Any]], Optional[str]]
+
+
+class SignatureError(ValueError):
+    """
+    A Delivery Whose Signature Is Missing, Malformed, Expired Or Wrong; Answered 401.
+    """
+
+
+def Sign(Secret: str, Body: str, Timestamp: Optional[int] = None) -> str:
+    """
+    X-Ats-Signature Value For Body, Signed Now Unless Timestamp Is Given.
+    """
+    Stamp = int(time.time()) if Timestamp is None else int(Timestamp)
+    Digest = hmac.new(Secret.encode(), f"{Stamp}.{Body}".encode(), hashlib.sha256).hexdigest()
+    return f"t={Stamp},v1={Digest}"
+
+
+def VerifySignature(Secret: str, Body: str, Header: Optional[str], Tolerance: float = DEFAULT_TOLERANCE_SECONDS) -> int:
+    """
+    Check Header Against Body; Returns The Signed Timestamp Or Raises SignatureError.
+    """
+    if not Header:
+        raise SignatureError(f"Missing {SIGNATURE_HEADER} Header")
+    Stamp: Optional[int] = None
+    Digests: List[str] = []
+    for Part in Header.split(","):
+        Name, _, Value = Part.strip().partition("=")
+        if Name == "t":
+            try:
+                Stamp = int(Value)
+            except ValueError:
+                raise SignatureError("Malformed Signature Timestamp")
+        elif Name == "v1":
+            Digests.append(Value)
+    if Stamp is None or not Digests:
+        raise SignatureError("Signature Needs t= And v1=")
+    if Tolerance > 0 and abs(time.time() - Stamp) > Tolerance:
+        raise SignatureError("Signature Timestamp Outside The Tolerance")
+    Expected = hmac.new(Secret.encode(), f"{Stamp}.{Body}".encode(), hashlib.sha256).hexdigest()
+    # Compare Every Candidate, So Timing Does Not Reveal Which One Matched
+    Matched = [hmac.compare_digest(Expected, Digest) for Digest in Digests]
+    if not any(Matched):
+        raise SignatureError("Signature Does Not Match")
+    return Stamp
+
+
+class ReadModel:
+    """
+    Applications Per Job With Status Counts, Fed By Webhook Events.
+    Readers Never See A Half-Applied Event (WAL Mode, One Transaction Each).
+    """
+
+    STATS = ("applied", "duplicates", "stale", "ignored", "primed")
+
+    def __init__(self, Path: str, EventTtl: float = 7 * 86400) -> None:
+        self.Path = Path
+        self.EventTtl = EventTtl
+        self._Lock = threading.Lock()
+        self.PrimeLocks: Dict[Tuple[str, str], threading.Lock] = defaultdict(threading.Lock)
+        self._Stats: Dict[str, int] = dict.fromkeys(self.STATS, 0)
+        self._Recorded = 0
+        self._Connection = sqlite3.connect(Path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._Connection.execute("PRAGMA journal_mode=WAL")
+        self._Connection.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            " connector TEXT, id TEXT, type TEXT, received_at REAL, PRIMARY KEY (connector, id))"
+        )
+        self._Connection.execute("CREATE INDEX IF NOT EXISTS events_received ON events (received_at)")
+        self._Connection.execute(
+            "CREATE TABLE IF NOT EXISTS applications ("
+            " connector TEXT, id TEXT, position INTEGER, job_id TEXT, status TEXT, updated_at TEXT, data TEXT,"
+            " PRIMARY KEY (connector, id))"
+        )
+        self._Connection.execute("CREATE INDEX IF NOT EXISTS applications_job ON applications (connector, job_id, position, id)")
+        self._Connection.execute(
+            "CREATE TABLE IF NOT EXISTS job_counts ("
+            " connector TEXT, job_id TEXT, status TEXT, count INTEGER, PRIMARY KEY (connector, job_id, status))"
+        )
+        self._Connection.execute(
+            "CREATE TABLE IF NOT EXISTS primed_jobs (connector TEXT, job_id TEXT, primed_at REAL, PRIMARY KEY (connector, job_id))"
+        )
+
+    @contextmanager
+    def _Transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._Lock:
+            self._Connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._Connection
+                self._Connection.execute("COMMIT")
+            except BaseException:
+                self._Connection.execute("ROLLBACK")
+                raise
+
+    def _Query(self, Sql: str, Args: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+        with self._Lock:
+            return self._Connection.execute(Sql, Args).fetchall()
+
+    def _Count(self, Field: str, Amount: int = 1) -> None:
+        with self._Lock:
+            self._Stats[Field] += Amount
+
+    # -----------------------
+    # Read Side
+    # -----------------------
+    def PrimedAge(self, Connector: str, JobId: str) -> Optional[float]:
+        """
+        Seconds Since The Job Was Last Primed; None If It Never Was.
+        """
+        Rows = self._Query("SELECT primed_at FROM primed_jobs WHERE connector = ? AND job_id = ?", (Connector, str(JobId)))
+        return max(0.0, time.time() - Rows[0][0]) if Rows else None
+
+    def Page(self, Connector: str, JobId: str, Page: int, PerPage: int) -> List[Dict[str, Any]]:
+        Rows = self._Query(
+            "SELECT data FROM applications WHERE connector = ? AND job_id = ? ORDER BY position, id LIMIT ? OFFSET ?",
+            (Connector, str(JobId), PerPage, max(0, (Page - 1) * PerPage)),
+        )
+        return [json.loads(Row[0]) for Row in Rows]
+
+    def StatusCounts(self, Connector: str, JobId: str) -> Dict[str, int]:
+        return {
+            Status: Count
+            for Status, Count in self._Query(
+                "SELECT status, count FROM job_counts WHERE connector = ? AND job_id = ? ORDER BY status", (Connector, str(JobId))
+            )
+        }
+
+    def Snapshot(self) -> Dict[str, Any]:
+        Events, Applications, Jobs = self._Query(
+            "SELECT (SELECT COUNT(*) FROM events), (SELECT COUNT(*) FROM applications), (SELECT COUNT(*) FROM primed_jobs)"
+        )[0]
+        with self._Lock:
+            Stats = dict(self._Stats)
+        return {"events": Events, "applications": Applications, "primed_jobs": Jobs, "stats": Stats}
+
+    # -----------------------
+    # Write Side
+    # -----------------------
+    def Apply(self, Connector: str, EventId: str, Type: str, Record: Any, StatusOf: StatusFunc) -> str:
+        """
+        Record EventId And Apply The Event, Once; Returns APPLIED, DUPLICATE,
+        STALE (Older Than The Stored Copy) Or IGNORED (Not An Application Event).
+        """
+        Now = time.time()
+        with self._Transaction() as Connection:
+            Inserted = Connection.execute(
+                "INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?)", (Connector, str(EventId), Type, Now)
+            ).rowcount
+            if not Inserted:
+                Outcome = DUPLICATE
+            elif Type not in APPLICATION_EVENTS or not isinstance(Record, dict) or Record.get("id") is None:
+                Outcome = IGNORED
+            elif Type == "application.deleted":
+                Outcome = APPLIED if self._Delete(Connection, Connector, Record) else IGNORED
+            else:
+                Outcome = APPLIED if self._Upsert(Connection, Connector, Record, StatusOf(Record)) else STALE
+            self._Recorded += 1
+            if self._Recorded % PRUNE_EVERY == 0 and self.EventTtl > 0:
+                Connection.execute("DELETE FROM events WHERE received_at < ?", (Now - self.EventTtl,))
+        self._Count({APPLIED: "applied", DUPLICATE: "duplicates", STALE: "stale", IGNORED: "ignored"}[Outcome])
+        return Outcome
+
+    def Prime(self, Connector: str, JobId: str, Records: List[Dict[str, Any]], StatusOf: StatusFunc) -> int:
+        """
+        Load A Job's Full Upstream Listing And Mark It Served From The Model.
+        Stored Copies Newer Than The Listing (From Events That Raced It) Win.
+        Returns How Many Records Were Written.
+        """
+        Written = 0
+        with self._Transaction() as Connection:
+            for Record in Records:
+                if Record.get("id") is not None:
+                    Written += self._Upsert(Connection, Connector, {**Record, "job_id": Record.get("job_id", JobId)}, StatusOf(Record))
+            Connection.execute("INSERT OR REPLACE INTO primed_jobs VALUES (?, ?, ?)", (Connector, str(JobId), time.time()))
+        self._Count("primed")
+        return Written
+
+    @staticmethod
+    def _Adjust(Connection: sqlite3.Connection, Connector: str, JobId: Optional[str], Status: Optional[str], Delta: int) -> None:
+        if JobId is None:
+            return
+        Key = (Connector, JobId, Status or "")
+        Connection.execute(
+            "INSERT INTO job_counts VALUES (?, ?, ?, ?) ON CONFLICT (connector, job_id, status) DO UPDATE SET count = count + excluded.count",
+            (*Key, Delta),
+        )
+        Connection.execute("DELETE FROM job_counts WHERE connector = ? AND job_id = ? AND status = ? AND count <= 0", Key)
+
+    def _Upsert(self, Connection: sqlite3.Connection, Connector: str, Record: Dict[str, Any], Status: Optional[str]) -> bool:
+        Id = str(Record["id"])
+        JobId = str(Record["job_id"]) if Record.get("job_id") is not None else None
+        UpdatedAt = Record.get("updated_at")
+        Row = Connection.execute(
+            "SELECT position, job_id, status, updated_at FROM applications WHERE connector = ? AND id = ?", (Connector, Id)
+        ).fetchone()
+        if Row is not None:
+            Position, OldJob, OldStatus, OldUpdatedAt = Row
+            if UpdatedAt and OldUpdatedAt and str(UpdatedAt) < OldUpdatedAt:
+                return False
+            self._Adjust(Connection, Connector, OldJob, OldStatus, -1)
+        else:
+            Position = Connection.execute(
+                "SELECT COALESCE(MAX(position), -1) + 1 FROM applications WHERE connector = ?", (Connector,)
+            ).fetchone()[0]
+        Connection.execute(
+            "INSERT OR REPLACE INTO applications VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                Connector,
+                Id,
+                Position,
+                JobId,
+                Status or "",
+                str(UpdatedAt) if UpdatedAt else None,
+                json.dumps(Record, separators=(",", ":")),
+            ),
+        )
+        self._Adjust(Connection, Connector, JobId, Status, 1)
+        return True
+
+    def _Delete(self, Connection: sqlite3.Connection, Connector: str, Record: Dict[str, Any]) -> bool:
+        Key = (Connector, str(Record["id"]))
+        Row = Connection.execute("SELECT job_id, status FROM applications WHERE connector = ? AND id = ?", Key).fetchone()
+        if Row is None:
+            return False
+        Connection.execute("DELETE FROM applications WHERE connector = ? AND id = ?", Key)
+        self._Adjust(Connection, Connector, Row[0], Row[1], -1)
+        return True
+
+    def Close(self) -> None:
+        with self._Lock:
+            self._Connection.close()
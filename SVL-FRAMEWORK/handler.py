@@ -1,14 +1,163 @@
+import base64
+import functools
+import hashlib
+import hmac
+import importlib
 import json
-import os
 import logging
-from typing import Any, Dict, List, Optional
-
-import requests
+import math
+import random
+import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+from ats_cache import ResponseCache
+from ats_config import Cached, ConfigError, Env, EnvInt, EnvFloat, Frozen, InLambda, Validate
+from ats_export import DEFAULT_CHUNK_ROWS, Export, ExportError
+from ats_federation import (
+    DEFAULT_DEDUP,
+    Connector,
+    ConnectorRegistry,
+    FanOut,
+    FederationError,
+    MergeRecords,
+    ParseDedup,
+    ParseRegistry,
+    ServerTiming,
+)
+from ats_idempotency import IN_FLIGHT, MISMATCH, REPLAY, IdempotencyStore
+from ats_normalize import (
+    DEFAULT_FIELD_MAPPINGS_PATH,
+    BuildAtsCandidatePayload,
+    ExtractList,
+    GetFieldMappers,
+    GetStatusNormalizers,
+    LoadFieldMappings,
+    UnifiedRecord,
+    UnifyApplications,
+    UnifyCandidates,
+    UnifyCreatedApplication,
+    UnifyJobs,
+)
+from ats_query import FilterPage, ListQuery, ParsePushDown, PlanPushDown, PushDownPlan, QueryError, SelectPage
+from ats_replica import DEFAULT_SYNC_PAGE_SIZE, SYNC_MODES, Replica, SyncResource
+from ats_ratelimit import QUOTA_METER, FlightKey, ParseRateLimits, RateLimiter, SingleFlight
+from ats_resilience import CircuitOpenError, ParseRetryAfter, Resilience, UpstreamError
+from ats_serialize import CompressResponse, DumpJson, GetHeader, ReadRequestBody
+from ats_trace import Bind, ContextExecutor, MarkColdStart, Span, TraceRequest, TraceUpstream
+from ats_webhooks import DEFAULT_TOLERANCE_SECONDS, DUPLICATE, IGNORED, SIGNATURE_HEADER, ReadModel, SignatureError, VerifySignature
+
+# requests, asyncio And The Async Client Load On First Use (See Init Phase At The End)
+if TYPE_CHECKING:
+    import asyncio
+
+    import requests
+
+    from ats_async import AsyncAtsClient
 
 Logging = logging.getLogger()
 Logging.setLevel(logging.INFO)
 
 
+# -----------------------
+# Client Configuration
+# -----------------------
+# Default Read Timeouts (Seconds) Per Ats Endpoint, Overridable Via AtsTimeouts
+DEFAULT_TIMEOUTS: Dict[str, float] = {
+    "GetJobs": 15,
+    "GetCandidates": 15,
+    "CreateCandidate": 20,
+    "GetApplications": 20,
+    "CreateApplication": 20,
+}
+
+
+def _ParseTimeouts(Raw: Optional[str]) -> Dict[str, float]:
+    """
+    Parse "GetJobs=10,CreateCandidate=30" Into A Timeout Map Over The Defaults.
+    """
+    Timeouts = dict(DEFAULT_TIMEOUTS)
+    for Entry in (Raw or "").split(","):
+        if "=" not in Entry:
+            continue
+        Name, Value = Entry.split("=", 1)
+        Timeouts[Name.strip()] = float(Value)
+    return Timeouts
+
+
+@Cached
+def _ReadAtsConfig() -> Dict[str, Any]:
+    """
+    Snapshot Every Environment Setting The Ats Client Depends On.
+    Two Equal Snapshots Can Safely Share One Client.
+    """
+    ConnectTimeoutRaw = Env("AtsConnectTimeout")
+    return {
+        "AtsBaseUrl": Env("AtsBaseUrl"),
+        "AtsApiKey": Env("AtsApiKey"),
+        "AtsApplicationsPath": Env("AtsApplicationsPath", "/applications"),
+        "PoolSize": EnvInt("AtsPoolSize", 10),
+        "KeepAlive": Env("AtsKeepAlive", "true").lower() not in ("0", "false", "no"),
+        "ConnectTimeout": float(ConnectTimeoutRaw) if ConnectTimeoutRaw else None,
+        "Timeouts": _ParseTimeouts(Env("AtsTimeouts")),
+        "PrefetchDepth": EnvInt("AtsPrefetchDepth", 2),
+        "RetryAttempts": EnvInt("AtsRetryAttempts", 3),
+        "RetryBaseDelay": EnvFloat("AtsRetryBaseDelay", 0.1),
+        "RetryMaxDelay": EnvFloat("AtsRetryMaxDelay", 2),
+        "RetryAfterMax": EnvFloat("AtsRetryAfterMax", 5),
+        "BreakerThreshold": EnvInt("AtsBreakerThreshold", 5),
+        "BreakerResetSeconds": EnvFloat("AtsBreakerResetSeconds", 30),
+        "HedgeEnabled": Env("AtsHedge", "false").lower() in ("1", "true", "yes"),
+        "HedgeMinDelay": EnvFloat("AtsHedgeMinDelay", 0.05),
+        "RateLimits": ParseRateLimits(Env("AtsRateLimits")),
+        "RateLimitMaxWait": EnvFloat("AtsRateLimitMaxWait", 2),
+        "RateLimitBackend": Env("AtsRateLimitBackend", "memory").lower(),
+        "RateLimitPath": Env("AtsRateLimitPath", "/tmp/ats-ratelimit.sqlite"),
+        "Coalesce": Env("AtsCoalesce", "true").lower() not in ("0", "false", "no"),
+    }
+
+
+@Cached
+def _ReadLimits() -> Dict[str, int]:
+    """
+    Per-Request Scan Sizes And Caps For Queries, Streamed Listings, Bulk Imports And Batches.
+    """
+    return {
+        "QueryPageSize": EnvInt("AtsQueryPageSize", 100),
+        "QueryMaxScan": EnvInt("AtsQueryMaxScan", 5000),
+        "StreamMaxItems": EnvInt("AtsStreamMaxItems", 5000),
+        "StreamMaxBytes": EnvInt("AtsStreamMaxBytes", 5 * 1024 * 1024),
+        "BulkMaxItems": EnvInt("AtsBulkMaxItems", 5000),
+        "BulkConcurrency": EnvInt("AtsBulkConcurrency", 8),
+        "BatchMaxRequests": EnvInt("AtsBatchMaxRequests", 20),
+        "BatchConcurrency": EnvInt("AtsBatchConcurrency", 8),
+        "BatchMaxExpansions": EnvInt("AtsBatchMaxExpansions", 200),
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _KeepAliveAdapter() -> type:
+    """
+    Http Adapter Class That Enables TCP Keep-Alive On Pooled Sockets, So Idle
+    Connections Survive Between Warm Invocations. Built On First Use, Since
+    Subclassing HTTPAdapter Means Importing requests.
+    """
+    from requests.adapters import HTTPAdapter
+
+    class KeepAliveAdapter(HTTPAdapter):
+        def init_poolmanager(self, *Args: Any, **Kwargs: Any) -> None:
+            SocketOptions = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1), (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                SocketOptions.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+            Kwargs["socket_options"] = SocketOptions
+            super().init_poolmanager(*Args, **Kwargs)
+
+    return KeepAliveAdapter
+
+
 class AtsClient:
     """
     Simple ATS Client Wrapper
@@ -18,69 +167,369 @@ class AtsClient:
       Ats Base Url = "http://localhost:8080"
     - Ats Api Key Is A Secret Token Or Api Key
       For Local Testing, Use A Dummy Key
+    - All Calls Share One Pooled requests.Session, So Connections
+      Are Reused Instead Of Paying A Handshake Per Call
+    - Every Call Goes Through _Request: Circuit Breaker, Retries With
+      Backoff, Optional Hedging (See ats_resilience), Per-Endpoint Rate
+      Limits And Coalescing Of Identical In-Flight GETs (See ats_ratelimit)
+    - Config May Also Carry Paths ({Resource: Path}), AuthHeader,
+      AuthScheme And Extra Headers, Which Federation Connectors Set
+      (See ats_federation)
     """
 
-    def __init__(self) -> None:
-        self.AtsBaseUrl = os.environ.get("AtsBaseUrl")
-        self.AtsApiKey = os.environ.get("AtsApiKey")
-        self.AtsApplicationsPath = os.environ.get("AtsApplicationsPath", "/applications")
+    def __init__(self, Config: Optional[Dict[str, Any]] = None) -> None:
+        self.Config = Config if Config is not None else _ReadAtsConfig()
+        self.AtsBaseUrl = self.Config.get("AtsBaseUrl")
+        self.AtsApiKey = self.Config.get("AtsApiKey")
+        self.AtsApplicationsPath = self.Config.get("AtsApplicationsPath") or "/applications"
+        self.Paths: Dict[str, str] = {
+            "jobs": "/offers",
+            "candidates": "/candidates",
+            "applications": self.AtsApplicationsPath,
+            **(self.Config.get("Paths") or {}),
+        }
+        self.AtsApplicationsPath = self.Paths["applications"]
 
         if not self.AtsBaseUrl or not self.AtsApiKey:
             raise ValueError("Missing AtsBaseUrl Or AtsApiKey Environment Variables")
 
         # Normalize Base Url
         self.AtsBaseUrl = self.AtsBaseUrl.rstrip("/")
+        self.Timeouts: Dict[str, float] = self.Config.get("Timeouts") or dict(DEFAULT_TIMEOUTS)
+        self.Session = self._BuildSession()
+        self._Executor: Optional[ThreadPoolExecutor] = None
+        self._HedgeExecutor: Optional[ThreadPoolExecutor] = None
+        self._ExecutorLock = threading.Lock()
+        self.Resilience = Resilience(self.Config)
+        self.Limiter = RateLimiter(self.Config)
+        self.Flights: Optional[SingleFlight] = SingleFlight() if self.Config.get("Coalesce", True) else None
+
+    def _BuildSession(self) -> "requests.Session":
+        """
+        Build A Session With A Connection Pool Sized For Concurrent Calls.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        PoolSize = int(self.Config.get("PoolSize") or 10)
+        KeepAlive = self.Config.get("KeepAlive", True)
+
+        # ChunkedEncodingError Is A Body Cut Off Before Content-Length; ValueError A Garbled Json Body
+        self._TransportErrors: Tuple[type, ...] = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError, ValueError)
+        Session = requests.Session()
+        AdapterClass = _KeepAliveAdapter() if KeepAlive else HTTPAdapter
+        Adapter = AdapterClass(pool_connections=PoolSize, pool_maxsize=PoolSize)
+        Session.mount("http://", Adapter)
+        Session.mount("https://", Adapter)
+        Session.headers.update(self._GetHeaders())
+        if not KeepAlive:
+            Session.headers["Connection"] = "close"
+        return Session
+
+    def _GetTimeout(self, Endpoint: str) -> Union[float, Tuple[float, float]]:
+        """
+        Return The Requests Timeout For An Endpoint, As (Connect, Read) When A Connect Timeout Is Set.
+        """
+        ReadTimeout = self.Timeouts.get(Endpoint, 15)
+        ConnectTimeout = self.Config.get("ConnectTimeout")
+        return (ConnectTimeout, ReadTimeout) if ConnectTimeout else ReadTimeout
+
+    def _GetExecutor(self) -> ThreadPoolExecutor:
+        """
+        Lazily Create The Worker Pool Used For Concurrent Upstream Calls.
+        Sized Like The Connection Pool So Workers Never Wait On A Socket.
+        """
+        if self._Executor is None:
+            with self._ExecutorLock:
+                if self._Executor is None:
+                    self._Executor = ContextExecutor(
+                        max_workers=int(self.Config.get("PoolSize") or 10),
+                        thread_name_prefix="AtsClient",
+                    )
+        return self._Executor
+
+    def Close(self) -> None:
+        """
+        Release Pooled Connections And Worker Threads.
+        """
+        for Executor in (self._Executor, self._HedgeExecutor):
+            if Executor is not None:
+                Executor.shutdown(wait=False, cancel_futures=True)
+        self.Session.close()
+        self.Limiter.Close()
+
+    def _IterPages(
+        self,
+        FetchPage: Callable[[int], Any],
+        PerPage: int,
+        StartPage: int,
+        PrefetchDepth: Optional[int],
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Yield (Page, Records) Until The Upstream Returns A Short Or Empty Page.
+
+        Up To PrefetchDepth Following Pages Are Requested Concurrently While
+        The Caller Works On The Current One. Pages Still In Flight When The
+        Caller Stops Early Are Cancelled.
+        """
+        Depth = self.Config.get("PrefetchDepth", 2) if PrefetchDepth is None else PrefetchDepth
+        Executor = self._GetExecutor()
+        Pending: Deque[Tuple[int, "Future[Any]"]] = deque()
+        NextPage = StartPage
+
+        try:
+            while True:
+                while len(Pending) <= max(0, Depth):
+                    Pending.append((NextPage, Executor.submit(FetchPage, NextPage)))
+                    NextPage += 1
+
+                Page, PageFuture = Pending.popleft()
+                Records = ExtractList(PageFuture.result())
+                if Records:
+                    yield Page, Records
+                if len(Records) < PerPage:
+                    return
+        finally:
+            for _, PageFuture in Pending:
+                PageFuture.cancel()
 
     def _GetHeaders(self) -> Dict[str, str]:
         """
         Return Default Headers For Ats Api.
-        Generic Auth: Bearer Token
+        Generic Auth: Bearer Token (AuthHeader / AuthScheme Override It;
+        An Empty Scheme Sends The Bare Key)
         """
+        AuthScheme = self.Config.get("AuthScheme", "Bearer")
         return {
-            "Authorization": f"Bearer {self.AtsApiKey}",
+            self.Config.get("AuthHeader") or "Authorization": f"{AuthScheme} {self.AtsApiKey}" if AuthScheme else str(self.AtsApiKey),
             "Content-Type": "application/json",
             "Accept": "application/json",
+            **(self.Config.get("Headers") or {}),
         }
 
     # -----------------------
-    # Jobs / Offers
+    # Resilient Request Path
     # -----------------------
-    def GetJobsFromAts(self, Page: Optional[int] = None, PerPage: Optional[int] = None) -> Dict[str, Any]:
+    def _GetHedgeExecutor(self) -> ThreadPoolExecutor:
         """
-        Fetch Jobs From Ats.
+        Separate Pool For Hedged GETs, So Prefetch Workers That Hedge Never
+        Wait On Their Own Pool.
+        """
+        if self._HedgeExecutor is None:
+            with self._ExecutorLock:
+                if self._HedgeExecutor is None:
+                    self._HedgeExecutor = ThreadPoolExecutor(
+                        max_workers=2 * int(self.Config.get("PoolSize") or 10),
+                        thread_name_prefix="AtsHedge",
+                    )
+        return self._HedgeExecutor
+
+    def _Send(
+        self,
+        Method: str,
+        Endpoint: str,
+        Url: str,
+        Params: Optional[Dict[str, Any]],
+        Payload: Optional[Dict[str, Any]],
+        Headers: Optional[Dict[str, str]],
+    ) -> "requests.Response":
+        """
+        One Attempt, Spending One Unit Of Upstream Quota. Latency Of Non-5xx
+        Answers Feeds The Hedge Delay.
+        """
+        QUOTA_METER.CountUpstreamCall(Endpoint)
+        Start = time.monotonic()
+        Response = self.Session.request(Method, Url, params=Params, json=Payload, headers=Headers, timeout=self._GetTimeout(Endpoint))
+        if Response.status_code < 500:
+            self.Resilience.Latency.Record(Endpoint, time.monotonic() - Start)
+        return Response
+
+    def _SendHedged(self, Endpoint: str, Send: Callable[[], "requests.Response"]) -> "requests.Response":
+        """
+        Send A GET; If It Is Still Running After The Endpoint's p95 Latency,
+        Send A Duplicate And Take Whichever Answers First. The Duplicate Is
+        Skipped When The Rate Limiter Has No Token To Spare For It.
+        """
+        Delay = self.Resilience.Latency.HedgeDelay(Endpoint, self.Resilience.HedgeMinDelay)
+        if Delay is None:
+            return Send()
+
+        Executor = self._GetHedgeExecutor()
+        Primary = Executor.submit(Send)
+        Done, _ = wait([Primary], timeout=Delay)
+        if Done or not self.Limiter.TryReserve(Endpoint):
+            return Primary.result()
+
+        self.Resilience.Count("hedges")
+        Backup = Executor.submit(Send)
+        Pending = {Primary, Backup}
+        Error: Optional[BaseException] = None
+        while Pending:
+            Done, Pending = wait(Pending, return_when=FIRST_COMPLETED)
+            for Finished in Done:
+                if Finished.exception() is None:
+                    if Finished is Backup:
+                        self.Resilience.Count("hedge_wins")
+                    return Finished.result()
+                Error = Finished.exception()
+        raise Error  # type: ignore[misc]
+
+    def _Request(
+        self,
+        Method: str,
+        Endpoint: str,
+        Path: str,
+        Label: str,
+        Params: Optional[Dict[str, Any]] = None,
+        Payload: Optional[Dict[str, Any]] = None,
+        Headers: Optional[Dict[str, str]] = None,
+        IdempotencyKey: Optional[str] = None,
+    ) -> Tuple[int, Any, Optional[str]]:
+        """
+        Send One Logical Request And Return (Status, Json, ETag). 304 Yields A None Body.
 
-        Generic Endpoint: GET {BaseUrl}/offers
+        Identical GETs Already In Flight (Same Endpoint, Params And Headers)
+        Are Joined Instead Of Sent Again, Unless AtsCoalesce Is Off; Joined
+        Callers Share The Same Json, So Treat It As Read-Only.
+        """
+        if Method == "GET" and self.Flights is not None:
+            return self.Flights.Do(
+                FlightKey(Endpoint, Params, Headers),
+                lambda: self._Exchange(Method, Endpoint, Path, Label, Params, Payload, Headers, IdempotencyKey),
+            )
+        return self._Exchange(Method, Endpoint, Path, Label, Params, Payload, Headers, IdempotencyKey)
+
+    def _Exchange(
+        self,
+        Method: str,
+        Endpoint: str,
+        Path: str,
+        Label: str,
+        Params: Optional[Dict[str, Any]],
+        Payload: Optional[Dict[str, Any]],
+        Headers: Optional[Dict[str, str]],
+        IdempotencyKey: Optional[str],
+    ) -> Tuple[int, Any, Optional[str]]:
         """
+        The Attempts Behind One _Request:
+
+        - Each Attempt First Takes A Rate Limit Token, Sleeping Until It Accrues;
+          RateLimitedError If That Would Take Longer Than AtsRateLimitMaxWait
+        - Fails Fast With CircuitOpenError While The Endpoint's Breaker Is Open
+        - GETs, And POSTs Carrying An Idempotency Key, Are Retried On Network
+          Errors, Timeouts, Unreadable Bodies And 429/502/503/504, Backing Off
+          With Jitter Or Waiting Out Retry-After
+        - GETs Are Hedged When AtsHedge Is On
+        - Anything Else Raises UpstreamError
+        """
+        Resilience = self.Resilience
+        Policy = Resilience.Policy
+        Breaker = Resilience.Breaker(Endpoint)
+        Repeatable = Method == "GET" or IdempotencyKey is not None
+        if IdempotencyKey is not None:
+            Headers = {**(Headers or {}), "Idempotency-Key": IdempotencyKey}
+        Url = f"{self.AtsBaseUrl}{Path}"
+
+        def Send() -> "requests.Response":
+            return self._Send(Method, Endpoint, Url, Params, Payload, Headers)
+
+        Attempt = 0
+        while True:
+            Attempt += 1
+            Throttle = self.Limiter.Reserve(Endpoint)
+            if Throttle:
+                time.sleep(Throttle)
+            if not Breaker.Allow():
+                self.Limiter.Refund(Endpoint)
+                Resilience.Count("short_circuits")
+                raise CircuitOpenError(Endpoint, Breaker.RetryIn())
+
+            RetryAfter: Optional[float] = None
+            Status: Optional[int] = None
+            Started = time.perf_counter()
+            try:
+                Response = self._SendHedged(Endpoint, Send) if Method == "GET" and Resilience.HedgeEnabled else Send()
+                Status = Response.status_code
+                TraceUpstream(Endpoint, Method, Attempt, Status, Started, len(Response.content))
+                if Status >= 500:
+                    Breaker.RecordFailure()
+                else:
+                    Breaker.RecordSuccess()
+
+                ETag = Response.headers.get("ETag")
+                if Status == 304:
+                    return 304, None, ETag
+                if Response.ok:
+                    with Span("upstream_json"):
+                        Body = Response.json()
+                    return Status, Body, ETag
+
+                if Status in (429, 503):
+                    RetryAfter = ParseRetryAfter(Response.headers.get("Retry-After"))
+                Failure = UpstreamError(f"Ats {Label} Error: {Status} {Response.text}", StatusCode=Status, RetryAfter=RetryAfter)
+            except self._TransportErrors as Ex:
+                if Status is None:
+                    TraceUpstream(Endpoint, Method, Attempt, None, Started, Error=type(Ex).__name__)
+                Breaker.RecordFailure()
+                Failure = UpstreamError(f"Ats {Label} Error: {Ex}")
+
+            Wait = Policy.Delay(Attempt, RetryAfter) if Repeatable and Policy.ShouldRetry(Attempt, Failure.StatusCode) else None
+            if Wait is None:
+                raise Failure
+            Resilience.Count("retries")
+            time.sleep(Wait)
+
+    @staticmethod
+    def _PageParams(Page: Optional[int], PerPage: Optional[int]) -> Dict[str, Any]:
         Params: Dict[str, Any] = {}
         if Page is not None:
             Params["page"] = Page
         if PerPage is not None:
             Params["per_page"] = PerPage
+        return Params
 
-        Url = f"{self.AtsBaseUrl}/offers"
-        Response = requests.get(Url, headers=self._GetHeaders(), params=Params, timeout=15)
+    # -----------------------
+    # Jobs / Offers
+    # -----------------------
+    def GetJobsFromAts(self, Page: Optional[int] = None, PerPage: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Fetch Jobs From Ats.
 
-        if not Response.ok:
-            raise RuntimeError(f"Ats Jobs Error: {Response.status_code} {Response.text}")
+        Generic Endpoint: GET {BaseUrl}/offers
+        """
+        _, Body, _ = self._Request("GET", "GetJobs", self.Paths["jobs"], "Jobs", Params=self._PageParams(Page, PerPage))
+        return Body
 
-        return Response.json()
+    def IterJobsFromAts(
+        self,
+        PerPage: int = 100,
+        StartPage: int = 1,
+        PrefetchDepth: Optional[int] = None,
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Iterate Every Page Of Jobs As (Page, Records), Prefetching Ahead.
+        """
+        return self._IterPages(
+            lambda Page: self.GetJobsFromAts(Page=Page, PerPage=PerPage),
+            PerPage,
+            StartPage,
+            PrefetchDepth,
+        )
 
     # -----------------------
     # Candidates
     # -----------------------
-    def CreateCandidateInAts(self, CandidatePayload: Dict[str, Any]) -> Dict[str, Any]:
+    def CreateCandidateInAts(self, CandidatePayload: Dict[str, Any], IdempotencyKey: Optional[str] = None) -> Dict[str, Any]:
         """
         Create Candidate In Ats.
 
         Generic Endpoint: POST {BaseUrl}/candidates
+        Only Retried When An IdempotencyKey Is Given (Sent As Idempotency-Key).
         """
-        Url = f"{self.AtsBaseUrl}/candidates"
-        Response = requests.post(Url, headers=self._GetHeaders(), json=CandidatePayload, timeout=20)
-
-        if not Response.ok:
-            raise RuntimeError(f"Ats Create Candidate Error: {Response.status_code} {Response.text}")
-
-        return Response.json()
+        _, Body, _ = self._Request(
+            "POST", "CreateCandidate", self.Paths["candidates"], "Create Candidate", Payload=CandidatePayload, IdempotencyKey=IdempotencyKey
+        )
+        return Body
 
     def GetCandidatesFromAts(self, Page: Optional[int] = None, PerPage: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -88,24 +537,29 @@ class AtsClient:
 
         Generic Endpoint: GET {BaseUrl}/candidates
         """
-        Params: Dict[str, Any] = {}
-        if Page is not None:
-            Params["page"] = Page
-        if PerPage is not None:
-            Params["per_page"] = PerPage
-
-        Url = f"{self.AtsBaseUrl}/candidates"
-        Response = requests.get(Url, headers=self._GetHeaders(), params=Params, timeout=15)
+        _, Body, _ = self._Request("GET", "GetCandidates", self.Paths["candidates"], "Candidates", Params=self._PageParams(Page, PerPage))
+        return Body
 
-        if not Response.ok:
-            raise RuntimeError(f"Ats Candidates Error: {Response.status_code} {Response.text}")
-
-        return Response.json()
+    def IterCandidatesFromAts(
+        self,
+        PerPage: int = 100,
+        StartPage: int = 1,
+        PrefetchDepth: Optional[int] = None,
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Iterate Every Page Of Candidates As (Page, Records), Prefetching Ahead.
+        """
+        return self._IterPages(
+            lambda Page: self.GetCandidatesFromAts(Page=Page, PerPage=PerPage),
+            PerPage,
+            StartPage,
+            PrefetchDepth,
+        )
 
     # -----------------------
     # Applications / Pipeline
     # -----------------------
-    def CreateApplicationInAts(self, CandidateId: str, JobId: str) -> Dict[str, Any]:
+    def CreateApplicationInAts(self, CandidateId: str, JobId: str, IdempotencyKey: Optional[str] = None) -> Dict[str, Any]:
         """
         Attach Candidate To Job (Create Application / Pipeline Entry).
 
@@ -117,19 +571,16 @@ class AtsClient:
                 "job_id": "...",
                 "initial_stage_id": null Or Concrete Stage Id
               }
+        Only Retried When An IdempotencyKey Is Given (Sent As Idempotency-Key).
         """
-        Url = f"{self.AtsBaseUrl}{self.AtsApplicationsPath}"
         Payload = {
             "candidate_id": CandidateId,
             "job_id": JobId,
         }
-
-        Response = requests.post(Url, headers=self._GetHeaders(), json=Payload, timeout=20)
-
-        if not Response.ok:
-            raise RuntimeError(f"Ats Create Application Error: {Response.status_code} {Response.text}")
-
-        return Response.json()
+        _, Body, _ = self._Request(
+            "POST", "CreateApplication", self.AtsApplicationsPath, "Create Application", Payload=Payload, IdempotencyKey=IdempotencyKey
+        )
+        return Body
 
     def GetApplicationsFromAts(
         self,
@@ -141,259 +592,1560 @@ class AtsClient:
         Fetch Applications For A Given Job From Ats.
         Generic Endpoint: GET {BaseUrl}{AtsApplicationsPath}?job_id=...
         """
-        Url = f"{self.AtsBaseUrl}{self.AtsApplicationsPath}"
-        Params: Dict[str, Any] = {}
-
+        Params = self._PageParams(Page, PerPage)
         if JobId is not None:
             Params["job_id"] = JobId
+        _, Body, _ = self._Request("GET", "GetApplications", self.AtsApplicationsPath, "Applications", Params=Params)
+        return Body
 
-        if Page is not None:
-            Params["page"] = Page
-        if PerPage is not None:
-            Params["per_page"] = PerPage
+    def GetConditional(
+        self,
+        Resource: str,
+        Params: Dict[str, Any],
+        IfNoneMatch: Optional[str] = None,
+    ) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        GET A Read Resource ("jobs", "candidates" Or "applications") With If-None-Match.
+
+        Returns (Payload, ETag), Or (None, ETag) When The Upstream Answers
+        304 Not Modified. ETag Is None If The Upstream Does Not Send One.
+        """
+        Endpoint, Path, Label = {
+            "jobs": ("GetJobs", self.Paths["jobs"], "Jobs"),
+            "candidates": ("GetCandidates", self.Paths["candidates"], "Candidates"),
+            "applications": ("GetApplications", self.AtsApplicationsPath, "Applications"),
+        }[Resource]
+
+        Headers = {"If-None-Match": IfNoneMatch} if IfNoneMatch else None
+        Status, Body, ETag = self._Request("GET", Endpoint, Path, Label, Params=Params, Headers=Headers)
+        if Status == 304:
+            return None, ETag or IfNoneMatch
+        return Body, ETag
+
+    def IterResourceFromAts(
+        self,
+        Resource: str,
+        Params: Dict[str, Any],
+        PerPage: int = 100,
+        StartPage: int = 1,
+        PrefetchDepth: Optional[int] = None,
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Iterate Every Page Of A Read Resource With Extra Upstream Params
+        (E.g. job_id Or Pushed-Down Filters), Prefetching Ahead.
+        """
+        return self._IterPages(
+            lambda Page: self.GetConditional(Resource, {**Params, "page": Page, "per_page": PerPage})[0],
+            PerPage,
+            StartPage,
+            PrefetchDepth,
+        )
+
+    def IterCursorPagesFromAts(
+        self,
+        Resource: str,
+        Params: Dict[str, Any],
+        PerPage: int = 100,
+        StartCursor: str = "",
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Iterate A Read Resource By The Upstream's Own Keyset Cursor As
+        (Cursor, Records), Where Cursor Fetched That Page ("" For The First).
+        Each Page Needs The Previous One's next_cursor, So Nothing Is Prefetched.
+        """
+        Cursor: Optional[str] = StartCursor
+        while Cursor is not None:
+            Raw, _ = self.GetConditional(Resource, {**Params, "cursor": Cursor, "per_page": PerPage})
+            Records = ExtractList(Raw)
+            if Records:
+                yield Cursor, Records
+            Cursor = Raw.get("next_cursor") if isinstance(Raw, dict) else None
+
+    def IterApplicationsFromAts(
+        self,
+        JobId: Optional[str] = None,
+        PerPage: int = 100,
+        StartPage: int = 1,
+        PrefetchDepth: Optional[int] = None,
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Iterate Every Page Of Applications As (Page, Records), Prefetching Ahead.
+        """
+        return self._IterPages(
+            lambda Page: self.GetApplicationsFromAts(JobId=JobId, Page=Page, PerPage=PerPage),
+            PerPage,
+            StartPage,
+            PrefetchDepth,
+        )
 
-        Response = requests.get(Url, headers=self._GetHeaders(), params=Params, timeout=20)
 
-        if not Response.ok:
-            raise RuntimeError(f"Ats Applications Error: {Response.status_code} {Response.text}")
+# -----------------------
+# Shared Client (Warm Container Reuse)
+# -----------------------
+_ClientLock = threading.Lock()
+_SharedClient: Optional[AtsClient] = None
+
+
+def GetAtsClient() -> AtsClient:
+    """
+    Return The Module-Level Ats Client, Creating It On First Use.
+
+    The Client Lives As Long As The Lambda Container, So Warm Invocations
+    Reuse Its Pooled Connections. If The Environment Config Changed Since
+    It Was Built, A New Client Replaces It And The Old Pool Is Closed.
+    """
+    global _SharedClient
+    Config = _ReadAtsConfig()
+    Client = _SharedClient
+    if Client is not None and (Client.Config is Config or Client.Config == Config):
+        return Client
 
-        return Response.json()
+    with _ClientLock:
+        if _SharedClient is None or _SharedClient.Config != Config:
+            Previous = _SharedClient
+            _SharedClient = AtsClient(Config)
+            if Previous is not None:
+                Previous.Close()
+        return _SharedClient
 
 
 # -----------------------
 # Helper Response Builder
 # -----------------------
 def _Response(StatusCode: int, BodyDict: Dict[str, Any]) -> Dict[str, Any]:
-    return {
-        "statusCode": StatusCode,
-        "headers": {"Content-Type": "application/json"},
-        "body": json.dumps(BodyDict),
-    }
+    return _RawResponse(StatusCode, _Serialize(BodyDict))
 
 
-# -----------------------
-# Lambda Handlers
-# -----------------------
-def Hello(Event, Context):
-    """
-    Simple Health Check For Serverless Offline.
-    """
-    Body = {
-        "Message": "Hello From Serverless Offline Python",
-        "Path": Event.get("rawPath") if isinstance(Event, dict) else None,
-    }
+def _Serialize(Value: Any) -> str:
+    with Span("serialize"):
+        return DumpJson(Value)
+
 
+def _RawResponse(StatusCode: int, Body: str, Headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     return {
-        "statusCode": 200,
-        "headers": {
-            "Content-Type": "application/json",
-        },
-        "body": json.dumps(Body),
+        "statusCode": StatusCode,
+        "headers": {"Content-Type": "application/json", **(Headers or {})},
+        "body": Body,
     }
 
 
-def GetJobs(Event, Context):
+def _FailureResponse(Error: str, Ex: Exception) -> Dict[str, Any]:
     """
-    GET /jobs
-    Returns Jobs In Unified Format:
-        {
-          "jobs": [
-            {
-              "id": "string",
-              "title": "string",
-              "location": "string",
-              "status": "OPEN|CLOSED|DRAFT",
-              "external_url": "string"
-            }
-          ]
-        }
+    Error Body For A Failed Handler: 503 With Retry-After When The Upstream Is
+    Throttling Us Or Its Circuit Is Open, 500 Otherwise.
     """
-    try:
-        Client = AtsClient()
-        QueryParams = Event.get("queryStringParameters") or {}
-        PageRaw = QueryParams.get("page")
-        PerPageRaw = QueryParams.get("per_page")
+    Body = {"error": Error, "message": str(Ex)}
+    RetryAfter = getattr(Ex, "RetryAfter", None)
+    if isinstance(Ex, UpstreamError) and RetryAfter is not None:
+        return _RawResponse(503, _Serialize(Body), {"Retry-After": str(max(1, math.ceil(RetryAfter)))})
+    return _Response(500, Body)
 
-        Page = int(PageRaw) if PageRaw is not None else None
-        PerPage = int(PerPageRaw) if PerPageRaw is not None else None
 
-        RawJobs = Client.GetJobsFromAts(Page=Page, PerPage=PerPage)
-
-        # "data" Key Is Common, Fallback To Raw List
-        RawJobsList: List[Dict[str, Any]] = RawJobs.get("data", RawJobs if isinstance(RawJobs, list) else [])
-
-        UnifiedJobs: List[Dict[str, Any]] = []
-        for Job in RawJobsList:
-            UnifiedJobs.append(
-                {
-                    "id": str(Job.get("id")),
-                    "title": Job.get("title") or Job.get("job_title"),
-                    "location": Job.get("location") or Job.get("city") or Job.get("country"),
-                    "status": _NormalizeJobStatus(Job.get("status")),
-                    "external_url": Job.get("url") or Job.get("apply_url") or Job.get("careers_url"),
-                }
-            )
+def _ReadJsonBody(Event: Any) -> Any:
+    with Span("parse"):
+        return json.loads(ReadRequestBody(Event) or "{}")
 
-        return _Response(200, {"jobs": UnifiedJobs})
 
-    except Exception as Ex:
-        Logging.exception("GetJobs Failed")
-        return _Response(
-            500,
-            {
-                "error": "JobsFetchFailed",
-                "message": str(Ex),
-            },
-        )
+def _ScopedKey(Key: Optional[str], *Scope: str) -> Optional[str]:
+    return ":".join((Key, *Scope)) if Key else None
 
 
-def CreateCandidate(Event, Context):
+def _IdempotencyKey(Event: Any, *Scope: str) -> Optional[str]:
     """
-    POST /candidates
+    Derive A Per-Upstream-Call Key From The Request's Idempotency-Key Header,
+    So Upstream Creates Become Safe To Retry. None Without The Header.
+    """
+    return _ScopedKey(GetHeader(Event, "Idempotency-Key"), *Scope)
 
-    Request Body:
-        {
-          "name": "string",
-          "email": "string",
-          "phone": "string",
-          "resume_url": "string",
-          "job_id": "string"
-        }
 
-    Steps:
-      1. Create Candidate In Ats
-      2. Attach Candidate To Given Job (Create Application / Pipeline Entry)
+def _Compressed(Func: Callable[..., Dict[str, Any]]) -> Callable[[Any, Any], Dict[str, Any]]:
+    """
+    Compress The Handler's Response Per The Request's Accept-Encoding (See ats_serialize).
+    Every API Handler Passes Through Here, So It Also Counts Requests For The Quota Meter
+    And Runs Each Invocation Under A Trace (See ats_trace).
     """
-    try:
-        Client = AtsClient()
 
-        BodyRaw = Event.get("body") or "{}"
-        Payload = json.loads(BodyRaw)
+    @functools.wraps(Func)
+    def Wrapper(Event, Context):
+        QUOTA_METER.CountApiRequest()
 
-        Name = Payload.get("name")
-        Email = Payload.get("email")
-        Phone = Payload.get("phone")
-        ResumeUrl = Payload.get("resume_url")
-        JobId = Payload.get("job_id")
+        def Handle() -> Dict[str, Any]:
+            Response = Func(Event, Context)
+            with Span("compress"):
+                return CompressResponse(Response, GetHeader(Event, "Accept-Encoding"))
 
-        if not Name or not Email or not JobId:
-            return _Response(
-                400,
-                {
-                    "error": "ValidationError",
-                    "message": "Name, Email And job_id Are Required",
-                },
-            )
+        return TraceRequest(Func.__name__, Event, Context, Handle)
 
-        # Split Name Naively Into First / Last
-        NameParts = str(Name).strip().split(" ", 1)
-        FirstName = NameParts[0]
-        LastName = NameParts[1] if len(NameParts) > 1 else ""
-
-        # Map To A Generic Candidate Payload
-        AtsCandidatePayload: Dict[str, Any] = {
-            "first_name": FirstName,
-            "last_name": LastName,
-            "emails": [{"value": Email, "type": "work"}],
-            "phones": [{"value": Phone, "type": "mobile"}] if Phone else [],
-            "photo_url": None,
-            "social_links": [],
-            "cv_url": ResumeUrl,
-        }
+    return Wrapper
 
-        CreatedCandidate = Client.CreateCandidateInAts(AtsCandidatePayload)
-        CandidateId = str(CreatedCandidate.get("id") or CreatedCandidate.get("candidate_id"))
 
-        # Attach Candidate To Job (Create Application / Pipeline Entry)
-        CreatedApplication = Client.CreateApplicationInAts(CandidateId=CandidateId, JobId=str(JobId))
+# -----------------------
+# Response Cache (Read Endpoints)
+# -----------------------
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "jobs": 60,
+    "candidates": 15,
+    "applications": 15,
+}
 
-        UnifiedApplication = {
-            "id": str(CreatedApplication.get("id", "")),
-            "job_id": str(JobId),
-            "candidate_id": CandidateId,
-            "status": _NormalizeApplicationStatus(CreatedApplication.get("status")),
-        }
+_CacheLock = threading.Lock()
+_SharedCache: Optional[ResponseCache] = None
+_SharedCacheConfig: Optional[Tuple[Any, ...]] = None
 
-        UnifiedCandidate = {
-            "id": CandidateId,
-            "name": Name,
-            "email": Email,
-            "phone": Phone,
-        }
 
-        return _Response(
-            201,
-            {
-                "candidate": UnifiedCandidate,
-                "application": UnifiedApplication,
-            },
-        )
+@Cached
+def _ReadCacheConfig() -> Optional[Tuple[Any, ...]]:
+    """
+    Return (Ttls, MaxEntries, SharedPath), Or None When Caching Is Disabled.
+    """
+    if not _IsTruthy(Env("AtsCacheEnabled", "true")):
+        return None
+    Ttls = dict(DEFAULT_CACHE_TTLS)
+    for Entry in Env("AtsCacheTtls", "").split(","):
+        if "=" in Entry:
+            Name, Value = Entry.split("=", 1)
+            Ttls[Name.strip()] = float(Value)
+    SharedPath = Env("AtsCachePath") if Env("AtsCacheBackend", "memory") == "sqlite" else None
+    return (tuple(sorted(Ttls.items())), EnvInt("AtsCacheMaxEntries", 256), SharedPath)
+
+
+def GetResponseCache() -> Optional[ResponseCache]:
+    """
+    Return The Module-Level Response Cache, Or None When AtsCacheEnabled Is Off.
+    Rebuilt Like The Ats Client When Its Environment Config Changes.
+    """
+    global _SharedCache, _SharedCacheConfig
+    Config = _ReadCacheConfig()
+    if Config is None:
+        return None
+    if _SharedCache is not None and _SharedCacheConfig == Config:
+        return _SharedCache
+
+    with _CacheLock:
+        if _SharedCache is None or _SharedCacheConfig != Config:
+            Ttls, MaxEntries, SharedPath = Config
+            _SharedCache = ResponseCache(dict(Ttls), MaxEntries=MaxEntries, SharedPath=SharedPath or None)
+            _SharedCacheConfig = Config
+        return _SharedCache
+
+
+def _InvalidateCache(*Resources: str) -> None:
+    """
+    Drop Cached Listings After A Write, And Make The Next Replica Read Of
+    Those Resources Sync First.
+    """
+    Cache = GetResponseCache()
+    if Cache is not None:
+        Cache.Invalidate(Resources)
+    Store = GetReplica()
+    if Store is not None:
+        Store.MarkStale(Resources)
+
+
+def _CachedRead(
+    Client: AtsClient,
+    Resource: str,
+    Params: Dict[str, Any],
+    UnifyPage: Callable[[List[Dict[str, Any]]], List[UnifiedRecord]],
+) -> Dict[str, Any]:
+    """
+    Serve One Page Of A Read Resource Through The Response Cache.
 
-    except Exception as Ex:
-        Logging.exception("CreateCandidate Failed")
-        return _Response(
-            500,
-            {
-                "error": "CandidateCreateFailed",
-                "message": str(Ex),
-            },
-        )
+    Fresh Entries Are Returned As-Is (X-Cache: HIT). Stale Entries With An
+    ETag Are Revalidated Upstream (X-Cache: REVALIDATED On 304); Anything
+    Else Is Fetched, Normalized And Stored (X-Cache: MISS).
+    """
+    Probe = _CacheProbe(Client.AtsBaseUrl, Resource, Params)
+    if Probe.Hit is not None:
+        return Probe.Hit
 
+    Raw, ETag = Client.GetConditional(Resource, Params, IfNoneMatch=Probe.ETag)
+    return Probe.Fill(Raw, ETag, UnifyPage)
 
-def GetCandidates(Event, Context):
+
+class _CacheProbe:
     """
-    GET /candidates
-    Returns Candidates In Unified Format:
-        {
-          "candidates": [
-            {
-              "id": "string",
-              "name": "string",
-              "email": "string",
-              "phone": "string"
-            }
-          ]
-        }
+    The I/O-Free Halves Of A Cached Read, Shared By The Sync And Async Paths.
+
+    Construction Looks The Page Up; Hit Is Set When It Can Be Served As-Is.
+    Otherwise The Caller Fetches Upstream (Sending ETag As If-None-Match)
+    And Hands The Result To Fill().
     """
-    try:
-        Client = AtsClient()
-        QueryParams = Event.get("queryStringParameters") or {}
-        PageRaw = QueryParams.get("page")
-        PerPageRaw = QueryParams.get("per_page")
 
-        Page = int(PageRaw) if PageRaw is not None else None
-        PerPage = int(PerPageRaw) if PerPageRaw is not None else None
+    def __init__(self, BaseUrl: str, Resource: str, Params: Dict[str, Any]) -> None:
+        self.Resource = Resource
+        self.Cache = GetResponseCache()
+        self.Key: Optional[str] = None
+        self.Entry = None
+        self.Generation: Optional[Tuple[int, int]] = None
+        self.Hit: Optional[Dict[str, Any]] = None
 
-        RawCandidates = Client.GetCandidatesFromAts(Page=Page, PerPage=PerPage)
+        if self.Cache is None or not self.Cache.IsCacheable(Resource):
+            self.Cache = None
+            return
 
-        RawCandidatesList: List[Dict[str, Any]] = RawCandidates.get("data", RawCandidates if isinstance(RawCandidates, list) else [])
+        self.Key = self.Cache.MakeKey(Resource, BaseUrl, Params.get("page"), Params.get("per_page"), Params.get("job_id"))
+        self.Entry, Fresh, self.Generation = self.Cache.Lookup(Resource, self.Key)
+        if self.Entry is not None and Fresh:
+            self.Hit = _RawResponse(200, self.Entry.Body, {"X-Cache": "HIT"})
 
-        UnifiedCandidates: List[Dict[str, Any]] = []
-        for Candidate in RawCandidatesList:
-            UnifiedCandidates.append(
-                {
-                    "id": str(Candidate.get("id")),
-                    "name": Candidate.get("name") or f"{Candidate.get('first_name', '')} {Candidate.get('last_name', '')}".strip(),
-                    "email": Candidate.get("email") or (Candidate.get("emails") or [{}])[0].get("value"),
-                    "phone": (Candidate.get("phones") or [{}])[0].get("value"),
-                }
-            )
+    @property
+    def ETag(self) -> Optional[str]:
+        return self.Entry.ETag if self.Entry is not None else None
 
-        return _Response(200, {"candidates": UnifiedCandidates})
+    def Fill(self, Raw: Optional[Any], ETag: Optional[str], UnifyPage: Callable[[List[Dict[str, Any]]], List[UnifiedRecord]]) -> Dict[str, Any]:
+        if self.Cache is None:
+            return _Response(200, {self.Resource: UnifyPage(ExtractList(Raw))})
 
-    except Exception as Ex:
-        Logging.exception("GetCandidates Failed")
-        return _Response(
-            500,
-            {
-                "error": "CandidatesFetchFailed",
-                "message": str(Ex),
-            },
-        )
+        if Raw is None and self.Entry is not None:
+            self.Cache.Refresh(self.Key, self.Entry, self.Generation)
+            return _RawResponse(200, self.Entry.Body, {"X-Cache": "REVALIDATED"})
 
+        Body = _Serialize({self.Resource: UnifyPage(ExtractList(Raw))})
+        self.Cache.Store(self.Resource, self.Key, Body, ETag, self.Generation)
+        return _RawResponse(200, Body, {"X-Cache": "MISS"})
 
-def CreateApplication(Event, Context):
-    """
+
+# -----------------------
+# Idempotent Writes (Create Endpoints)
+# -----------------------
+# Upstream Statuses That Mean An Indexed Candidate Id No Longer Exists There
+STALE_CANDIDATE_STATUSES = frozenset((404, 410, 422))
+
+_IdempotencyLock = threading.Lock()
+_SharedIdempotency: Optional[IdempotencyStore] = None
+_SharedIdempotencyConfig: Optional[Tuple[Any, ...]] = None
+
+
+@Cached
+def _ReadIdempotencyConfig() -> Optional[Tuple[Any, ...]]:
+    """
+    Return (Ttl, IndexTtl, WaitSeconds, MaxEntries, SharedPath), Or None When
+    Both Stored Responses And The Candidate Email Index Are Off.
+    """
+    Ttl = EnvFloat("AtsIdempotencyTtl", 86400)
+    IndexTtl = EnvFloat("AtsCandidateIndexTtl", 86400) if _IsTruthy(Env("AtsCandidateDedup", "true")) else 0.0
+    if Ttl <= 0 and IndexTtl <= 0:
+        return None
+    SharedPath = Env("AtsIdempotencyPath", "/tmp/ats-idempotency.sqlite") if Env("AtsIdempotencyBackend", "memory") == "sqlite" else None
+    return (Ttl, IndexTtl, EnvFloat("AtsIdempotencyWait", 5), EnvInt("AtsIdempotencyMaxEntries", 1024), SharedPath)
+
+
+def GetIdempotencyStore() -> Optional[IdempotencyStore]:
+    """
+    Return The Module-Level Idempotency Store, Or None When It Is Off.
+    Rebuilt Like The Response Cache When Its Environment Config Changes.
+    """
+    global _SharedIdempotency, _SharedIdempotencyConfig
+    Config = _ReadIdempotencyConfig()
+    if Config is None:
+        return None
+    if _SharedIdempotency is not None and _SharedIdempotencyConfig == Config:
+        return _SharedIdempotency
+
+    with _IdempotencyLock:
+        if _SharedIdempotency is None or _SharedIdempotencyConfig != Config:
+            Ttl, IndexTtl, WaitSeconds, MaxEntries, SharedPath = Config
+            _SharedIdempotency = IdempotencyStore(Ttl, IndexTtl, WaitSeconds=WaitSeconds, MaxEntries=MaxEntries, SharedPath=SharedPath)
+            _SharedIdempotencyConfig = Config
+        return _SharedIdempotency
+
+
+def _Idempotent(Route: str) -> Callable[[Callable[..., Dict[str, Any]]], Callable[[Any, Any], Dict[str, Any]]]:
+    """
+    Answer Repeats Of A Create Request (Same Idempotency-Key On Route) From
+    The Idempotency Store Instead Of Running The Handler Again. Goes Under
+    _Compressed, So Stored Bodies Are Plain JSON And Replays Are Compressed
+    For Whoever Asks. 5xx Responses Are Not Kept, So Those Can Be Retried.
+    """
+
+    def Decorate(Func: Callable[..., Dict[str, Any]]) -> Callable[[Any, Any], Dict[str, Any]]:
+        @functools.wraps(Func)
+        def Wrapper(Event, Context):
+            Store = GetIdempotencyStore()
+            Header = GetHeader(Event, "Idempotency-Key")
+            if Store is None or Store.Ttl <= 0 or not Header:
+                return Func(Event, Context)
+
+            Key = _ScopedKey(Header, Route)
+            Fingerprint = hashlib.sha256(ReadRequestBody(Event).encode()).hexdigest()
+            with Span("idempotency"):
+                Outcome, Record = Store.Begin(Key, Fingerprint)
+            if Outcome == REPLAY:
+                return _RawResponse(Record.Status, Record.Body, {**Record.Headers, "Idempotent-Replayed": "true"})
+            if Outcome == MISMATCH:
+                return _Response(
+                    422,
+                    {"error": "IdempotencyKeyReused", "message": "Idempotency-Key Was Already Used With A Different Request Body"},
+                )
+            if Outcome == IN_FLIGHT:
+                return _RawResponse(
+                    409,
+                    _Serialize({"error": "IdempotencyConflict", "message": "A Request With This Idempotency-Key Is Still In Progress"}),
+                    {"Retry-After": "1"},
+                )
+
+            Response: Optional[Dict[str, Any]] = None
+            try:
+                Response = Func(Event, Context)
+                return Response
+            finally:
+                Status = Response.get("statusCode") if isinstance(Response, dict) else None
+                if isinstance(Status, int) and Status < 500 and isinstance(Response.get("body"), str):
+                    Store.Complete(Key, Fingerprint, Status, dict(Response.get("headers") or {}), Response["body"])
+                else:
+                    Store.Release(Key)
+
+        return Wrapper
+
+    return Decorate
+
+
+def _CandidateIndex() -> Optional[IdempotencyStore]:
+    Store = GetIdempotencyStore()
+    return Store if Store is not None and Store.IndexTtl > 0 else None
+
+
+def _ResolveCandidate(Client: AtsClient, Item: Dict[str, Any], IdempotencyKey: Optional[str]) -> Tuple[str, bool]:
+    """
+    (CandidateId, Reused): The Indexed Candidate For Item's Email, Else A New One.
+    """
+    Index = _CandidateIndex()
+    CandidateId = Index.LookupCandidate(Item["email"]) if Index is not None else None
+    if CandidateId is not None:
+        return CandidateId, True
+
+    AtsCandidatePayload = BuildAtsCandidatePayload(Item["name"], Item["email"], Item.get("phone"), Item.get("resume_url"))
+    CreatedCandidate = Client.CreateCandidateInAts(AtsCandidatePayload, IdempotencyKey=_ScopedKey(IdempotencyKey, "candidate"))
+    CandidateId = str(CreatedCandidate.get("id") or CreatedCandidate.get("candidate_id"))
+    if Index is not None:
+        Index.RememberCandidate(Item["email"], CandidateId)
+    return CandidateId, False
+
+
+def _ApplyToJob(
+    Client: AtsClient,
+    Item: Dict[str, Any],
+    CandidateId: str,
+    Reused: bool,
+    IdempotencyKey: Optional[str],
+) -> Tuple[str, bool, Dict[str, Any]]:
+    """
+    Create The Application For Item's job_id. If A Reused Candidate Turns Out
+    To Be Gone Upstream, Forget It, Create The Candidate Once And Try Again.
+    Returns (CandidateId, Reused, CreatedApplication).
+    """
+    JobId = str(Item["job_id"])
+    try:
+        Created = Client.CreateApplicationInAts(CandidateId=CandidateId, JobId=JobId, IdempotencyKey=_ScopedKey(IdempotencyKey, "application"))
+        return CandidateId, Reused, Created
+    except UpstreamError as Ex:
+        Index = _CandidateIndex()
+        if not Reused or Index is None or Ex.StatusCode not in STALE_CANDIDATE_STATUSES:
+            raise
+        Index.ForgetCandidate(Item["email"])
+
+    CandidateId, Reused = _ResolveCandidate(Client, Item, IdempotencyKey)
+    Created = Client.CreateApplicationInAts(CandidateId=CandidateId, JobId=JobId, IdempotencyKey=_ScopedKey(IdempotencyKey, "application"))
+    return CandidateId, Reused, Created
+
+
+# -----------------------
+# Local Replica (Read Endpoints)
+# -----------------------
+# Matches The Upstream's Own Default per_page, So Replica Pages Line Up With Live Ones
+DEFAULT_REPLICA_PAGE_SIZE = 10
+REPLICA_RESOURCES = ("jobs", "candidates", "applications")
+# Records Per Replica Read When A Query Scans It
+REPLICA_SCAN_PAGE_SIZE = 500
+
+_ReplicaLock = threading.Lock()
+_SharedReplica: Optional[Replica] = None
+
+
+@Cached
+def _ReadReplicaConfig() -> Optional[Dict[str, Any]]:
+    """
+    Replica Settings, Or None When AtsReplicaEnabled Is Off.
+    """
+    if not _IsTruthy(Env("AtsReplicaEnabled", "false")):
+        return None
+    Modes = dict.fromkeys(REPLICA_RESOURCES, "auto")
+    for Entry in Env("AtsReplicaSyncModes", "").split(","):
+        if "=" in Entry:
+            Name, Value = Entry.split("=", 1)
+            if Value.strip() not in SYNC_MODES:
+                raise ValueError(f"Unknown Replica Sync Mode {Value.strip()!r} For {Name.strip()}")
+            Modes[Name.strip()] = Value.strip()
+    return {
+        "Path": Env("AtsReplicaPath", "/tmp/ats-replica.sqlite"),
+        "MaxStaleness": EnvFloat("AtsReplicaMaxStaleness", 60),
+        "Modes": Modes,
+        "PageSize": EnvInt("AtsReplicaSyncPageSize", DEFAULT_SYNC_PAGE_SIZE),
+        "Overlap": EnvFloat("AtsReplicaSyncOverlap", 5),
+        "FullSyncSeconds": EnvFloat("AtsReplicaFullSyncSeconds", 3600),
+    }
+
+
+def GetReplica() -> Optional[Replica]:
+    """
+    Return The Module-Level Replica, Or None When AtsReplicaEnabled Is Off.
+    Reopened When AtsReplicaPath Changes.
+    """
+    global _SharedReplica
+    Config = _ReadReplicaConfig()
+    if Config is None:
+        return None
+    if _SharedReplica is not None and _SharedReplica.Path == Config["Path"]:
+        return _SharedReplica
+
+    with _ReplicaLock:
+        if _SharedReplica is None or _SharedReplica.Path != Config["Path"]:
+            Previous = _SharedReplica
+            _SharedReplica = Replica(Config["Path"])
+            if Previous is not None:
+                Previous.Close()
+        return _SharedReplica
+
+
+def _SyncReplica(Client: AtsClient, Store: Replica, Resource: str, Config: Dict[str, Any]) -> Dict[str, Any]:
+    return SyncResource(
+        Store,
+        lambda Params, IfNoneMatch: Client.GetConditional(Resource, Params, IfNoneMatch=IfNoneMatch),
+        Resource,
+        Mode=Config["Modes"].get(Resource, "auto"),
+        PageSize=Config["PageSize"],
+        Overlap=Config["Overlap"],
+        FullSyncSeconds=Config["FullSyncSeconds"],
+    )
+
+
+def _ReplicaRead(
+    Resource: str,
+    QueryParams: Dict[str, Any],
+    UnifyPage: Callable[[List[Dict[str, Any]]], List[UnifiedRecord]],
+    Query: Optional[ListQuery] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Serve One Page From The Local Replica, Or Return None To Read Live.
+
+    The Replica Is Synced First If Its Last Sync Started More Than
+    AtsReplicaMaxStaleness Seconds Ago (A max_staleness Query Param May
+    Tighten That), So Served Data Is Never Older Than The Bound. If That
+    Sync Fails, Or source=live Is Asked For, The Read Goes Upstream.
+    A Query Is Answered By Scanning The Replica, Never The Upstream.
+    """
+    Config = _ReadReplicaConfig()
+    if Config is None or QueryParams.get("source") == "live":
+        return None
+    Store = GetReplica()
+    MaxStaleness = Config["MaxStaleness"]
+    if QueryParams.get("max_staleness") is not None:
+        try:
+            Requested = float(QueryParams["max_staleness"])
+        except ValueError:
+            Requested = math.nan
+        if not math.isfinite(Requested) or Requested < 0:
+            raise QueryError("max_staleness Must Be A Non-Negative Number Of Seconds")
+        MaxStaleness = min(MaxStaleness, Requested)
+
+    Age = Store.Age(Resource)
+    if Age is None or Age > MaxStaleness:
+        with Store.SyncLocks[Resource]:
+            Age = Store.Age(Resource)
+            if Age is None or Age > MaxStaleness:
+                try:
+                    _SyncReplica(GetAtsClient(), Store, Resource, Config)
+                except Exception:
+                    Logging.exception("Replica Sync Of %s Failed, Reading Live", Resource)
+                    return None
+                Age = Store.Age(Resource) or 0.0
+
+    Page = int(QueryParams.get("page") or 1)
+    PerPage = int(QueryParams.get("per_page") or DEFAULT_REPLICA_PAGE_SIZE)
+    Headers = {"X-Data-Source": "replica", "X-Replica-Age": f"{Age:.1f}"}
+    if Query is not None:
+        Pages = _ReplicaPages(Store, Resource, QueryParams.get("job_id"))
+        Records, _ = SelectPage(Pages, UnifyPage, Query, Page, PerPage, LocalSort=bool(Query.Sort))
+        return _QueryResponse(Resource, Query, Records, Headers)
+    Records = Store.Page(Resource, Page, PerPage, QueryParams.get("job_id"))
+    Body = _Serialize({Resource: UnifyPage(Records)})
+    return _RawResponse(200, Body, Headers)
+
+
+def _ReplicaPages(Store: Replica, Resource: str, JobId: Optional[str]) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    Page = 1
+    while True:
+        Records = Store.Page(Resource, Page, REPLICA_SCAN_PAGE_SIZE, JobId)
+        if Records:
+            yield Page, Records
+        if len(Records) < REPLICA_SCAN_PAGE_SIZE:
+            return
+        Page += 1
+
+
+def _PageParams(QueryParams: Dict[str, Any], *Extra: str) -> Dict[str, Any]:
+    """
+    Build Upstream Query Params From page/per_page (Plus Any Extra Keys Present).
+    """
+    Params: Dict[str, Any] = {}
+    for Name in Extra:
+        if QueryParams.get(Name) is not None:
+            Params[Name] = QueryParams[Name]
+    if QueryParams.get("page") is not None:
+        Params["page"] = int(QueryParams["page"])
+    if QueryParams.get("per_page") is not None:
+        Params["per_page"] = int(QueryParams["per_page"])
+    return Params
+
+
+# -----------------------
+# List Queries (status / location / q / sort / fields)
+# -----------------------
+# Resource -> Key Of Its Field Mapper And Status Normalizer
+_RECORD_KINDS = {"jobs": "job", "candidates": "candidate", "applications": "application"}
+# Upstream Params Each Listing Already Passes Through, Kept On Every Query Page
+_QUERY_SCOPES: Dict[str, Tuple[str, ...]] = {"jobs": (), "candidates": (), "applications": ("job_id",)}
+
+
+def _ParseQuery(Resource: str, QueryParams: Dict[str, Any]) -> Optional[ListQuery]:
+    Kind = _RECORD_KINDS[Resource]
+    Normalizer = GetStatusNormalizers().get(Kind)
+    return ListQuery.Parse(Resource, QueryParams, GetFieldMappers()[Kind].Fields, Normalizer.Statuses if Normalizer else ())
+
+
+@Cached
+def _ReadPushDown() -> Dict[str, FrozenSet[str]]:
+    return ParsePushDown(Env("AtsPushDown"))
+
+
+def _PlanQuery(Resource: str, Query: ListQuery) -> PushDownPlan:
+    """
+    Split A Query Against The Upstream's Declared Capabilities (AtsPushDown).
+    """
+    Capabilities = _ReadPushDown().get(Resource, frozenset())
+    Normalizer = GetStatusNormalizers().get(_RECORD_KINDS[Resource])
+    return PlanPushDown(Query, Capabilities, Normalizer.RawValues if Normalizer else lambda _: [])
+
+
+def _QueryResponse(Resource: str, Query: ListQuery, Records: List[UnifiedRecord], Headers: Dict[str, str]) -> Dict[str, Any]:
+    return _RawResponse(200, _Serialize({Resource: [Query.Project(Record) for Record in Records]}), Headers)
+
+
+def _QueryPages(
+    Client: AtsClient,
+    Resource: str,
+    QueryParams: Dict[str, Any],
+    Plan: PushDownPlan,
+    PerPage: int,
+    Start: Optional[Union[int, str]] = None,
+) -> Iterator[Tuple[Any, List[Dict[str, Any]]]]:
+    Params = _PageParams({Name: QueryParams.get(Name) for Name in _QUERY_SCOPES[Resource]}, *_QUERY_SCOPES[Resource])
+    return _ListPages(Client, Resource, {**Params, **Plan.Params}, PerPage, Start)
+
+
+def _QueryRead(
+    Client: AtsClient,
+    Resource: str,
+    QueryParams: Dict[str, Any],
+    UnifyPage: Callable[[List[Dict[str, Any]]], List[UnifiedRecord]],
+    Query: ListQuery,
+) -> Dict[str, Any]:
+    """
+    Serve A Filtered / Sorted / Projected Listing.
+
+    all=true Streams Like An Unfiltered Listing, With The Filter Applied As
+    Pages Arrive. Otherwise The Replica Answers If Enabled; Then, If The
+    Whole Query Was Pushed Down, The Upstream Page Is The Answer (One Call,
+    Re-Checked Locally). Failing That, Upstream Pages Of AtsQueryPageSize
+    Records, Narrowed By Whatever Was Pushed, Stream Through The Filter
+    Until The Page Fills, Reading At Most AtsQueryMaxScan Records
+    (X-Query-Truncated Marks A Page Cut Short By That). Queries Bypass The
+    Response Cache.
+    """
+    Plan = _PlanQuery(Resource, Query)
+    PushDown = "full" if Plan.Complete else "partial" if Plan.Params else "none"
+
+    if _WantsAll(QueryParams):
+        if Query.Sort and not Plan.SortPushed:
+            raise QueryError("sort With all=true Needs An Upstream That Sorts By Those Fields (See AtsPushDown)")
+        Start, Offset, PerPage = _StreamPosition(Resource, QueryParams)
+        Pages = _QueryPages(Client, Resource, QueryParams, Plan, PerPage, Start)
+        Response = _StreamAll(Resource, Pages, UnifyPage, QueryParams, Offset, PerPage, Query)
+        Response["headers"]["X-Query-Pushdown"] = PushDown
+        return Response
+
+    Served = _ReplicaRead(Resource, QueryParams, UnifyPage, Query)
+    if Served is not None:
+        return Served
+
+    Headers = {"X-Query-Pushdown": PushDown}
+    if Plan.Complete:
+        Raw, _ = Client.GetConditional(Resource, {**_PageParams(QueryParams, *_QUERY_SCOPES[Resource]), **Plan.Params})
+        return _QueryResponse(Resource, Query, FilterPage(ExtractList(Raw), UnifyPage, Query), Headers)
+
+    Page = int(QueryParams.get("page") or 1)
+    PerPage = int(QueryParams.get("per_page") or DEFAULT_REPLICA_PAGE_SIZE)
+    Limits = _ReadLimits()
+    ScanPageSize = Limits["QueryPageSize"]
+    MaxScan = Limits["QueryMaxScan"]
+    Pages = _QueryPages(Client, Resource, QueryParams, Plan, ScanPageSize)
+    Records, Truncated = SelectPage(Pages, UnifyPage, Query, Page, PerPage, bool(Query.Sort) and not Plan.SortPushed, MaxScan)
+    if Truncated:
+        Headers["X-Query-Truncated"] = "true"
+    return _QueryResponse(Resource, Query, Records, Headers)
+
+
+# -----------------------
+# Auto-Pagination (all=true)
+# -----------------------
+DEFAULT_STREAM_PAGE_SIZE = 100
+
+
+def _IsTruthy(Value: Optional[str]) -> bool:
+    return str(Value or "").lower() in ("1", "true", "yes")
+
+
+def _CursorSecret() -> bytes:
+    # Falls Back To A Key Derived From The Upstream Api Key, So Every Container Agrees
+    return (Env("AtsCursorSecret") or "cursor:" + (Env("AtsApiKey") or "")).encode()
+
+
+def _EncodeCursor(State: Dict[str, Any]) -> str:
+    """
+    Opaque Token For A Stream Position: Base64 JSON Plus A Truncated HMAC-SHA256.
+    """
+    Body = base64.urlsafe_b64encode(json.dumps(State, separators=(",", ":")).encode()).decode().rstrip("=")
+    Signature = hmac.new(_CursorSecret(), Body.encode(), hashlib.sha256).digest()[:16]
+    return Body + "." + base64.urlsafe_b64encode(Signature).decode().rstrip("=")
+
+
+def _DecodeCursor(Cursor: str) -> Dict[str, Any]:
+    Body, _, Signature = Cursor.partition(".")
+    Expected = base64.urlsafe_b64encode(hmac.new(_CursorSecret(), Body.encode(), hashlib.sha256).digest()[:16]).decode().rstrip("=")
+    if not hmac.compare_digest(Signature, Expected):
+        raise QueryError("Invalid Cursor")
+    return json.loads(base64.urlsafe_b64decode(Body + "=" * (-len(Body) % 4)))
+
+
+def _CursorScope(Resource: str, QueryParams: Dict[str, Any]) -> Dict[str, str]:
+    """
+    What A Cursor Is Bound To: The Resource And Every Param That Shapes The
+    Listing, So It Cannot Resume A Different One.
+    """
+    Shape = [QueryParams.get(Name) for Name in ("job_id", "status", "location", "q", "sort")]
+    return {"r": Resource, "f": hashlib.sha256(json.dumps(Shape).encode()).hexdigest()[:16]}
+
+
+def _UpstreamKeyset(Resource: str, Start: Optional[Union[int, str]] = None) -> bool:
+    """
+    True When AtsPushDown Says The Upstream Pages This Resource By Its Own
+    Cursor. A Start Saved Under The Other Mode (Config Changed) Is Refused.
+    """
+    Keyset = "cursor" in _ReadPushDown().get(Resource, frozenset())
+    if Start is not None and isinstance(Start, str) != Keyset:
+        raise QueryError("Cursor Expired; Restart The Listing")
+    return Keyset
+
+
+def _ListPages(
+    Client: AtsClient,
+    Resource: str,
+    Params: Dict[str, Any],
+    PerPage: int,
+    Start: Optional[Union[int, str]] = None,
+) -> Iterator[Tuple[Any, List[Dict[str, Any]]]]:
+    """
+    Walk A Listing From Start: An Upstream Cursor When It Supports Keyset
+    Paging, Otherwise A Page Number (Prefetched Ahead).
+    """
+    if _UpstreamKeyset(Resource, Start):
+        return Client.IterCursorPagesFromAts(Resource, Params, PerPage=PerPage, StartCursor=Start or "")
+    return Client.IterResourceFromAts(Resource, Params, PerPage=PerPage, StartPage=Start or 1)
+
+
+def _WantsAll(QueryParams: Dict[str, Any]) -> bool:
+    return _IsTruthy(QueryParams.get("all")) or bool(QueryParams.get("cursor"))
+
+
+def _StreamPosition(Resource: str, QueryParams: Dict[str, Any]) -> Tuple[Optional[Union[int, str]], int, int]:
+    """
+    Return (Start, Offset, PerPage) For An all=true Request, Resuming From cursor If Given.
+    Start Is None For The Beginning, Else A Page Number Or Upstream Cursor.
+    """
+    if QueryParams.get("cursor"):
+        State = _DecodeCursor(QueryParams["cursor"])
+        if {Key: State.get(Key) for Key in ("r", "f")} != _CursorScope(Resource, QueryParams):
+            raise QueryError("Cursor Does Not Match This Listing")
+        return State["p"], int(State["o"]), int(State["n"])
+    PerPageRaw = QueryParams.get("per_page")
+    return None, 0, int(PerPageRaw) if PerPageRaw is not None else DEFAULT_STREAM_PAGE_SIZE
+
+
+def _StreamCaps(QueryParams: Dict[str, Any]) -> Tuple[int, int]:
+    """
+    Return (MaxItems, MaxBytes). A limit Query Param May Lower, But Never Raise, The Item Cap.
+    """
+    Limits = _ReadLimits()
+    MaxItems = Limits["StreamMaxItems"]
+    MaxBytes = Limits["StreamMaxBytes"]
+    if QueryParams.get("limit") is not None:
+        MaxItems = max(1, min(MaxItems, int(QueryParams["limit"])))
+    return MaxItems, MaxBytes
+
+
+def _StreamAll(
+    Key: str,
+    Pages: Iterator[Tuple[int, List[Dict[str, Any]]]],
+    UnifyPage: Callable[[List[Dict[str, Any]]], List[UnifiedRecord]],
+    QueryParams: Dict[str, Any],
+    Offset: int,
+    PerPage: int,
+    Query: Optional[ListQuery] = None,
+) -> Dict[str, Any]:
+    """
+    Stream Every Page Through A _StreamWriter Until A Cap Is Hit.
+    """
+    Writer = _StreamWriter(Key, UnifyPage, QueryParams, Offset, PerPage, Query)
+    try:
+        for Page, Records in Pages:
+            if not Writer.Add(Page, Records):
+                break
+    finally:
+        Pages.close()
+    return Writer.Response()
+
+
+class _StreamWriter:
+    """
+    Encode Unified Records Into The Body As Pages Arrive, Stopping At The
+    Item Or Byte Cap. When A Cap Cuts The Listing Short, next_cursor Points
+    At The First Record Left Out.
+
+    With A Query, Records Are Filtered And Projected On The Way In, And At
+    Most AtsQueryMaxScan Upstream Records Are Read Per Response; next_cursor
+    Then Resumes The Scan (Send The Same Query Params With It).
+    """
+
+    def __init__(
+        self,
+        Key: str,
+        UnifyPage: Callable[[List[Dict[str, Any]]], List[UnifiedRecord]],
+        QueryParams: Dict[str, Any],
+        Offset: int,
+        PerPage: int,
+        Query: Optional[ListQuery] = None,
+    ) -> None:
+        self.Key = Key
+        self.UnifyPage = UnifyPage
+        self.Offset = Offset
+        self.PerPage = PerPage
+        self.Query = Query
+        self.Scope = _CursorScope(Key, QueryParams)
+        self.MaxItems, self.MaxBytes = _StreamCaps(QueryParams)
+        self.MaxScan = _ReadLimits()["QueryMaxScan"] if Query is not None else None
+        self.Scanned = 0
+        self.Parts: List[str] = []
+        self.Size = len(Key) + 32
+        self.NextCursor: Optional[str] = None
+
+    def Add(self, Page: Union[int, str], Records: List[Dict[str, Any]]) -> bool:
+        """
+        Append One Page. Returns False Once A Cap Is Hit And No More Pages Are Wanted.
+        """
+        UnifiedRecords = self.UnifyPage(Records[self.Offset:])
+        with Span("serialize"):
+            for Index, Unified in enumerate(UnifiedRecords, self.Offset):
+                if self.Query is not None:
+                    if self.Scanned >= self.MaxScan:
+                        self.NextCursor = _EncodeCursor({**self.Scope, "p": Page, "o": Index, "n": self.PerPage})
+                        return False
+                    self.Scanned += 1
+                    if not self.Query.Matches(Unified):
+                        continue
+                    Unified = self.Query.Project(Unified)
+                Encoded = DumpJson(Unified)
+                if len(self.Parts) >= self.MaxItems or self.Size + len(Encoded) + 1 > self.MaxBytes:
+                    self.NextCursor = _EncodeCursor({**self.Scope, "p": Page, "o": Index, "n": self.PerPage})
+                    return False
+                self.Parts.append(Encoded)
+                self.Size += len(Encoded) + 1
+        self.Offset = 0
+        return True
+
+    def Response(self) -> Dict[str, Any]:
+        Body = '{"%s":[%s],"next_cursor":%s}' % (self.Key, ",".join(self.Parts), json.dumps(self.NextCursor))
+        return _RawResponse(200, Body)
+
+
+# -----------------------
+# Federation (connectors=)
+# -----------------------
+# Request Params A Federated Read Serves; Anything Else Needs The Single-Upstream Path
+FEDERATED_PARAMS = frozenset(("connectors", "page", "per_page", "job_id"))
+
+
+class _Federation:
+    """
+    The Registry Plus One AtsClient Per Connector (Own Pool, Breakers And
+    Rate Limits) And The Pool The Fan-Out Runs On.
+
+    A Timed-Out Fetch Cannot Be Cancelled Once Running, So Each Connector's
+    Connect And Read Timeouts Are Capped At Timeout: A Straggler Holds Its
+    Thread For At Most RetryAttempts Tries (Plus Backoff) Past Its Start.
+    The Pool Keeps RetryAttempts + 2 Threads Per Connector, So Stragglers
+    Left By Earlier Requests Never Queue Ahead Of A New Request's Fetches.
+    """
+
+    def __init__(self, Registry: ConnectorRegistry, Timeout: float, Dedup: Dict[str, str]) -> None:
+        self.Registry = Registry
+        self.Timeout = Timeout
+        self.Dedup = Dedup
+        Base = _ReadAtsConfig()
+        self.Clients: Dict[str, AtsClient] = {}
+        self.Mappers: Dict[str, Dict[str, Any]] = {}
+        for Name in Registry.Names:
+            Item = Registry.Connectors[Name]
+            Config = {**Base, **Item.Overrides, "AtsBaseUrl": Item.BaseUrl, "AtsApiKey": Item.ApiKey}
+            if Item.Timeouts:
+                Config["Timeouts"] = _ParseTimeouts(Item.Timeouts)
+            Config["Timeouts"] = {Endpoint: min(Seconds, Timeout) for Endpoint, Seconds in Config["Timeouts"].items()}
+            Config["ConnectTimeout"] = min(Config.get("ConnectTimeout") or Timeout, Timeout)
+            if Item.RateLimits:
+                Config["RateLimits"] = ParseRateLimits(Item.RateLimits)
+            # Sqlite Buckets Are Keyed By Endpoint, So Each Connector Gets Its Own File
+            Config["RateLimitPath"] = f"{Base['RateLimitPath']}.{Name}"
+            self.Clients[Name] = AtsClient(Config)
+            if Item.FieldProfile:
+                self.Mappers[Name] = LoadFieldMappings(Item.FieldProfile, Env("AtsFieldMappingsPath") or DEFAULT_FIELD_MAPPINGS_PATH)
+        Workers = (max(1, Base["RetryAttempts"]) + 2) * len(Registry.Names)
+        self.Executor = ContextExecutor(max_workers=max(4, Workers), thread_name_prefix="Federation")
+
+    def Unify(self, Name: str, Resource: str, Records: List[Dict[str, Any]], UnifyPage: Callable[[List[Dict[str, Any]]], List[UnifiedRecord]]) -> List[Dict[str, Any]]:
+        Mappers = self.Mappers.get(Name)
+        if Mappers is not None:
+            with Span("normalize"):
+                Unified = Mappers[_RECORD_KINDS[Resource]].MapPage(Records)
+        else:
+            Unified = UnifyPage(Records)
+        return [Record.ToDict() for Record in Unified]
+
+    def Close(self) -> None:
+        self.Executor.shutdown(wait=False)
+        for Client in self.Clients.values():
+            Client.Close()
+
+
+_FederationLock = threading.Lock()
+_SharedFederation: Optional[Tuple[Tuple[Any, ...], _Federation]] = None
+
+
+@Cached
+def _ReadFederationConfig() -> Optional[Tuple[Any, ...]]:
+    """
+    Return (Key, Registry, Timeout, Dedup), Or None Without AtsConnectors / AtsConnectorsPath.
+    """
+    Raw = Env("AtsConnectors")
+    Path = Env("AtsConnectorsPath")
+    if not Raw and Path:
+        with open(Path, "r") as ConnectorsFile:
+            Raw = ConnectorsFile.read()
+    if not Raw:
+        return None
+    Timeout = EnvFloat("AtsFederationTimeout", 5)
+    Dedup = ParseDedup(Env("AtsFederationDedup", DEFAULT_DEDUP))
+    # Keys Named By api_key_env Are Part Of The Key, So Rotating One Rebuilds The Clients
+    Registry = ParseRegistry(Raw)
+    Key = (Raw, Timeout, tuple(sorted(Dedup.items())), tuple(Item.ApiKey for Item in Registry.Connectors.values()))
+    return (Key, Registry, Timeout, Dedup)
+
+
+def GetFederation() -> Optional[_Federation]:
+    """
+    Return The Module-Level Federation, Or None When No Connectors Are
+    Configured. Rebuilt (Closing The Old Clients) When Its Config Changes.
+    """
+    global _SharedFederation
+    Config = _ReadFederationConfig()
+    if Config is None:
+        return None
+    Current = _SharedFederation
+    if Current is not None and Current[0] == Config[0]:
+        return Current[1]
+
+    with _FederationLock:
+        if _SharedFederation is None or _SharedFederation[0] != Config[0]:
+            Previous = _SharedFederation
+            Key, Registry, Timeout, Dedup = Config
+            _SharedFederation = (Key, _Federation(Registry, Timeout, Dedup))
+            if Previous is not None:
+                Previous[1].Close()
+        return _SharedFederation[1]
+
+
+def _FederatedRead(
+    Resource: str,
+    QueryParams: Dict[str, Any],
+    UnifyPage: Callable[[List[Dict[str, Any]]], List[UnifiedRecord]],
+) -> Optional[Dict[str, Any]]:
+    """
+    Serve One Page From Every Selected Connector, Merged (See ats_federation),
+    Or Return None When The Request Takes The Single-Upstream Path:
+
+        {"jobs": [... Each With "connector"], "connectors": {"acme": {"status": "ok", "ms": 41.2, "count": 10}, ...},
+         "duplicates": 0, "partial": false}
+
+    Per-Connector Timings Also Go Out As Server-Timing. Only Complete Merges
+    Are Cached; If Every Connector Fails, The First Error Is Raised.
+    """
+    Federation = GetFederation()
+    if Federation is None:
+        if QueryParams.get("connectors"):
+            raise FederationError("No Connectors Configured (AtsConnectors / AtsConnectorsPath)")
+        return None
+    Selected = Federation.Registry.Select(QueryParams.get("connectors"))
+    if Selected is None:
+        return None
+    Unsupported = sorted(set(QueryParams) - FEDERATED_PARAMS)
+    if Unsupported:
+        raise FederationError(f"Federated Reads Serve Plain Pages (page, per_page, job_id); Not {', '.join(Unsupported)}")
+
+    Params = _PageParams(QueryParams, *_QUERY_SCOPES[Resource])
+    Names = [Item.Name for Item in Selected]
+    Cache = GetResponseCache()
+    CacheKey: Optional[str] = None
+    Generation: Optional[Tuple[int, int]] = None
+    if Cache is not None and Cache.IsCacheable(Resource):
+        CacheKey = Cache.MakeKey(Resource, "federated:" + ",".join(Names), Params.get("page"), Params.get("per_page"), Params.get("job_id"))
+        Entry, Fresh, Generation = Cache.Lookup(Resource, CacheKey)
+        if Entry is not None and Fresh:
+            return _RawResponse(200, Entry.Body, {"X-Cache": "HIT"})
+
+    def Fetch(Item: Connector) -> List[Dict[str, Any]]:
+        Raw, _ = Federation.Clients[Item.Name].GetConditional(Resource, Params)
+        return Federation.Unify(Item.Name, Resource, ExtractList(Raw), UnifyPage)
+
+    with Span("federation"):
+        Results = FanOut(Federation.Executor, Selected, Fetch, Federation.Timeout)
+    Failed = [Result for Result in Results if Result.Status != "ok"]
+    if len(Failed) == len(Results):
+        First = next((Result.Error for Result in Results if Result.Error is not None), None)
+        raise First or UpstreamError(f"Ats {Resource} Error: No Connector Answered Within {Federation.Timeout}s")
+    for Result in Failed:
+        Logging.warning(f"Federated {Resource} Read: Connector {Result.Name} {Result.Status}: {Result.Error or ''}")
+
+    Records, Duplicates = MergeRecords(Results, Federation.Dedup.get(Resource))
+    Body = _Serialize(
+        {
+            Resource: Records,
+            "connectors": {Result.Name: Result.Report() for Result in Results},
+            "duplicates": Duplicates,
+            "partial": bool(Failed),
+        }
+    )
+    Headers = {"Server-Timing": ServerTiming(Results)}
+    if CacheKey is not None and not Failed:
+        Cache.Store(Resource, CacheKey, Body, None, Generation)  # type: ignore[union-attr]
+        Headers["X-Cache"] = "MISS"
+    return _RawResponse(200, Body, Headers)
+
+
+# -----------------------
+# Webhooks And The Applications Read Model
+# -----------------------
+# Connector Name Of The Single AtsBaseUrl Upstream (POST /webhooks/default)
+DEFAULT_CONNECTOR = "default"
+# Event Types Map To The Resource Whose Cached Listings They Make Stale
+_EVENT_RESOURCES = {"job": "jobs", "candidate": "candidates", "application": "applications"}
+
+_ReadModelLock = threading.Lock()
+_SharedReadModel: Optional[ReadModel] = None
+
+
+@Cached
+def _ReadReadModelConfig() -> Optional[Dict[str, Any]]:
+    """
+    Read Model And Webhook Settings, Or None When AtsReadModelEnabled Is Off.
+    """
+    if not _IsTruthy(Env("AtsReadModelEnabled", "false")):
+        return None
+    Secrets: Dict[str, str] = {}
+    for Entry in Env("AtsWebhookSecrets", "").split(","):
+        if "=" in Entry:
+            Name, Value = Entry.split("=", 1)
+            Secrets[Name.strip()] = Value.strip()
+    return {
+        "Path": Env("AtsReadModelPath", "/tmp/ats-read-model.sqlite"),
+        "MaxAge": EnvFloat("AtsReadModelMaxAge", 3600),
+        "Secret": Env("AtsWebhookSecret") or "",
+        "Secrets": Secrets,
+        "Tolerance": EnvFloat("AtsWebhookTolerance", DEFAULT_TOLERANCE_SECONDS),
+        "EventTtl": EnvFloat("AtsWebhookEventTtl", 7 * 86400),
+    }
+
+
+def GetReadModel() -> Optional[ReadModel]:
+    """
+    Return The Module-Level Read Model, Or None When AtsReadModelEnabled Is Off.
+    Reopened When AtsReadModelPath Changes.
+    """
+    global _SharedReadModel
+    Config = _ReadReadModelConfig()
+    if Config is None:
+        return None
+    if _SharedReadModel is not None and _SharedReadModel.Path == Config["Path"]:
+        return _SharedReadModel
+
+    with _ReadModelLock:
+        if _SharedReadModel is None or _SharedReadModel.Path != Config["Path"]:
+            Previous = _SharedReadModel
+            _SharedReadModel = ReadModel(Config["Path"], EventTtl=Config["EventTtl"])
+            if Previous is not None:
+                Previous.Close()
+        return _SharedReadModel
+
+
+def _StatusOf(Name: str) -> Callable[[Dict[str, Any]], Optional[str]]:
+    """
+    Unified Status Of A Raw Application From Connector Name (Its Own Field Profile If It Has One).
+    """
+    Federation = GetFederation() if Name != DEFAULT_CONNECTOR else None
+    Mappers = Federation.Mappers.get(Name) if Federation is not None else None
+    if Mappers is not None:
+        return lambda Record: getattr(Mappers["application"].Map(Record), "status", None)
+    return lambda Record: getattr(UnifyApplications([Record])[0], "status", None)
+
+
+def _ReadModelRead(QueryParams: Dict[str, Any], UnifyPage: Callable[[List[Dict[str, Any]]], List[UnifiedRecord]]) -> Optional[Dict[str, Any]]:
+    """
+    Serve One Page Of GET /applications?job_id= From The Read Model, Or
+    Return None To Read As Before:
+
+        {"applications": [...], "status_counts": {"APPLIED": 3, "HIRED": 1}, "total": 4}
+
+    A Job Not Yet In The Model (Or Last Primed Over AtsReadModelMaxAge
+    Seconds Ago, Which Heals Any Missed Event) Is Loaded From A Full
+    Upstream Listing First; Webhook Events Keep It Current Between Primes.
+    If Priming Fails, Or source=live Is Asked For, The Read Goes Upstream.
+    """
+    Config = _ReadReadModelConfig()
+    JobId = QueryParams.get("job_id")
+    if Config is None or not JobId or QueryParams.get("source") == "live":
+        return None
+    Model = GetReadModel()
+
+    Age = Model.PrimedAge(DEFAULT_CONNECTOR, JobId)
+    if Age is None or Age > Config["MaxAge"]:
+        with Model.PrimeLocks[(DEFAULT_CONNECTOR, str(JobId))]:
+            Age = Model.PrimedAge(DEFAULT_CONNECTOR, JobId)
+            if Age is None or Age > Config["MaxAge"]:
+                try:
+                    with Span("read_model_prime"):
+                        Pages = _ListPages(GetAtsClient(), "applications", {"job_id": JobId}, DEFAULT_STREAM_PAGE_SIZE)
+                        Model.Prime(DEFAULT_CONNECTOR, JobId, [Record for _, Records in Pages for Record in Records], _StatusOf(DEFAULT_CONNECTOR))
+                except Exception:
+                    Logging.exception("Read Model Prime Of Job %s Failed, Reading Upstream", JobId)
+                    return None
+
+    Page = int(QueryParams.get("page") or 1)
+    PerPage = int(QueryParams.get("per_page") or DEFAULT_REPLICA_PAGE_SIZE)
+    Counts = Model.StatusCounts(DEFAULT_CONNECTOR, JobId)
+    Body = _Serialize(
+        {
+            "applications": UnifyPage(Model.Page(DEFAULT_CONNECTOR, JobId, Page, PerPage)),
+            "status_counts": Counts,
+            "total": sum(Counts.values()),
+        }
+    )
+    return _RawResponse(200, Body, {"X-Data-Source": "read-model"})
+
+
+# -----------------------
+# Lambda Handlers
+# -----------------------
+def Hello(Event, Context):
+    """
+    Simple Health Check For Serverless Offline.
+    """
+    Body = {
+        "Message": "Hello From Serverless Offline Python",
+        "Path": Event.get("rawPath") if isinstance(Event, dict) else None,
+    }
+
+    return {
+        "statusCode": 200,
+        "headers": {
+            "Content-Type": "application/json",
+        },
+        "body": json.dumps(Body),
+    }
+
+
+@_Compressed
+def GetJobs(Event, Context):
+    """
+    GET /jobs
+    Returns Jobs In Unified Format:
+        {
+          "jobs": [
+            {
+              "id": "string",
+              "title": "string",
+              "location": "string",
+              "status": "OPEN|CLOSED|DRAFT",
+              "external_url": "string"
+            }
+          ]
+        }
+
+    With all=true (Or A cursor) Every Page Is Fetched And Streamed Into One
+    Response Up To The Item/Byte Cap, Plus "next_cursor" To Resume From.
+
+    status=, location=, q=, sort= And fields= Filter, Order And Project The
+    Listing (See ats_query); Unknown Fields Or Statuses Answer 400.
+    """
+    try:
+        QueryParams = Event.get("queryStringParameters") or {}
+        Federated = _FederatedRead("jobs", QueryParams, UnifyJobs)
+        if Federated is not None:
+            return Federated
+
+        Client = GetAtsClient()
+        Query = _ParseQuery("jobs", QueryParams)
+        if Query is not None:
+            return _QueryRead(Client, "jobs", QueryParams, UnifyJobs, Query)
+
+        if _WantsAll(QueryParams):
+            Start, Offset, PerPage = _StreamPosition("jobs", QueryParams)
+            Pages = _ListPages(Client, "jobs", {}, PerPage, Start)
+            return _StreamAll("jobs", Pages, UnifyJobs, QueryParams, Offset, PerPage)
+
+        Served = _ReplicaRead("jobs", QueryParams, UnifyJobs)
+        if Served is not None:
+            return Served
+        return _CachedRead(Client, "jobs", _PageParams(QueryParams), UnifyJobs)
+
+    except (QueryError, FederationError) as Ex:
+        return _Response(400, {"error": "ValidationError", "message": str(Ex)})
+
+    except Exception as Ex:
+        Logging.exception("GetJobs Failed")
+        return _FailureResponse("JobsFetchFailed", Ex)
+
+
+@_Compressed
+@_Idempotent("candidates")
+def CreateCandidate(Event, Context):
+    """
+    POST /candidates
+
+    Request Body:
+        {
+          "name": "string",
+          "email": "string",
+          "phone": "string",
+          "resume_url": "string",
+          "job_id": "string"
+        }
+
+    Steps:
+      1. Create Candidate In Ats, Or Reuse The One Already Indexed For This Email
+      2. Attach Candidate To Given Job (Create Application / Pipeline Entry)
+
+    With An Idempotency-Key Header, Repeats Replay The First Response.
+    """
+    try:
+        Client = GetAtsClient()
+
+        Payload = _ReadJsonBody(Event)
+
+        Name = Payload.get("name")
+        Email = Payload.get("email")
+        Phone = Payload.get("phone")
+        ResumeUrl = Payload.get("resume_url")
+        JobId = Payload.get("job_id")
+
+        if not Name or not Email or not JobId:
+            return _Response(
+                400,
+                {
+                    "error": "ValidationError",
+                    "message": "Name, Email And job_id Are Required",
+                },
+            )
+
+        Item = {"name": Name, "email": Email, "phone": Phone, "resume_url": ResumeUrl, "job_id": JobId}
+        IdempotencyKey = _IdempotencyKey(Event)
+
+        CandidateId, Reused = _ResolveCandidate(Client, Item, IdempotencyKey)
+        if not Reused:
+            _InvalidateCache("candidates")
+
+        # Attach Candidate To Job (Create Application / Pipeline Entry)
+        AppliedId, Reused, CreatedApplication = _ApplyToJob(Client, Item, CandidateId, Reused, IdempotencyKey)
+        if AppliedId != CandidateId:
+            _InvalidateCache("candidates")
+        CandidateId = AppliedId
+        _InvalidateCache("applications")
+
+        UnifiedApplication = UnifyCreatedApplication(CreatedApplication, CandidateId, str(JobId))
+
+        UnifiedCandidate = {
+            "id": CandidateId,
+            "name": Name,
+            "email": Email,
+            "phone": Phone,
+        }
+
+        return _Response(
+            201,
+            {
+                "candidate": UnifiedCandidate,
+                "application": UnifiedApplication,
+                "candidate_reused": Reused,
+            },
+        )
+
+    except Exception as Ex:
+        Logging.exception("CreateCandidate Failed")
+        return _FailureResponse("CandidateCreateFailed", Ex)
+
+
+# -----------------------
+# Bulk Candidate Import
+# -----------------------
+# API Gateway Ends The Integration At 29 s Whatever The Lambda Timeout, So An
+# Import Budgets Against This From Entry And Reports The Rest As "skipped"
+GATEWAY_BUDGET_MS = 28000
+
+
+def _ParseBulkBody(Event: Dict[str, Any]) -> List[Any]:
+    """
+    Accept A JSON Array, {"candidates": [...]}, Or NDJSON (One Object Per Line).
+    """
+    BodyRaw = ReadRequestBody(Event).strip()
+    if not BodyRaw:
+        return []
+    with Span("parse"):
+        try:
+            Parsed = json.loads(BodyRaw)
+        except ValueError:
+            return [json.loads(Line) for Line in BodyRaw.splitlines() if Line.strip()]
+    if isinstance(Parsed, dict):
+        # A Single Object Body Is Either A Wrapper Or One NDJSON Line
+        return Parsed.get("candidates") if isinstance(Parsed.get("candidates"), list) else [Parsed]
+    if isinstance(Parsed, list):
+        return Parsed
+    raise ValueError("Body Must Be A JSON Array Or NDJSON")
+
+
+def _BulkConcurrency(Event: Dict[str, Any]) -> int:
+    """
+    AtsBulkConcurrency, Lowered By ?concurrency=N. Raises ValueError If N Is Not An Integer.
+    """
+    Concurrency = _ReadLimits()["BulkConcurrency"]
+    Requested = (Event.get("queryStringParameters") or {}).get("concurrency")
+    if Requested is None:
+        return Concurrency
+    try:
+        return max(1, min(Concurrency, int(Requested)))
+    except ValueError:
+        raise ValueError("concurrency Must Be An Integer") from None
+
+
+def _ImportCandidate(Client: AtsClient, Index: int, Item: Any, IdempotencyKey: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Create One Candidate And Chain Its Application Straight Away.
+    Never Raises; Failures Are Reported In The Returned Result.
+    """
+    Result: Dict[str, Any] = {"index": Index}
+    if not isinstance(Item, dict) or not Item.get("name") or not Item.get("email") or not Item.get("job_id"):
+        Result.update(status="invalid", error="Name, Email And job_id Are Required")
+        return Result
+
+    JobId = str(Item["job_id"])
+    try:
+        CandidateId, Reused = _ResolveCandidate(Client, Item, IdempotencyKey)
+    except Exception as Ex:
+        Result.update(status="failed", error=str(Ex))
+        return Result
+    Result["candidate"] = {"id": CandidateId, "name": Item["name"], "email": Item["email"], "phone": Item.get("phone")}
+
+    try:
+        CandidateId, Reused, CreatedApplication = _ApplyToJob(Client, Item, CandidateId, Reused, IdempotencyKey)
+    except Exception as Ex:
+        # Candidate Exists Upstream; The Client Can Retry Just The Application
+        Result.update(status="application_failed", error=str(Ex))
+        return Result
+
+    Result["candidate"]["id"] = CandidateId
+    Result["candidate_reused"] = Reused
+    Result["application"] = UnifyCreatedApplication(CreatedApplication, CandidateId, JobId)
+    Result["status"] = "created"
+    return Result
+
+
+def _RemainingMillis(Context: Any) -> Optional[int]:
+    GetRemaining = getattr(Context, "get_remaining_time_in_millis", None)
+    return GetRemaining() if callable(GetRemaining) else None
+
+
+def _BudgetMillis(Context: Any, Deadline: Optional[float]) -> Optional[int]:
+    # The Lambda's Remaining Time, Capped By A time.monotonic() Deadline
+    Remaining = _RemainingMillis(Context)
+    if Deadline is None:
+        return Remaining
+    Left = int((Deadline - time.monotonic()) * 1000)
+    return Left if Remaining is None else min(Left, Remaining)
+
+
+def ImportCandidates(
+    Client: AtsClient,
+    Items: List[Any],
+    Concurrency: int,
+    Context: Any = None,
+    ReserveMillis: int = 3000,
+    IdempotencyKey: Optional[str] = None,
+    Deadline: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run _ImportCandidate Over Items With At Most Concurrency In Flight.
+
+    New Items Are Only Submitted As Earlier Ones Finish, So A Slow Upstream
+    Throttles Intake Instead Of Piling Up Requests. Once The Lambda (Or The
+    time.monotonic() Deadline, If Sooner) Has Less Than ReserveMillis Left,
+    Remaining Items Are Reported As "skipped".
+    With An IdempotencyKey, Item i's Upstream Creates Use "<Key>:i:...".
+    """
+    Results: List[Optional[Dict[str, Any]]] = [None] * len(Items)
+    InFlight: Dict["Future[Dict[str, Any]]", int] = {}
+    NextIndex = 0
+
+    with ContextExecutor(max_workers=max(1, Concurrency), thread_name_prefix="BulkImport") as Executor:
+        while NextIndex < len(Items) or InFlight:
+            Remaining = _BudgetMillis(Context, Deadline)
+            OutOfTime = Remaining is not None and Remaining < ReserveMillis
+
+            while not OutOfTime and NextIndex < len(Items) and len(InFlight) < Concurrency:
+                ItemKey = _ScopedKey(IdempotencyKey, str(NextIndex))
+                InFlight[Executor.submit(_ImportCandidate, Client, NextIndex, Items[NextIndex], ItemKey)] = NextIndex
+                NextIndex += 1
+
+            if OutOfTime:
+                for Index in range(NextIndex, len(Items)):
+                    Results[Index] = {"index": Index, "status": "skipped", "error": "Time Budget Exhausted"}
+                NextIndex = len(Items)
+            if not InFlight:
+                continue
+
+            Done, _ = wait(list(InFlight), return_when=FIRST_COMPLETED)
+            for ItemFuture in Done:
+                Results[InFlight.pop(ItemFuture)] = ItemFuture.result()
+
+    return [Result for Result in Results if Result is not None]
+
+
+@_Compressed
+@_Idempotent("candidates/bulk")
+def CreateCandidatesBulk(Event, Context):
+    """
+    POST /candidates/bulk?concurrency=N
+
+    Request Body: JSON Array (Or NDJSON) Of POST /candidates Bodies.
+
+    Answers Within GATEWAY_BUDGET_MS; Items Not Started By Then Come Back
+    "skipped", To Be Resent. Returns 201 When Every Item Succeeded, Otherwise
+    207 With A Per-Item Report:
+        {
+          "summary": {"total": 0, "created": 0, "failed": 0},
+          "results": [
+            {"index": 0, "status": "created|invalid|failed|application_failed|skipped",
+             "candidate": {...}, "application": {...}, "error": "string"}
+          ]
+        }
+    """
+    Deadline = time.monotonic() + GATEWAY_BUDGET_MS / 1000
+    try:
+        try:
+            Items = _ParseBulkBody(Event)
+            Concurrency = _BulkConcurrency(Event)
+        except ValueError as Ex:
+            return _Response(400, {"error": "ValidationError", "message": str(Ex)})
+
+        MaxItems = _ReadLimits()["BulkMaxItems"]
+        if not Items or len(Items) > MaxItems:
+            return _Response(
+                400,
+                {
+                    "error": "ValidationError",
+                    "message": f"Body Must Contain Between 1 And {MaxItems} Candidates",
+                },
+            )
+
+        Client = GetAtsClient()
+        Results = ImportCandidates(Client, Items, Concurrency, Context, IdempotencyKey=_IdempotencyKey(Event), Deadline=Deadline)
+        _InvalidateCache("candidates", "applications")
+
+        Created = sum(1 for Result in Results if Result["status"] == "created")
+        Summary = {"total": len(Results), "created": Created, "failed": len(Results) - Created}
+        return _Response(201 if Created == len(Results) else 207, {"summary": Summary, "results": Results})
+
+    except Exception as Ex:
+        Logging.exception("CreateCandidatesBulk Failed")
+        return _FailureResponse("BulkCandidateCreateFailed", Ex)
+
+
+@_Compressed
+def GetCandidates(Event, Context):
+    """
+    GET /candidates
+    Returns Candidates In Unified Format:
+        {
+          "candidates": [
+            {
+              "id": "string",
+              "name": "string",
+              "email": "string",
+              "phone": "string"
+            }
+          ]
+        }
+
+    Supports all=true / cursor Streaming And The Query Params Of GET /jobs.
+    """
+    try:
+        QueryParams = Event.get("queryStringParameters") or {}
+        Federated = _FederatedRead("candidates", QueryParams, UnifyCandidates)
+        if Federated is not None:
+            return Federated
+
+        Client = GetAtsClient()
+        Query = _ParseQuery("candidates", QueryParams)
+        if Query is not None:
+            return _QueryRead(Client, "candidates", QueryParams, UnifyCandidates, Query)
+
+        if _WantsAll(QueryParams):
+            Start, Offset, PerPage = _StreamPosition("candidates", QueryParams)
+            Pages = _ListPages(Client, "candidates", {}, PerPage, Start)
+            return _StreamAll("candidates", Pages, UnifyCandidates, QueryParams, Offset, PerPage)
+
+        Served = _ReplicaRead("candidates", QueryParams, UnifyCandidates)
+        if Served is not None:
+            return Served
+        return _CachedRead(Client, "candidates", _PageParams(QueryParams), UnifyCandidates)
+
+    except (QueryError, FederationError) as Ex:
+        return _Response(400, {"error": "ValidationError", "message": str(Ex)})
+
+    except Exception as Ex:
+        Logging.exception("GetCandidates Failed")
+        return _FailureResponse("CandidatesFetchFailed", Ex)
+
+
+@_Compressed
+@_Idempotent("applications")
+def CreateApplication(Event, Context):
+    """
     POST /applications
 
     Request Body:
@@ -405,10 +2157,9 @@ def CreateApplication(Event, Context):
     Creates An Application Linking Candidate To Job.
     """
     try:
-        Client = AtsClient()
+        Client = GetAtsClient()
 
-        BodyRaw = Event.get("body") or "{}"
-        Payload = json.loads(BodyRaw)
+        Payload = _ReadJsonBody(Event)
 
         CandidateId = Payload.get("candidate_id")
         JobId = Payload.get("job_id")
@@ -422,14 +2173,12 @@ def CreateApplication(Event, Context):
                 },
             )
 
-        CreatedApplication = Client.CreateApplicationInAts(CandidateId=str(CandidateId), JobId=str(JobId))
+        CreatedApplication = Client.CreateApplicationInAts(
+            CandidateId=str(CandidateId), JobId=str(JobId), IdempotencyKey=_IdempotencyKey(Event, "application")
+        )
+        _InvalidateCache("applications")
 
-        UnifiedApplication = {
-            "id": str(CreatedApplication.get("id", "")),
-            "candidate_id": str(CandidateId),
-            "job_id": str(JobId),
-            "status": _NormalizeApplicationStatus(CreatedApplication.get("status")),
-        }
+        UnifiedApplication = UnifyCreatedApplication(CreatedApplication, str(CandidateId), str(JobId))
 
         return _Response(
             201,
@@ -440,15 +2189,10 @@ def CreateApplication(Event, Context):
 
     except Exception as Ex:
         Logging.exception("CreateApplication Failed")
-        return _Response(
-            500,
-            {
-                "error": "ApplicationCreateFailed",
-                "message": str(Ex),
-            },
-        )
+        return _FailureResponse("ApplicationCreateFailed", Ex)
 
 
+@_Compressed
 def GetApplications(Event, Context):
     """
     GET /applications?job_id=... (optional)
@@ -464,74 +2208,919 @@ def GetApplications(Event, Context):
             }
           ]
         }
+
+    Supports all=true / cursor Streaming And The Query Params Of GET /jobs.
+
+    With AtsReadModelEnabled, A Plain job_id Page Is Served From The
+    Webhook-Fed Read Model, Plus "status_counts" And "total" For The Job.
     """
     try:
-        Client = AtsClient()
-
         QueryParams = Event.get("queryStringParameters") or {}
-        JobId = QueryParams.get("job_id")
-        PageRaw = QueryParams.get("page")
-        PerPageRaw = QueryParams.get("per_page")
-
-        Page = int(PageRaw) if PageRaw is not None else None
-        PerPage = int(PerPageRaw) if PerPageRaw is not None else None
+        Federated = _FederatedRead("applications", QueryParams, UnifyApplications)
+        if Federated is not None:
+            return Federated
 
-        RawApplications = Client.GetApplicationsFromAts(JobId=JobId, Page=Page, PerPage=PerPage)
+        Client = GetAtsClient()
+        Query = _ParseQuery("applications", QueryParams)
+        if Query is not None:
+            return _QueryRead(Client, "applications", QueryParams, UnifyApplications, Query)
 
-        RawApplicationsList: List[Dict[str, Any]] = RawApplications.get(
-            "data",
-            RawApplications if isinstance(RawApplications, list) else [],
-        )
+        if _WantsAll(QueryParams):
+            Start, Offset, PerPage = _StreamPosition("applications", QueryParams)
+            Pages = _ListPages(Client, "applications", _PageParams(QueryParams, "job_id"), PerPage, Start)
+            return _StreamAll("applications", Pages, UnifyApplications, QueryParams, Offset, PerPage)
 
-        UnifiedApplications: List[Dict[str, Any]] = []
-        for Application in RawApplicationsList:
-            CandidateInfo = Application.get("candidate", {})
-            UnifiedApplications.append(
-                {
-                    "id": str(Application.get("id")),
-                    "candidate_name": CandidateInfo.get("name")
-                    or f"{CandidateInfo.get('first_name', '')} {CandidateInfo.get('last_name', '')}".strip(),
-                    "email": CandidateInfo.get("email")
-                    or (CandidateInfo.get("emails") or [{}])[0].get("value"),
-                    "status": _NormalizeApplicationStatus(Application.get("status")),
-                }
-            )
+        Served = _ReadModelRead(QueryParams, UnifyApplications) or _ReplicaRead("applications", QueryParams, UnifyApplications)
+        if Served is not None:
+            return Served
+        return _CachedRead(Client, "applications", _PageParams(QueryParams, "job_id"), UnifyApplications)
 
-        return _Response(200, {"applications": UnifiedApplications})
+    except (QueryError, FederationError) as Ex:
+        return _Response(400, {"error": "ValidationError", "message": str(Ex)})
 
     except Exception as Ex:
         Logging.exception("GetApplications Failed")
+        return _FailureResponse("ApplicationsFetchFailed", Ex)
+
+
+# -----------------------
+# Batch Reads (POST /batch)
+# -----------------------
+# Sub-Requests Run The GET Handlers' Own Bodies (Replica, Cache, Queries And
+# Streaming Included), Unwrapped So They Are Not Compressed Or Traced Twice
+_BATCH_READS: Dict[str, Callable[[Any, Any], Dict[str, Any]]] = {
+    "jobs": GetJobs.__wrapped__,
+    "candidates": GetCandidates.__wrapped__,
+    "applications": GetApplications.__wrapped__,
+}
+
+# include= Expansions Of A Jobs Listing: The Applications Read Each Job Needs
+BATCH_INCLUDES: Dict[str, Callable[[str], Dict[str, str]]] = {
+    # The Same First Page A Client Would Fetch, So It Shares Cache Entries And Dedup With Explicit Reads
+    "applications": lambda JobId: {"job_id": JobId},
+    # Every Application, Projected To ids (Counted Up To AtsStreamMaxItems)
+    "application_count": lambda JobId: {"job_id": JobId, "all": "true", "fields": "id"},
+}
+
+
+_BatchLock = threading.Lock()
+_BatchExecutor: Optional[Tuple[int, ThreadPoolExecutor]] = None
+
+
+def _GetBatchExecutor(Size: int) -> ThreadPoolExecutor:
+    """
+    The Batch Worker Pool, Kept For The Life Of The Container So Warm
+    Invocations Do Not Start Threads. Sub-Reads Prefetch On The Ats Client's
+    Own Pool, Never This One, So A Full Pool Cannot Deadlock.
+    """
+    global _BatchExecutor
+    Current = _BatchExecutor
+    if Current is not None and Current[0] == Size:
+        return Current[1]
+    with _BatchLock:
+        if _BatchExecutor is None or _BatchExecutor[0] != Size:
+            Previous = _BatchExecutor
+            _BatchExecutor = (Size, ContextExecutor(max_workers=Size, thread_name_prefix="Batch"))
+            if Previous is not None:
+                Previous[1].shutdown(wait=False)
+        return _BatchExecutor[1]
+
+
+class _BatchRequest:
+    def __init__(self, Id: str, Resource: str, Params: Dict[str, str], Include: List[str]) -> None:
+        self.Id = Id
+        self.Resource = Resource
+        self.Params = Params
+        self.Include = Include
+
+
+def _ParseBatchBody(Event: Any, MaxRequests: int) -> List[_BatchRequest]:
+    """
+    Validate {"requests": [{"id", "path", "params", "include"}, ...]}; Raises ValueError.
+    """
+    Body = _ReadJsonBody(Event)
+    Entries = Body.get("requests") if isinstance(Body, dict) else None
+    if not isinstance(Entries, list) or not 1 <= len(Entries) <= MaxRequests:
+        raise ValueError(f'Body Must Be {{"requests": [...]}} With Between 1 And {MaxRequests} Requests')
+
+    Requests: List[_BatchRequest] = []
+    for Index, Entry in enumerate(Entries):
+        if not isinstance(Entry, dict):
+            raise ValueError(f"Request {Index} Must Be An Object")
+        Resource = str(Entry.get("path") or "").strip("/")
+        if Resource not in _BATCH_READS:
+            raise ValueError(f"Request {Index}: Unknown path {Entry.get('path')!r}; Expected One Of /{', /'.join(_BATCH_READS)}")
+
+        RawParams = Entry.get("params") or {}
+        if not isinstance(RawParams, dict) or any(isinstance(Value, (dict, list)) for Value in RawParams.values()):
+            raise ValueError(f"Request {Index}: params Must Map Names To Single Values")
+        Params = {str(Name): str(Value).lower() if isinstance(Value, bool) else str(Value) for Name, Value in RawParams.items() if Value is not None}
+
+        Include = Entry.get("include") or []
+        if isinstance(Include, str):
+            Include = Include.split(",")
+        Include = [str(Name).strip() for Name in Include if str(Name).strip()]
+        Unknown = [Name for Name in Include if Name not in BATCH_INCLUDES]
+        if Include and (Resource != "jobs" or Unknown):
+            raise ValueError(f"Request {Index}: include Supports {', '.join(BATCH_INCLUDES)} On /jobs Only")
+
+        Id = str(Entry["id"]) if Entry.get("id") is not None else str(Index)
+        if any(Request.Id == Id for Request in Requests):
+            raise ValueError(f"Request {Index}: Duplicate id {Id!r}")
+        Requests.append(_BatchRequest(Id, Resource, Params, Include))
+    return Requests
+
+
+class _BatchReads:
+    """
+    The Reads Of One Batch On A Shared Pool. A Read Asked For Twice (Same
+    Resource And Params) Runs Once, And Every Asker Gets Its Response.
+    Only The Invoking Thread Submits, So No Lock Is Needed.
+    """
+
+    def __init__(self, Executor: ThreadPoolExecutor, Context: Any) -> None:
+        self.Executor = Executor
+        self.Context = Context
+        self.Pending: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], "Future[Dict[str, Any]]"] = {}
+        self.Asked = 0
+
+    def Read(self, Resource: str, Params: Dict[str, str]) -> "Future[Dict[str, Any]]":
+        self.Asked += 1
+        Key = (Resource, tuple(sorted(Params.items())))
+        Pending = self.Pending.get(Key)
+        if Pending is None:
+            Event = {"queryStringParameters": dict(Params)}
+            Pending = self.Pending[Key] = self.Executor.submit(_BATCH_READS[Resource], Event, self.Context)
+        return Pending
+
+
+def _SubResponse(Pending: "Future[Dict[str, Any]]") -> Tuple[int, Dict[str, str], str]:
+    """
+    (Status, Headers, JSON Body) Of A Finished Read.
+    """
+    try:
+        Response = Pending.result()
+    except Exception as Ex:
+        Logging.exception("Batch Read Failed")
+        Response = _FailureResponse("BatchReadFailed", Ex)
+    Headers = {Name: Value for Name, Value in (Response.get("headers") or {}).items() if Name != "Content-Type"}
+    return Response["statusCode"], Headers, Response["body"]
+
+
+class _JobExpansion:
+    """
+    The include= Reads For One Jobs Listing, Submitted As Soon As The Listing Is In.
+    """
+
+    def __init__(self, Reads: _BatchReads, Request: _BatchRequest, Listing: Dict[str, Any], MaxExpansions: int) -> None:
+        self.Listing = Listing
+        self.Include = Request.Include
+        Jobs = Listing.get("jobs") or []
+        if any(not isinstance(Job, dict) or Job.get("id") is None for Job in Jobs):
+            raise QueryError("include Needs id Among The Listing's fields")
+        if len(Jobs) * len(self.Include) > MaxExpansions:
+            raise QueryError(f"include Would Read {len(Jobs) * len(self.Include)} Listings (Max {MaxExpansions}); Lower per_page Or limit")
+        self.Pending = [(Job, Name, Reads.Read("applications", BATCH_INCLUDES[Name](str(Job["id"])))) for Job in Jobs for Name in self.Include]
+
+    def Finish(self) -> str:
+        """
+        Embed Each Job's Expansions And Return The Listing As JSON.
+        Expansions That Failed Leave The Field null And Are Listed Under "include_errors".
+        """
+        Errors: List[Dict[str, Any]] = []
+        for Job, Name, Pending in self.Pending:
+            Status, _, Body = _SubResponse(Pending)
+            if Status != 200:
+                Job[Name] = None
+                Errors.append({"job_id": Job["id"], "include": Name, "status": Status, "body": json.loads(Body)})
+                continue
+            Applications = json.loads(Body)
+            if Name == "application_count":
+                Job[Name] = len(Applications["applications"])
+                if Applications.get("next_cursor"):
+                    Job["application_count_truncated"] = True
+            else:
+                Job[Name] = Applications["applications"]
+        if Errors:
+            self.Listing["include_errors"] = Errors
+        return _Serialize(self.Listing)
+
+
+@_Compressed
+def Batch(Event, Context):
+    """
+    POST /batch
+
+    Several Unified Reads In One Invocation. Request Body:
+        {
+          "requests": [
+            {"id": "jobs", "path": "/jobs", "params": {"status": "OPEN"}, "include": ["application_count"]},
+            {"id": "candidates", "path": "/candidates", "params": {"page": 1}}
+          ]
+        }
+
+    path Is /jobs, /candidates Or /applications; params Are That Endpoint's
+    Query Params. include (On /jobs) Embeds Per-Job Reads Into Each Job:
+    "applications" (The First Page Of GET /applications?job_id=) And
+    "application_count" (Every Application, Counted).
+
+    Reads Run Concurrently (AtsBatchConcurrency), And A Read Asked For More
+    Than Once, Explicitly Or Through include, Runs Once. Returns 200 When
+    Every Sub-Response Is Below 400, Else 207:
+        {
+          "responses": [{"id": "jobs", "status": 200, "headers": {...}, "body": {...}}],
+          "summary": {"requests": 2, "reads": 12, "deduplicated": 0}
+        }
+    """
+    try:
+        Limits = _ReadLimits()
+        try:
+            Requests = _ParseBatchBody(Event, Limits["BatchMaxRequests"])
+        except ValueError as Ex:
+            return _Response(400, {"error": "ValidationError", "message": str(Ex)})
+
+        Reads = _BatchReads(_GetBatchExecutor(max(1, Limits["BatchConcurrency"])), Context)
+        Listings = [Reads.Read(Request.Resource, Request.Params) for Request in Requests]
+
+        # Expansions Wait Only On Their Own Listing; Other Reads Keep Running Meanwhile
+        Expansions: Dict[int, Union[_JobExpansion, Tuple[int, Dict[str, str], str]]] = {}
+        for Index, Request in enumerate(Requests):
+            if not Request.Include:
+                continue
+            Status, Headers, Body = _SubResponse(Listings[Index])
+            if Status != 200:
+                Expansions[Index] = (Status, Headers, Body)
+                continue
+            try:
+                Expansions[Index] = _JobExpansion(Reads, Request, json.loads(Body), Limits["BatchMaxExpansions"])
+            except QueryError as Ex:
+                Expansions[Index] = (400, {}, _Serialize({"error": "ValidationError", "message": str(Ex)}))
+
+        Parts: List[str] = []
+        Failed = False
+        for Index, Request in enumerate(Requests):
+            Expansion = Expansions.get(Index)
+            if isinstance(Expansion, _JobExpansion):
+                _, Headers, _ = _SubResponse(Listings[Index])
+                Status, Body = 200, Expansion.Finish()
+            else:
+                Status, Headers, Body = Expansion or _SubResponse(Listings[Index])
+            Failed = Failed or Status >= 400
+            # Sub-Bodies Are Already JSON (Cache Hits Verbatim), So They Are Spliced In, Not Re-Encoded
+            Parts.append(f'{{"id":{DumpJson(Request.Id)},"status":{Status},"headers":{DumpJson(Headers)},"body":{Body}}}')
+
+        Summary = {"requests": len(Requests), "reads": len(Reads.Pending), "deduplicated": Reads.Asked - len(Reads.Pending)}
+        return _RawResponse(207 if Failed else 200, f'{{"responses":[{",".join(Parts)}],"summary":{DumpJson(Summary)}}}')
+
+    except Exception as Ex:
+        Logging.exception("Batch Failed")
+        return _FailureResponse("BatchFailed", Ex)
+
+
+@_Compressed
+def Webhook(Event, Context):
+    """
+    POST /webhooks/{connector}
+
+    Change Events From An Upstream (connector Is "default" For AtsBaseUrl,
+    Or A Name From The Connector Registry), One Event Or A List Of Them:
+        {"id": "evt_...", "type": "application.updated", "data": {... Raw Upstream Record}}
+
+    The Body Must Carry A Valid X-Ats-Signature (See ats_webhooks), Made With
+    That Connector's AtsWebhookSecrets Entry Or AtsWebhookSecret; Anything
+    Else Is Answered 401. Each Event Id Is Applied Once (Redeliveries Report
+    "duplicate"), Application Events Update The Read Model, And Every New
+    Event Drops Cached Listings Of Its Resource. The Model Only Serves The
+    default Upstream, So A Registry Connector's Events Are Reported As
+    "ignored" And Only Drop Cached Listings:
+        {"events": [{"id": "evt_...", "type": "application.updated", "outcome": "applied"}]}
+    """
+    try:
+        Config = _ReadReadModelConfig()
+        if Config is None:
+            return _Response(404, {"error": "NotFound", "message": "Webhooks Need AtsReadModelEnabled"})
+        Name = str((Event.get("pathParameters") or {}).get("connector") or "")
+        Federation = GetFederation()
+        if Name != DEFAULT_CONNECTOR and (Federation is None or Name not in Federation.Registry.Connectors):
+            return _Response(404, {"error": "NotFound", "message": f"Unknown Connector {Name!r}"})
+
+        Secret = Config["Secrets"].get(Name) or Config["Secret"]
+        Body = ReadRequestBody(Event)
+        try:
+            if not Secret:
+                raise SignatureError(f"No Webhook Secret Configured For {Name}")
+            VerifySignature(Secret, Body, GetHeader(Event, SIGNATURE_HEADER), Config["Tolerance"])
+        except SignatureError as Ex:
+            return _Response(401, {"error": "InvalidSignature", "message": str(Ex)})
+
+        try:
+            Payload = json.loads(Body)
+        except ValueError:
+            return _Response(400, {"error": "ValidationError", "message": "Body Must Be JSON"})
+        Events = Payload if isinstance(Payload, list) else [Payload]
+        if not Events or any(not isinstance(Item, dict) or not Item.get("id") or not Item.get("type") for Item in Events):
+            return _Response(400, {"error": "ValidationError", "message": "Each Event Needs An id And A type"})
+
+        Model = GetReadModel() if Name == DEFAULT_CONNECTOR else None
+        StatusOf = _StatusOf(Name)
+        Results: List[Dict[str, Any]] = []
+        Stale: List[str] = []
+        with Span("webhook"):
+            for Item in Events:
+                Type = str(Item["type"])
+                Outcome = Model.Apply(Name, str(Item["id"]), Type, Item.get("data"), StatusOf) if Model is not None else IGNORED
+                Results.append({"id": Item["id"], "type": Type, "outcome": Outcome})
+                Resource = _EVENT_RESOURCES.get(Type.split(".", 1)[0])
+                if Outcome != DUPLICATE and Resource is not None and Resource not in Stale:
+                    Stale.append(Resource)
+        if Stale:
+            _InvalidateCache(*Stale)
+        return _Response(200, {"events": Results})
+
+    except Exception as Ex:
+        Logging.exception("Webhook Failed")
+        return _FailureResponse("WebhookFailed", Ex)
+
+
+@_Compressed
+def CacheStats(Event, Context):
+    """
+    GET /cache/stats
+    Returns Response Cache Counters For This Container, Plus The Idempotency
+    Store's (Replays, Waits, Candidate Index Hits, ...):
+        {
+          "enabled": true,
+          "stats": {"hits": 0, "misses": 0, "revalidations": 0, "evictions": 0, ...},
+          "idempotency": {"claims": 0, "replays": 0, "index_hits": 0, ...}
+        }
+    """
+    Cache = GetResponseCache()
+    Store = GetIdempotencyStore()
+    return _Response(
+        200,
+        {
+            "enabled": Cache is not None,
+            "stats": Cache.Snapshot() if Cache else {},
+            "idempotency": Store.Snapshot() if Store else {},
+        },
+    )
+
+
+@_Compressed
+def UpstreamStats(Event, Context):
+    """
+    GET /upstream/stats
+    Returns Upstream Quota Use And Client Counters For This Container:
+        {
+          "quota": {"api_requests": 0, "upstream_calls": 0, "upstream_calls_per_1k_requests": null, ...},
+          "rate_limits": {"backend": "MemoryBucketStore", "limits": {...}, "throttled": 0, ...},
+          "coalesced": 0,
+          "resilience": {"retries": 0, "hedges": 0, ..., "breakers": {...}},
+          "replica": {"jobs": {"mode": "updated_since", "records": 0, "watermark": "...", "age_seconds": 0.0}, ...},
+          "read_model": {"events": 0, "applications": 0, "primed_jobs": 0, "stats": {"applied": 0, "duplicates": 0, ...}},
+          "connectors": {"acme": {"rate_limits": {...}, "resilience": {...}}, ...}
+        }
+    """
+    try:
+        Client = GetAtsClient()
+        Store = GetReplica()
+        Model = GetReadModel()
+        Federation = GetFederation()
         return _Response(
-            500,
+            200,
             {
-                "error": "ApplicationsFetchFailed",
-                "message": str(Ex),
+                "quota": QUOTA_METER.Snapshot(),
+                "rate_limits": Client.Limiter.Snapshot(),
+                "coalesced": Client.Flights.Coalesced if Client.Flights is not None else 0,
+                "resilience": Client.Resilience.Snapshot(),
+                "replica": Store.Snapshot() if Store is not None else None,
+                "read_model": Model.Snapshot() if Model is not None else None,
+                "connectors": {
+                    Name: {"rate_limits": Connected.Limiter.Snapshot(), "resilience": Connected.Resilience.Snapshot()}
+                    for Name, Connected in Federation.Clients.items()
+                }
+                if Federation is not None
+                else None,
             },
         )
+    except Exception as Ex:
+        Logging.exception("UpstreamStats Failed")
+        return _FailureResponse("UpstreamStatsFailed", Ex)
+
+
+def SyncReplica(Event, Context):
+    """
+    Scheduled Sync Of The Local Replica (Not Behind API Gateway).
+
+    Syncs Every Resource, Or Just Event["resources"] When Given, And Returns
+    What Each Sync Did. Point AtsReplicaPath At Storage Shared With The API
+    Functions (E.g. An EFS Mount) So Their Reads Find The Replica Fresh.
+    """
+    Config = _ReadReplicaConfig()
+    if Config is None:
+        return {"enabled": False, "results": []}
+
+    Client = GetAtsClient()
+    Store = GetReplica()
+    Resources = (Event or {}).get("resources") or REPLICA_RESOURCES
+    Results = []
+    for Resource in Resources:
+        try:
+            with Store.SyncLocks[Resource]:
+                Results.append(_SyncReplica(Client, Store, Resource, Config))
+        except Exception as Ex:
+            Logging.exception("SyncReplica Failed For %s", Resource)
+            Results.append({"resource": Resource, "error": str(Ex)})
+    return {"enabled": True, "results": Results}
+
+
+# -----------------------
+# Bulk Export
+# -----------------------
+# Milliseconds Left In The Invocation Below Which An Export Stops After Its Current Chunk
+EXPORT_STOP_MARGIN_MS = 30000
+
+_EXPORT_UNIFIERS: Dict[str, Callable[[List[Dict[str, Any]]], List[UnifiedRecord]]] = {
+    "jobs": UnifyJobs,
+    "candidates": UnifyCandidates,
+    "applications": UnifyApplications,
+}
+
+
+def ExportResource(Event, Context):
+    """
+    Stream Every Unified Record Of One Resource To A File Or store:// Prefix
+    (Not Behind API Gateway; ats_export.py's Command Line Runs It Too):
+        {"resource": "candidates", "format": "ndjson|csv|parquet", "target": "/mnt/exports/candidates.ndjson",
+         "chunk_rows": 10000, "per_page": 100, "restart": false}
+
+    Pages Come From The Upstream (By Keyset When AtsPushDown Lists cursor)
+    Through The Field Mappers, One At A Time. Returns The Export Summary
+    (rows, bytes, rows_per_second, ...). Inside Lambda It Stops After The
+    Chunk That Leaves Less Than EXPORT_STOP_MARGIN_MS, With status
+    "partial"; Invoking It Again With The Same Event Resumes From The Checkpoint,
+    And Invoking It After A Complete Run Exports Everything Afresh.
+    """
+    Event = Event or {}
+    Resource = Event.get("resource")
+    if Resource not in _EXPORT_UNIFIERS or not Event.get("target"):
+        return {"status": "error", "error": f"resource ({', '.join(_EXPORT_UNIFIERS)}) And target Are Required"}
+    try:
+        Client = GetAtsClient()
+        PerPage = int(Event.get("per_page") or DEFAULT_STREAM_PAGE_SIZE)
+
+        def Pages(Start: Optional[Union[int, str]]) -> Iterator[Tuple[Any, List[Dict[str, Any]]]]:
+            return _ListPages(Client, Resource, {}, PerPage, Start)
+
+        def ShouldStop() -> bool:
+            Remaining = _RemainingMillis(Context)
+            return Remaining is not None and Remaining < EXPORT_STOP_MARGIN_MS
+
+        def Progress(Report: Dict[str, Any]) -> None:
+            Logging.info(f"Export {Resource}: {Report['rows']} Rows, {Report['rows_per_second']} Rows/s")
+
+        with Span("export"):
+            return Export(
+                Pages,
+                _EXPORT_UNIFIERS[Resource],
+                GetFieldMappers()[_RECORD_KINDS[Resource]].Fields,
+                Resource,
+                str(Event.get("format") or "ndjson"),
+                str(Event["target"]),
+                ChunkRows=int(Event.get("chunk_rows") or DEFAULT_CHUNK_ROWS),
+                PerPage=PerPage,
+                Restart=_IsTruthy(str(Event.get("restart"))),
+                ShouldStop=ShouldStop,
+                Progress=Progress,
+            )
+    except ExportError as Ex:
+        return {"status": "error", "error": str(Ex)}
+    except Exception as Ex:
+        Logging.exception("ExportResource Failed")
+        return {"status": "error", "error": str(Ex)}
+
+
+# -----------------------
+# Async Handler Path
+# -----------------------
+# One Event Loop Per Container: The Async Client's Pooled Session Is Bound
+# To It, So Keeping The Loop Alive Keeps Connections Warm Across Invocations.
+# asyncio And ats_async Are Imported Here On First Use, So Sync Functions
+# Never Pay For Them At Cold Start
+_AsyncLoop: Optional["asyncio.AbstractEventLoop"] = None
+_SharedAsyncClient: Optional["AsyncAtsClient"] = None
+
+_ASYNC_PAGE_ITERATORS = {
+    "jobs": "IterJobsFromAts",
+    "candidates": "IterCandidatesFromAts",
+    "applications": "IterApplicationsFromAts",
+}
+
+
+async def GetAsyncAtsClient() -> "AsyncAtsClient":
+    """
+    Async Counterpart Of GetAtsClient. Must Run On The Container Event Loop.
+    """
+    from ats_async import AsyncAtsClient
+
+    global _SharedAsyncClient
+    Config = _ReadAtsConfig()
+    if _SharedAsyncClient is None or _SharedAsyncClient.Config != Config:
+        Previous = _SharedAsyncClient
+        _SharedAsyncClient = AsyncAtsClient(Config)
+        if Previous is not None:
+            await Previous.Close()
+    return _SharedAsyncClient
+
+
+def _RunAsync(Coroutine: Any) -> Any:
+    import asyncio
+
+    global _AsyncLoop
+    if _AsyncLoop is None or _AsyncLoop.is_closed():
+        _AsyncLoop = asyncio.new_event_loop()
+    return _AsyncLoop.run_until_complete(Coroutine)
+
+
+def _AsyncHandler(Func: Callable[..., Any]) -> Callable[[Any, Any], Dict[str, Any]]:
+    """
+    Expose An async def Handler As A Regular Lambda Entry Point.
+    """
+
+    @functools.wraps(Func)
+    def Wrapper(Event, Context):
+        return _RunAsync(Func(Event, Context))
+
+    return Wrapper
+
+
+async def _AsyncRead(
+    Event: Dict[str, Any],
+    Resource: str,
+    UnifyPage: Callable[[List[Dict[str, Any]]], List[UnifiedRecord]],
+    *Extra: str,
+) -> Dict[str, Any]:
+    """
+    Shared Body Of The Async GET Handlers: Same Federation, Replica, Cache, Streaming And Output As The Sync Path.
+    """
+    import asyncio
+
+    QueryParams = Event.get("queryStringParameters") or {}
+    if QueryParams.get("connectors") or _ReadFederationConfig() is not None:
+        # Federated Fan-Out Runs On The Per-Connector Sync Clients, Off The Loop
+        Federated = await asyncio.get_running_loop().run_in_executor(None, Bind(_FederatedRead), Resource, QueryParams, UnifyPage)
+        if Federated is not None:
+            return Federated
+
+    Client = await GetAsyncAtsClient()
+    Query = _ParseQuery(Resource, QueryParams)
+    if Query is not None:
+        # Queries Scan And Filter On The Sync Client, Off The Loop
+        return await asyncio.get_running_loop().run_in_executor(
+            None, Bind(lambda: _QueryRead(GetAtsClient(), Resource, QueryParams, UnifyPage, Query))
+        )
+
+    if _WantsAll(QueryParams):
+        Start, Offset, PerPage = _StreamPosition(Resource, QueryParams)
+        if _UpstreamKeyset(Resource, Start):
+            Pages = Client.IterCursorPagesFromAts(Resource, _PageParams(QueryParams, *Extra), PerPage=PerPage, StartCursor=Start or "")
+        else:
+            Filters = {"JobId": QueryParams.get("job_id")} if "job_id" in Extra else {}
+            Pages = getattr(Client, _ASYNC_PAGE_ITERATORS[Resource])(PerPage=PerPage, StartPage=Start or 1, **Filters)
+        Writer = _StreamWriter(Resource, UnifyPage, QueryParams, Offset, PerPage)
+        try:
+            async for Page, Records in Pages:
+                if not Writer.Add(Page, Records):
+                    break
+        finally:
+            await Pages.aclose()
+        return Writer.Response()
+
+    if Resource == "applications" and _ReadReadModelConfig() is not None:
+        # Read Model Reads (And Any Prime They Trigger) Run On The Sync Client, Off The Loop
+        Served = await asyncio.get_running_loop().run_in_executor(None, Bind(_ReadModelRead), QueryParams, UnifyPage)
+        if Served is not None:
+            return Served
+
+    if _ReadReplicaConfig() is not None:
+        # Replica Reads (And Any Sync They Trigger) Run On The Sync Client, Off The Loop
+        Served = await asyncio.get_running_loop().run_in_executor(None, Bind(_ReplicaRead), Resource, QueryParams, UnifyPage)
+        if Served is not None:
+            return Served
+
+    Params = _PageParams(QueryParams, *Extra)
+    Probe = _CacheProbe(Client.AtsBaseUrl, Resource, Params)
+    if Probe.Hit is not None:
+        return Probe.Hit
+
+    Raw, ETag = await Client.GetConditional(Resource, Params, IfNoneMatch=Probe.ETag)
+    return Probe.Fill(Raw, ETag, UnifyPage)
+
+
+async def _ResolveCandidateAsync(Client: "AsyncAtsClient", Item: Dict[str, Any], IdempotencyKey: Optional[str]) -> Tuple[str, bool]:
+    """
+    Async Counterpart Of _ResolveCandidate.
+    """
+    Index = _CandidateIndex()
+    CandidateId = Index.LookupCandidate(Item["email"]) if Index is not None else None
+    if CandidateId is not None:
+        return CandidateId, True
+
+    AtsCandidatePayload = BuildAtsCandidatePayload(Item["name"], Item["email"], Item.get("phone"), Item.get("resume_url"))
+    CreatedCandidate = await Client.CreateCandidateInAts(AtsCandidatePayload, IdempotencyKey=_ScopedKey(IdempotencyKey, "candidate"))
+    CandidateId = str(CreatedCandidate.get("id") or CreatedCandidate.get("candidate_id"))
+    if Index is not None:
+        Index.RememberCandidate(Item["email"], CandidateId)
+    return CandidateId, False
+
+
+async def _ApplyToJobAsync(
+    Client: "AsyncAtsClient",
+    Item: Dict[str, Any],
+    CandidateId: str,
+    Reused: bool,
+    IdempotencyKey: Optional[str],
+) -> Tuple[str, bool, Dict[str, Any]]:
+    """
+    Async Counterpart Of _ApplyToJob.
+    """
+    JobId = str(Item["job_id"])
+    try:
+        Created = await Client.CreateApplicationInAts(CandidateId=CandidateId, JobId=JobId, IdempotencyKey=_ScopedKey(IdempotencyKey, "application"))
+        return CandidateId, Reused, Created
+    except UpstreamError as Ex:
+        Index = _CandidateIndex()
+        if not Reused or Index is None or Ex.StatusCode not in STALE_CANDIDATE_STATUSES:
+            raise
+        Index.ForgetCandidate(Item["email"])
+
+    CandidateId, Reused = await _ResolveCandidateAsync(Client, Item, IdempotencyKey)
+    Created = await Client.CreateApplicationInAts(CandidateId=CandidateId, JobId=JobId, IdempotencyKey=_ScopedKey(IdempotencyKey, "application"))
+    return CandidateId, Reused, Created
+
+
+async def _ImportCandidateAsync(Client: "AsyncAtsClient", Index: int, Item: Any, IdempotencyKey: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Async Counterpart Of _ImportCandidate, With The Same Result Shape.
+    """
+    Result: Dict[str, Any] = {"index": Index}
+    if not isinstance(Item, dict) or not Item.get("name") or not Item.get("email") or not Item.get("job_id"):
+        Result.update(status="invalid", error="Name, Email And job_id Are Required")
+        return Result
+
+    JobId = str(Item["job_id"])
+    try:
+        CandidateId, Reused = await _ResolveCandidateAsync(Client, Item, IdempotencyKey)
+    except Exception as Ex:
+        Result.update(status="failed", error=str(Ex))
+        return Result
+    Result["candidate"] = {"id": CandidateId, "name": Item["name"], "email": Item["email"], "phone": Item.get("phone")}
+
+    try:
+        CandidateId, Reused, CreatedApplication = await _ApplyToJobAsync(Client, Item, CandidateId, Reused, IdempotencyKey)
+    except Exception as Ex:
+        Result.update(status="application_failed", error=str(Ex))
+        return Result
+
+    Result["candidate"]["id"] = CandidateId
+    Result["candidate_reused"] = Reused
+    Result["application"] = UnifyCreatedApplication(CreatedApplication, CandidateId, JobId)
+    Result["status"] = "created"
+    return Result
+
+
+@_Compressed
+@_AsyncHandler
+async def GetJobsAsync(Event, Context):
+    """
+    GET /jobs On The Async Path. Same Contract As GetJobs; With all=true
+    Prefetched Pages Are Concurrent Tasks On One Event Loop.
+    """
+    try:
+        return await _AsyncRead(Event, "jobs", UnifyJobs)
+    except (QueryError, FederationError) as Ex:
+        return _Response(400, {"error": "ValidationError", "message": str(Ex)})
+    except Exception as Ex:
+        Logging.exception("GetJobsAsync Failed")
+        return _FailureResponse("JobsFetchFailed", Ex)
+
+
+@_Compressed
+@_AsyncHandler
+async def GetCandidatesAsync(Event, Context):
+    """
+    GET /candidates On The Async Path. Same Contract As GetCandidates.
+    """
+    try:
+        return await _AsyncRead(Event, "candidates", UnifyCandidates)
+    except (QueryError, FederationError) as Ex:
+        return _Response(400, {"error": "ValidationError", "message": str(Ex)})
+    except Exception as Ex:
+        Logging.exception("GetCandidatesAsync Failed")
+        return _FailureResponse("CandidatesFetchFailed", Ex)
+
+
+@_Compressed
+@_AsyncHandler
+async def GetApplicationsAsync(Event, Context):
+    """
+    GET /applications On The Async Path. Same Contract As GetApplications.
+    """
+    try:
+        return await _AsyncRead(Event, "applications", UnifyApplications, "job_id")
+    except (QueryError, FederationError) as Ex:
+        return _Response(400, {"error": "ValidationError", "message": str(Ex)})
+    except Exception as Ex:
+        Logging.exception("GetApplicationsAsync Failed")
+        return _FailureResponse("ApplicationsFetchFailed", Ex)
+
+
+@_Compressed
+@_Idempotent("candidates")
+@_AsyncHandler
+async def CreateCandidateAsync(Event, Context):
+    """
+    POST /candidates On The Async Path. Same Contract As CreateCandidate.
+    """
+    try:
+        Client = await GetAsyncAtsClient()
+        Result = await _ImportCandidateAsync(Client, 0, _ReadJsonBody(Event), _IdempotencyKey(Event))
+        if Result["status"] == "invalid":
+            return _Response(400, {"error": "ValidationError", "message": Result["error"]})
+        if "candidate" in Result and not Result.get("candidate_reused"):
+            _InvalidateCache("candidates")
+        if Result["status"] != "created":
+            raise RuntimeError(Result["error"])
+
+        _InvalidateCache("applications")
+        return _Response(201, {"candidate": Result["candidate"], "application": Result["application"], "candidate_reused": Result["candidate_reused"]})
+
+    except Exception as Ex:
+        Logging.exception("CreateCandidateAsync Failed")
+        return _FailureResponse("CandidateCreateFailed", Ex)
+
+
+@_Compressed
+@_Idempotent("applications")
+@_AsyncHandler
+async def CreateApplicationAsync(Event, Context):
+    """
+    POST /applications On The Async Path. Same Contract As CreateApplication.
+    """
+    try:
+        Client = await GetAsyncAtsClient()
+        Payload = _ReadJsonBody(Event)
+        CandidateId = Payload.get("candidate_id")
+        JobId = Payload.get("job_id")
+
+        if not CandidateId or not JobId:
+            return _Response(400, {"error": "ValidationError", "message": "candidate_id And job_id Are Required"})
+
+        CreatedApplication = await Client.CreateApplicationInAts(
+            CandidateId=str(CandidateId), JobId=str(JobId), IdempotencyKey=_IdempotencyKey(Event, "application")
+        )
+        _InvalidateCache("applications")
+        return _Response(201, {"application": UnifyCreatedApplication(CreatedApplication, str(CandidateId), str(JobId))})
+
+    except Exception as Ex:
+        Logging.exception("CreateApplicationAsync Failed")
+        return _FailureResponse("ApplicationCreateFailed", Ex)
+
+
+@_Compressed
+@_Idempotent("candidates/bulk")
+@_AsyncHandler
+async def CreateCandidatesBulkAsync(Event, Context):
+    """
+    POST /candidates/bulk On The Async Path. Same Contract As CreateCandidatesBulk,
+    With A Semaphore-Bounded Set Of Tasks Instead Of A Thread Pool.
+    """
+    import asyncio
+
+    Deadline = time.monotonic() + GATEWAY_BUDGET_MS / 1000
+    try:
+        try:
+            Items = _ParseBulkBody(Event)
+            Concurrency = _BulkConcurrency(Event)
+        except ValueError as Ex:
+            return _Response(400, {"error": "ValidationError", "message": str(Ex)})
+
+        MaxItems = _ReadLimits()["BulkMaxItems"]
+        if not Items or len(Items) > MaxItems:
+            return _Response(400, {"error": "ValidationError", "message": f"Body Must Contain Between 1 And {MaxItems} Candidates"})
+
+        Client = await GetAsyncAtsClient()
+        Slots = asyncio.Semaphore(Concurrency)
+        BulkKey = _IdempotencyKey(Event)
+
+        async def RunOne(Index: int, Item: Any) -> Dict[str, Any]:
+            async with Slots:
+                Remaining = _BudgetMillis(Context, Deadline)
+                if Remaining is not None and Remaining < 3000:
+                    return {"index": Index, "status": "skipped", "error": "Time Budget Exhausted"}
+                return await _ImportCandidateAsync(Client, Index, Item, _ScopedKey(BulkKey, str(Index)))
+
+        Results = await asyncio.gather(*(RunOne(Index, Item) for Index, Item in enumerate(Items)))
+        _InvalidateCache("candidates", "applications")
+
+        Created = sum(1 for Result in Results if Result["status"] == "created")
+        Summary = {"total": len(Results), "created": Created, "failed": len(Results) - Created}
+        return _Response(201 if Created == len(Results) else 207, {"summary": Summary, "results": list(Results)})
+
+    except Exception as Ex:
+        Logging.exception("CreateCandidatesBulkAsync Failed")
+        return _FailureResponse("BulkCandidateCreateFailed", Ex)
 
 
 # -----------------------
-# Normalization Helpers
+# Init Phase (Cold Start)
 # -----------------------
-def _NormalizeJobStatus(Status: Optional[str]) -> str:
-    if not Status:
-        return "OPEN"
-    StatusLower = str(Status).lower()
-    if "draft" in StatusLower:
-        return "DRAFT"
-    if "close" in StatusLower or "archive" in StatusLower:
-        return "CLOSED"
-    return "OPEN"
+# Lambda Imports This Module Once Per Container, Before The First Request
+# And At Full CPU. Warm() Moves The First Request's One-Time Setup There:
+# Settings Are Parsed And Validated, And The Objects The Deployed Handler
+# (_HANDLER, E.g. "handler.GetJobs") Needs Are Built. No Connection Is
+# Opened, So Init Never Waits On The Upstream And A Snapshot Holds No Sockets.
+_LOCAL_HANDLERS = frozenset({"Hello", "CacheStats", "UpstreamStats"})
 
+try:
+    from snapshot_restore_py import register_after_restore
+except ImportError:  # pragma: no cover - Only Present On SnapStart Runtimes
+    register_after_restore = None
 
-def _NormalizeApplicationStatus(Status: Optional[str]) -> str:
-    if not Status:
-        return "APPLIED"
-    StatusLower = str(Status).lower()
-    if "screen" in StatusLower or "review" in StatusLower:
-        return "SCREENING"
-    if "reject" in StatusLower or "fail" in StatusLower:
-        return "REJECTED"
-    if "hire" in StatusLower or "offer_accepted" in StatusLower:
-        return "HIRED"
-    return "APPLIED"
\ No newline at end of file
+
+async def _WarmAsyncClient() -> None:
+    await GetAsyncAtsClient()
+    # AsyncAtsClient Imports aiohttp On Its First Call
+    importlib.import_module("aiohttp")
+
+
+def Warm(Handler: Optional[str] = None) -> Dict[str, float]:
+    """
+    Prepare This Container For Handler (Default: The Function's _HANDLER)
+    And Return Milliseconds Spent Per Step. Raises ConfigError On A
+    Malformed Setting; A Missing AtsBaseUrl / AtsApiKey Is Only Logged,
+    As Every Request Reports It Anyway.
+    """
+    Name = (Handler or Env("_HANDLER") or "").rsplit(".", 1)[-1]
+    Steps: Dict[str, float] = {}
+
+    def Step(Label: str, Func: Callable[[], Any]) -> None:
+        Start = time.perf_counter()
+        Func()
+        Steps[Label] = round((time.perf_counter() - Start) * 1000, 3)
+
+    Step("config", Validate)
+    if Name in _LOCAL_HANDLERS:
+        return Steps
+    Step("mappings", lambda: (GetFieldMappers(), GetStatusNormalizers()))
+    Step("serializer", lambda: DumpJson({}))
+    Step("cache", GetResponseCache)
+    Step("replica", GetReplica)
+    Step("read_model", GetReadModel)
+    Step("idempotency", GetIdempotencyStore)
+    Step("federation", GetFederation)
+    try:
+        if Name.endswith("Async"):
+            Step("client", lambda: _RunAsync(_WarmAsyncClient()))
+        else:
+            Step("client", GetAtsClient)
+    except ConfigError:
+        raise
+    except (ImportError, ValueError) as Ex:
+        Logging.warning(f"Init Warm-Up Skipped The Ats Client: {Ex}")
+    return Steps
+
+
+def _AfterRestore() -> None:
+    """
+    Every Container Restored From One Snapshot Starts With The Same Random
+    State And Pooled Sockets That No Longer Exist: Reseed And Drop The Pools.
+    """
+    global _SharedAsyncClient, _AsyncLoop
+    random.seed()
+    Federation = _SharedFederation
+    Clients = [_SharedClient] + (list(Federation[1].Clients.values()) if Federation is not None else [])
+    for Client in Clients:
+        if Client is not None:
+            Client.Resilience.Policy.Random.seed()
+            Client.Session.close()
+
+    # The aiohttp Session Is Bound To The Loop: Drop Both, The Next Async Invocation Builds Fresh Ones
+    AsyncClient, Loop = _SharedAsyncClient, _AsyncLoop
+    _SharedAsyncClient, _AsyncLoop = None, None
+    if Loop is not None and not Loop.is_closed():
+        try:
+            if AsyncClient is not None:
+                Loop.run_until_complete(AsyncClient.Close())
+        except Exception as Ex:
+            Logging.warning(f"Closing The Restored Async Client Failed: {Ex}")
+        finally:
+            Loop.close()
+    MarkColdStart()
+
+
+if register_after_restore is not None:
+    register_after_restore(_AfterRestore)
+
+if InLambda() and _IsTruthy(Env("AtsWarmInit", "true")):
+    Logging.info(f"Init Warm-Up (Config {'Frozen' if Frozen() else 'Live'}): {Warm()}")
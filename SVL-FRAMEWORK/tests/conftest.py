@@ -0,0 +1,17 @@
+"""
+Puts SVL-FRAMEWORK On sys.path So Tests Import Its Modules The Way handler.py Does.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def DefaultProfiles(monkeypatch):
+    # Status And Field Profiles Come From The Bundled JSON Files
+    for Name in ("AtsStatusProfile", "AtsStatusProfilesPath", "AtsFieldProfile", "AtsFieldMappingsPath"):
+        monkeypatch.delenv(Name, raising=False)
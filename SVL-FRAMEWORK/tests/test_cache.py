@@ -0,0 +1,30 @@
+import pytest
+
+from ats_cache import CacheTier, ResponseCache
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def Cache(request, tmp_path):
+    SharedPath = str(tmp_path / "cache.sqlite") if request.param == "sqlite" else None
+    return ResponseCache({"jobs": 60}, SharedPath=SharedPath)
+
+
+def test_cache_tier_is_abstract():
+    with pytest.raises(TypeError):
+        CacheTier()
+
+
+def test_store_then_hit(Cache):
+    Entry, Fresh, Generation = Cache.Lookup("jobs", "k")
+    assert Entry is None and not Fresh
+    assert Cache.Store("jobs", "k", "body", '"v1"', Generation) is not None
+    Entry, Fresh, _ = Cache.Lookup("jobs", "k")
+    assert Fresh and Entry.Body == "body"
+
+
+def test_store_racing_an_invalidation_is_dropped(Cache):
+    _, _, Generation = Cache.Lookup("jobs", "k")
+    Cache.Invalidate(["jobs"])
+    assert Cache.Store("jobs", "k", "stale", None, Generation) is None
+    assert Cache.Lookup("jobs", "k")[0] is None
+    assert Cache.Stats.Snapshot()["discarded"] == 1
@@ -0,0 +1,47 @@
+import pytest
+
+import handler
+from ats_query import QueryError
+
+
+@pytest.fixture(autouse=True)
+def CursorSecret(monkeypatch):
+    monkeypatch.setenv("AtsCursorSecret", "test-secret")
+
+
+def test_cursor_round_trip():
+    State = {"p": 3, "o": 7, "s": {"r": "jobs", "f": "abc"}}
+    Cursor = handler._EncodeCursor(State)
+    assert "=" not in Cursor
+    assert handler._DecodeCursor(Cursor) == State
+
+
+@pytest.mark.parametrize("Tamper", [lambda C: "x" + C, lambda C: C[:-1], lambda C: C.split(".")[0], lambda C: ""])
+def test_tampered_cursor_is_rejected(Tamper):
+    Cursor = handler._EncodeCursor({"p": 1})
+    with pytest.raises(QueryError, match="Invalid Cursor"):
+        handler._DecodeCursor(Tamper(Cursor))
+
+
+def test_cursor_signed_with_another_secret_is_rejected(monkeypatch):
+    Cursor = handler._EncodeCursor({"p": 1})
+    monkeypatch.setenv("AtsCursorSecret", "rotated")
+    with pytest.raises(QueryError):
+        handler._DecodeCursor(Cursor)
+
+
+def test_cursor_secret_falls_back_to_api_key(monkeypatch):
+    monkeypatch.delenv("AtsCursorSecret")
+    monkeypatch.setenv("AtsApiKey", "key-1")
+    Cursor = handler._EncodeCursor({"p": 2})
+    assert handler._DecodeCursor(Cursor) == {"p": 2}
+    monkeypatch.setenv("AtsApiKey", "key-2")
+    with pytest.raises(QueryError):
+        handler._DecodeCursor(Cursor)
+
+
+def test_cursor_scope_tracks_listing_shape():
+    Scope = handler._CursorScope("jobs", {"status": "OPEN", "page": "2"})
+    assert Scope == handler._CursorScope("jobs", {"status": "OPEN", "per_page": "50"})
+    assert Scope != handler._CursorScope("jobs", {"status": "DRAFT"})
+    assert Scope != handler._CursorScope("candidates", {"status": "OPEN"})
@@ -0,0 +1,138 @@
+import itertools
+from typing import Optional
+
+import pytest
+
+from ats_normalize import LoadFieldMappings, LoadStatusProfile, FieldMapper
+
+
+# The Hand-Written Mappings The Profiles Replaced, Kept As The Reference
+def OldJobStatus(Status: Optional[str]) -> str:
+    if not Status:
+        return "OPEN"
+    StatusLower = str(Status).lower()
+    if "draft" in StatusLower:
+        return "DRAFT"
+    if "close" in StatusLower or "archive" in StatusLower:
+        return "CLOSED"
+    return "OPEN"
+
+
+def OldApplicationStatus(Status: Optional[str]) -> str:
+    if not Status:
+        return "APPLIED"
+    StatusLower = str(Status).lower()
+    if "screen" in StatusLower or "review" in StatusLower:
+        return "SCREENING"
+    if "reject" in StatusLower or "fail" in StatusLower:
+        return "REJECTED"
+    if "hire" in StatusLower or "offer_accepted" in StatusLower:
+        return "HIRED"
+    return "APPLIED"
+
+
+def OldJob(Job):
+    return {
+        "id": str(Job.get("id")),
+        "title": Job.get("title") or Job.get("job_title"),
+        "location": Job.get("location") or Job.get("city") or Job.get("country"),
+        "status": OldJobStatus(Job.get("status")),
+        "external_url": Job.get("url") or Job.get("apply_url") or Job.get("careers_url"),
+    }
+
+
+def OldCandidate(Candidate):
+    return {
+        "id": str(Candidate.get("id")),
+        "name": Candidate.get("name") or f"{Candidate.get('first_name', '')} {Candidate.get('last_name', '')}".strip(),
+        "email": Candidate.get("email") or (Candidate.get("emails") or [{}])[0].get("value"),
+        "phone": (Candidate.get("phones") or [{}])[0].get("value"),
+    }
+
+
+def OldApplication(Application):
+    CandidateInfo = Application.get("candidate", {})
+    return {
+        "id": str(Application.get("id")),
+        "candidate_name": CandidateInfo.get("name") or f"{CandidateInfo.get('first_name', '')} {CandidateInfo.get('last_name', '')}".strip(),
+        "email": CandidateInfo.get("email") or (CandidateInfo.get("emails") or [{}])[0].get("value"),
+        "status": OldApplicationStatus(Application.get("status")),
+    }
+
+
+FRAGMENTS = ["", "open", "Draft", "CLOSED", "archived", "screen", "In_Review", "reject", "failed", "hired", "offer_accepted", "new", "x"]
+STATUSES = [None, 0, 7, True] + ["".join(Parts) for Parts in itertools.product(FRAGMENTS, repeat=2)] + ["Closed Draft", "re-view", "HIRE-ME"]
+
+
+@pytest.mark.parametrize("Resource,Old", [("job", OldJobStatus), ("application", OldApplicationStatus)])
+def test_status_normalizer_matches_old_if_chain(Resource, Old):
+    Normalizer = LoadStatusProfile("generic")[Resource]
+    for Status in STATUSES:
+        assert Normalizer.Normalize(Status) == Old(Status), Status
+    # Second Pass Is Served From The Memo
+    assert Normalizer.NormalizeMany(STATUSES) == [Old(Status) for Status in STATUSES]
+
+
+def test_status_normalizer_unhashable_and_raw_values():
+    Normalizer = LoadStatusProfile("generic")["application"]
+    assert Normalizer.NormalizeMany([["hired"], "new"]) == ["HIRED", "APPLIED"]
+    assert Normalizer.RawValues("SCREENING") == ["in_review", "screening"]
+    assert Normalizer.Statuses == ("APPLIED", "HIRED", "REJECTED", "SCREENING")
+
+
+def test_unknown_status_profile():
+    with pytest.raises(ValueError):
+        LoadStatusProfile("missing")
+
+
+JOBS = [
+    {"id": 1, "title": "Engineer", "location": "Remote", "status": "published", "url": "https://x/1"},
+    {"id": "2", "job_title": "Designer", "city": "Pune", "status": "Archived", "apply_url": "https://x/2"},
+    {"id": 3, "country": "IN", "status": None, "careers_url": "https://x/3"},
+    {},
+]
+CANDIDATES = [
+    {"id": 1, "name": "Ada", "email": "ada@x", "phones": [{"value": "1"}]},
+    {"id": 2, "first_name": "Alan", "last_name": "Turing", "emails": [{"value": "alan@x"}], "phones": []},
+    {"id": 3, "first_name": "Grace", "emails": []},
+    {"id": 4},
+]
+APPLICATIONS = [
+    {"id": 1, "candidate": {"name": "Ada", "email": "ada@x"}, "status": "in_review"},
+    {"id": 2, "candidate": {"first_name": "Alan", "last_name": "Turing", "emails": [{"value": "alan@x"}]}, "status": "Offer_Accepted"},
+    {"id": 3, "candidate": {}, "status": "failed screening"},
+    {"id": 4},
+]
+
+
+@pytest.mark.parametrize(
+    "Resource,Records,Old",
+    [("job", JOBS, OldJob), ("candidate", CANDIDATES, OldCandidate), ("application", APPLICATIONS, OldApplication)],
+)
+def test_generic_field_mappings_match_old_mappings(Resource, Records, Old):
+    Mapper = LoadFieldMappings("generic")[Resource]
+    assert [Record.ToDict() for Record in Mapper.MapPage(Records)] == [Old(Record) for Record in Records]
+    assert Mapper.Map(Records[0]).ToDict() == Old(Records[0])
+
+
+def test_field_mapper_generated_record():
+    Mapper = FieldMapper("job_posting", {"id": {"from": "id", "as": "str"}, "city": {"from": ["address.city", "offices.1.name"]}})
+    Record = Mapper.Map({"id": 5, "offices": [{"name": "A"}, {"name": "B"}]})
+    assert type(Record).__name__ == "UnifiedJobPosting"
+    assert Record.FIELDS == ("id", "city")
+    assert (Record.id, Record.city) == ("5", "B")
+    assert Record == Mapper.Map({"id": "5", "address": {"city": "B"}})
+    with pytest.raises(AttributeError):
+        Record.extra = 1
+    assert "def MapPage(Records):" in Mapper.Source
+
+
+@pytest.mark.parametrize("Field", ["class", "None", "self", "ToDict", "__init__", "not-a-name", "1st"])
+def test_field_mapper_rejects_bad_field_names(Field):
+    with pytest.raises(ValueError, match="Invalid Field Name"):
+        FieldMapper("job", {Field: {"from": ["id"]}})
+
+
+def test_field_mapper_rejects_unknown_cast():
+    with pytest.raises(ValueError, match="Unsupported Cast"):
+        FieldMapper("job", {"id": {"from": ["id"], "as": "int"}})
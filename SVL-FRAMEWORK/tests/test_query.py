@@ -0,0 +1,99 @@
+import pytest
+
+from ats_normalize import LoadFieldMappings, LoadStatusProfile
+from ats_query import ListQuery, ParsePushDown, PlanPushDown, QueryError, SortKey
+
+JOB_FIELDS = ("id", "title", "location", "status", "external_url")
+JOB_STATUSES = ("CLOSED", "DRAFT", "OPEN")
+
+
+def Parse(**Params):
+    return ListQuery.Parse("jobs", Params, JOB_FIELDS, JOB_STATUSES)
+
+
+def Jobs(*Raw):
+    return LoadFieldMappings("generic")["job"].MapPage(list(Raw))
+
+
+def test_parse_without_query_params():
+    assert Parse() is None
+    assert Parse(page="2", per_page="10") is None
+
+
+def test_parse_all_params():
+    Query = Parse(status="open, draft", location=" Remote ", q="Senior  Python", sort="-title,id", fields="id,title")
+    assert Query.Status == frozenset(("OPEN", "DRAFT"))
+    assert Query.Location == "remote"
+    assert Query.Search == ("senior", "python")
+    assert Query.SearchFields == ("title", "location")
+    assert Query.Sort == (("title", True), ("id", False))
+    assert Query.Fields == ("id", "title")
+    assert Query.Filtering
+
+
+@pytest.mark.parametrize(
+    "Params,Message",
+    [
+        ({"status": "OPEN,LIVE"}, "Unknown jobs status: LIVE"),
+        ({"sort": "salary"}, "Unknown Sort Field"),
+        ({"fields": "id,salary"}, "Unknown Fields"),
+    ],
+)
+def test_parse_rejects_unknown_values(Params, Message):
+    with pytest.raises(QueryError, match=Message):
+        Parse(**Params)
+
+
+def test_parse_rejects_fields_the_resource_lacks():
+    with pytest.raises(QueryError, match="Cannot Be Filtered By status"):
+        ListQuery.Parse("candidates", {"status": "OPEN"}, ("id", "name", "email", "phone"))
+    with pytest.raises(QueryError, match="Cannot Be Searched"):
+        ListQuery.Parse("applications", {"q": "x"}, ("id", "status"))
+
+
+def test_matches_sorts_and_projects():
+    Records = Jobs(
+        {"id": 10, "title": "Senior Python Dev", "location": "Remote", "status": "open"},
+        {"id": 2, "title": "python intern", "location": "remote", "status": "draft"},
+        {"id": 3, "title": "Senior Python Lead", "location": "Pune", "status": "open"},
+        {"id": 4, "location": "Remote", "status": "closed"},
+    )
+    Query = Parse(status="OPEN,DRAFT", location="remote", q="python")
+    assert [Record.id for Record in Records if Query.Matches(Record)] == ["10", "2"]
+
+    Sorted = Parse(sort="-title,id").SortRecords(Records)
+    assert [Record.id for Record in Sorted] == ["3", "10", "2", "4"]
+    assert [Record.id for Record in Parse(sort="id").SortRecords(Records)] == ["2", "3", "4", "10"]
+    assert Parse(fields="id,status").Project(Records[0]) == {"id": "10", "status": "OPEN"}
+
+
+def test_sort_key_orders_numbers_before_text():
+    assert sorted(["b", "10", 2, "A", 1.5], key=SortKey) == [1.5, 2, "10", "A", "b"]
+
+
+def test_parse_push_down():
+    assert ParsePushDown("jobs=status|q|sort:title, applications=status,bogus") == {
+        "jobs": frozenset(("status", "q", "sort:title")),
+        "applications": frozenset(("status",)),
+    }
+    assert ParsePushDown(None) == {}
+
+
+def test_plan_push_down_complete():
+    RawValues = LoadStatusProfile("generic")["job"].RawValues
+    Plan = PlanPushDown(Parse(status="OPEN", q="python", sort="-title"), frozenset(("status", "q", "sort:title")), RawValues)
+    assert Plan.Params == {"status": "open,published", "q": "python", "sort": "-title"}
+    assert Plan.Complete and Plan.SortPushed
+
+
+def test_plan_push_down_partial():
+    RawValues = LoadStatusProfile("generic")["job"].RawValues
+    Plan = PlanPushDown(Parse(status="OPEN", location="remote", sort="title,id"), frozenset(("status", "sort:title")), RawValues)
+    assert Plan.Params == {"status": "open,published"}
+    assert not Plan.Complete and not Plan.SortPushed
+
+
+def test_plan_push_down_keeps_status_local_without_raw_values():
+    Plan = PlanPushDown(Parse(status="OPEN,DRAFT"), frozenset(("status",)), lambda Unified: ["open"] if Unified == "OPEN" else [])
+    assert Plan.Params == {}
+    assert not Plan.Complete
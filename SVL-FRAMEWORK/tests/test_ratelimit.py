@@ -0,0 +1,40 @@
+import pytest
+
+from ats_ratelimit import BucketStore, MemoryBucketStore, ParseRateLimits
+
+
+@pytest.mark.parametrize(
+    "Raw,Expected",
+    [
+        (None, {}),
+        ("", {}),
+        ("GetJobs=5:10", {"GetJobs": (5.0, 10.0)}),
+        ("GetJobs=5", {"GetJobs": (5.0, 5.0)}),
+        ("GetJobs=0.5", {"GetJobs": (0.5, 1.0)}),
+        (" GetJobs =2:4,*=20", {"GetJobs": (2.0, 4.0), "*": (20.0, 20.0)}),
+        ("GetJobs=0,CreateCandidate=-1,junk", {}),
+    ],
+)
+def test_parse_rate_limits(Raw, Expected):
+    assert ParseRateLimits(Raw) == Expected
+
+
+def test_parse_rate_limits_rejects_non_numbers():
+    with pytest.raises(ValueError):
+        ParseRateLimits("GetJobs=fast")
+
+
+def test_bucket_store_is_abstract():
+    with pytest.raises(TypeError):
+        BucketStore()
+
+
+def test_memory_bucket_spends_and_refunds():
+    Store = MemoryBucketStore()
+    Limit = (1.0, 2.0)
+    assert Store.Take("GetJobs", Limit, 1, 0) == (True, 0.0)
+    assert Store.Take("GetJobs", Limit, 1, 0)[0]
+    Granted, Wait = Store.Take("GetJobs", Limit, 1, 0)
+    assert not Granted and 0 < Wait <= 1
+    Store.Take("GetJobs", Limit, -1, 0)
+    assert Store.Take("GetJobs", Limit, 1, 0)[0]
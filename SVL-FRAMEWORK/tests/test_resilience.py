@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from ats_resilience import CircuitBreaker, ParseRetryAfter, RetryPolicy
+
+
+def test_retry_policy_attempts_and_statuses():
+    Policy = RetryPolicy(Attempts=3)
+    assert Policy.ShouldRetry(1, None)
+    assert Policy.ShouldRetry(2, 503)
+    assert not Policy.ShouldRetry(3, 503)
+    assert not Policy.ShouldRetry(1, 500)
+    assert not Policy.ShouldRetry(1, 404)
+    assert not RetryPolicy(Attempts=0).ShouldRetry(1, None)
+
+
+def test_retry_policy_full_jitter_is_capped():
+    Policy = RetryPolicy(BaseDelay=0.1, MaxDelay=0.3, Random=random.Random(7))
+    for Attempt, Ceiling in ((1, 0.1), (2, 0.2), (3, 0.3), (6, 0.3)):
+        Delays = [Policy.Delay(Attempt) for _ in range(200)]
+        assert all(0 <= Delay <= Ceiling for Delay in Delays)
+        assert max(Delays) > Ceiling / 2
+
+
+def test_retry_policy_honours_retry_after():
+    Policy = RetryPolicy(MaxRetryAfter=5)
+    assert Policy.Delay(1, RetryAfter=2.5) == 2.5
+    assert Policy.Delay(1, RetryAfter=6) is None
+
+
+@pytest.mark.parametrize("Value,Expected", [(None, None), ("", None), ("3", 3.0), ("-1", 0.0), ("soon", None)])
+def test_parse_retry_after(Value, Expected):
+    assert ParseRetryAfter(Value) == Expected
+
+
+def test_circuit_breaker_opens_after_threshold():
+    Breaker = CircuitBreaker(FailureThreshold=2, ResetSeconds=60)
+    Breaker.RecordFailure()
+    assert Breaker.Allow()
+    Breaker.RecordFailure()
+    assert Breaker.Snapshot() == {"state": "open", "failures": 2}
+    assert not Breaker.Allow()
+    assert 0 < Breaker.RetryIn() <= 60
+
+
+def test_circuit_breaker_success_resets_failures():
+    Breaker = CircuitBreaker(FailureThreshold=2)
+    Breaker.RecordFailure()
+    Breaker.RecordSuccess()
+    Breaker.RecordFailure()
+    assert Breaker.State == CircuitBreaker.CLOSED
+
+
+def test_circuit_breaker_half_open_lets_one_probe_through():
+    Breaker = CircuitBreaker(FailureThreshold=1, ResetSeconds=0)
+    Breaker.RecordFailure()
+    assert Breaker.Allow()
+    assert Breaker.State == CircuitBreaker.HALF_OPEN
+    assert not Breaker.Allow()
+
+    # A Failed Probe Re-Opens, A Successful One Closes
+    Breaker.RecordFailure()
+    assert Breaker.State == CircuitBreaker.OPEN
+    assert Breaker.Allow()
+    Breaker.RecordSuccess()
+    assert Breaker.State == CircuitBreaker.CLOSED
+    assert Breaker.RetryIn() == 0.0